@@ -133,6 +133,19 @@ if __name__ == "__main__":
         action='store_true',
         help="Create a merged file with all the annotations")
 
+    parser.add_argument(
+        "--pipeline",
+        action='store_true',
+        help="Stream each file through the consecutive STANDALONE annotations")
+
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of processes to annotate the files. 0 for one per "
+             "CPU. (default: 1)")
+
     # Force to print help if no argument is given then parse
     # ------------------------------------------------------
 
@@ -210,6 +223,7 @@ if __name__ == "__main__":
     parameters.set_lang(args.l)
     parameters.set_output_extension(args.e, "ANNOT")
     parameters.set_report_filename(args.log)
+    parameters.set_nb_workers(args.workers)
 
     # ----------------------------------------------------------------------------
     # Annotations are running here
@@ -218,6 +232,8 @@ if __name__ == "__main__":
     p = ProcessProgressTerminal()
     if args.merge:
         manager.set_do_merge(True)
+    if args.pipeline:
+        manager.set_do_pipeline(True)
     manager.annotate(parameters, p)
 
     try:
@@ -128,6 +128,9 @@ class sppasUnicode(object):
 
     """
 
+    # Sequences of whitespace, tab and CR/LF
+    __WHITESPACES = re.compile("[\\s]+")
+
     def __init__(self, entry):
         """Create a sppasUnicode instance.
 
@@ -176,15 +179,12 @@ class sppasUnicode(object):
         """
         # Remove multiple whitespace
         e = self.unicode()
-        self._entry = re.sub("[\\s]+", r" ", e)
+        self._entry = sppasUnicode.__WHITESPACES.sub(" ", e)
 
         # Remove whitespace at beginning and end
-        if self._entry.startswith(" "):
-            self._entry = re.sub("^[ ]+", r"", self._entry)
-        if self._entry.endswith(' '):
-            self._entry = re.sub("[ ]+$", r"", self._entry)
+        self._entry = self._entry.strip(" ")
         if "\ufeff" in self._entry:
-            self._entry = re.sub("\ufeff", r"", self._entry)
+            self._entry = self._entry.replace("\ufeff", "")
 
         return self._entry
 
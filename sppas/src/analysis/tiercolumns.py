@@ -0,0 +1,380 @@
+"""
+:filename: sppas.src.analysis.tiercolumns.py
+:author:   Brigitte Bigi
+:contact:  contact@sppas.org
+:summary:  Columns of the values of a tier and compiled filter predicates.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+"""
+
+
+import re
+
+from sppas.core.coreutils import text_type
+from sppas.core.coreutils import sppasTypeError
+from sppas.src.utils.datatype import sppasType
+from sppas.src.anndata.anndataexc import AnnDataTypeError
+from sppas.src.anndata.ann.annlocation import sppasPoint
+from sppas.src.anndata.ann.annlocation import sppasInterval
+from sppas.src.anndata.ann.annlocation import sppasDuration
+
+# ---------------------------------------------------------------------------
+
+
+class sppasTierColumns(object):
+    """The values of the localizations of a tier, extracted to be filtered.
+
+    The values are stored into flat lists of numbers, one item for each
+    localization, and the index of its annotation into another list. Each
+    column is extracted at the first time it is requested, then it is
+    re-used by all the next filters until the modification stamp of the
+    tier changes. The labels are not extracted: they are read in the tier.
+
+    - durations: (indexes, values, margins);
+    - localizations: (indexes, begins, begins radius, ends, ends radius);
+    - nlabels: the number of labels of each annotation.
+
+    """
+
+    def __init__(self, tier):
+        """Create a sppasTierColumns instance.
+
+        :param tier: (sppasTier) The tier to extract the values from
+
+        """
+        self.__tier = tier
+        self.__stamp = None
+        self.__annotations = list()
+        self.__durations = None
+        self.__localizations = None
+
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        self.__update()
+        return len(self.__annotations)
+
+    # -----------------------------------------------------------------------
+
+    def __iter__(self):
+        self.__update()
+        for annotation in self.__annotations:
+            yield annotation
+
+    # -----------------------------------------------------------------------
+
+    def get_annotation(self, index):
+        """Return the annotation at the given index of the last columns."""
+        return self.__annotations[index]
+
+    # -----------------------------------------------------------------------
+
+    def get_nlabels(self):
+        """Return the column of the number of labels."""
+        self.__update()
+        return [len(ann.get_labels()) for ann in self.__annotations]
+
+    # -----------------------------------------------------------------------
+
+    def get_durations(self):
+        """Return the columns (indexes, values, margins) of the durations."""
+        self.__update()
+        if self.__durations is None:
+            indexes = list()
+            values = list()
+            margins = list()
+            for i, annotation in enumerate(self.__annotations):
+                for localization, score in annotation.get_location():
+                    if isinstance(localization, sppasInterval) is True:
+                        # the same as duration(), without creating it
+                        begin = localization.get_begin()
+                        end = localization.get_end()
+                        values.append(end.get_midpoint() - begin.get_midpoint())
+                        margins.append((begin.get_radius() or 0) +
+                                       (end.get_radius() or 0))
+                    else:
+                        duration = localization.duration()
+                        values.append(duration.get_value())
+                        margins.append(duration.get_margin())
+                    indexes.append(i)
+            self.__durations = (indexes, values, margins)
+
+        return self.__durations
+
+    # -----------------------------------------------------------------------
+
+    def get_localizations(self):
+        """Return the columns (indexes, begins, radius, ends, radius)."""
+        self.__update()
+        if self.__localizations is None:
+            indexes = list()
+            begins = list()
+            begins_radius = list()
+            ends = list()
+            ends_radius = list()
+            for i, annotation in enumerate(self.__annotations):
+                for localization, score in annotation.get_location():
+                    if isinstance(localization, sppasPoint) is True:
+                        begin = end = localization
+                    else:
+                        begin = localization.get_begin()
+                        end = localization.get_end()
+                    begins.append(begin.get_midpoint())
+                    begins_radius.append(begin.get_radius() or 0)
+                    ends.append(end.get_midpoint())
+                    ends_radius.append(end.get_radius() or 0)
+                    indexes.append(i)
+            self.__localizations = (indexes, begins, begins_radius,
+                                    ends, ends_radius)
+
+        return self.__localizations
+
+    # -----------------------------------------------------------------------
+
+    def __update(self):
+        """Extract again the annotations if the tier was modified."""
+        stamp = self.__tier.get_modification_stamp()
+        if stamp != self.__stamp:
+            self.__annotations = [ann for ann in self.__tier]
+            self.__durations = None
+            self.__localizations = None
+            self.__stamp = stamp
+
+# ---------------------------------------------------------------------------
+
+
+class sppasFilterPredicates(object):
+    """Compile the functions of a filter into predicates.
+
+    The functions of sppasTagCompare, sppasDurationCompare,
+    sppasLocalizationCompare and sppasListCompare are turned into
+    predicates on a tag or on the values of a sppasTierColumns. The type
+    of the expected value is checked once, regular expressions are
+    compiled once, and the vagueness of durations and points is turned
+    into a tolerance. The result of a predicate is the same as the result
+    of the function.
+
+    """
+
+    @staticmethod
+    def tag(functions, logic_bool="and"):
+        """Return a predicate on a sppasTag.
+
+        :param functions: list of (function, value, logical_not)
+        :param logic_bool: (str) "and" or "or" between the functions
+        :returns: (function)
+
+        """
+        predicates = [sppasFilterPredicates.__complement(
+            sppasFilterPredicates.__tag_predicate(func, value), logical_not)
+            for func, value, logical_not in functions]
+        return sppasFilterPredicates.__combine(predicates, logic_bool)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def duration(functions, logic_bool="and"):
+        """Return a predicate on the value and the margin of a duration.
+
+        :param functions: list of (function, value, logical_not)
+        :param logic_bool: (str) "and" or "or" between the functions
+        :returns: (function)
+
+        """
+        predicates = [sppasFilterPredicates.__complement(
+            sppasFilterPredicates.__duration_predicate(func, value), logical_not)
+            for func, value, logical_not in functions]
+        return sppasFilterPredicates.__combine(predicates, logic_bool)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def localization(functions, logic_bool="and"):
+        """Return a predicate on the begin, radius, end, radius of a localization.
+
+        :param functions: list of (function, value, logical_not)
+        :param logic_bool: (str) "and" or "or" between the functions
+        :returns: (function)
+
+        """
+        predicates = [sppasFilterPredicates.__complement(
+            sppasFilterPredicates.__localization_predicate(func, value), logical_not)
+            for func, value, logical_not in functions]
+        return sppasFilterPredicates.__combine(predicates, logic_bool)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def nlabels(functions, logic_bool="and"):
+        """Return a predicate on a number of labels.
+
+        :param functions: list of (function, value, logical_not)
+        :param logic_bool: (str) "and" or "or" between the functions
+        :returns: (function)
+
+        """
+        predicates = [sppasFilterPredicates.__complement(
+            sppasFilterPredicates.__nlabels_predicate(func, value), logical_not)
+            for func, value, logical_not in functions]
+        return sppasFilterPredicates.__combine(predicates, logic_bool)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __complement(predicate, logical_not):
+        if logical_not is True:
+            return lambda *args: not predicate(*args)
+        return predicate
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __combine(predicates, logic_bool):
+        first = predicates[0]
+        if len(predicates) == 1:
+            return first
+        others = sppasFilterPredicates.__combine(predicates[1:], logic_bool)
+        if logic_bool == "and":
+            return lambda *args: first(*args) and others(*args)
+        return lambda *args: first(*args) or others(*args)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __tag_predicate(func, value):
+        """Return the predicate of a sppasTagCompare function."""
+        name = func.__name__
+        if name in ("exact", "iexact", "startswith", "istartswith",
+                    "endswith", "iendswith", "contains", "icontains"):
+            if not isinstance(value, text_type):
+                raise AnnDataTypeError(value, text_type)
+            lowered = value.lower()
+            if name == "exact":
+                return lambda tag: tag.get_content() == value
+            if name == "iexact":
+                return lambda tag: tag.get_content().lower() == lowered
+            if name == "startswith":
+                return lambda tag: tag.get_content().startswith(value)
+            if name == "istartswith":
+                return lambda tag: tag.get_content().lower().startswith(lowered)
+            if name == "endswith":
+                return lambda tag: tag.get_content().endswith(value)
+            if name == "iendswith":
+                return lambda tag: tag.get_content().lower().endswith(lowered)
+            if name == "contains":
+                return lambda tag: value in tag.get_content()
+            return lambda tag: lowered in tag.get_content().lower()
+
+        if name == "regexp":
+            match = re.compile(value).match
+            return lambda tag: match(tag.get_content()) is not None
+
+        # Numerical and boolean tags: the type of each tag is checked
+        return lambda tag: func(tag, value)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __duration_predicate(func, value):
+        """Return the predicate of a sppasDurationCompare function."""
+        name = func.__name__
+        if name not in ("eq", "ne", "gt", "lt", "ge", "le"):
+            raise AnnDataTypeError(func, "eq/ne/gt/lt/ge/le")
+
+        if isinstance(value, sppasDuration) is True:
+            x, margin = value.get_value(), value.get_margin()
+        elif sppasType().is_number(value) is True:
+            x, margin = value, 0
+        else:
+            raise AnnDataTypeError(value, "int/float/sppasDuration")
+
+        # Durations are equal if their difference is in their vagueness
+        if name == "eq":
+            return lambda v, m: abs(v - x) <= m + margin
+        if name == "ne":
+            return lambda v, m: abs(v - x) > m + margin
+        if name == "gt":
+            return lambda v, m: v - x > m + margin
+        if name == "lt":
+            return lambda v, m: x - v > m + margin
+        if name == "ge":
+            return lambda v, m: v - x >= -(m + margin)
+        return lambda v, m: v - x <= m + margin
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __localization_predicate(func, value):
+        """Return the predicate of a sppasLocalizationCompare function."""
+        name = func.__name__
+        if name not in ("rangefrom", "rangeto"):
+            raise AnnDataTypeError(func, "rangefrom/rangeto")
+
+        if isinstance(value, sppasPoint) is True:
+            x, radius = value.get_midpoint(), value.get_radius() or 0
+        elif sppasType().is_number(value) is True:
+            x, radius = value, 0
+        else:
+            raise AnnDataTypeError(value, "int/float/sppasBaseLocalization")
+
+        # Points are equal if their difference is in their radius
+        if name == "rangefrom":
+            return lambda b, br, e, er: b - x >= -(br + radius)
+        return lambda b, br, e, er: e - x <= er + radius
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __nlabels_predicate(func, value):
+        """Return the predicate of a sppasListCompare function."""
+        name = func.__name__
+        if name not in ("leq", "lne", "lgt", "llt", "lle", "lge"):
+            raise sppasTypeError(func, "leq/lne/lgt/llt/lle/lge")
+        if sppasType().is_number(value) is False:
+            raise sppasTypeError(value, "int/float")
+
+        x = int(value)
+        if name == "leq":
+            return lambda n: n == x
+        if name == "lne":
+            return lambda n: n != x
+        if name == "lgt":
+            return lambda n: n > x
+        if name == "llt":
+            return lambda n: n < x
+        if name == "lle":
+            return lambda n: n <= x
+        return lambda n: n >= x
@@ -39,6 +39,8 @@
 """
 
 import logging
+from bisect import bisect_left
+from bisect import bisect_right
 
 from sppas.core.coreutils import sppasKeyError
 from sppas.core.coreutils import u
@@ -51,6 +53,10 @@ from sppas.src.anndata.ann.annlabel import sppasTagCompare
 from sppas.src.anndata.ann.annlocation import sppasDurationCompare
 from sppas.src.anndata.ann.annlocation import sppasLocalizationCompare
 from sppas.src.anndata.ann.annlocation import sppasIntervalCompare
+from sppas.src.anndata.ann.annlocation import sppasDuration
+
+from .tiercolumns import sppasTierColumns
+from .tiercolumns import sppasFilterPredicates
 
 # ---------------------------------------------------------------------------
 
@@ -273,6 +279,9 @@ class sppasTierFilters(sppasBaseFilters):
             raise AnnDataTypeError(obj, "sppasTier")
         super(sppasTierFilters, self).__init__(obj)
 
+        # The values of the annotations, extracted again if the tier changes
+        self.__columns = sppasTierColumns(obj)
+
     # -----------------------------------------------------------------------
 
     def tag(self, **kwargs):
@@ -298,16 +307,22 @@ class sppasTierFilters(sppasBaseFilters):
         label_logic_bool = sppasBaseFilters.fix_logic_bool_label(**kwargs)
         tag_fct_values = sppasBaseFilters.fix_function_values(comparator, **kwargs)
         tag_functions = sppasBaseFilters.fix_functions(comparator, **kwargs)
+        predicate = sppasFilterPredicates.tag(tag_functions, tag_logic_bool)
 
         data = sppasAnnSet()
 
         # search for the annotations to be returned:
-        for annotation in self.obj:
+        for annotation in self.__columns:
             is_matching = False
 
             # "any" or "all" labels can match
             for label in annotation.get_labels():
-                is_matching = label.match(tag_functions, tag_logic_bool)
+                # any tag of the label can match
+                is_matching = False
+                for tag, score in label:
+                    if predicate(tag) is True:
+                        is_matching = True
+                        break
 
                 # do not test the next labels if...
                 if is_matching is True and label_logic_bool == "any":
@@ -342,16 +357,18 @@ class sppasTierFilters(sppasBaseFilters):
         logic_bool = sppasBaseFilters.fix_logic_bool(**kwargs)
         dur_fct_values = sppasBaseFilters.fix_function_values(comparator, **kwargs)
         dur_functions = sppasBaseFilters.fix_functions(comparator, **kwargs)
+        predicate = sppasFilterPredicates.duration(dur_functions, logic_bool)
 
         data = sppasAnnSet()
 
         # search for the annotations to be returned:
-        for annotation in self.obj:
-
-            location = annotation.get_location()
-            is_matching = location.match_duration(dur_functions, logic_bool)
-            if is_matching is True:
-                data.append(annotation, dur_fct_values)
+        indexes, values, margins = self.__columns.get_durations()
+        matching = -1
+        for i, value, margin in zip(indexes, values, margins):
+            # any localization can match
+            if i != matching and predicate(value, margin) is True:
+                data.append(self.__columns.get_annotation(i), dur_fct_values)
+                matching = i
 
         return data
 
@@ -375,16 +392,19 @@ class sppasTierFilters(sppasBaseFilters):
         logic_bool = sppasBaseFilters.fix_logic_bool(**kwargs)
         loc_fct_values = sppasBaseFilters.fix_function_values(comparator, **kwargs)
         loc_functions = sppasBaseFilters.fix_functions(comparator, **kwargs)
+        predicate = sppasFilterPredicates.localization(loc_functions, logic_bool)
 
         data = sppasAnnSet()
 
         # search for the annotations to be returned:
-        for annotation in self.obj:
-
-            location = annotation.get_location()
-            is_matching = location.match_localization(loc_functions, logic_bool)
-            if is_matching is True:
-                data.append(annotation, loc_fct_values)
+        indexes, begins, begins_radius, ends, ends_radius = \
+            self.__columns.get_localizations()
+        matching = -1
+        for i, b, br, e, er in zip(indexes, begins, begins_radius, ends, ends_radius):
+            # any localization can match
+            if i != matching and predicate(b, br, e, er) is True:
+                data.append(self.__columns.get_annotation(i), loc_fct_values)
+                matching = i
 
         return data
 
@@ -407,26 +427,14 @@ class sppasTierFilters(sppasBaseFilters):
         logic_bool = sppasBaseFilters.fix_logic_bool(**kwargs)
         nlab_fct_values = sppasBaseFilters.fix_function_values(comparator, **kwargs)
         nlab_functions = sppasBaseFilters.fix_functions(comparator, **kwargs)
+        predicate = sppasFilterPredicates.nlabels(nlab_functions, logic_bool)
 
         data = sppasAnnSet()
 
         # search for the annotations to be returned:
-        for annotation in self.obj:
-            labels = annotation.get_labels()
-
-            matches = list()
-            for func, value, logical_not in nlab_functions:
-                if logical_not is True:
-                    matches.append(not func(labels, value))
-                else:
-                    matches.append(func(labels, value))
-            if logic_bool == "and":
-                is_matching = all(matches)
-            else:
-                is_matching = any(matches)
-
-            if is_matching is True:
-                data.append(annotation, nlab_fct_values)
+        for i, nlabels in enumerate(self.__columns.get_nlabels()):
+            if predicate(nlabels) is True:
+                data.append(self.__columns.get_annotation(i), nlab_fct_values)
 
         return data
 
@@ -457,6 +465,11 @@ class sppasTierFilters(sppasBaseFilters):
         # extract the information from the arguments
         rel_functions = sppasTierFilters.__fix_relation_functions(comparator, *args)
 
+        # the localizations of the other tier, sorted by their begin, and
+        # how far from a localization the relations can be connected
+        other_index = sppasTierFilters.__index_localizations(other_tier)
+        reach = sppasTierFilters.__fix_relation_reach(rel_functions, **kwargs)
+
         data = sppasAnnSet()
 
         # search for the annotations to be returned:
@@ -464,8 +477,9 @@ class sppasTierFilters(sppasBaseFilters):
 
             location = annotation.get_location()
             match_values = sppasTierFilters.__connect(location,
-                                                      other_tier,
+                                                      other_index,
                                                       rel_functions,
+                                                      reach,
                                                       **kwargs)
             if len(match_values) > 0:
                 data.append(annotation, list(set(match_values)))
@@ -532,17 +546,121 @@ class sppasTierFilters(sppasBaseFilters):
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def __connect(location, other_tier, rel_functions, **kwargs):
-        """Find connections between location and the other tier."""
+    def __fix_relation_reach(rel_functions, max_delay=None, **kwargs):
+        """Return how far from a localization the relations can be connected.
+
+        Except 'before' and 'after', the relations are connected only if the
+        localizations are in contact. 'before' and 'after' are connected up to
+        max_delay, or anywhere if it is not defined.
+
+        :returns: (tuple) Reach before the begin and after the end of a \
+        localization, or None if unlimited.
+
+        """
+        delay = None
+        if max_delay is not None:
+            if isinstance(max_delay, sppasDuration) is True:
+                delay = float(max_delay.get_value() + max_delay.get_margin())
+            else:
+                delay = float(max_delay)
+
+        left = 0.
+        right = 0.
+        for func, complement in rel_functions:
+            if func.__name__.startswith("before"):
+                right = None if delay is None or right is None else max(right, delay)
+            elif func.__name__.startswith("after"):
+                left = None if delay is None or left is None else max(left, delay)
+
+        return left, right
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __extremities(localization):
+        """Return the first and the last points of a localization."""
+        if localization.is_point() is True:
+            return localization, localization
+        return localization.get_begin(), localization.get_end()
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __radius(point):
+        """Return the radius of a point, 0 if not defined."""
+        radius = point.get_radius()
+        return 0. if radius is None else radius
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __index_localizations(tier):
+        """Sort the localizations of the annotations of a tier by their begin.
+
+        :returns: (tuple) the midpoints of the begins and of the ends, the
+        localizations, the max duration and the max radius.
+
+        """
+        items = list()
+        max_duration = 0.
+        max_radius = 0.
+        for annotation in tier:
+            for localization, score in annotation.get_location():
+                begin, end = sppasTierFilters.__extremities(localization)
+                items.append((begin.get_midpoint(), end.get_midpoint(), localization))
+                max_duration = max(max_duration, end.get_midpoint() - begin.get_midpoint())
+                max_radius = max(max_radius,
+                                 sppasTierFilters.__radius(begin),
+                                 sppasTierFilters.__radius(end))
+        items.sort(key=lambda item: item[0])
+
+        begins = [item[0] for item in items]
+        ends = [item[1] for item in items]
+        localizations = [item[2] for item in items]
+        return begins, ends, localizations, max_duration, max_radius
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __connect(location, other_index, rel_functions, reach, **kwargs):
+        """Find connections between location and the other tier.
+
+        Only the localizations of the other tier within the reach of the
+        relations are compared, and a relation is no longer tested once it
+        is connected.
+
+        """
+        begins, ends, localizations, max_duration, max_radius = other_index
+        left, right = reach
         values = list()
-        for other_ann in other_tier:
-            for localization, score in location:
-                for other_loc, other_score in other_ann.get_location():
-                    for func_name, complement in rel_functions:
-                        is_connected = func_name(localization,
-                                                 other_loc,
-                                                 **kwargs)
-                        if is_connected:
-                            values.append(func_name.__name__)
+        for localization, score in location:
+            functions = [func for func, complement in rel_functions
+                         if func.__name__ not in values]
+            if len(functions) == 0:
+                break
+
+            # the window of the other localizations within reach
+            x1, x2 = sppasTierFilters.__extremities(localization)
+            margin = max_radius + max(sppasTierFilters.__radius(x1),
+                                      sppasTierFilters.__radius(x2))
+            lower = None
+            first = 0
+            if left is not None:
+                lower = x1.get_midpoint() - left - margin
+                first = bisect_left(begins, lower - max_duration)
+            last = len(begins)
+            if right is not None:
+                last = bisect_right(begins, x2.get_midpoint() + right + margin)
+
+            for i in range(first, last):
+                if lower is not None and ends[i] < lower:
+                    continue
+                for func in functions:
+                    if func(localization, localizations[i], **kwargs):
+                        values.append(func.__name__)
+                functions = [func for func in functions
+                             if func.__name__ not in values]
+                if len(functions) == 0:
+                    break
 
         return values
@@ -60,10 +60,12 @@ from .aio import format_labels
 from .aio import format_label
 from .aio import sppasXRA
 from .aio.readwrite import sppasTrsRW
+from .aio.readwrite import sppasTrsCache
 from .aio.readwrite import FileFormatProperty
 from .metadata import sppasMetaData
 from .transcription import sppasTranscription
 from .tier import sppasTier
+from .columnartier import sppasColumnarTier
 from .ctrlvocab import sppasCtrlVocab
 from .media import sppasMedia
 from .hierarchy import sppasHierarchy
@@ -84,10 +86,12 @@ from .ann.annset import sppasAnnSet
 __all__ = (
     'sppasMetaData',
     'sppasTrsRW',
+    'sppasTrsCache',
     'FileFormatProperty',
     'sppasXRA',
     'sppasTranscription',
     'sppasTier',
+    'sppasColumnarTier',
     'sppasAnnotation',
     'sppasCtrlVocab',
     'sppasMedia',
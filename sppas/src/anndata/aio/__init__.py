@@ -39,35 +39,28 @@
 
 """
 
-from .annotationpro import sppasANT
-from .annotationpro import sppasANTX
-from .anvil import sppasAnvil
-from .audacity import sppasAudacity
-from .elan import sppasEAF
-from .htk import sppasLab
-from .phonedit import sppasMRK
-from .phonedit import sppasSignaix
-from .praat import sppasTextGrid
-from .praat import sppasIntensityTier
-from .praat import sppasPitchTier
-from .sclite import sppasCTM
-from .sclite import sppasSTM
-from .subtitle import sppasSubRip
-from .subtitle import sppasSubViewer
-from .subtitle import sppasWebVTT
-from .text import sppasRawText
-from .text import sppasCSV
-from .table import sppasARFF
-from .table import sppasXRFF
-from .table import sppasTRA
-from .xtrans import sppasTDF
-from .xra import sppasXRA
+import importlib
+
+from .readwrite import TRS_FORMATS
 
 from .aioutils import serialize_label
 from .aioutils import serialize_labels
 from .aioutils import format_label
 from .aioutils import format_labels
 
+# ----------------------------------------------------------------------------
+# The reader-writers are imported only when they are requested
+# ----------------------------------------------------------------------------
+
+_RW_MODULES = {p["name"]: p["module"] for p in TRS_FORMATS.values()}
+
+
+def __getattr__(name):
+    if name in _RW_MODULES:
+        module = importlib.import_module("." + _RW_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError("module {:s} has no attribute {:s}".format(__name__, name))
+
 # ----------------------------------------------------------------------------
 # Variables
 # ----------------------------------------------------------------------------
@@ -56,6 +56,7 @@ from ..ann.annlabel import sppasLabel
 from ..ann.annlabel import sppasTag
 from ..anndataexc import AioError
 from ..anndataexc import AioEncodingError
+from ..anndataexc import TierAppendError
 
 # ---------------------------------------------------------------------------
 
@@ -94,6 +95,39 @@ def load(filename, file_encoding=sg.__encoding__):
 # ---------------------------------------------------------------------------
 
 
+def sniff_encoding(filename, default_encoding=sg.__encoding__):
+    """Return the encoding of a file from its first bytes.
+
+    The encoding is the one of the BOM if any. A file without BOM but
+    with null bytes in its first characters is UTF-16. Otherwise, the
+    given default encoding is returned.
+
+    :param filename: (str)
+    :param default_encoding: (str)
+    :returns: (str) Encoding name
+
+    """
+    try:
+        with open(filename, 'rb') as fp:
+            head = fp.read(4)
+    except IOError:
+        raise AioError(filename)
+
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+        return "UTF-16"
+    if len(head) >= 2:
+        if head[0] == 0 and head[1] != 0:
+            return "UTF-16-BE"
+        if head[0] != 0 and head[1] == 0:
+            return "UTF-16-LE"
+
+    return default_encoding
+
+# ---------------------------------------------------------------------------
+
+
 def is_ortho_tier(tier_name):
     """Return true is the tier_name matches an ortho trans.
 
@@ -304,13 +338,13 @@ def format_tag(text, empty="", tag_type="str"):
     :param tag_type: (str): The type of this content.\
         One of: ('str', 'int', 'float', 'bool').
 
-    :returns: sppasTag
+    :returns: sppasTag, an interned one if the type is 'str'
 
     """
     if len(text) == 0:
-        return sppasTag(empty, tag_type)
+        text = empty
 
-    if "=" in text:
+    elif "=" in text:
         tab = text.split("=")
         try:
             float(tab[1])
@@ -321,11 +355,33 @@ def format_tag(text, empty="", tag_type="str"):
             # the given text is in the format: text=score
             text = tab[0]
 
+    if tag_type == "str":
+        return sppasTag.intern(text)
     return sppasTag(text, tag_type)
 
 # ---------------------------------------------------------------------------
 
 
+def extend_tier(tier, annotations):
+    """Add the annotations of a file into a tier.
+
+    The annotations of a file are expected to be sorted: they are added
+    with a single validation. If they are not, they are inserted one by
+    one in the sorted order, like sppasTier.add() does.
+
+    :param tier: (sppasTier)
+    :param annotations: (list of sppasAnnotation)
+
+    """
+    try:
+        tier.extend_sorted(annotations)
+    except TierAppendError:
+        for ann in annotations:
+            tier.add(ann)
+
+# ---------------------------------------------------------------------------
+
+
 def check_gaps(tier, min_loc=None, max_loc=None):
     """Check if there are holes between annotations.
 
@@ -184,6 +184,7 @@ class sppasANTX(sppasBaseIO):
         self._accept_radius = False
         self._accept_gaps = True
         self._accept_overlaps = False
+        self._accept_tier_selection = True
 
         # Information that are both used by AnnotationPro and
         # another software tool. A bidict() is a bi-directional dict.
@@ -201,10 +202,14 @@ class sppasANTX(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def read(self, filename):
+    def read(self, filename, tier_names=None):
         """Read an ANTX file and fill the Transcription.
 
+        The annotations of the tiers which are not selected are not created.
+
         :param filename: (str)
+        :param tier_names: (list of str, function or None) Selection of the
+        tiers to read. See sppasBaseIO.is_selected_tier().
 
         """
         tree = ET.parse(filename)
@@ -220,12 +225,15 @@ class sppasANTX(sppasBaseIO):
             self._parse_audiofile(child, uri)
 
         # Create tiers
+        skipped_layers = list()
         for child in tree.iter(tag=uri+"Layer"):
-            self._parse_layer(child, uri)
+            tier = self._parse_layer(child, uri, tier_names)
+            if tier is None:
+                skipped_layers.append(child.find(uri + 'Id').text)
 
         # Create annotations
         for child in tree.iter(tag=uri+"Segment"):
-            self._parse_segment(child, uri)
+            self._parse_segment(child, uri, skipped_layers)
 
     # -----------------------------------------------------------------------
 
@@ -278,28 +286,37 @@ class sppasANTX(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def _parse_layer(self, tier_root, uri=''):
+    def _parse_layer(self, tier_root, uri='', tier_names=None):
         """Get the elements 'Layer'.
 
         :param tier_root: (ET) Layer root.
         :param uri: (str)
+        :param tier_names: (list of str, function or None) Selection of the tiers to create
+        :returns: (sppasTier) the created tier or None if it was skipped
 
         """
         tier_name = tier_root.find(uri + 'Name').text
+        if self.is_selected_tier(tier_name, tier_names) is False:
+            return None
         tier = self.create_tier(tier_name)
         self.elt_to_meta(tier_root, tier, uri, ['Name'])
 
+        return tier
+
     # -----------------------------------------------------------------------
 
-    def _parse_segment(self, annotation_root, uri=""):
+    def _parse_segment(self, annotation_root, uri="", skipped_layers=()):
         """Get the elements 'Segment'.
 
         :param annotation_root: (ET) Segment root.
         :param uri: (str)
+        :param skipped_layers: (list) Identifiers of the layers not read
 
         """
         # fix parent tier
         tier_id = annotation_root.find(uri + 'IdLayer').text
+        if tier_id in skipped_layers:
+            return
         tier = self.find_id(tier_id)
         if tier is None:
             raise AioFormatError("Layer id="+tier_id)
@@ -701,13 +718,16 @@ class sppasANT(sppasBaseIO):
         self._accept_radius = False
         self._accept_gaps = True
         self._accept_overlaps = False
+        self._accept_tier_selection = True
 
     # -----------------------------------------------------------------------
 
-    def read(self, filename):
+    def read(self, filename, tier_names=None):
         """Read an ANT file and fill the Transcription.
 
         :param filename: (str)
+        :param tier_names: (list of str, function or None) Selection of the
+        tiers to read. See sppasBaseIO.is_selected_tier().
 
         """
         zf = zipfile.ZipFile(filename, 'r')
@@ -717,7 +737,7 @@ class sppasANT(sppasBaseIO):
 
         antx_filename = os.path.join(unzip_dir, "annotation.xml")
         antx = sppasANTX()
-        antx.read(antx_filename)
+        antx.read(antx_filename, tier_names)
         self.set(antx)
 
     # -----------------------------------------------------------------------
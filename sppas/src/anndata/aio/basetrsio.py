@@ -40,6 +40,7 @@
 """
 
 from ..transcription import sppasTranscription
+from ..columnartier import sppasColumnarTier
 from ..anndataexc import AnnDataTypeError
 
 # ---------------------------------------------------------------------------
@@ -82,6 +83,25 @@ class sppasBaseIO(sppasTranscription):
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def is_selected_tier(tier_name, tier_names=None):
+        """Check whether a tier has to be read or not.
+
+        :param tier_name: (str) Name of a tier of a file
+        :param tier_names: (list of str, function or None) The exact names
+        of the tiers to read, or a function returning True for the name of
+        a tier to read, or None to read all the tiers.
+        :returns: (bool)
+
+        """
+        if tier_names is None:
+            return True
+        if callable(tier_names) is True:
+            return bool(tier_names(tier_name))
+        return tier_name in tier_names
+
+    # -----------------------------------------------------------------------
+
     def __init__(self, name=None):
         """Initialize a new Transcription reader-writer instance.
 
@@ -108,6 +128,9 @@ class sppasBaseIO(sppasTranscription):
         self._accept_radius = True
         self._accept_gaps = False
         self._accept_overlaps = False
+        self._accept_columnar = False
+        self._accept_tier_selection = False
+        self._accept_handoff = False
 
     # -----------------------------------------------------------------------
     # Getters
@@ -255,6 +278,43 @@ class sppasBaseIO(sppasTranscription):
         """
         return self._accept_overlaps
 
+    # -----------------------------------------------------------------------
+
+    def columnar_support(self):
+        """Return True if it can write a sppasColumnarTier as it is.
+
+        Otherwise, the columnar tiers are converted into sppasTier.
+
+        :returns: boolean
+
+        """
+        return self._accept_columnar
+
+    # -----------------------------------------------------------------------
+
+    def tier_selection_support(self):
+        """Return True if it can read only a selection of the tiers of a file.
+
+        If True, the reader accepts a 'tier_names' argument.
+
+        :returns: boolean
+
+        """
+        return self._accept_tier_selection
+
+    # -----------------------------------------------------------------------
+
+    def handoff_support(self):
+        """Return True if a written transcription can replace a read.
+
+        If True, the transcription written into a file can be given to
+        handoff() instead of reading the file.
+
+        :returns: boolean
+
+        """
+        return self._accept_handoff
+
     # -----------------------------------------------------------------------
     # Setters
     # -----------------------------------------------------------------------
@@ -274,6 +334,10 @@ class sppasBaseIO(sppasTranscription):
         self._media = other.get_media_list()
         self._ctrlvocab = other.get_ctrl_vocab_list()
         self._tiers = other.get_tier_list()
+        if self._accept_columnar is False:
+            if any(isinstance(tier, sppasColumnarTier) for tier in self._tiers):
+                self._tiers = [tier.to_tier() if isinstance(tier, sppasColumnarTier) else tier
+                               for tier in self._tiers]
         self._hierarchy = other.get_hierarchy()
 
     # -----------------------------------------------------------------------
@@ -295,3 +359,13 @@ class sppasBaseIO(sppasTranscription):
 
         """
         raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def handoff(self, other):
+        """Fill the transcription like read() would do from a written file.
+
+        :param other: (sppasBaseIO) The reader-writer which wrote the file
+
+        """
+        raise NotImplementedError
@@ -48,6 +48,8 @@ video and audio resources.
 """
 
 import xml.etree.cElementTree as ET
+from array import array
+from itertools import chain
 from operator import itemgetter
 from collections import OrderedDict
 import logging
@@ -104,6 +106,97 @@ MIMES = {'wav': 'audio/x-wav',
 # ---------------------------------------------------------------------------
 
 
+class sppasEAFTimeSlots(object):
+    """Time values of the TIME_SLOT elements of an EAF document.
+
+    ELAN names the time slots "ts" followed by an index, so their values are
+    stored into an array of floats indexed by this number. A time slot takes
+    8 bytes instead of a dictionary entry made of two strings. The time slots
+    without time value are stored as NaN. Any other identifier is stored
+    into a dictionary.
+
+    It implements the part of the dict API used by the reader:
+
+        >>> time_slots = sppasEAFTimeSlots()
+        >>> time_slots['ts1'] = "1000"
+        >>> time_slots.get('ts1')
+        1000.0
+        >>> time_slots.get('ts2', -1)
+        -1
+
+    """
+
+    def __init__(self):
+        """Create a new sppasEAFTimeSlots instance."""
+        self.__values = array('d')
+        self.__others = dict()
+        self.__size = 0
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __index(time_id):
+        """Return the index of an identifier "ts<N>" or -1."""
+        if time_id.startswith("ts") is False:
+            return -1
+        digits = time_id[2:]
+        if digits.isdigit() is False or (len(digits) > 1 and digits[0] == "0"):
+            return -1
+        return int(digits)
+
+    # -----------------------------------------------------------------------
+
+    def get(self, time_id, default=None):
+        """Return the time value of a time slot.
+
+        :param time_id: (str) Identifier of the time slot
+        :param default: Value to return if the time slot has no time value
+        :returns: (float or str)
+
+        """
+        idx = sppasEAFTimeSlots.__index(time_id)
+        if 0 <= idx < len(self.__values):
+            value = self.__values[idx]
+            if value == value:
+                return value
+            return default
+        return self.__others.get(time_id, default)
+
+    # -----------------------------------------------------------------------
+
+    def __setitem__(self, time_id, value):
+        try:
+            value = float(value)
+        except ValueError:
+            # Stored as is: an error will occur when the point is created.
+            idx = -1
+        else:
+            idx = sppasEAFTimeSlots.__index(time_id)
+            # Do not allocate a huge array for a very sparse numbering and
+            # do not confuse a NaN value with a missing one.
+            if idx > 2 * len(self.__values) + 1024 or value != value:
+                idx = -1
+
+        if idx == -1:
+            if time_id not in self.__others:
+                self.__size += 1
+            self.__others[time_id] = value
+            return
+
+        if idx >= len(self.__values):
+            self.__values.extend([float('nan')] * (idx + 1 - len(self.__values)))
+        if self.__values[idx] != self.__values[idx]:
+            self.__size += 1
+        self.__values[idx] = value
+
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return self.__size
+
+# ---------------------------------------------------------------------------
+
+
 class sppasEAF(sppasBaseIO):
     """Elan EAF reader and writer.
 
@@ -160,6 +253,7 @@ class sppasEAF(sppasBaseIO):
         self._accept_radius = False
         self._accept_gaps = True
         self._accept_overlaps = False  # to be verified
+        self._accept_tier_selection = True
 
         # Information that are both used by ELAN and another software tool
         self._map_meta = bidict()
@@ -206,33 +300,74 @@ class sppasEAF(sppasBaseIO):
     # reader
     # -----------------------------------------------------------------------
 
-    def read(self, filename):
+    def read(self, filename, tier_names=None):
         """Read a ELAN EAF file.
 
+        The file is parsed incrementally: the time slots are stored into a
+        compact array and each 'ANNOTATION' element is removed from the tree
+        as soon as it is converted. A tier referring to a parent tier which
+        is not known yet is parsed at the end of the document.
+
+        The annotations of the tiers which are not selected are not created,
+        except if they are required to create the ones of a selected tier.
+
         :param filename: (str) input filename.
+        :param tier_names: (list of str, function or None) Selection of the
+        tiers to read. See sppasBaseIO.is_selected_tier().
 
         """
-        tree = ET.parse(filename)
-        root = tree.getroot()
-
-        # 1. Document
-        self._parse_document(root)
+        root = None
+        depth = 0
+        nb_licenses = 0
+        header_root = None
+        time_slots = None
+        removed_annotations = dict()
+        parents = OrderedDict()
+        alignable = dict()
+        pending_tiers = list()
+
+        events = ET.iterparse(filename, events=("start", "end"))
+        for event, elem in events:
+            if event == "start":
+                if root is None:
+                    # 1. Document
+                    root = elem
+                    self._parse_document(root)
+                elif depth == 1 and elem.tag == "TIER":
+                    # 6. Tiers (0..*)
+                    # the end of the tier is consumed by __read_tier
+                    parents[elem.attrib['TIER_ID']] = elem.attrib.get('PARENT_REF', None)
+                    kind = self.__read_tier(events, elem, time_slots,
+                                            removed_annotations, tier_names)
+                    if kind is None:
+                        pending_tiers.append(elem)
+                    else:
+                        alignable[elem.attrib['TIER_ID']] = kind
+                    root.remove(elem)
+                    continue
+                depth += 1
 
-        # 2. License (0..*)
-        for i, license_root in enumerate(root.findall('LICENSE')):
-            self._parse_license(license_root, i)
+            else:
+                depth -= 1
+                if depth != 1:
+                    continue
+                if elem.tag == "LICENSE":
+                    # 2. License (0..*)
+                    self._parse_license(elem, nb_licenses)
+                    nb_licenses += 1
+                elif elem.tag == "HEADER":
+                    # 3. Header (1..1)
+                    header_root = elem
+                    self._parse_header(header_root)
+                elif elem.tag == "TIME_ORDER":
+                    # 4. Time order (1..1)
+                    time_slots = sppasEAF._parse_time_order(elem)
+                    root.remove(elem)
 
-        # 3. Header (1..1)
-        header_root = root.find('HEADER')
         if header_root is None:
             raise AioFormatError('HEADER')
-        self._parse_header(root.find('HEADER'))
-
-        # 4. Time order (1..1)
-        time_order_root = root.find('TIME_ORDER')
-        if time_order_root is None:
+        if time_slots is None:
             raise AioFormatError('TIME_ORDER')
-        time_slots = sppasEAF._parse_time_order(time_order_root)
 
         # 5. Controlled vocabularies (0..*)
         for vocabulary_root in root.findall('CONTROLLED_VOCABULARY'):
@@ -241,7 +376,8 @@ class sppasEAF(sppasBaseIO):
                 self.add_ctrl_vocab(ctrl_vocab)
 
         # 6. Tiers (0..*)
-        self._parse_tiers(root, time_slots)
+        self._parse_tiers(pending_tiers, parents, alignable, time_slots,
+                          removed_annotations, tier_names)
 
         # 7. Linguistic type
         for linguistic_root in root.findall('LINGUISTIC_TYPE'):
@@ -263,6 +399,92 @@ class sppasEAF(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
+    def __read_tier(self, events, tier_root, time_slots, removed_annotations,
+                    tier_names=None):
+        """Parse a 'TIER' element while the document is read.
+
+        The tier is parsed only if it is selected and if its parent tier was
+        already parsed. Otherwise, its annotations are kept into tier_root.
+
+        :param events: (iterator) Events of the XML parser, after the start of the tier
+        :param tier_root: (ET) Tier root, without its annotations yet.
+        :param time_slots: (sppasEAFTimeSlots) or None if not read yet
+        :param removed_annotations: (dict)
+        :param tier_names: (list of str, function or None) Selection of the tiers
+        :returns: (int) Result of __is_alignable_tier() or None if the tier
+        was not parsed.
+
+        """
+        annotation_roots = sppasEAF.__iter_annotation_roots(events)
+
+        # The first annotation indicates if the tier is alignable or not
+        first_root = next(annotation_roots, None)
+        parent_ref = tier_root.attrib.get('PARENT_REF', None)
+        if time_slots is None or \
+                self.is_selected_tier(tier_root.attrib['TIER_ID'], tier_names) is False or \
+                (parent_ref is not None and self.find(parent_ref) is None):
+            for annotation_root in annotation_roots:
+                pass
+            return None
+
+        alignable = sppasEAF.__is_alignable_tier(tier_root)
+        if first_root is not None:
+            annotation_roots = sppasEAF.__release_annotation_roots(
+                tier_root, chain([first_root], annotation_roots))
+
+        try:
+            tier = self._parse_tier(tier_root, time_slots,
+                                    removed_annotations, annotation_roots)
+            logging.debug(" ... successfully parsed TIER: {:s}"
+                          "".format(tier.get_name()))
+        except Exception as e:
+            if alignable != 2:
+                raise
+            logging.error(" ... failed to parse alignable TIER: {}. "
+                          "Not loaded.".format(e))
+
+        # skip the annotations which were not parsed because of an error
+        for annotation_root in annotation_roots:
+            pass
+        return alignable
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __iter_annotation_roots(events):
+        """Yield the 'ANNOTATION' elements of a 'TIER' when they are closed.
+
+        :param events: (iterator) Events of the XML parser, after the start of the tier
+
+        """
+        depth = 0
+        for event, elem in events:
+            if event == "start":
+                depth += 1
+            elif depth == 0:
+                # end of the tier
+                return
+            else:
+                depth -= 1
+                if depth == 0 and elem.tag == "ANNOTATION":
+                    yield elem
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __release_annotation_roots(tier_root, annotation_roots):
+        """Yield the annotations and remove them from the tier when converted.
+
+        :param tier_root: (ET) Tier root.
+        :param annotation_roots: (iterator) 'ANNOTATION' elements of the tier
+
+        """
+        for annotation_root in annotation_roots:
+            yield annotation_root
+            tier_root.remove(annotation_root)
+
+    # -----------------------------------------------------------------------
+
     def _parse_document(self, document_root):
         """Get the main element root.
 
@@ -473,9 +695,10 @@ class sppasEAF(sppasBaseIO):
         The TIME_ORDER element is a container for ordered TIME_SLOT elements.
 
         :param time_order_root: (ET) Time order root element.
+        :returns: (sppasEAFTimeSlots)
 
         """
-        time_slots = dict()
+        time_slots = sppasEAFTimeSlots()
 
         # parse each of the <TIME_SLOT> elements
         for time_slot_node in time_order_root.findall('TIME_SLOT'):
@@ -585,20 +808,37 @@ class sppasEAF(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def _parse_tiers(self, root, time_slots):
-        """Get all the elements 'TIER' -> sppasTier().
+    def _parse_tiers(self, tier_roots, parents, alignable, time_slots,
+                     removed_annotations, tier_names=None):
+        """Get the elements 'TIER' which were not parsed while reading.
 
-        :param root: (ET) Document root.
-        :param time_slots: (dict)
+        Then, link the tiers into the hierarchy.
+
+        :param tier_roots: (list of ET) Tier roots with their annotations.
+        :param parents: (OrderedDict) PARENT_REF of each tier of the document
+        :param alignable: (dict) Result of __is_alignable_tier() for each
+        tier already parsed.
+        :param time_slots: (sppasEAFTimeSlots)
+        :param removed_annotations: (dict) Alignable annotations without
+        time values, of the tiers already parsed.
+        :param tier_names: (list of str, function or None) Selection of the tiers
 
         """
-        # list of alignable annotations that are not saved in SPPAS because
-        # they don't have a localization. Their label is added to the closest
-        # time-aligned annotations.
-        removed_annotations = dict()
+        # The selected tiers and the parents they are referring to
+        required = set(parents)
+        if tier_names is not None:
+            required = set()
+            for tier_name in parents:
+                if self.is_selected_tier(tier_name, tier_names) is True:
+                    while tier_name is not None and tier_name not in required:
+                        required.add(tier_name)
+                        tier_name = parents.get(tier_name, None)
+            tier_roots = [t for t in tier_roots if t.attrib['TIER_ID'] in required]
+        for tier_root in tier_roots:
+            alignable[tier_root.attrib['TIER_ID']] = sppasEAF.__is_alignable_tier(tier_root)
 
         # We first parse only alignable tiers
-        for tier_root in root.findall('TIER'):
+        for tier_root in tier_roots:
             if sppasEAF.__is_alignable_tier(tier_root) == 2:
                 try:
                     tier = self._parse_tier(tier_root, time_slots, removed_annotations)
@@ -607,30 +847,55 @@ class sppasEAF(sppasBaseIO):
                     logging.error(f" ... failed to parse alignable TIER: {e}. Not loaded.")
 
         # We then parse alignable-ref tiers
-        for tier_root in root.findall('TIER'):
+        for tier_root in tier_roots:
             if sppasEAF.__is_alignable_tier(tier_root) == 1:
                 tier = self._parse_tier(tier_root, time_slots, removed_annotations)
                 logging.debug(f" ... successfully parsed alignable-ref TIER: {tier.get_name()}")
 
         # We then parse ref tiers
-        for tier_root in root.findall('TIER'):
+        for tier_root in tier_roots:
             if sppasEAF.__is_alignable_tier(tier_root) in [0, -1]:
                 tier = self._parse_tier(tier_root, time_slots, removed_annotations)
                 logging.debug(f" ... successfully parsed reference TIER: {tier.get_name()}")
 
+        # A tier is linked to its parent if the parent is parsed before it:
+        # the alignable tiers first, then the alignable-ref, then the ref ones.
+        tier_ids = [tier_name for tier_name in parents if tier_name in required]
+        ranks = dict()
+        for i, tier_name in enumerate(tier_ids):
+            ranks[tier_name] = (2 - max(alignable.get(tier_name, 2), 0), i)
+        for tier_name in sorted(tier_ids, key=lambda t: ranks[t]):
+            parent_tier_name = parents[tier_name]
+            if parent_tier_name not in ranks:
+                continue
+            if ranks[parent_tier_name] < ranks[tier_name]:
+                tier = self.find(tier_name)
+                parent_tier = self.find(parent_tier_name)
+                if tier is not None and parent_tier is not None:
+                    self.__fix_tiers_hierarchy(tier, parent_tier)
+
         # We have to re-organize tiers:
         # we restore the original rank of each tier
-        for i, tier_root in enumerate(root.findall('TIER')):
-            tier_name = tier_root.attrib['TIER_ID']
+        for i, tier_name in enumerate(tier_ids):
             self.set_tier_index(tier_name, i)
 
+        # and we remove the parents which were not selected
+        if tier_names is not None:
+            for i in reversed(range(len(self))):
+                if self.is_selected_tier(self[i].get_name(), tier_names) is False:
+                    self.pop(i)
+
     # -----------------------------------------------------------------------
 
-    def _parse_tier(self, tier_root, time_slots, removed_annotations=dict()):
+    def _parse_tier(self, tier_root, time_slots, removed_annotations=dict(),
+                    annotation_roots=None):
         """Get the element 'TIER' -> sppasTier().
 
         :param tier_root: (ET) Tier root.
-        :param time_slots: (dict)
+        :param time_slots: (dict or sppasEAFTimeSlots)
+        :param removed_annotations: (dict)
+        :param annotation_roots: (iterable) 'ANNOTATION' elements of the
+        tier or None to get the ones of tier_root.
 
         """
         # The name is used as identifier.
@@ -648,36 +913,37 @@ class sppasEAF(sppasBaseIO):
             self._parse_alignable_tier(tier_root,
                                        tier,
                                        time_slots,
-                                       removed_annotations)
+                                       removed_annotations,
+                                       annotation_roots)
         else:
             self._parse_ref_tier(tier_root,
                                  tier,
-                                 removed_annotations)
-
-        # hierarchy
-        if 'PARENT_REF' in tier_root.attrib:
-            parent_tier_name = tier_root.attrib['PARENT_REF']
-            parent_tier = self.find(parent_tier_name)
-            if parent_tier is not None:
-                self.__fix_tiers_hierarchy(tier, parent_tier)
+                                 removed_annotations,
+                                 annotation_roots)
 
         return tier
 
     # -----------------------------------------------------------------------
 
     def _parse_alignable_tier(self, tier_root, tier, time_slots,
-                              removed_annotations=dict()):
+                              removed_annotations=dict(),
+                              annotation_roots=None):
         """Get the elements 'TIER' -> sppasTier().
 
         :param tier_root: (ET) Tier root.
         :param tier: (sppasTier) The tier to add the annotation
-        :param time_slots: (dict)
+        :param time_slots: (dict or sppasEAFTimeSlots)
         :param removed_annotations: (dict) Alignable annotations
         without time values. key=id of the removed annotation,
         value=id of the aligned-annotation for which the removed one
         is attached (in the same tier).
+        :param annotation_roots: (iterable) 'ANNOTATION' elements of the
+        tier or None to get the ones of tier_root.
 
         """
+        if annotation_roots is None:
+            annotation_roots = tier_root.findall('ANNOTATION')
+
         # Some time slots don't have a time value, so some annotations do not
         # starts/ends at a given localization.
         # From the SPPAS opinion, it's not an annotation...
@@ -686,7 +952,7 @@ class sppasEAF(sppasBaseIO):
         text = list()
         removed = list()
 
-        for annotation_root in tier_root.findall('ANNOTATION'):
+        for annotation_root in annotation_roots:
 
             # In an alignable tier, we expect only alignable annotations
             align_ann_root = sppasEAF.__get_ann_root(
@@ -799,13 +1065,20 @@ class sppasEAF(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def _parse_ref_tier(self, tier_root, tier, removed_annotations=dict()):
+    def _parse_ref_tier(self, tier_root, tier, removed_annotations=dict(),
+                        annotation_roots=None):
         """Get the elements 'TIER'.
 
         :param tier_root: (ET) Tier root element.
         :param tier: (sppasTier) The tier to add the annotations
+        :param removed_annotations: (dict)
+        :param annotation_roots: (iterable) 'ANNOTATION' elements of the
+        tier or None to get the ones of tier_root.
 
         """
+        if annotation_roots is None:
+            annotation_roots = tier_root.findall('ANNOTATION')
+
         if 'PARENT_REF' in tier_root.attrib:
             # we expect that the parent tier has already been included in self
             parent_tier_ref = tier_root.attrib['PARENT_REF']
@@ -819,7 +1092,7 @@ class sppasEAF(sppasBaseIO):
                                  ''.format(tier.get_name()))
 
         # while we have the aligned parent, we can fill the child tier
-        for i, annotation_root in enumerate(tier_root.findall('ANNOTATION')):
+        for annotation_root in annotation_roots:
 
             ref_ann_root = sppasEAF.__get_ann_root(
                 annotation_root,
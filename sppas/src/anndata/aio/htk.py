@@ -55,9 +55,11 @@ from ..anndataexc import AioLocationTypeError
 from ..ann.annlocation import sppasLocation
 from ..ann.annlocation import sppasPoint
 from ..ann.annlocation import sppasInterval
+from ..ann.annotation import sppasAnnotation
 
 from .basetrsio import sppasBaseIO
 from .aioutils import load
+from .aioutils import extend_tier
 from .aioutils import serialize_labels
 from .aioutils import format_label
 
@@ -242,6 +244,7 @@ class sppasLab(sppasBaseHTK):
         """
         lines = load(filename)
         tier = self.create_tier('Trans-MLF')
+        annotations = list()
         text = ""
         prev_end = sppasBaseHTK.make_point(0)
 
@@ -254,7 +257,7 @@ class sppasLab(sppasBaseHTK):
             if has_begin and has_end:
                 if len(text) > 0:
                     time_interval = sppasInterval(prev_end, sppasBaseHTK.make_point(line[0]))
-                    tier.create_annotation(sppasLocation(time_interval), format_label(text))
+                    annotations.append(sppasAnnotation(sppasLocation(time_interval), format_label(text)))
 
                 time_interval = sppasInterval(sppasBaseHTK.make_point(line[0]), sppasBaseHTK.make_point(line[1]))
                 text_label = format_label(line[2])
@@ -266,7 +269,7 @@ class sppasLab(sppasBaseHTK):
                         # todo: auxiliary labels or comment
                         pass
 
-                tier.create_annotation(sppasLocation(time_interval), text_label)
+                annotations.append(sppasAnnotation(sppasLocation(time_interval), text_label))
                 text = ""
                 prev_end = sppasBaseHTK.make_point(line[1])
 
@@ -277,6 +280,8 @@ class sppasLab(sppasBaseHTK):
             else:
                 text = text + "\n" + " ".join(line)
 
+        extend_tier(tier, annotations)
+
     # -----------------------------------------------------------------------
 
     def write(self, filename):
@@ -62,10 +62,15 @@ from ..ann.annlocation import sppasInterval
 from ..ann.annlabel import sppasLabel
 from ..ann.annlabel import sppasTag
 from ..ann.annotation import sppasAnnotation
+from ..columnartier import sppasColumnarTier
 
 from .aioutils import fill_gaps
+from .aioutils import check_overlaps
+from .aioutils import format_point_to_float
 from .aioutils import merge_overlapping_annotations
 from .aioutils import load
+from .aioutils import extend_tier
+from .aioutils import sniff_encoding
 from .aioutils import format_labels
 from .aioutils import serialize_labels
 from .basetrsio import sppasBaseIO
@@ -230,7 +235,13 @@ class sppasBasePraat(sppasBaseIO):
         """Convert the annotation labels into a string."""
         text = serialize_labels(annotation.get_labels(),
                                 separator="\n", empty="", alt=True)
+        return sppasBasePraat._serialize_text(text)
 
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _serialize_text(text):
+        """Convert a text into a string, with Praat double quotes."""
         if '"' in text:
             text = re.sub('([^"])["]([^"])', '\\1""\\2', text)
 
@@ -301,6 +312,10 @@ class sppasTextGrid(sppasBasePraat):
 
     """
 
+    # Items of a line: a double-quote starting a text, an index between
+    # brackets, a comment, or any other sequence of characters.
+    __ITEM = re.compile(r'"|\[[^\]]*\]?|!.*|[^\s"\[!]+')
+
     @staticmethod
     def _detect(fp):
         line = fp.readline()
@@ -315,8 +330,8 @@ class sppasTextGrid(sppasBasePraat):
     def detect(filename):
         """Check whether a file is of TextGrid format or not.
 
-        Try first to open the file with the default sppas encoding,
-        then UTF-16.
+        The encoding of the file is sniffed from its first bytes: either
+        the default sppas encoding or UTF-16.
 
         :param filename: (str) Name of the file to check.
         :returns: (bool)
@@ -324,16 +339,11 @@ class sppasTextGrid(sppasBasePraat):
         """
         detected = False
         try:
-            with codecs.open(filename, 'r', sg.__encoding__) as fp:
+            with codecs.open(filename, 'r', sniff_encoding(filename)) as fp:
                 detected = sppasTextGrid._detect(fp)
                 fp.close()
         except UnicodeError:
-            try:
-                with codecs.open(filename, 'r', 'UTF-16') as fp:
-                    detected = sppasTextGrid._detect(fp)
-                    fp.close()
-            except UnicodeError:
-                return False
+            return False
         except IOError:
             pass
 
@@ -355,183 +365,257 @@ class sppasTextGrid(sppasBasePraat):
 
         self._accept_point = True
         self._accept_interval = True
+        self._accept_columnar = True
+        self._accept_tier_selection = True
 
     # -----------------------------------------------------------------------
 
-    def read(self, filename):
+    def read(self, filename, tier_names=None):
         """Read a TextGrid file.
 
+        The file is parsed while its lines are read: they are not loaded
+        into memory. The annotations of the tiers which are not selected
+        are not created.
+
         :param filename: is the input file name, ending by ".TextGrid"
+        :param tier_names: (list of str, function or None) Selection of the
+        tiers to read. See sppasBaseIO.is_selected_tier().
 
         """
         if not self.detect(filename):
             raise IOError('{:s} is not of the expected {:s} format.'
                           ''.format(filename, self.default_extension))
 
-        # Get the content of the file
+        encoding = sniff_encoding(filename)
+        if encoding.upper().startswith("UTF-16"):
+            logging.warning("The file {:s} is UTF-16 encoding but UTF-8 was expected."
+                            "".format(filename))
+            logging.warning("You should consider 1/ to convert it and "
+                            "2/ to fix Praat preferences to the appropriate write setting.")
+
         try:
-            lines = load(filename, sg.__encoding__)
-        except AioEncodingError:
-            try:
-                lines = load(filename, "UTF-16")
-                logging.warning("The file {:s} is UTF-16 encoding but UTF-8 was expected."
-                                "".format(filename))
-                logging.warning("You should consider 1/ to convert it and "
-                                "2/ to fix Praat preferences to the appropriate write setting.")
-            except AioEncodingError:
-                raise AioEncodingError(filename, "", sg.__encoding__)
-
-        # Check if supported TextGrid format
-        if "chronological" in lines[0].lower():
-            raise NotImplementedError("The chronological TextGrid files are not supported by SPPAS "
-                                      "and they probably never won't. You have to convert the file "
-                                      "{:s} into a normal TextGrid file.".format(filename))
-
-        # Parse the header of the file
-        if len(lines[2].strip()) == 0:
-            has_blank = 1
-        else:
-            has_blank = 0
+            with open(filename, 'r', encoding=encoding) as fp:
+                values = sppasTextGrid._tokenize(fp)
+
+                # Check if supported TextGrid format
+                number, file_type = sppasTextGrid._next_value(values, is_text=True)
+                if "chronological" in file_type.lower():
+                    raise NotImplementedError("The chronological TextGrid files are not supported by SPPAS "
+                                              "and they probably never won't. You have to convert the file "
+                                              "{:s} into a normal TextGrid file.".format(filename))
+
+                # Parse the header of the file: object class, xmin, xmax, size
+                sppasTextGrid._next_value(values, is_text=True)
+                sppasTextGrid._next_value(values)
+                sppasTextGrid._next_value(values)
+                number, value = sppasTextGrid._next_value(values)
+                size = sppasBasePraat._parse_int(value, number)
+
+                # Parse the tiers of the file
+                for i in range(size):
+                    self._parse_tier(values, tier_names)
 
-        # If the size isn't named, it is a short TextGrid file
-        is_long = not lines[5+has_blank].strip().isdigit()
+        except UnicodeDecodeError:
+            raise AioEncodingError(filename, "", encoding)
 
-        last_line = len(lines) - 1
-        cur_line = 6 + has_blank
-        if is_long is True:
-            # Ignore the line 'item []:'
-            cur_line += 1
+    # -----------------------------------------------------------------------
 
-        # Parse all lines of the file
-        while cur_line < last_line:
-            # Ignore the line: 'item [1]:'
-            # with the tier number between the brackets
-            if is_long is True:
-                cur_line += 1
-            cur_line = self._parse_tier(lines, cur_line, is_long)
+    @staticmethod
+    def _tokenize(lines):
+        """Generate the values of a TextGrid from its lines.
+
+        Both the long and the short forms of TextGrid files are made of
+        the same sequence of values: texts between double-quotes, which
+        can be written on several lines, numbers and flags like <exists>.
+        The keys of the long form, the indexes between brackets and the
+        comments are ignored.
+
+        :param lines: (iterable of str) Lines of a TextGrid, like an opened file
+        :returns: Generator of tuples (line number, value, is_text). The
+        last one is (line number, None, False) at the end of the lines.
+        :raises: AioLineFormatError: a text is not closed
+
+        """
+        number = 0
+        text = None
+        text_number = 0
+        for number, line in enumerate(lines, 1):
+            line = line.rstrip("\r\n")
+            pos = 0
+
+            # Continue a text started on a previous line
+            if text is not None:
+                end = sppasTextGrid.__find_text_end(line, 0)
+                if end == -1:
+                    text.append(line)
+                    continue
+                text.append(line[:end])
+                yield text_number, "\n".join(text).replace('""', '"'), True
+                text = None
+                pos = end + 1
+
+            # Most of the lines are a number or a key with a number
+            elif '"' not in line and '[' not in line and '!' not in line:
+                for value in line.split():
+                    if value[0] in "0123456789-+.<":
+                        yield number, value, False
+                continue
+
+            item = sppasTextGrid.__ITEM.search(line, pos)
+            while item is not None:
+                value = item.group(0)
+                pos = item.end()
+                if value == '"':
+                    end = sppasTextGrid.__find_text_end(line, pos)
+                    if end == -1:
+                        text = [line[pos:]]
+                        text_number = number
+                        break
+                    yield number, line[pos:end].replace('""', '"'), True
+                    pos = end + 1
+                elif value[0] in "0123456789-+.<":
+                    yield number, value, False
+                item = sppasTextGrid.__ITEM.search(line, pos)
+
+        if text is not None:
+            raise AioLineFormatError(text_number, text[0])
+        yield number, None, False
 
     # -----------------------------------------------------------------------
 
-    def _parse_tier(self, lines, start_line, is_long):
-        """Parse a tier from the content of a TextGrid file.
+    @staticmethod
+    def _next_value(values, is_text=False):
+        """Return the next number or the next text of the values.
 
-        :param lines: the contents of the file.
-        :param start_line: index in lines when the tier content starts.
-        :param is_long: (bool) False if the TextGrid is in short form.
-        :returns: (int) Number of lines of this tier
+        The flags are ignored.
+
+        :param values: (generator) Values of a TextGrid, see _tokenize()
+        :param is_text: (bool) The expected value is a text
+        :returns: (tuple) line number, value
+        :raises: AioLineFormatError: unexpected value or end of the values
 
         """
-        # Parse the header of the tier
-        tier_type = sppasBasePraat._parse_string(lines[start_line])
-        tier_name = sppasBasePraat._parse_string(lines[start_line+1])
-        tier_size = sppasBasePraat._parse_int(lines[start_line+4])
-        tier = self.create_tier(tier_name)
+        number = 0
+        for number, value, text in values:
+            if value is None:
+                raise AioLineFormatError(number, "")
+            if text is False and value.startswith("<"):
+                continue
+            if text is is_text:
+                return number, value
+            raise AioLineFormatError(number, value)
+
+        raise AioLineFormatError(number, "")
+
+    # -----------------------------------------------------------------------
+
+    def _parse_tier(self, values, tier_names=None):
+        """Parse a tier from the values of a TextGrid file.
+
+        :param values: (generator) Values of a TextGrid, see _tokenize()
+        :param tier_names: (list of str, function or None) Selection of the tiers to create
+        :returns: (sppasTier) the created tier or None if it was skipped
 
+        """
+        # Parse the header of the tier
+        number, tier_type = sppasTextGrid._next_value(values, is_text=True)
         if tier_type == "IntervalTier":
             is_interval = True
         elif tier_type == "TextTier":
             is_interval = False
         else:
-            raise AioLineFormatError(start_line+1, lines[start_line])
+            raise AioLineFormatError(number, tier_type)
+
+        number, tier_name = sppasTextGrid._next_value(values, is_text=True)
+        sppasTextGrid._next_value(values)
+        sppasTextGrid._next_value(values)
+        number, value = sppasTextGrid._next_value(values)
+        tier_size = sppasBasePraat._parse_int(value, number)
+
+        # Skip the content of an unselected tier
+        if self.is_selected_tier(tier_name, tier_names) is False:
+            for i in range(tier_size):
+                if is_interval is True:
+                    sppasTextGrid._next_value(values)
+                sppasTextGrid._next_value(values)
+                sppasTextGrid._next_value(values, is_text=True)
+            return None
 
         # Parse the content of the tier
-        start_line += 5
-        end = len(lines) - 1
-
-        while start_line < end and len(tier) < tier_size:
-            # Ignore the line: 'intervals [1]:'
-            # with the interval number between the brackets
-            if is_long is True:
-                start_line += 1
-            ann, start_line = self._parse_annotation(lines,
-                                                     start_line,
-                                                     is_interval)
-            tier.add(ann)
+        tier = self.create_tier(tier_name)
+        annotations = [sppasTextGrid._parse_annotation(values, is_interval)
+                       for i in range(tier_size)]
+        extend_tier(tier, annotations)
 
-        return start_line
+        return tier
 
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def _parse_annotation(lines, start_line, is_interval):
-        """Read an annotation from an IntervalTier in the content of lines.
+    def _parse_annotation(values, is_interval):
+        """Parse an annotation from the values of a TextGrid file.
 
-        :param lines: (list) the contents of the file.
-        :param start_line: (int) index in lines when the tier content starts.
+        :param values: (generator) Values of a TextGrid, see _tokenize()
         :param is_interval: (bool)
-        :returns: number of lines for this annotation in the file
+        :returns: (sppasAnnotation)
 
         """
-        # Parse the localization
-        localization, start_line = \
-            sppasTextGrid._parse_localization(lines, start_line, is_interval)
-        if start_line >= len(lines):
-            raise AioLineFormatError(start_line - 1, lines[-1])
-
-        # Parse the tag
-        labels, start_line = \
-            sppasTextGrid._parse_text(lines, start_line)
+        localization = sppasTextGrid._parse_localization(values, is_interval)
+        labels = sppasTextGrid._parse_text(values)
 
-        ann = sppasAnnotation(sppasLocation(localization),
-                              labels)
-
-        return ann, start_line
+        return sppasAnnotation(sppasLocation(localization), labels)
 
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def _parse_localization(lines, start_line, is_interval):
+    def _parse_localization(values, is_interval):
         """Parse the localization (point or interval)."""
-        midpoint = sppasBasePraat._parse_float(lines[start_line], start_line+1)
-        start_line += 1
+        number, value = sppasTextGrid._next_value(values)
+        midpoint = sppasTextGrid.__to_float(value, number)
         if is_interval is True:
-            if start_line >= len(lines):
-                raise AioLineFormatError(start_line-1, lines[-1])
-            end = sppasBasePraat._parse_float(lines[start_line], start_line+1)
-            start_line += 1
-            localization = sppasInterval(sppasBasePraat.make_point(midpoint),
-                                         sppasBasePraat.make_point(end))
-        else:
-            localization = sppasBasePraat.make_point(midpoint)
+            number, value = sppasTextGrid._next_value(values)
+            end = sppasTextGrid.__to_float(value, number)
+            return sppasInterval(sppasBasePraat.make_point(midpoint),
+                                 sppasBasePraat.make_point(end))
 
-        return localization, start_line
+        return sppasBasePraat.make_point(midpoint)
 
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def _parse_text(lines, start_line):
+    def _parse_text(values):
         """Parse the text entry. Returns a list of sppasLabel().
 
         text can be on several lines.
         we save each line in an individual label.
 
         """
-        # read one line
-        line = lines[start_line].strip()
+        number, text = sppasTextGrid._next_value(values, is_text=True)
+        return format_labels(text, separator="\n")
 
-        # The text can starts with a carriage return... so line is:
-        # text = "
-        first = line.find('"')
-        last = line.rfind('"')
+    # -----------------------------------------------------------------------
 
-        # parse this line
-        text = sppasBasePraat._parse_string(line)
-        start_line += 1
+    @staticmethod
+    def __to_float(value, line_number):
+        """Return the float of a number value of a TextGrid."""
+        try:
+            return float(value)
+        except ValueError:
+            raise AioLineFormatError(line_number, value)
 
-        # if the text continue on the following lines
-        while first == last:   # line.endswith('"') is False:
-            line = lines[start_line].strip()
-            first = line.find('"')
-            last = line.rfind('"')
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __find_text_end(line, start):
+        """Return the index of the double-quote closing a text, or -1.
 
-            text += "\n" + sppasBasePraat._parse_string(line)
-            start_line += 1
-            if line.endswith('"'):
-                break
-            if start_line >= len(lines):
-                raise AioLineFormatError(start_line-1, lines[-1])
+        Double-quotes are doubled inside a text.
 
-        return format_labels(text, separator="\n"), start_line
+        """
+        end = line.find('"', start)
+        while end != -1 and line.startswith('"', end + 1):
+            end = line.find('"', end + 2)
+        return end
 
     # -----------------------------------------------------------------------
     # Writer
@@ -571,15 +655,28 @@ class sppasTextGrid(sppasBasePraat):
                 if tier.is_disjoint() is True:
                     continue
 
-                # intervals of annotations must be in a continuum
+                if isinstance(tier, sppasColumnarTier) is True:
+                    sppasTextGrid._write_columnar_tier(fp, tier, i+1,
+                                                       min_time_point.get_midpoint(),
+                                                       max_time_point.get_midpoint())
+                    continue
+
+                # intervals of annotations must be in a continuum: the gaps
+                # are filled while writing if the tier is not overlapping.
+                if tier.is_interval() is True and check_overlaps(tier) is False:
+                    sppasTextGrid._write_interval_tier(fp, tier, i+1,
+                                                       min_time_point,
+                                                       max_time_point)
+                    continue
+
                 # (this won't do anything if it's not necessary...)
                 new_tier = fill_gaps(tier, min_time_point, max_time_point)
                 new_tier = merge_overlapping_annotations(new_tier)
 
                 # Write the header of the tier
                 try:
-                    fp.write(sppasTextGrid._serialize_tier_header(new_tier,
-                                                                  i+1))
+                    content = [sppasTextGrid._serialize_tier_header(new_tier,
+                                                                    i+1)]
                 except:
                     fp.close()
                     raise
@@ -588,11 +685,12 @@ class sppasTextGrid(sppasBasePraat):
                 is_point = new_tier.is_point()
                 for a, annotation in enumerate(new_tier):
                     if is_point is True:
-                        fp.write(sppasTextGrid._serialize_point_annotation(
+                        content.append(sppasTextGrid._serialize_point_annotation(
                             annotation, a+1))
                     else:
-                        fp.write(sppasTextGrid._serialize_interval_annotation(
+                        content.append(sppasTextGrid._serialize_interval_annotation(
                             annotation, a+1))
+                fp.write("".join(content))
 
             fp.close()
 
@@ -618,16 +716,27 @@ class sppasTextGrid(sppasBasePraat):
         if len(tier) == 0:
             raise AioEmptyTierError("TextGrid", tier.get_name())
 
+        return sppasTextGrid._format_tier_header(
+            tier_number,
+            tier.get_name(),
+            tier.is_interval(),
+            tier.get_first_point().get_midpoint(),
+            tier.get_last_point().get_midpoint(),
+            len(tier))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _format_tier_header(tier_number, name, is_interval, xmin, xmax, size):
+        """Create the string with the header for a new tier from its values."""
         content = '\titem [{:d}]:\n'.format(tier_number)
         content += '\t\tclass = "{:s}"\n'.format('IntervalTier'
-                                                 if tier.is_interval()
+                                                 if is_interval
                                                  else 'TextTier')
-        content += '\t\tname = "{:s}"\n'.format(tier.get_name())
-        content += '\t\txmin = {}\n'.format(
-            tier.get_first_point().get_midpoint())
-        content += '\t\txmax = {}\n'.format(
-            tier.get_last_point().get_midpoint())
-        content += '\t\tintervals: size = {:d}\n'.format(len(tier))
+        content += '\t\tname = "{:s}"\n'.format(name)
+        content += '\t\txmin = {}\n'.format(xmin)
+        content += '\t\txmax = {}\n'.format(xmax)
+        content += '\t\tintervals: size = {:d}\n'.format(size)
         return content
 
     # -----------------------------------------------------------------------
@@ -653,6 +762,104 @@ class sppasTextGrid(sppasBasePraat):
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def _write_columnar_tier(fp, tier, tier_number, min_time, max_time):
+        """Write a columnar tier, without creating its annotations.
+
+        Like with a sppasTier, the gaps are filled by un-labelled intervals,
+        from min_time to max_time. Annotations of a columnar tier can't be
+        overlapping.
+
+        :param fp: (file) Stream to write into
+        :param tier: (sppasColumnarTier)
+        :param tier_number: (int) the index of the tier in the file + 1.
+        :param min_time: (float) Begin of the first interval
+        :param max_time: (float) End of the last interval
+
+        """
+        if tier.is_point() is True:
+            fp.write(sppasTextGrid._format_tier_header(
+                tier_number, tier.get_name(), False,
+                tier.get_begin(0), tier.get_end(len(tier) - 1), len(tier)))
+            for a, row in enumerate(tier.rows()):
+                text = sppasBasePraat._serialize_text(row[4] or "")
+                content = '\t\t\tpoints [{:d}]:\n'.format(a + 1)
+                content += '\t\t\ttime = {}\n'.format(row[0])
+                content += text.replace("text =", "mark =")
+                fp.write(u(content))
+            return
+
+        # Fix the intervals to be written, including the gaps
+        intervals = list()
+        prev_end = min_time
+        for begin, _, end, _, text, _ in tier.rows():
+            if begin > prev_end:
+                intervals.append((prev_end, begin, ""))
+            intervals.append((begin, end, text or ""))
+            prev_end = end
+        if prev_end < max_time or len(intervals) == 0:
+            intervals.append((prev_end, max_time, ""))
+
+        fp.write(sppasTextGrid._format_tier_header(
+            tier_number, tier.get_name(), True,
+            intervals[0][0], intervals[-1][1], len(intervals)))
+        for a, (begin, end, text) in enumerate(intervals):
+            content = '\t\tintervals [{:d}]:\n'.format(a + 1)
+            content += '\t\t\txmin = {}\n'.format(begin)
+            content += '\t\t\txmax = {}\n'.format(end)
+            content += sppasBasePraat._serialize_text(text)
+            fp.write(u(content))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _write_interval_tier(fp, tier, tier_number, min_point, max_point):
+        """Write a tier of not overlapping intervals and fill its gaps.
+
+        The un-labelled intervals of the gaps are serialized while iterating
+        over the annotations, like fill_gaps() would have created them, so
+        that the tier is not copied. The content of the tier is written all
+        at once.
+
+        :param fp: (file) Stream to write into
+        :param tier: (sppasTier) A not empty tier of not overlapping intervals
+        :param tier_number: (int) the index of the tier in the file + 1.
+        :param min_point: (sppasPoint) Begin of the first interval
+        :param max_point: (sppasPoint) End of the last interval
+
+        """
+        # Fix the intervals to be written, including the gaps
+        intervals = list()
+        first_point = tier.get_first_point()
+        if format_point_to_float(first_point) > format_point_to_float(min_point):
+            intervals.append((min_point, first_point, None))
+        prev_end = None
+        for annotation in tier:
+            begin = annotation.get_lowest_localization()
+            if prev_end is not None and prev_end < begin:
+                intervals.append((prev_end, begin, None))
+            prev_end = annotation.get_highest_localization()
+            intervals.append((begin, prev_end, annotation))
+        if format_point_to_float(prev_end) < format_point_to_float(max_point):
+            intervals.append((prev_end, max_point, None))
+
+        content = [sppasTextGrid._format_tier_header(
+            tier_number, tier.get_name(), True,
+            intervals[0][0].get_midpoint(), intervals[-1][1].get_midpoint(),
+            len(intervals))]
+        empty_text = sppasBasePraat._serialize_text("")
+        for a, (begin, end, annotation) in enumerate(intervals):
+            content.append('\t\tintervals [{:d}]:\n'.format(a + 1))
+            content.append('\t\t\txmin = {}\n'.format(begin.get_midpoint()))
+            content.append('\t\t\txmax = {}\n'.format(end.get_midpoint()))
+            if annotation is None:
+                content.append(empty_text)
+            else:
+                content.append(sppasBasePraat._serialize_labels_text(annotation))
+        fp.write(u("".join(content)))
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def _serialize_point_annotation(annotation, number):
         """Convert an annotation consisting of points to the TextGrid format.
@@ -706,6 +913,7 @@ class sppasBaseNumericalTier(sppasBasePraat):
         self._accept_radius = False
         self._accept_gaps = False
         self._accept_overlaps = False
+        self._accept_columnar = True
 
     # -----------------------------------------------------------------------
 
@@ -730,6 +938,7 @@ class sppasBaseNumericalTier(sppasBasePraat):
         is_long = not lines[5].strip().isdigit()
 
         # parse all lines of the file
+        annotations = list()
         while cur_line < last_line:
             # Ignore the line: 'points [1]:'
             if is_long:
@@ -749,10 +958,12 @@ class sppasBaseNumericalTier(sppasBasePraat):
             value = sppasBasePraat._parse_float(lines[cur_line], cur_line + 1)
             tag = sppasTag(value, tag_type="float")
 
-            tier.create_annotation(sppasLocation(localization),
-                                   sppasLabel(tag))
+            annotations.append(sppasAnnotation(sppasLocation(localization),
+                                               sppasLabel(tag)))
             cur_line += 1
 
+        extend_tier(tier, annotations)
+
     # -----------------------------------------------------------------------
 
     def _write(self, filename, file_type):
@@ -796,6 +1007,11 @@ class sppasBaseNumericalTier(sppasBasePraat):
                 "points: size = {:d}\n".format(len(tier)))
 
             # Write the annotations
+            if isinstance(tier, sppasColumnarTier) is True:
+                sppasBaseNumericalTier._write_columnar_points(fp, tier)
+                fp.close()
+                return
+
             for a, annotation in enumerate(tier):
 
                 content = 'points [{:d}]:\n'.format(a+1)
@@ -807,6 +1023,32 @@ class sppasBaseNumericalTier(sppasBasePraat):
 
             fp.close()
 
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _write_columnar_points(fp, tier):
+        """Write the points of a columnar tier, without creating them.
+
+        :param fp: (file) Stream to write into
+        :param tier: (sppasColumnarTier)
+
+        """
+        tag_type = tier.get_tag_type()
+        if tag_type not in ('int', 'float'):
+            logging.error("The annotation label is of type {:s}. "
+                          "It can't be saved into the expected file format."
+                          "".format(tag_type))
+            raise AioFormatError(tag_type)
+        value_type = int if tag_type == "int" else float
+
+        for a, row in enumerate(tier.rows()):
+            if row[4] is None:
+                raise TagValueError('None')
+            content = 'points [{:d}]:\n'.format(a+1)
+            content += '\tnumber = {}\n'.format(row[0])
+            content += "\tvalue = {}\n".format(value_type(row[4]))
+            fp.write(content)
+
 # ---------------------------------------------------------------------------
 
 
@@ -42,7 +42,9 @@
 from __future__ import annotations
 import logging
 import os
+import importlib
 from collections import OrderedDict
+from collections.abc import Mapping
 
 from sppas.core.coreutils import IOExtensionError
 from sppas.core.coreutils import u
@@ -51,30 +53,208 @@ from sppas.src.utils.datatype import sppasTime
 from ..anndataexc import AioEncodingError
 from ..anndataexc import AioError
 
-from .text import sppasRawText
-from .text import sppasCSV
-from .sclite import sppasCTM
-from .sclite import sppasSTM
-from .xtrans import sppasTDF
-from .praat import sppasTextGrid
-from .praat import sppasPitchTier
-from .praat import sppasIntensityTier
-from .phonedit import sppasMRK
-from .phonedit import sppasSignaix
-from .htk import sppasLab
-from .subtitle import sppasSubRip
-from .subtitle import sppasSubViewer
-from .subtitle import sppasWebVTT
-from .table import sppasTRA
-from .table import sppasARFF
-from .table import sppasXRFF
-from .transcriber import sppasTRS
-from .audacity import sppasAudacity
-from .anvil import sppasAnvil
-from .elan import sppasEAF
-from .annotationpro import sppasANT
-from .annotationpro import sppasANTX
-from .xra import sppasXRA
+# ---------------------------------------------------------------------------
+# The supported file formats.
+# Each extension is associated to the module and the name of its class, and
+# to the properties of the format, so that the modules are imported only
+# when a file is read or written.
+# ---------------------------------------------------------------------------
+
+TRS_FORMATS = OrderedDict()
+
+# ANNOT
+TRS_FORMATS["xra"] = dict(module="xra", name="sppasXRA", software="SPPAS4", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["TextGrid"] = dict(module="praat", name="sppasTextGrid", software="Praat", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["anvil"] = dict(module="anvil", name="sppasAnvil", software="Anvil", trs_type="ANNOT", reader=True, writer=False)
+TRS_FORMATS["eaf"] = dict(module="elan", name="sppasEAF", software="Elan", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["ant"] = dict(module="annotationpro", name="sppasANT", software="AnnotationPro", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["antx"] = dict(module="annotationpro", name="sppasANTX", software="AnnotationPro", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["trs"] = dict(module="transcriber", name="sppasTRS", software="Transcriber", trs_type="ANNOT", reader=True, writer=False)
+TRS_FORMATS["mrk"] = dict(module="phonedit", name="sppasMRK", software="Phonedit", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["hz"] = dict(module="phonedit", name="sppasSignaix", software="Und", trs_type="MEASURE", reader=True, writer=True)
+TRS_FORMATS["lab"] = dict(module="htk", name="sppasLab", software="HTK", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["srt"] = dict(module="subtitle", name="sppasSubRip", software="SubRip", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["sub"] = dict(module="subtitle", name="sppasSubViewer", software="SubViewer", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["vtt"] = dict(module="subtitle", name="sppasWebVTT", software="Subs for Web", trs_type="ANNOT", reader=False, writer=True)
+TRS_FORMATS["ctm"] = dict(module="sclite", name="sppasCTM", software="SCTK", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["stm"] = dict(module="sclite", name="sppasSTM", software="SCTK", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["aup"] = dict(module="audacity", name="sppasAudacity", software="Audacity", trs_type="ANNOT", reader=True, writer=False)
+TRS_FORMATS["tdf"] = dict(module="xtrans", name="sppasTDF", software="Xtrans", trs_type="ANNOT", reader=True, writer=False)
+TRS_FORMATS["csv"] = dict(module="text", name="sppasCSV", software="", trs_type="ANNOT", reader=True, writer=True)
+TRS_FORMATS["txt"] = dict(module="text", name="sppasRawText", software="", trs_type="ANNOT", reader=True, writer=True)
+# TABLE
+TRS_FORMATS["tra"] = dict(module="table", name="sppasTRA", software="SPPAS4", trs_type="TABLE", reader=False, writer=True)
+TRS_FORMATS["arff"] = dict(module="table", name="sppasARFF", software="weka", trs_type="TABLE", reader=False, writer=True)
+TRS_FORMATS["xrff"] = dict(module="table", name="sppasXRFF", software="none", trs_type="TABLE", reader=False, writer=True)
+# MEASURE
+TRS_FORMATS["IntensityTier"] = dict(module="praat", name="sppasIntensityTier", software="Praat", trs_type="MEASURE", reader=True, writer=True)
+TRS_FORMATS["PitchTier"] = dict(module="praat", name="sppasPitchTier", software="Praat", trs_type="MEASURE", reader=True, writer=True)
+
+# ---------------------------------------------------------------------------
+
+
+class sppasTrsTypes(Mapping):
+    """A dictionary to associate a file extension and a class to instantiate.
+
+    The module of a class is imported the first time the class is requested.
+
+    :example:
+    >>> types = sppasTrsTypes(TRS_FORMATS)
+    >>> "xra" in types
+    True
+    >>> types["xra"]
+    <class 'sppas.src.anndata.aio.xra.sppasXRA'>
+
+    """
+
+    def __init__(self, formats):
+        """Create a sppasTrsTypes instance.
+
+        :param formats: (OrderedDict) Properties of each extension, including
+        the 'module' name in this package and the 'name' of the class.
+
+        """
+        self.__formats = formats
+        self.__classes = dict()
+
+    # -----------------------------------------------------------------------
+
+    def get_property(self, extension, name, default=None):
+        """Return a property of the format of an extension.
+
+        Nothing is imported.
+
+        :param extension: (str) An extension, as given by keys()
+        :param name: (str) Name of the property: software, trs_type, reader...
+        :param default: Value to return if the extension or the property is unknown
+        :returns: Value of the property
+
+        """
+        return self.__formats.get(extension, dict()).get(name, default)
+
+    # -----------------------------------------------------------------------
+
+    def __getitem__(self, extension):
+        trs_class = self.__classes.get(extension, None)
+        if trs_class is None:
+            properties = self.__formats[extension]
+            module = importlib.import_module("." + properties["module"],
+                                             package=__package__)
+            trs_class = getattr(module, properties["name"])
+            self.__classes[extension] = trs_class
+        return trs_class
+
+    # -----------------------------------------------------------------------
+
+    def __iter__(self):
+        return iter(self.__formats)
+
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__formats)
+
+# ---------------------------------------------------------------------------
+
+
+class sppasTrsCache(object):
+    """The transcriptions written into files, to be handed off to a read.
+
+    A transcription is stored with the inode, the modification time and
+    the size of the file it was written into. It is given to the next read
+    of the file only if the file was not modified since it was written,
+    then it is removed: the next reads of the file are parsing it. The
+    reader gets a copy of the written transcription.
+
+    The transcription must not be modified after it was written.
+
+    >>> cache = sppasTrsCache()
+    >>> sppasTrsRW.set_cache(cache)
+    >>> sppasTrsRW("file-syll.xra").write(trs)
+    >>> trs = sppasTrsRW("file-syll.xra").read()  # the file is not parsed
+
+    """
+
+    def __init__(self, max_size=32):
+        """Create a sppasTrsCache instance.
+
+        :param max_size: (int) Max number of stored transcriptions
+
+        """
+        self.__max_size = max(1, int(max_size))
+        self.__trs = OrderedDict()
+
+    # -----------------------------------------------------------------------
+
+    def add(self, filename, trs):
+        """Store the transcription which was just written into a file.
+
+        :param filename: (str) Name of the written file
+        :param trs: (sppasBaseIO) The reader-writer which wrote the file
+
+        """
+        key = os.path.abspath(filename)
+        stat = os.stat(key)
+
+        # The tiers of a transcription can be written into several files.
+        tiers = set(id(tier) for tier in trs)
+        for other in list(self.__trs.keys()):
+            if tiers.intersection(self.__trs[other][2]):
+                del self.__trs[other]
+
+        self.__trs[key] = (sppasTrsCache.__get_stamp(stat), trs, tiers)
+        while len(self.__trs) > self.__max_size:
+            self.__trs.popitem(last=False)
+
+    # -----------------------------------------------------------------------
+
+    def pop(self, filename):
+        """Remove and return the transcription written into a file.
+
+        :param filename: (str) Name of the file to read
+        :returns: (sppasBaseIO) or None if the file was modified or unknown
+
+        """
+        entry = self.__trs.pop(os.path.abspath(filename), None)
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        if sppasTrsCache.__get_stamp(stat) != entry[0]:
+            return None
+
+        return entry[1]
+
+    # -----------------------------------------------------------------------
+
+    def discard(self, filename):
+        """Remove the transcription written into a file, if any.
+
+        :param filename: (str) Name of the file to be written
+
+        """
+        self.__trs.pop(os.path.abspath(filename), None)
+
+    # -----------------------------------------------------------------------
+
+    def clear(self):
+        """Remove all the stored transcriptions."""
+        self.__trs.clear()
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __get_stamp(stat):
+        """Return what identifies a version of a file from its stat."""
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__trs)
 
 # ---------------------------------------------------------------------------
 
@@ -86,35 +266,53 @@ class sppasTrsRW(object):
 
     """
     # A dictionary to associate a file extension and a class to instantiate.
-    TRANSCRIPTION_TYPES = OrderedDict()
-
-    # ANNOT
-    TRANSCRIPTION_TYPES[sppasXRA().default_extension] = sppasXRA
-    TRANSCRIPTION_TYPES[sppasTextGrid().default_extension] = sppasTextGrid
-    TRANSCRIPTION_TYPES[sppasAnvil().default_extension] = sppasAnvil
-    TRANSCRIPTION_TYPES[sppasEAF().default_extension] = sppasEAF
-    TRANSCRIPTION_TYPES[sppasANT().default_extension] = sppasANT
-    TRANSCRIPTION_TYPES[sppasANTX().default_extension] = sppasANTX
-    TRANSCRIPTION_TYPES[sppasTRS().default_extension] = sppasTRS
-    TRANSCRIPTION_TYPES[sppasMRK().default_extension] = sppasMRK
-    TRANSCRIPTION_TYPES[sppasSignaix().default_extension] = sppasSignaix
-    TRANSCRIPTION_TYPES[sppasLab().default_extension] = sppasLab
-    TRANSCRIPTION_TYPES[sppasSubRip().default_extension] = sppasSubRip
-    TRANSCRIPTION_TYPES[sppasSubViewer().default_extension] = sppasSubViewer
-    TRANSCRIPTION_TYPES[sppasWebVTT().default_extension] = sppasWebVTT
-    TRANSCRIPTION_TYPES[sppasCTM().default_extension] = sppasCTM
-    TRANSCRIPTION_TYPES[sppasSTM().default_extension] = sppasSTM
-    TRANSCRIPTION_TYPES[sppasAudacity().default_extension] = sppasAudacity
-    TRANSCRIPTION_TYPES[sppasTDF().default_extension] = sppasTDF
-    TRANSCRIPTION_TYPES[sppasCSV().default_extension] = sppasCSV
-    TRANSCRIPTION_TYPES[sppasRawText().default_extension] = sppasRawText
-    # TABLE
-    TRANSCRIPTION_TYPES[sppasTRA().default_extension] = sppasTRA
-    TRANSCRIPTION_TYPES[sppasARFF().default_extension] = sppasARFF
-    TRANSCRIPTION_TYPES[sppasXRFF().default_extension] = sppasXRFF
-    # MEASURE
-    TRANSCRIPTION_TYPES[sppasIntensityTier().default_extension] = sppasIntensityTier
-    TRANSCRIPTION_TYPES[sppasPitchTier().default_extension] = sppasPitchTier
+    TRANSCRIPTION_TYPES = sppasTrsTypes(TRS_FORMATS)
+
+    # The lists of extensions matching a property, when once requested.
+    __EXTENSIONS = dict()
+
+    # The written transcriptions to be handed off to the reads, if any.
+    __CACHE = None
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def set_cache(cache=None):
+        """Set the cache of the written transcriptions, or disable it.
+
+        When a cache is set, the transcriptions written by the reader-writers
+        supporting it are stored, and the next read of their file returns
+        them without parsing the file.
+
+        :param cache: (sppasTrsCache or None)
+
+        """
+        sppasTrsRW.__CACHE = cache
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_cache():
+        """Return the cache of the written transcriptions or None."""
+        return sppasTrsRW.__CACHE
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __extensions_with(name, value) -> list:
+        """Return the list of extensions with the given property value.
+
+        :param name: (str) Name of the property of the format
+        :param value: Expected value of the property
+
+        """
+        key = (name, value)
+        if key not in sppasTrsRW.__EXTENSIONS:
+            types = sppasTrsRW.TRANSCRIPTION_TYPES
+            sppasTrsRW.__EXTENSIONS[key] = \
+                [ext for ext in types if types.get_property(ext, name) == value]
+
+        return list(sppasTrsRW.__EXTENSIONS[key])
 
     # -----------------------------------------------------------------------
 
@@ -128,65 +326,35 @@ class sppasTrsRW(object):
     @staticmethod
     def extensions_in() -> list:
         """Return the list of supported extensions if the reader exists."""
-        e = list()
-        for ext in list(sppasTrsRW.TRANSCRIPTION_TYPES.keys()):
-            fp = FileFormatProperty(extension=ext)
-            if fp.get_reader() is True:
-                e.append(ext)
-
-        return e
+        return sppasTrsRW.__extensions_with("reader", True)
 
     # -----------------------------------------------------------------------
 
     @staticmethod
     def extensions_out() -> list:
         """Return the list of supported extensions if the writer exists."""
-        e = list()
-        for ext in list(sppasTrsRW.TRANSCRIPTION_TYPES.keys()):
-            fp = FileFormatProperty(extension=ext)
-            if fp.get_writer() is True:
-                e.append(ext)
-
-        return e
+        return sppasTrsRW.__extensions_with("writer", True)
 
     # -----------------------------------------------------------------------
 
     @staticmethod
     def annot_extensions() -> list:
         """Return the list of ANNOT extensions (case-sensitive)."""
-        e = list()
-        for ext in list(sppasTrsRW.TRANSCRIPTION_TYPES.keys()):
-            fp = FileFormatProperty(extension=ext)
-            if fp.get_trs_type() == "ANNOT":
-                e.append(ext)
-
-        return e
+        return sppasTrsRW.__extensions_with("trs_type", "ANNOT")
 
     # -----------------------------------------------------------------------
 
     @staticmethod
     def measure_extensions() -> list:
         """Return the list of MEASURE extensions (case-sensitive)."""
-        e = list()
-        for ext in list(sppasTrsRW.TRANSCRIPTION_TYPES.keys()):
-            fp = FileFormatProperty(extension=ext)
-            if fp.get_trs_type() == "MEASURE":
-                e.append(ext)
-
-        return e
+        return sppasTrsRW.__extensions_with("trs_type", "MEASURE")
 
     # -----------------------------------------------------------------------
 
     @staticmethod
     def table_extensions() -> list:
         """Return the list of TABLE extensions (case-sensitive)."""
-        e = list()
-        for ext in list(sppasTrsRW.TRANSCRIPTION_TYPES.keys()):
-            fp = FileFormatProperty(extension=ext)
-            if fp.get_trs_type() == "TABLE":
-                e.append(ext)
-
-        return e
+        return sppasTrsRW.__extensions_with("trs_type", "TABLE")
 
     # -----------------------------------------------------------------------
 
@@ -216,11 +384,22 @@ class sppasTrsRW(object):
         
     # -----------------------------------------------------------------------
 
-    def read(self, heuristic: bool = False) -> object:
+    def read(self, heuristic: bool = False, tier_names=None) -> object:
         """Read a transcription from a file.
 
+        If a selection of tiers is given, the returned transcription contains
+        only the selected tiers. Readers supporting it do not even create the
+        annotations of the other tiers.
+
+        :example:
+        >>> trs = sppasTrsRW("file-palign.xra").read(tier_names=["PhonAlign"])
+        >>> trs = sppasTrsRW("file-palign.xra").read(tier_names=lambda name: "align" in name.lower())
+
         :param heuristic: (bool) if the extension of the file is unknown, use
         a heuristic to detect the format, then to choose the reader-writer.
+        :param tier_names: (list of str, function or None) The exact names
+        of the tiers to read, or a function returning True for the name of
+        a tier to read, or None to read all the tiers.
         :return: sppasTranscription reader-writer
 
         """
@@ -245,7 +424,20 @@ class sppasTrsRW(object):
             trs.set_meta('file_read_date', sppasTime().now)
 
             # Read the file content dans store into a Transcription()
-            trs.read(self.__filename)
+            handed = None
+            if tier_names is None and sppasTrsRW.__CACHE is not None:
+                handed = sppasTrsRW.__CACHE.pop(self.__filename)
+            if handed is not None and handed.__class__ is trs.__class__:
+                trs.handoff(handed)
+            elif tier_names is None:
+                trs.read(self.__filename)
+            elif trs.tier_selection_support() is True:
+                trs.read(self.__filename, tier_names)
+            else:
+                trs.read(self.__filename)
+                for i in reversed(range(len(trs))):
+                    if trs.is_selected_tier(trs[i].get_name(), tier_names) is False:
+                        trs.pop(i)
 
         except UnicodeError as e:
             raise AioEncodingError(filename=self.__filename, error_msg=str(e))
@@ -295,7 +487,7 @@ class sppasTrsRW(object):
                     return file_reader()
             except:
                 continue
-        return sppasRawText()
+        return sppasTrsRW.TRANSCRIPTION_TYPES["txt"]()
 
     # -----------------------------------------------------------------------
 
@@ -305,6 +497,9 @@ class sppasTrsRW(object):
         :param transcription: (sppasTranscription)
 
         """
+        if sppasTrsRW.__CACHE is not None:
+            sppasTrsRW.__CACHE.discard(self.__filename)
+
         trs_rw = sppasTrsRW.create_trs_from_extension(self.__filename)
         trs_rw.set(transcription)
 
@@ -326,6 +521,9 @@ class sppasTrsRW(object):
         except Exception:
             raise
 
+        if sppasTrsRW.__CACHE is not None and trs_rw.handoff_support() is True:
+            sppasTrsRW.__CACHE.add(self.__filename, trs_rw)
+
 # ---------------------------------------------------------------------------
 
 
@@ -337,6 +535,9 @@ class FileFormatProperty(object):
     def __init__(self, extension: str):
         """Create a FileFormatProperty instance.
 
+        The properties are the declared ones of the format: the reader-writer
+        is created only if the instance is requested.
+
         :param extension: (str) File name extension.
 
         """
@@ -344,25 +545,25 @@ class FileFormatProperty(object):
         if extension.startswith(".") is False:
             self._extension = "." + extension
 
-        self._instance = None
-        self._software = "Unknown"
+        self.__trs_ext = None
+        self.__instance = None
         for ext in sppasTrsRW.TRANSCRIPTION_TYPES.keys():
-            if ext.lower() == extension.lower():
-                self._instance = sppasTrsRW.TRANSCRIPTION_TYPES[ext]()
-                self._software = self._instance.software
+            if ext.lower() == self._extension[1:].lower():
+                self.__trs_ext = ext
 
-        try:
-            self._instance.read("")
-        except NotImplementedError:
-            self._reader = False
-        except Exception:
-            self._reader = True
-        try:
-            self._instance.write("")
-        except NotImplementedError:
-            self._writer = False
-        except Exception:
-            self._writer = True
+        types = sppasTrsRW.TRANSCRIPTION_TYPES
+        self._software = types.get_property(self.__trs_ext, "software", "Unknown")
+        self._reader = types.get_property(self.__trs_ext, "reader", False)
+        self._writer = types.get_property(self.__trs_ext, "writer", False)
+
+    # -----------------------------------------------------------------------
+
+    @property
+    def _instance(self):
+        """Return the reader-writer of the extension or None."""
+        if self.__instance is None and self.__trs_ext is not None:
+            self.__instance = sppasTrsRW.TRANSCRIPTION_TYPES[self.__trs_ext]()
+        return self.__instance
 
     # -----------------------------------------------------------------------
 
@@ -384,9 +585,7 @@ class FileFormatProperty(object):
 
     def get_trs_type(self) -> str | None:
         """Return the transcription type: ANNOT, MEASURE, TABLE or None."""
-        if self._instance is None:
-            return None
-        return self._instance.trs_type
+        return sppasTrsRW.TRANSCRIPTION_TYPES.get_property(self.__trs_ext, "trs_type")
 
     # -----------------------------------------------------------------------
     # Overloads
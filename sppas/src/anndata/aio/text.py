@@ -56,6 +56,7 @@ from ..ann.annlocation import sppasLocation
 from ..ann.annlocation import sppasPoint
 from ..ann.annlocation import sppasInterval
 from ..media import sppasMedia
+from ..columnartier import sppasColumnarTier
 
 from .basetrsio import sppasBaseIO
 from .aioutils import format_labels
@@ -621,6 +622,7 @@ class sppasCSV(sppasBaseText):
 
         self.default_extension = "csv"
         self._accept_multi_tiers = True
+        self._accept_columnar = True
 
     # -----------------------------------------------------------------------
 
@@ -728,6 +730,11 @@ class sppasCSV(sppasBaseText):
             for tier in self._tiers:
                 name = tier.get_name()
                 point = tier.is_point()
+                if isinstance(tier, sppasColumnarTier) is True:
+                    for b, _, e, _, content, _ in tier.rows():
+                        csvwriter.writerow([name, b, None if point else e, content or ""])
+                    continue
+
                 for ann in tier:
                     content = serialize_labels(ann.get_labels(), separator=" ", empty="", alt=True)
                     if point is True:
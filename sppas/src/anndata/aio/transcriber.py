@@ -214,10 +214,10 @@ class sppasTRS(sppasBaseIO):
             if "Trans" in tier.get_name():
                 for ann in tier:
                     if ann.is_labelled():
-                        for label in ann.get_labels():
-                            tag = label.get_best()
-                            new_content = sppasTRS.__format_tag(tag)
-                            label.get_best().set_content(new_content)
+                        labels = ann.get_labels()
+                        for i, label in enumerate(labels):
+                            new_content = sppasTRS.__format_tag(label.get_best())
+                            labels[i] = sppasTRS.__replace_best_tag(label, sppasTag(new_content))
 
         # Create the hierarchy
         self.add_hierarchy_link("TimeAlignment",
@@ -730,9 +730,26 @@ class sppasTRS(sppasBaseIO):
         if len(labels) == 0:
             labels.append(sppasLabel(sppasTag(text)))
         else:
-            old_tag = labels[0].get_best()
-            old_text = old_tag.get_content()
-            old_tag.set_content(old_text + " " + text)
+            old_text = labels[0].get_best().get_content()
+            labels[0] = sppasTRS.__replace_best_tag(labels[0], sppasTag(old_text + " " + text))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __replace_best_tag(label, new_tag):
+        """Return a copy of the label in which the best tag is replaced.
+
+        Tags of the labels can be shared ones, they can't be modified.
+
+        """
+        best_tag = label.get_best()
+        new_label = sppasLabel(None)
+        new_label.set_key(label.get_key())
+        for tag, score in label:
+            if tag is best_tag:
+                tag = new_tag
+            new_label.append(tag, score, add=False)
+        return new_label
 
     # -----------------------------------------------------------------------
 
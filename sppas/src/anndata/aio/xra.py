@@ -39,6 +39,7 @@
 
 """
 
+import copy
 import logging
 import xml.etree.cElementTree as ET
 
@@ -55,8 +56,11 @@ from ..ann.annlocation import sppasInterval
 from ..ann.annlocation import sppasDisjoint
 from ..ann.annlabel import sppasLabel
 from ..ann.annlabel import sppasTag
+from ..ann.annotation import sppasAnnotation
+from ..columnartier import sppasColumnarTier
 
 from .basetrsio import sppasBaseIO
+from .aioutils import extend_tier
 
 # ---------------------------------------------------------------------------
 
@@ -183,24 +187,163 @@ class sppasXRA(sppasBaseIO):
         self._accept_radius = True
         self._accept_gaps = True
         self._accept_overlaps = True
+        self._accept_columnar = True
+        self._accept_tier_selection = True
+        self._accept_handoff = True
 
         # 1.4 -> 1.5: support of sppasTag() of type "point" and "rect"
         self.__format = "1.5"
 
+        # The 'Document' element of the last write, without its children
+        self.__document = None
+
     # -----------------------------------------------------------------------
 
-    def read(self, filename):
+    def read(self, filename, tier_names=None):
         """Read an XRA file and fill the Transcription.
 
+        The file is parsed incrementally: each 'Annotation' element is
+        converted as soon as it is closed, then it is removed from the tree.
+        The memory needed to read a file does not grow with the size of its
+        XML tree. The annotations of the tiers which are not selected are
+        not created.
+
         :param filename: (str)
+        :param tier_names: (list of str, function or None) Selection of the
+        tiers to read. See sppasBaseIO.is_selected_tier().
 
         """
+        root = None
+        tier = None
+        annotations = list()
+        elements = list()
+        deferred = list()
         try:
-            tree = ET.parse(filename)
-            root = tree.getroot()
+            for event, elem in ET.iterparse(filename, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                        self._parse_document_attributes(root)
+                    elif len(elements) == 1 and elem.tag == "Tier":
+                        tier = self._create_tier(elem, tier_names)
+                    elements.append(elem)
+                    continue
+
+                elements.pop()
+                depth = len(elements)
+                if depth == 2 and elements[1].tag == "Tier":
+                    # A child of a tier: its content is not needed anymore
+                    if tier is not None:
+                        if elem.tag == "Annotation":
+                            annotations.append(sppasXRA._parse_annotation(elem))
+                        elif elem.tag == "Metadata":
+                            sppasXRA._parse_metadata(tier, elem)
+                    elements[1].remove(elem)
+
+                elif depth == 1:
+                    if elem.tag == "Tier":
+                        if tier is not None:
+                            extend_tier(tier, annotations)
+                            tier.set_meta("id", sppasXRA.__get_tier_id(elem))
+                        tier = None
+                        annotations = list()
+                        root.remove(elem)
+                    elif elem.tag == "Metadata":
+                        sppasXRA._parse_metadata(self, elem)
+                        root.remove(elem)
+                    else:
+                        # Media, Hierarchy and Vocabulary refer to tiers
+                        deferred.append(elem)
+
         except ET.ParseError as e:
             raise sppasReadError(filename, msg=str(e))
 
+        for media_root in deferred:
+            if media_root.tag == "Media":
+                self._parse_media(media_root)
+
+        for hierarchy_root in deferred:
+            if hierarchy_root.tag == "Hierarchy":
+                self._parse_hierarchy(hierarchy_root, tier_names is not None)
+                break
+
+        for vocabulary_root in deferred:
+            if vocabulary_root.tag == "Vocabulary":
+                self._parse_vocabulary(vocabulary_root)
+
+    # -----------------------------------------------------------------------
+
+    def handoff_support(self):
+        """Return True if a written transcription can replace a read.
+
+        A sppasColumnarTier is written as it is but read as a sppasTier:
+        a transcription with columnar tiers is not handed off.
+
+        """
+        return not any(isinstance(tier, sppasColumnarTier) for tier in self)
+
+    # -----------------------------------------------------------------------
+
+    def handoff(self, other):
+        """Fill the transcription like read() would do from a written file.
+
+        The tiers, media, controlled vocabularies and hierarchy of the
+        reader-writer which wrote the file are copied: the written
+        transcription is not modified. The differences between what is
+        written and what is read are applied to the copies: the attributes
+        of the document are added to the metadata, the metadata without
+        value are removed, and the scores are float.
+
+        :param other: (sppasXRA) The reader-writer which wrote the file
+
+        """
+        self._parse_document_attributes(other.__document)
+        for key in other.get_meta_keys():
+            value = other.get_meta(key)
+            if len(value) > 0:
+                self.set_meta(key, value)
+
+        # The parent of the copied tiers is self instead of a copy of other
+        tiers, media, ctrl_vocab, hierarchy = copy.deepcopy(
+            (other.get_tier_list(), other.get_media_list(),
+             other.get_ctrl_vocab_list(), other.get_hierarchy()),
+            {id(other): self})
+
+        for tier in tiers:
+            sppasXRA.__pop_empty_metadata(tier)
+            for ann in tier:
+                sppasXRA.__pop_empty_metadata(ann)
+                if ann.get_score() is not None:
+                    ann.set_score(float(ann.get_score()))
+                for label in ann.get_labels():
+                    for tag, score in label:
+                        if score is not None and isinstance(score, float) is False:
+                            label.set_score(tag, float(score))
+
+        self._tiers = list(tiers)
+        self._media = list(media)
+        self._ctrlvocab = list(ctrl_vocab)
+        self._hierarchy = hierarchy
+        for tier in self._tiers:
+            tier.set_parent(self)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __pop_empty_metadata(meta_object):
+        """Remove the metadata without value: they are not read."""
+        for key in list(meta_object.get_meta_keys()):
+            if key != "id" and len(meta_object.get_meta(key)) == 0:
+                meta_object.pop_meta(key)
+
+    # -----------------------------------------------------------------------
+
+    def _parse_document_attributes(self, root):
+        """Parse the attributes of the 'Document' element.
+
+        :param root: (ET) XML Element tree root.
+
+        """
         if "name" in root.attrib:
             self.set_name(root.attrib['name'])
 
@@ -216,23 +359,6 @@ class sppasXRA(sppasBaseIO):
             self.set_meta('file_created_author',
                           root.attrib['author'])
 
-        metadata_root = root.find('Metadata')
-        if metadata_root is not None:
-            sppasXRA._parse_metadata(self, metadata_root)
-
-        for tier_root in root.findall('Tier'):
-            self._parse_tier(tier_root)
-
-        for media_root in root.findall('Media'):
-            self._parse_media(media_root)
-
-        hierarchy_root = root.find('Hierarchy')
-        if hierarchy_root is not None:
-            self._parse_hierarchy(hierarchy_root)
-
-        for vocabulary_root in root.findall('Vocabulary'):
-            self._parse_vocabulary(vocabulary_root)
-
     # -----------------------------------------------------------------------
 
     @staticmethod
@@ -256,41 +382,66 @@ class sppasXRA(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def _parse_tier(self, tier_root):
-        """Parse a 'Tier' element to create a sppasTier().
+    @staticmethod
+    def __get_tier_id(tier_root):
+        """Return the identifier of a 'Tier' element.
 
         :param tier_root: (ET) XML Element tree root.
 
         """
-        name = None
-        if "tiername" in tier_root.attrib:
-            name = tier_root.attrib['tiername']
-
         try:
-            tid = tier_root.attrib['id']
-        except Exception:
+            return tier_root.attrib['id']
+        except KeyError:
             # XRA < 1.2
-            tid = tier_root.attrib['ID']
-        if name is not None:
-            tier = self.create_tier(name)
-        else:
-            tier = self.create_tier(tid)
+            return tier_root.attrib['ID']
+
+    # -----------------------------------------------------------------------
+
+    def _create_tier(self, tier_root, tier_names=None):
+        """Create the sppasTier() of a 'Tier' element, without its content.
+
+        :param tier_root: (ET) XML Element tree root.
+        :param tier_names: (list of str, function or None) Selection of the tiers to create
+        :returns: (sppasTier) the created tier or None if it was skipped
+
+        """
+        tid = sppasXRA.__get_tier_id(tier_root)
+        name = tier_root.attrib.get('tiername', tid)
+        if self.is_selected_tier(name, tier_names) is False:
+            return None
+        return self.create_tier(name)
+
+    # -----------------------------------------------------------------------
+
+    def _parse_tier(self, tier_root, tier_names=None):
+        """Parse a 'Tier' element to create a sppasTier().
+
+        :param tier_root: (ET) XML Element tree root.
+        :param tier_names: (list of str, function or None) Selection of the tiers to create
+        :returns: (sppasTier) the created tier or None if it was skipped
+
+        """
+        tier = self._create_tier(tier_root, tier_names)
+        if tier is None:
+            return None
 
         # Set metadata
         sppasXRA._parse_metadata(tier, tier_root.find('Metadata'))
-        tier.set_meta("id", tid)
+        tier.set_meta("id", sppasXRA.__get_tier_id(tier_root))
+
+        extend_tier(tier, [sppasXRA._parse_annotation(annotation_root)
+                           for annotation_root in tier_root.findall('Annotation')])
 
-        for annotation_root in tier_root.findall('Annotation'):
-            sppasXRA._parse_annotation(tier, annotation_root)
+        return tier
 
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def _parse_annotation(tier, annotation_root):
+    def _parse_annotation(annotation_root):
         """Parse an 'Annotation' element and create a sppasAnnotation().
 
-        :param tier: (sppasTier) Tier to add the newly created annotation.
         :param annotation_root: (ET) XML Element tree root.
+        :returns: (sppasAnnotation)
 
         """
         location_root = annotation_root.find('Location')
@@ -303,7 +454,7 @@ class sppasXRA(sppasBaseIO):
                 label.set_key(label_root.attrib['key'])
             labels.append(label)
 
-        ann = tier.create_annotation(location, labels)
+        ann = sppasAnnotation(location, labels)
         sppasXRA._parse_metadata(ann, annotation_root.find('Metadata'))
 
         # Attributes (from XRA 1.4)
@@ -312,6 +463,8 @@ class sppasXRA(sppasBaseIO):
         if 'score' in annotation_root.attrib:  # optional
             ann.set_score(float(annotation_root.attrib['score']))
 
+        return ann
+
     # -----------------------------------------------------------------------
 
     @staticmethod
@@ -516,7 +669,10 @@ class sppasXRA(sppasBaseIO):
         # Create the sppasTag(). Information is given "as it",
         # i.e. it's a string representing its content and its data type
         content = (tag_node.text if tag_node.text is not None else '')
-        tag = sppasTag(content, data_type)
+        if data_type == "str":
+            tag = sppasTag.intern(content)
+        else:
+            tag = sppasTag(content, data_type)
 
         return tag, score
 
@@ -553,10 +709,12 @@ class sppasXRA(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def _parse_hierarchy(self, hierarchy_root):
+    def _parse_hierarchy(self, hierarchy_root, is_selection=False):
         """Parse a 'Hierarchy' element and set it.
 
         :param hierarchy_root: (ET) XML Element tree root.
+        :param is_selection: (bool) Only a selection of the tiers was read:
+        the links with a tier which was not read are ignored.
 
         """
         for link_node in hierarchy_root.findall('Link'):
@@ -578,6 +736,9 @@ class sppasXRA(sppasBaseIO):
                 if tier.get_id() == child_tier_id:
                     child_tier = tier
 
+            if is_selection is True and (parent_tier is None or child_tier is None):
+                continue
+
             try:
                 self.add_hierarchy_link(hierarchy_type,
                                         parent_tier,
@@ -640,6 +801,11 @@ class sppasXRA(sppasBaseIO):
     def write(self, filename):
         """Write an XRA file.
 
+        The XML content is streamed into the file: only the elements of one
+        annotation at a time are created, so that the whole tree of the
+        document is never built. The content is indented like indent()
+        would do.
+
         :param filename: (str)
 
         """
@@ -649,33 +815,119 @@ class sppasXRA(sppasBaseIO):
         root.set('date', sppasTime().now)
         root.set('format', self.__format)
         root.set('name', self.get_name())
+        self.__document = root
+
+        with open(filename, 'w', encoding=sg.__encoding__,
+                  errors="xmlcharrefreplace", buffering=65536) as fp:
+            fp.write("<?xml version='1.0' encoding='{:s}'?>\n"
+                     "".format(sg.__encoding__))
+            fp.write(sppasXRA._serialize_start_tag(root))
+
+            # Write the children of the document. Like indent() does, an
+            # element with children is followed by a blank line.
+            separator = "\n\t"
+            metadata_root = ET.Element('Metadata')
+            sppasXRA.format_metadata(metadata_root, self)
+            if len(metadata_root.findall('Entry')) > 0:
+                fp.write(separator + sppasXRA._serialize_element(metadata_root, 1))
+                separator = "\n\n\t"
 
-        metadata_root = ET.SubElement(root, 'Metadata')
-        sppasXRA.format_metadata(metadata_root, self)
-        if len(metadata_root.findall('Entry')) == 0:
-            root.remove(metadata_root)
+            for tier in self:
+                fp.write(separator)
+                if sppasXRA._write_tier(fp, tier) is True:
+                    separator = "\n\n\t"
+                else:
+                    separator = "\n\t"
+
+            elements = list()
+            for media in self.get_media_list():
+                media_root = ET.Element('Media')
+                self._format_media(media_root, media)
+                elements.append(media_root)
+
+            hierarchy_root = ET.Element('Hierarchy')
+            self._format_hierarchy(hierarchy_root)
+            elements.append(hierarchy_root)
+
+            for vocabulary in self.get_ctrl_vocab_list():
+                vocabulary_root = ET.Element('Vocabulary')
+                self._format_vocabulary(vocabulary_root, vocabulary)
+                elements.append(vocabulary_root)
+
+            for element in elements:
+                fp.write(separator + sppasXRA._serialize_element(element, 1))
+                if len(element) > 0:
+                    separator = "\n\n\t"
+                else:
+                    separator = "\n\t"
 
-        for tier in self:
-            tier_root = ET.SubElement(root, 'Tier')
-            sppasXRA.format_tier(tier_root, tier)
+            fp.write("\n</Document>\n\n")
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _write_tier(fp, tier):
+        """Write a 'Tier' element, one annotation at a time.
+
+        :param fp: (file) Stream to write into
+        :param tier: (sppasTier)
+        :returns: (bool) The element has children
+
+        """
+        tier_root = ET.Element('Tier')
+        tier_root.set("id", tier.get_meta('id'))
+        tier_root.set("tiername", tier.get_name())
 
-        for media in self.get_media_list():
-            media_root = ET.SubElement(root, 'Media')
-            self._format_media(media_root, media)
+        metadata_root = ET.Element('Metadata')
+        sppasXRA.format_metadata(metadata_root, tier, exclude=['id'])
+        has_metadata = len(metadata_root.findall('Entry')) > 0
+        if has_metadata is False and len(tier) == 0:
+            fp.write(ET.tostring(tier_root, encoding="unicode"))
+            return False
 
-        hierarchy_root = ET.SubElement(root, 'Hierarchy')
-        self._format_hierarchy(hierarchy_root)
+        fp.write(sppasXRA._serialize_start_tag(tier_root))
+        if has_metadata is True:
+            fp.write("\n\t\t" + sppasXRA._serialize_element(metadata_root, 2))
 
-        for vocabulary in self.get_ctrl_vocab_list():
-            vocabulary_root = ET.SubElement(root, 'Vocabulary')
-            self._format_vocabulary(vocabulary_root, vocabulary)
+        if isinstance(tier, sppasColumnarTier) is True:
+            for annotation_root in sppasXRA._iter_columnar_annotations(tier):
+                fp.write("\n\t\t" + sppasXRA._serialize_element(annotation_root, 2))
+        else:
+            for annotation in tier:
+                annotation_root = ET.Element('Annotation')
+                sppasXRA.format_annotation(annotation_root, annotation)
+                fp.write("\n\t\t" + sppasXRA._serialize_element(annotation_root, 2))
 
-        sppasXRA.indent(root)
-        tree = ET.ElementTree(root)
-        tree.write(filename,
-                   encoding=sg.__encoding__,
-                   method="xml",
-                   xml_declaration=True)
+        fp.write("\n\t</Tier>")
+        return True
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _serialize_element(elem, level):
+        """Return the indented content of an element, without its tail.
+
+        :param elem: (ET) XML Element node.
+        :param level: (int) Depth of the element in the document
+        :returns: (str)
+
+        """
+        sppasXRA.indent(elem, level)
+        elem.tail = None
+        return ET.tostring(elem, encoding="unicode")
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _serialize_start_tag(elem):
+        """Return the start tag of an element with its attributes.
+
+        :param elem: (ET) XML Element node without children nor text.
+        :returns: (str)
+
+        """
+        # ElementTree serializes an empty element as '<tag attrib />'
+        return ET.tostring(elem, encoding="unicode")[:-3] + ">"
 
     # -----------------------------------------------------------------------
 
@@ -720,12 +972,71 @@ class sppasXRA(sppasBaseIO):
             tier_root.remove(metadata_root)
 
         # Tier annotations list
+        if isinstance(tier, sppasColumnarTier) is True:
+            sppasXRA.format_columnar_annotations(tier_root, tier)
+            return
+
         for annotation in tier:
             annotation_root = ET.SubElement(tier_root, 'Annotation')
             sppasXRA.format_annotation(annotation_root, annotation)
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def format_columnar_annotations(tier_root, tier):
+        """Add the 'Annotation' elements in the tree from a sppasColumnarTier().
+
+        The elements are created from the values of the columns, without
+        creating the sppasAnnotation() instances.
+
+        :param tier_root: (ET) XML Element tree root.
+        :param tier: (sppasColumnarTier)
+
+        """
+        for annotation_root in sppasXRA._iter_columnar_annotations(tier):
+            tier_root.append(annotation_root)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _iter_columnar_annotations(tier):
+        """Create the 'Annotation' elements of a sppasColumnarTier(), one by one.
+
+        :param tier: (sppasColumnarTier)
+        :returns: (generator of ET)
+
+        """
+        is_point = tier.is_point()
+        tag_type = tier.get_tag_type()
+        for i, row in enumerate(tier.rows()):
+            begin, begin_radius, end, end_radius, content, score = row
+            annotation_root = ET.Element('Annotation')
+            annotation_root.set("id", tier.get_annotation_id(i))
+            if score is not None:
+                annotation_root.set("score", str(score))
+
+            location_root = ET.SubElement(annotation_root, 'Location')
+            if is_point is True:
+                point_node = ET.SubElement(location_root, 'Point')
+                sppasXRA._format_point_values(point_node, begin, begin_radius)
+            else:
+                interval_root = ET.SubElement(location_root, 'Interval')
+                begin_node = ET.SubElement(interval_root, 'Begin')
+                sppasXRA._format_point_values(begin_node, begin, begin_radius)
+                end_node = ET.SubElement(interval_root, 'End')
+                sppasXRA._format_point_values(end_node, end, end_radius)
+
+            if content is not None:
+                label_root = ET.SubElement(annotation_root, 'Label')
+                tag_node = ET.SubElement(label_root, 'Tag')
+                if tag_type != "str":
+                    tag_node.set('type', tag_type)
+                tag_node.text = content
+
+            yield annotation_root
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def format_annotation(annotation_root, annotation):
         """Add an 'Annotation' element in the tree from a sppasAnnotation().
@@ -792,9 +1103,22 @@ class sppasXRA(sppasBaseIO):
         :param point: (sppasPoint)
 
         """
-        point_node.set('midpoint', u(str(point.get_midpoint())))
-        if point.get_radius() is not None:
-            point_node.set('radius', u(str(point.get_radius())))
+        sppasXRA._format_point_values(point_node, point.get_midpoint(), point.get_radius())
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _format_point_values(point_node, midpoint, radius):
+        """Set the attributes of a 'Point' element from its values.
+
+        :param point_node: (ET) XML Element node.
+        :param midpoint: (float, int)
+        :param radius: (float, int) or None
+
+        """
+        point_node.set('midpoint', u(str(midpoint)))
+        if radius is not None:
+            point_node.set('radius', u(str(radius)))
 
     # -----------------------------------------------------------------------
 
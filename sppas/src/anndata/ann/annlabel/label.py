@@ -61,6 +61,8 @@ class sppasLabel(object):
 
     """
 
+    __slots__ = ('__key', '__tags')
+
     def __init__(self, tag, score=None):
         """Create a new sppasLabel instance.
 
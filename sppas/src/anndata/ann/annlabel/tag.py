@@ -39,6 +39,8 @@
 
 """
 
+import weakref
+
 from sppas.core.config import symbols
 from sppas.core.coreutils import sppasUnicode
 from sppas.core.coreutils import b
@@ -83,10 +85,47 @@ class sppasTag(object):
         >>> t9 = sppasTag((27, 32, 3), tag_type="point")  # x=27, y=32 (point), radius=3
         >>> t10 = sppasTag((27, 32, 320, 200), tag_type="rect")
 
+    Labels like "#", "sil" or "dummy" are repeated thousands of times in
+    a file. The string tags created by intern() are shared: there's only one
+    instance for a given content. Such tags are immutable, and a copy() has
+    to be modified instead.
+
+        >>> t1 = sppasTag.intern("sil")
+        >>> t2 = sppasTag.intern("sil")
+        >>> t1 is t2
+        >>> True
+
     """
 
+    __slots__ = ('__tag_content', '__tag_type', '__immutable', '__weakref__')
+
     TAG_TYPES = ("str", "float", "int", "bool", "point", "rect")
 
+    # The interned tags. A tag is removed when it is not used anymore.
+    __POOL = weakref.WeakValueDictionary()
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def intern(tag_content):
+        """Return the shared immutable string tag of the given content.
+
+        :param tag_content: (str) Data content
+        :returns: (sppasTag)
+
+        """
+        tag = sppasTag.__POOL.get(tag_content, None)
+        if tag is None:
+            new_tag = sppasTag(tag_content)
+            tag = sppasTag.__POOL.get(new_tag.get_content(), None)
+            if tag is None:
+                tag = new_tag
+                tag.__immutable = True
+                sppasTag.__POOL[tag.get_content()] = tag
+            sppasTag.__POOL[tag_content] = tag
+
+        return tag
+
     # ------------------------------------------------------------------------
 
     def __init__(self, tag_content, tag_type=None):
@@ -101,7 +140,8 @@ class sppasTag(object):
         """
         self.__tag_content = ""
         self.__tag_type = None
-        
+        self.__immutable = False
+
         self.set_content(tag_content, tag_type)
 
     # ------------------------------------------------------------------------
@@ -114,6 +154,8 @@ class sppasTag(object):
         """
         if isinstance(other, sppasTag) is False:
             raise AnnDataTypeError(other, "sppasTag")
+        if self.__immutable is True:
+            raise AnnDataTypeError(self, "mutable sppasTag")
 
         self.set_content(other.get_content())
         self.__tag_type = other.get_type()
@@ -174,6 +216,9 @@ class sppasTag(object):
         :raise: AnnUnkTypeError, AnnDataTypeError
 
         """
+        if self.__immutable is True:
+            raise AnnDataTypeError(self, "mutable sppasTag")
+
         # Check type
         if tag_type is not None and tag_type not in sppasTag.TAG_TYPES:
             raise AnnUnkTypeError(tag_type)
@@ -245,8 +290,14 @@ class sppasTag(object):
 
     # ------------------------------------------------------------------------
 
+    def is_immutable(self):
+        """Return True if the tag is an interned one, that can't be modified."""
+        return self.__immutable
+
+    # ------------------------------------------------------------------------
+
     def copy(self):
-        """Return a deep copy of self."""
+        """Return a deep copy of self. The copy of an interned tag is mutable."""
         return sppasTag(self.__tag_content, self.__tag_type)
 
     # ------------------------------------------------------------------------
@@ -354,6 +405,11 @@ class sppasTag(object):
 
     # -----------------------------------------------------------------------
 
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    # -----------------------------------------------------------------------
+
     def __eq__(self, other):
         """Compare 2 tags."""
         if isinstance(other, sppasTag):
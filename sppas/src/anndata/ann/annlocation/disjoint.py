@@ -64,7 +64,7 @@ class sppasDisjoint(sppasBaseLocalization):
 
         self.__intervals = list()
         if intervals is not None:
-            self.set_intervals(intervals)
+            self.__set_intervals(intervals)
 
     # -----------------------------------------------------------------------
 
@@ -146,6 +146,8 @@ class sppasDisjoint(sppasBaseLocalization):
         if isinstance(interval, sppasInterval) is False:
             raise AnnDataTypeError(interval, "sppasInterval")
         self.__intervals.append(interval)
+        interval.add_owner(self)
+        self.touch()
 
     # -----------------------------------------------------------------------
 
@@ -171,11 +173,23 @@ class sppasDisjoint(sppasBaseLocalization):
         :param intervals: list of sppasInterval.
 
         """
+        self.__set_intervals(intervals)
+        self.touch()
+
+    # -----------------------------------------------------------------------
+
+    def __set_intervals(self, intervals):
+        """Set a new list of intervals without indicating a modification."""
+        for interval in self.__intervals:
+            interval.remove_owner(self)
         self.__intervals = list()
         if isinstance(intervals, list) is False:
             raise AnnDataTypeError(intervals, "list")
         for interval in intervals:
-            self.append_interval(interval)
+            if isinstance(interval, sppasInterval) is False:
+                raise AnnDataTypeError(interval, "sppasInterval")
+            self.__intervals.append(interval)
+            interval.add_owner(self)
 
     # -----------------------------------------------------------------------
 
@@ -241,6 +255,16 @@ class sppasDisjoint(sppasBaseLocalization):
     # Overloads
     # -----------------------------------------------------------------------
 
+    def __getstate__(self):
+        return (self.__intervals, )
+
+    def __setstate__(self, state):
+        sppasBaseLocalization.__init__(self)
+        self.__intervals = list()
+        self.__set_intervals(state[0])
+
+    # -----------------------------------------------------------------------
+
     def __format__(self, fmt):
         return str(self).__format__(fmt)
 
@@ -62,6 +62,8 @@ class sppasInterval(sppasBaseLocalization):
 
     """
 
+    __slots__ = ('__begin', '__end')
+
     def __init__(self, begin, end):
         """Create a new sppasInterval instance.
 
@@ -91,6 +93,8 @@ class sppasInterval(sppasBaseLocalization):
 
         self.__begin = begin
         self.__end = end
+        begin.add_owner(self)
+        end.add_owner(self)
 
     # -----------------------------------------------------------------------
 
@@ -103,8 +107,13 @@ class sppasInterval(sppasBaseLocalization):
         if isinstance(other, sppasInterval) is False:
             raise AnnDataTypeError(other, "sppasInterval")
 
+        self.__begin.remove_owner(self)
+        self.__end.remove_owner(self)
         self.__begin = other.get_begin()
         self.__end = other.get_end()
+        self.__begin.add_owner(self)
+        self.__end.add_owner(self)
+        self.touch()
 
     # -----------------------------------------------------------------------
 
@@ -144,7 +153,10 @@ class sppasInterval(sppasBaseLocalization):
             raise IntervalBoundsError(tp, self.__end)
 
         # assign the reference
+        self.__begin.remove_owner(self)
         self.__begin = tp
+        tp.add_owner(self)
+        self.touch()
 
     # -----------------------------------------------------------------------
 
@@ -172,7 +184,10 @@ class sppasInterval(sppasBaseLocalization):
             raise IntervalBoundsError(self.__begin, tp)
 
         # assign the reference
+        self.__end.remove_owner(self)
         self.__end = tp
+        tp.add_owner(self)
+        self.touch()
 
     # -----------------------------------------------------------------------
 
@@ -350,6 +365,17 @@ class sppasInterval(sppasBaseLocalization):
     # Overloads
     # -----------------------------------------------------------------------
 
+    def __getstate__(self):
+        return self.__begin, self.__end
+
+    def __setstate__(self, state):
+        sppasBaseLocalization.__init__(self)
+        self.__begin, self.__end = state
+        self.__begin.add_owner(self)
+        self.__end.add_owner(self)
+
+    # -----------------------------------------------------------------------
+
     def __format__(self, fmt):
         return str(self).__format__(fmt)
 
@@ -43,11 +43,54 @@
 class sppasBaseLocalization(object):
     """Represents a base class for any kind of localization.
 
+    A localization knows the objects it belongs to, its owners -- like
+    an interval for a point or a location for an interval. When it is
+    modified in-place, it indicates it to its owners with touch(), so
+    that objects caching localization values -- like the index of a tier,
+    can know if their cached values are outdated. The owners are not
+    copied nor pickled with the localization.
+
     """
 
+    __slots__ = ('__owners',)
+
     def __init__(self):
         """Create a sppasLocalization instance."""
-        pass
+        self.__owners = None
+
+    # -----------------------------------------------------------------------
+
+    def add_owner(self, owner):
+        """Add an object to be told when the localization is modified.
+
+        :param owner: (object) Any object with a touch() method
+
+        """
+        if self.__owners is None:
+            self.__owners = [owner]
+        elif all(o is not owner for o in self.__owners):
+            self.__owners.append(owner)
+
+    # -----------------------------------------------------------------------
+
+    def remove_owner(self, owner):
+        """Remove an object of the owners of the localization.
+
+        :param owner: (object)
+
+        """
+        if self.__owners is not None:
+            self.__owners = [o for o in self.__owners if o is not owner]
+            if len(self.__owners) == 0:
+                self.__owners = None
+
+    # -----------------------------------------------------------------------
+
+    def touch(self):
+        """Indicate to the owners that the localization was modified."""
+        if self.__owners is not None:
+            for owner in self.__owners:
+                owner.touch()
 
     # -----------------------------------------------------------------------
 
@@ -69,17 +69,18 @@ class sppasLocation(object):
 
         """
         self.__localizations = list()
+        self.__owners = None
 
         if localization is not None:
             if isinstance(localization, list):
                 if isinstance(score, list) and len(localization) == len(score):
                     for l, s in zip(localization, score):
-                        self.append(l, s)
+                        self.__append(l, s)
                 else:
                     for loc in localization:
-                        self.append(loc, 1./len(localization))
+                        self.__append(loc, 1./len(localization))
             else:
-                self.append(localization, score)
+                self.__append(localization, score)
 
     # -----------------------------------------------------------------------
 
@@ -90,6 +91,13 @@ class sppasLocation(object):
         :param score: (float)
 
         """
+        self.__append(localization, score)
+        self.touch()
+
+    # -----------------------------------------------------------------------
+
+    def __append(self, localization, score=None):
+        """Add a localization without indicating a modification."""
         if isinstance(localization, sppasBaseLocalization) is False:
             raise AnnDataTypeError(localization, "sppasBaseLocalization")
 
@@ -104,6 +112,7 @@ class sppasLocation(object):
                     raise AnnDataTypeError(localization, "sppasDisjoint")
 
             self.__localizations.append([localization, score])
+            localization.add_owner(self)
 
     # -----------------------------------------------------------------------
 
@@ -124,6 +133,29 @@ class sppasLocation(object):
             for l in self.__localizations:
                 if l[0] == localization:
                     self.__localizations.remove(l)
+                    l[0].remove_owner(self)
+            self.touch()
+
+    # -----------------------------------------------------------------------
+
+    def add_owner(self, owner):
+        """Add an object to be told when the location is modified.
+
+        :param owner: (object) Any object with a touch() method
+
+        """
+        if self.__owners is None:
+            self.__owners = [owner]
+        elif all(o is not owner for o in self.__owners):
+            self.__owners.append(owner)
+
+    # -----------------------------------------------------------------------
+
+    def touch(self):
+        """Indicate to the owners that the location was modified."""
+        if self.__owners is not None:
+            for owner in self.__owners:
+                owner.touch()
 
     # -----------------------------------------------------------------------
 
@@ -381,6 +413,19 @@ class sppasLocation(object):
     # Overloads
     # -----------------------------------------------------------------------
 
+    def __getstate__(self):
+        # the owners are neither copied nor pickled
+        state = self.__dict__.copy()
+        state['_sppasLocation__owners'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for localization, score in self.__localizations:
+            localization.add_owner(self)
+
+    # -----------------------------------------------------------------------
+
     def __format__(self, fmt):
         return str(self).__format__(fmt)
 
@@ -94,6 +94,8 @@ class sppasPoint(sppasBaseLocalization):
 
     """
 
+    __slots__ = ('__midpoint', '__radius')
+
     def __init__(self, midpoint, radius=None):
         """Create a sppasPoint instance.
 
@@ -107,8 +109,8 @@ class sppasPoint(sppasBaseLocalization):
         self.__midpoint = 0
         self.__radius = None
 
-        self.set_midpoint(midpoint)
-        self.set_radius(radius)
+        self.__set_midpoint(midpoint)
+        self.__set_radius(radius)
 
     # -----------------------------------------------------------------------
 
@@ -155,6 +157,13 @@ class sppasPoint(sppasBaseLocalization):
         :raise: AnnDataTypeError
 
         """
+        self.__set_midpoint(midpoint)
+        self.touch()
+
+    # -----------------------------------------------------------------------
+
+    def __set_midpoint(self, midpoint):
+        """Set the midpoint value without indicating a modification."""
         if isinstance(midpoint, (int, float, text_type, binary_type)) is False:
             raise AnnDataTypeError(midpoint, "float, int")
 
@@ -199,6 +208,13 @@ class sppasPoint(sppasBaseLocalization):
         :raise: AnnDataTypeError, AnnDataNegValueError
 
         """
+        self.__set_radius(radius)
+        self.touch()
+
+    # -----------------------------------------------------------------------
+
+    def __set_radius(self, radius=None):
+        """Set the radius value without indicating a modification."""
         if radius is not None:
             if sppasPoint.check_types(self.__midpoint, radius) is False:
                 raise AnnDataTypeError(radius, str(type(self.__midpoint)))
@@ -237,6 +253,7 @@ class sppasPoint(sppasBaseLocalization):
             raise AnnDataTypeError(delay, str(type(self.__midpoint)))
 
         self.__midpoint += delay
+        self.touch()
 
     # -----------------------------------------------------------------------
 
@@ -280,6 +297,15 @@ class sppasPoint(sppasBaseLocalization):
     # overloads
     # -----------------------------------------------------------------------
 
+    def __getstate__(self):
+        return self.__midpoint, self.__radius
+
+    def __setstate__(self, state):
+        sppasBaseLocalization.__init__(self)
+        self.__midpoint, self.__radius = state
+
+    # -----------------------------------------------------------------------
+
     def __format__(self, fmt):
         return str(self).__format__(fmt)
 
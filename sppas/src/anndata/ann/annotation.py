@@ -88,6 +88,7 @@ class sppasAnnotation(sppasMetaData):
         self.__labels = list()
         self.__score = None
         self.set_labels(labels)
+        location.add_owner(self)
 
     # -----------------------------------------------------------------------
     # Member getters
@@ -147,15 +148,18 @@ class sppasAnnotation(sppasMetaData):
     # Setters
     # -----------------------------------------------------------------------
 
-    def set_parent(self, parent=None):
+    def set_parent(self, parent=None, validate=True):
         """Set a parent tier.
 
         :param parent: (sppasTier) The parent tier of this annotation.
+        :param validate: (bool) Ask the parent to validate the location and
+        the labels. Only the parent itself should turn it off, when it has
+        already validated them.
         :raises: CtrlVocabContainsError, HierarchyContainsError, \
         HierarchyTypeError
 
         """
-        if parent is not None:
+        if parent is not None and validate is True:
             parent.validate_annotation_location(self.__location)
             for label in self.__labels:
                 parent.validate_annotation_label(label)
@@ -620,10 +624,23 @@ class sppasAnnotation(sppasMetaData):
         if self.__parent is not None:
             self.__parent.validate_annotation_location(self.__location)
 
+    # -----------------------------------------------------------------------
+
+    def touch(self):
+        """Indicate to the parent that the location was modified in-place."""
+        if self.__parent is not None:
+            self.__parent.touch()
+
     # -----------------------------------------------------------------------
     # Overloads
     # -----------------------------------------------------------------------
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__location.add_owner(self)
+
+    # -----------------------------------------------------------------------
+
     def __format__(self, fmt):
         return str(self).__format__(fmt)
 
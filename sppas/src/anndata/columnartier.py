@@ -0,0 +1,781 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.anndata.columnartier.py
+:author:   Brigitte Bigi
+:contact:  contact@sppas.org
+:summary:  A tier storing its annotations into typed arrays.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    ---------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2023  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    ---------------------------------------------------------------------
+
+"""
+
+import uuid
+from array import array
+
+from sppas.core.coreutils import sppasUnicode
+
+from .anndataexc import AnnDataTypeError
+from .anndataexc import AnnDataKeyError
+from .anndataexc import AnnDataNegValueError
+from .anndataexc import AnnUnkTypeError
+from .anndataexc import IntervalBoundsError
+from .anndataexc import CtrlVocabContainsError
+from .anndataexc import TierAppendError
+from .anndataexc import TrsAddError
+from .ann.annlocation import sppasPoint
+from .ann.annlocation import sppasInterval
+from .ann.annlocation import sppasLocation
+from .ann.annlabel import sppasLabel
+from .ann.annlabel import sppasTag
+from .ann.annotation import sppasAnnotation
+from .metadata import sppasMetaData
+from .ctrlvocab import sppasCtrlVocab
+from .media import sppasMedia
+from .tier import sppasTier
+
+# ----------------------------------------------------------------------------
+
+
+class sppasColumnarTier(sppasMetaData):
+    """A compact representation of a tier, with annotations in columns.
+
+    A sppasTier stores a sppasAnnotation() instance for each of its
+    annotations, which itself stores its metadata, a sppasLocation(), a
+    sppasInterval(), two sppasPoint(), a list of sppasLabel() and sppasTag().
+    A 2-hours PitchTier or an alignment of 100k phonemes then require
+    hundreds of MB. The columnar tier is storing the annotations into
+    typed arrays instead:
+
+        - the midpoint and radius values of the begin and end points,
+        - the score of the annotations,
+        - the index of the content of the labels in a list of distinct
+          contents: each content is stored only once.
+
+    It can store the annotations of a point or interval tier, with at most
+    one label with a single tag each, and without overlaps. It is the case
+    for all measure tiers and all time-aligned tiers created by SPPAS.
+
+    Annotations are materialized on demand: a sppasAnnotation() is created
+    when an annotation is requested with tier[i], and when iterating. It is
+    a copy: modifying it won't modify the columnar tier.
+
+    :Example:
+
+        >>> tier = sppasColumnarTier("PitchTier", tag_type="float")
+        >>> tier.append(0.01, content=128.5)
+        >>> tier.append(0.02, content=130.1)
+        >>> tier[1].get_best_tag().get_typed_content()
+        >>> 130.1
+
+    The conversion from and to a sppasTier is lossless: localizations,
+    labels, scores, identifiers and tier metadata are preserved.
+
+        >>> columnar = sppasColumnarTier.from_tier(tier)
+        >>> tier = columnar.to_tier()
+
+    """
+
+    def __init__(self, name=None, ctrl_vocab=None, media=None, parent=None, tag_type="str"):
+        """Create a new sppasColumnarTier instance.
+
+        :param name: (str) Name of the tier. It is used as identifier.
+        :param ctrl_vocab: (sppasCtrlVocab)
+        :param media: (sppasMedia)
+        :param parent: (sppasTranscription)
+        :param tag_type: (str) Type of the tags of the labels.
+        :raises: AnnUnkTypeError
+
+        """
+        super(sppasColumnarTier, self).__init__()
+
+        if tag_type not in sppasTag.TAG_TYPES:
+            raise AnnUnkTypeError(tag_type)
+
+        self.__name = None
+        self.__ctrl_vocab = None
+        self.__media = None
+        self.__parent = None
+        self.__tag_type = tag_type
+
+        # Either None (empty tier), "point" or "interval"
+        self.__loc_type = None
+        # True if midpoint values are int, False if they are float
+        self.__loc_is_int = False
+
+        # Columns. An absent radius or score is stored as NaN.
+        self.__begin = array('d')
+        self.__begin_radius = array('d')
+        self.__end = array('d')
+        self.__end_radius = array('d')
+        self.__score = array('d')
+        self.__label = array('l')
+        self.__ann_id = list()
+
+        # Distinct contents of the labels, and their index in the list
+        self.__contents = list()
+        self.__contents_idx = dict()
+
+        self.set_name(name)
+        self.set_ctrl_vocab(ctrl_vocab)
+        self.set_media(media)
+        self.set_parent(parent)
+
+    # -----------------------------------------------------------------------
+    # Getters
+    # -----------------------------------------------------------------------
+
+    def get_name(self):
+        """Return the identifier name of the tier."""
+        return self.__name
+
+    # -----------------------------------------------------------------------
+
+    def get_ctrl_vocab(self):
+        """Return the controlled vocabulary of the tier."""
+        return self.__ctrl_vocab
+
+    # -----------------------------------------------------------------------
+
+    def get_media(self):
+        """Return the media of the tier."""
+        return self.__media
+
+    # -----------------------------------------------------------------------
+
+    def get_parent(self):
+        """Return the parent of the tier."""
+        return self.__parent
+
+    # -----------------------------------------------------------------------
+
+    def get_tag_type(self):
+        """Return the type of the tags of the labels."""
+        return self.__tag_type
+
+    # -----------------------------------------------------------------------
+    # Setters
+    # -----------------------------------------------------------------------
+
+    def set_name(self, name=None):
+        """Set the name of the tier.
+
+        If no name is given, an GUID is randomly assigned.
+        Important: An empty string is accepted.
+
+        :param name: (str) The identifier name or None.
+        :returns: the formatted name
+
+        """
+        if name is None:
+            if self.get_id() == "":
+                self.gen_id()
+            name = self.get_id()
+        su = sppasUnicode(name)
+        self.__name = su.to_strip()
+
+        return self.__name
+
+    # -----------------------------------------------------------------------
+
+    def set_ctrl_vocab(self, ctrl_vocab=None):
+        """Set a controlled vocabulary to this tier.
+
+        :param ctrl_vocab: (sppasCtrlVocab or None)
+        :raises: AnnDataTypeError, CtrlVocabContainsError
+
+        """
+        if ctrl_vocab is not None:
+            if isinstance(ctrl_vocab, sppasCtrlVocab) is False:
+                raise AnnDataTypeError(ctrl_vocab, "sppasCtrlVocab")
+
+            # Check all the distinct contents to validate the
+            # ctrl_vocab before assignment
+            for content in self.__contents:
+                tag = sppasTag(content, self.__tag_type)
+                if tag.is_empty() is False and ctrl_vocab.contains(tag) is False:
+                    raise CtrlVocabContainsError(tag)
+
+            if self.__parent is not None:
+                try:
+                    self.__parent.add_ctrl_vocab(ctrl_vocab)
+                except TrsAddError:
+                    pass
+
+        self.__ctrl_vocab = ctrl_vocab
+
+    # -----------------------------------------------------------------------
+
+    def set_media(self, media):
+        """Set a media to the tier.
+
+        :param media: (sppasMedia)
+        :raises: AnnDataTypeError
+
+        """
+        if media is not None:
+            if isinstance(media, sppasMedia) is False:
+                raise AnnDataTypeError(media, "sppasMedia")
+            if self.__parent is not None:
+                try:
+                    self.__parent.add_media(media)
+                except TrsAddError:
+                    pass
+
+        self.__media = media
+
+    # -----------------------------------------------------------------------
+
+    def set_parent(self, parent):
+        """Set the parent of the tier.
+
+        :param parent: (sppasTranscription)
+
+        """
+        self.__parent = parent
+
+        if parent is not None:
+            if self.__media is not None:
+                try:
+                    self.__parent.add_media(self.__media)
+                except TrsAddError:
+                    pass
+
+            if self.__ctrl_vocab is not None:
+                try:
+                    self.__parent.add_ctrl_vocab(self.__ctrl_vocab)
+                except TrsAddError:
+                    pass
+
+    # -----------------------------------------------------------------------
+
+    def copy(self):
+        """Return a deep copy of the tier.
+
+        :return: (sppasColumnarTier) including the 'id'.
+
+        """
+        new_tier = sppasColumnarTier(self.__name, self.__ctrl_vocab, self.__media, tag_type=self.__tag_type)
+        new_tier.__loc_type = self.__loc_type
+        new_tier.__loc_is_int = self.__loc_is_int
+        new_tier.__begin = array('d', self.__begin)
+        new_tier.__begin_radius = array('d', self.__begin_radius)
+        new_tier.__end = array('d', self.__end)
+        new_tier.__end_radius = array('d', self.__end_radius)
+        new_tier.__score = array('d', self.__score)
+        new_tier.__label = array('l', self.__label)
+        new_tier.__ann_id = list(self.__ann_id)
+        new_tier.__contents = list(self.__contents)
+        new_tier.__contents_idx = dict(self.__contents_idx)
+        for key in self.get_meta_keys():
+            new_tier.set_meta(key, self.get_meta(key))
+
+        return new_tier
+
+    # -----------------------------------------------------------------------
+    # Conversion
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def from_tier(tier):
+        """Create a columnar tier from the annotations of a sppasTier.
+
+        :param tier: (sppasTier)
+        :returns: (sppasColumnarTier)
+        :raises: AnnDataTypeError, AnnDataKeyError, TierAppendError
+
+        """
+        if isinstance(tier, sppasTier) is False:
+            raise AnnDataTypeError(tier, "sppasTier")
+
+        tag_type = tier.get_labels_type()
+        if len(tag_type) == 0:
+            tag_type = "str"
+        new_tier = sppasColumnarTier(tier.get_name(), tier.get_ctrl_vocab(), tier.get_media(), tag_type=tag_type)
+        for key in tier.get_meta_keys():
+            new_tier.set_meta(key, tier.get_meta(key))
+
+        for ann in tier:
+            for key in ann.get_meta_keys():
+                if key != "id":
+                    raise AnnDataKeyError("sppasColumnarTier", key)
+
+            location = ann.get_location()
+            if len(location) != 1 or location.get_score(location.get_best()) is not None:
+                raise AnnDataTypeError(location, "sppasLocation with a single localization")
+            if location.is_disjoint() is True:
+                raise AnnDataTypeError(ann, "sppasPoint or sppasInterval")
+
+            content = None
+            labels = ann.get_labels()
+            if len(labels) > 1:
+                raise AnnDataTypeError(ann, "sppasAnnotation with a single label")
+            if len(labels) == 1:
+                label = labels[0]
+                if len(label) != 1 or label.get_key() is not None or \
+                        label.get_score(label.get_best()) is not None:
+                    raise AnnDataTypeError(label, "sppasLabel with a single tag")
+                content = label.get_best().get_content()
+
+            begin = ann.get_lowest_localization()
+            if location.is_point() is True:
+                new_tier.append(begin.get_midpoint(), content=content, score=ann.get_score(),
+                                begin_radius=begin.get_radius(), identifier=ann.get_id())
+            else:
+                end = ann.get_highest_localization()
+                new_tier.append(begin.get_midpoint(), end.get_midpoint(), content, ann.get_score(),
+                                begin.get_radius(), end.get_radius(), ann.get_id())
+
+        return new_tier
+
+    # -----------------------------------------------------------------------
+
+    def to_tier(self):
+        """Return a sppasTier with the annotations of this tier.
+
+        :returns: (sppasTier)
+
+        """
+        new_tier = sppasTier(self.__name, self.__ctrl_vocab, self.__media)
+        for key in self.get_meta_keys():
+            new_tier.set_meta(key, self.get_meta(key))
+        for i in range(len(self.__begin)):
+            new_tier.append(self.__make_annotation(i))
+
+        return new_tier
+
+    # -----------------------------------------------------------------------
+    # Annotations
+    # -----------------------------------------------------------------------
+
+    def is_empty(self):
+        """Return True if the tier does not contain annotations."""
+        return len(self.__begin) == 0
+
+    # -----------------------------------------------------------------------
+
+    def append(self, begin, end=None, content=None, score=None,
+               begin_radius=None, end_radius=None, identifier=None):
+        """Append an annotation at the end of the tier.
+
+        The annotation is a point if end is None, an interval otherwise. All
+        annotations of a tier must be of the same type.
+
+        :param begin: (int, float) Midpoint value of the begin
+        :param end: (int, float) Midpoint value of the end or None
+        :param content: (any) Content of the tag of the label or None
+        :param score: (float) Score of the annotation or None
+        :param begin_radius: (int, float) Radius of the begin or None
+        :param end_radius: (int, float) Radius of the end or None
+        :param identifier: (str) Identifier of the annotation or None
+        :raises: AnnDataTypeError, AnnDataNegValueError, IntervalBoundsError, \
+        CtrlVocabContainsError, TierAppendError
+
+        """
+        loc_type = "point" if end is None else "interval"
+        if self.__loc_type is None:
+            loc_is_int = isinstance(begin, int)
+        else:
+            loc_is_int = self.__loc_is_int
+            if loc_type != self.__loc_type:
+                raise AnnDataTypeError(loc_type, self.__loc_type)
+
+        sppasColumnarTier.__check_value(begin, loc_is_int)
+        sppasColumnarTier.__check_radius(begin_radius, loc_is_int)
+        if end is not None:
+            sppasColumnarTier.__check_value(end, loc_is_int)
+            sppasColumnarTier.__check_radius(end_radius, loc_is_int)
+            if begin >= end:
+                raise IntervalBoundsError(begin, end)
+
+        if len(self.__begin) > 0:
+            self.__check_append(begin, begin_radius)
+
+        label_idx = -1
+        if content is not None:
+            label_idx = self.__content_index(content)
+        if score is not None:
+            try:
+                score = float(score)
+            except ValueError:
+                raise AnnDataTypeError(score, "float")
+
+        self.__loc_type = loc_type
+        self.__loc_is_int = loc_is_int
+        self.__begin.append(begin)
+        self.__begin_radius.append(sppasColumnarTier.__to_column(begin_radius))
+        if end is not None:
+            self.__end.append(end)
+            self.__end_radius.append(sppasColumnarTier.__to_column(end_radius))
+        self.__score.append(sppasColumnarTier.__to_column(score))
+        self.__label.append(label_idx)
+        self.__ann_id.append(identifier)
+
+    # -----------------------------------------------------------------------
+
+    def get_begin(self, index):
+        """Return the midpoint value of the begin of the annotation at index."""
+        return self.__to_loc(self.__begin[index])
+
+    # -----------------------------------------------------------------------
+
+    def get_end(self, index):
+        """Return the midpoint value of the end of the annotation at index.
+
+        The end of a point is its begin.
+
+        """
+        if self.__loc_type == "point":
+            return self.__to_loc(self.__begin[index])
+        return self.__to_loc(self.__end[index])
+
+    # -----------------------------------------------------------------------
+
+    def get_content(self, index):
+        """Return the content of the label of the annotation at index.
+
+        :returns: (str) The tag content or None if the annotation has no label
+
+        """
+        label_idx = self.__label[index]
+        if label_idx == -1:
+            return None
+        return self.__contents[label_idx]
+
+    # -----------------------------------------------------------------------
+
+    def get_annotation_id(self, index):
+        """Return the identifier of the annotation at index.
+
+        An identifier is generated the first time it is requested for an
+        annotation appended without identifier.
+
+        """
+        identifier = self.__ann_id[index]
+        if identifier is None:
+            identifier = str(uuid.uuid4())
+            self.__ann_id[index] = identifier
+        return identifier
+
+    # -----------------------------------------------------------------------
+
+    def get_contents(self):
+        """Return the list of the distinct contents of the labels."""
+        return list(self.__contents)
+
+    # -----------------------------------------------------------------------
+
+    def rows(self):
+        """Iterate over the values of the annotations, without creating them.
+
+        Each row is a tuple with: begin, begin radius, end, end radius,
+        label content and score. Absent values are None. The end of a point
+        is its begin.
+
+        """
+        is_point = self.__loc_type == "point"
+        for i in range(len(self.__begin)):
+            begin = self.__to_loc(self.__begin[i])
+            begin_radius = self.__to_radius(self.__begin_radius[i])
+            if is_point is True:
+                end = begin
+                end_radius = begin_radius
+            else:
+                end = self.__to_loc(self.__end[i])
+                end_radius = self.__to_radius(self.__end_radius[i])
+            content = None
+            if self.__label[i] != -1:
+                content = self.__contents[self.__label[i]]
+            score = self.__score[i]
+            if score != score:
+                score = None
+            yield begin, begin_radius, end, end_radius, content, score
+
+    # -----------------------------------------------------------------------
+
+    def shift(self, delay):
+        """Shift all localizations to a given delay.
+
+        :param delay: (int, float) delay to shift all localizations
+        :raises: AnnDataTypeError
+
+        """
+        sppasColumnarTier.__check_value(delay, self.__loc_is_int)
+        for i in range(len(self.__begin)):
+            self.__begin[i] += delay
+        for i in range(len(self.__end)):
+            self.__end[i] += delay
+
+    # -----------------------------------------------------------------------
+    # Localizations
+    # -----------------------------------------------------------------------
+
+    def get_first_point(self):
+        """Return the first point of the first annotation."""
+        if len(self.__begin) == 0:
+            return None
+        return self.__make_point(self.__begin[0], self.__begin_radius[0])
+
+    # -----------------------------------------------------------------------
+
+    def get_last_point(self):
+        """Return the last point of the last annotation."""
+        if len(self.__begin) == 0:
+            return None
+        if self.__loc_type == "point":
+            return self.__make_point(self.__begin[-1], self.__begin_radius[-1])
+        return self.__make_point(self.__end[-1], self.__end_radius[-1])
+
+    # -----------------------------------------------------------------------
+
+    def is_disjoint(self):
+        """Return False: disjoint intervals are not supported."""
+        return False
+
+    # -----------------------------------------------------------------------
+
+    def is_interval(self):
+        """Return True if the tier is made of interval localizations."""
+        return self.__loc_type == "interval"
+
+    # -----------------------------------------------------------------------
+
+    def is_point(self):
+        """Return True if the tier is made of point localizations."""
+        return self.__loc_type == "point"
+
+    # -----------------------------------------------------------------------
+    # Labels
+    # -----------------------------------------------------------------------
+
+    def get_labels_type(self):
+        """Return the current type of labels, or an empty string."""
+        for label_idx in self.__label:
+            if label_idx != -1:
+                return self.__tag_type
+        return ""
+
+    # -----------------------------------------------------------------------
+
+    def is_string(self):
+        """All label tags are string or unicode or None."""
+        return self.get_labels_type() == "str"
+
+    # -----------------------------------------------------------------------
+
+    def is_float(self):
+        """All label tags are float values or None."""
+        return self.get_labels_type() == "float"
+
+    # -----------------------------------------------------------------------
+
+    def is_int(self):
+        """All label tags are integer values or None."""
+        return self.get_labels_type() == "int"
+
+    # -----------------------------------------------------------------------
+
+    def is_bool(self):
+        """All label tags are boolean values or None."""
+        return self.get_labels_type() == "bool"
+
+    # -----------------------------------------------------------------------
+
+    def get_nb_filled_labels(self):
+        """Return the number annotation with a filled label."""
+        return len(self.__label) - self.__label.count(-1)
+
+    # -----------------------------------------------------------------------
+
+    def validate(self):
+        """Ask the parent to validate the hierarchy of the tier.
+
+        :raises: HierarchyAlignmentError, HierarchyAssociationError
+
+        """
+        if self.__parent is not None:
+            self.__parent.validate_hierarchy(self)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __check_value(value, is_int):
+        """Raise an exception if value is not of the expected type."""
+        if is_int is True:
+            if isinstance(value, int) is False:
+                raise AnnDataTypeError(value, "int")
+        elif isinstance(value, (int, float)) is False:
+            raise AnnDataTypeError(value, "float")
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __check_radius(radius, is_int):
+        """Raise an exception if radius is not a valid radius value."""
+        if radius is not None:
+            sppasColumnarTier.__check_value(radius, is_int)
+            if radius < 0:
+                raise AnnDataNegValueError(radius)
+
+    # -----------------------------------------------------------------------
+
+    def __check_append(self, begin, radius):
+        """Raise an exception if begin is not after the last annotation.
+
+        Comparisons are made like between sppasPoint(): they are taking
+        the radius into account.
+
+        """
+        if self.__loc_type == "point":
+            last = self.__begin[-1]
+            last_radius = self.__begin_radius[-1]
+        else:
+            last = self.__end[-1]
+            last_radius = self.__end_radius[-1]
+
+        if begin >= last and self.__loc_type == "interval":
+            return
+        if radius is None and last_radius != last_radius and begin > last:
+            return
+
+        end = self.__make_point(last, last_radius)
+        new = sppasPoint(begin, radius)
+        if self.__loc_type == "point" and end == new:
+            raise TierAppendError(end, new)
+        if end > new:
+            raise TierAppendError(end, new)
+
+    # -----------------------------------------------------------------------
+
+    def __content_index(self, content):
+        """Return the index of the given content in the list of contents.
+
+        The content is formatted like in a sppasTag() and validated by the
+        controlled vocabulary the first time it is given.
+
+        """
+        key = (content.__class__, content)
+        label_idx = self.__contents_idx.get(key, None)
+        if label_idx is None:
+            tag = sppasTag(content, self.__tag_type)
+            if self.__ctrl_vocab is not None:
+                if tag.is_empty() is False and self.__ctrl_vocab.contains(tag) is False:
+                    raise CtrlVocabContainsError(tag)
+            tag_key = (str, tag.get_content())
+            label_idx = self.__contents_idx.get(tag_key, None)
+            if label_idx is None:
+                label_idx = len(self.__contents)
+                self.__contents.append(tag.get_content())
+                self.__contents_idx[tag_key] = label_idx
+            self.__contents_idx[key] = label_idx
+
+        return label_idx
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __to_column(value):
+        """Return the value to be stored in a column of floats."""
+        if value is None:
+            return float('nan')
+        return value
+
+    # -----------------------------------------------------------------------
+
+    def __to_loc(self, value):
+        """Return a midpoint value of a column in its expected type."""
+        if self.__loc_is_int is True:
+            return int(value)
+        return value
+
+    # -----------------------------------------------------------------------
+
+    def __to_radius(self, value):
+        """Return a radius value of a column in its expected type or None."""
+        if value != value:
+            return None
+        return self.__to_loc(value)
+
+    # -----------------------------------------------------------------------
+
+    def __make_point(self, midpoint, radius):
+        """Return a sppasPoint from the values of the columns."""
+        return sppasPoint(self.__to_loc(midpoint), self.__to_radius(radius))
+
+    # -----------------------------------------------------------------------
+
+    def __make_annotation(self, index):
+        """Return a sppasAnnotation with the values of the columns at index."""
+        begin = self.__make_point(self.__begin[index], self.__begin_radius[index])
+        if self.__loc_type == "point":
+            localization = begin
+        else:
+            end = self.__make_point(self.__end[index], self.__end_radius[index])
+            localization = sppasInterval(begin, end)
+
+        labels = list()
+        if self.__label[index] != -1:
+            content = self.__contents[self.__label[index]]
+            labels.append(sppasLabel(sppasTag(content, self.__tag_type)))
+
+        ann = sppasAnnotation(sppasLocation(localization), labels)
+        ann.set_meta("id", self.get_annotation_id(index))
+        score = self.__score[index]
+        if score == score:
+            ann.set_score(score)
+
+        return ann
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __iter__(self):
+        for i in range(len(self.__begin)):
+            yield self.__make_annotation(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice) is True:
+            return [self.__make_annotation(j) for j in range(*i.indices(len(self.__begin)))]
+        if i < 0:
+            i += len(self.__begin)
+        if i < 0 or i >= len(self.__begin):
+            raise IndexError(i)
+        return self.__make_annotation(i)
+
+    def __len__(self):
+        return len(self.__begin)
+
+    def __hash__(self):
+        return hash(self.get_id())
@@ -60,8 +60,16 @@ class sppasCtrlVocab(sppasMetaData):
     A controlled vocabulary is made of an identifier name, a description and
     a list of pairs tag/description.
 
+    The entries are indexed by their typed content, so that a tag is found
+    in O(1). The tags of type 'point' or 'rect' are fuzzy, i.e. they can
+    be equal to other ones without the same content: they are not indexed
+    and they are compared one by one.
+
     """
 
+    # Types of the tags with a content that can be hashed
+    HASHABLE_TYPES = ("str", "int", "float", "bool")
+
     def __init__(self, name, description=""):
         """Create a new sppasCtrlVocab instance.
 
@@ -84,6 +92,9 @@ class sppasCtrlVocab(sppasMetaData):
         # The set of tags:
         self.__entries = OrderedDict()
 
+        # The typed contents of the hashable entries:
+        self.__index = set()
+
     # -----------------------------------------------------------------------
 
     def get_name(self):
@@ -135,6 +146,11 @@ class sppasCtrlVocab(sppasMetaData):
         if isinstance(tag, sppasTag) is False:
             raise AnnDataTypeError(tag, "sppasTag")
 
+        # all the entries are indexed, unless they are fuzzy ones
+        if tag.get_type() in sppasCtrlVocab.HASHABLE_TYPES and \
+                len(self.__index) == len(self.__entries):
+            return tag.get_typed_content() in self.__index
+
         for entry in self.__entries:
             if tag == entry:
                 # compare the content and the type...
@@ -178,6 +194,8 @@ class sppasCtrlVocab(sppasMetaData):
 
         su = sppasUnicode(description)
         self.__entries[tag] = su.to_strip()
+        if tag.get_type() in sppasCtrlVocab.HASHABLE_TYPES:
+            self.__index.add(tag.get_typed_content())
         return True
 
     # -----------------------------------------------------------------------
@@ -196,6 +214,8 @@ class sppasCtrlVocab(sppasMetaData):
             return False
 
         del self.__entries[tag]
+        if tag.get_type() in sppasCtrlVocab.HASHABLE_TYPES:
+            self.__index.discard(tag.get_typed_content())
         return True
 
     # ------------------------------------------------------------------------
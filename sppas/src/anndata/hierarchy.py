@@ -99,6 +99,10 @@ class sppasHierarchy(sppasMetaData):
         # key = child tier ; value = tuple(parent, link_type)
         self.__hierarchy = OrderedDict()
 
+        # key = child tier ; value = tuple(parent, link_type, stamps) of
+        # the last successful validation of the link
+        self.__validated = dict()
+
     # -----------------------------------------------------------------------
     # Getters
     # -----------------------------------------------------------------------
@@ -213,6 +217,34 @@ class sppasHierarchy(sppasMetaData):
 
     # -----------------------------------------------------------------------
 
+    def validate_child(self, child_tier):
+        """Validate the hierarchy link between a child tier and its parent.
+
+        The link is not validated again if none of both tiers was modified
+        since its last validation, including their localizations.
+
+        :param child_tier: (sppasTier) The child tier of the link
+        :raises: HierarchyAlignmentError, HierarchyAssociationError
+
+        """
+        if child_tier not in self.__hierarchy.keys():
+            return
+
+        parent_tier, link_type = self.__hierarchy[child_tier]
+        stamps = sppasHierarchy.__get_stamps(parent_tier, child_tier)
+        if child_tier in self.__validated:
+            parent, link, validated_stamps = self.__validated[child_tier]
+            if parent is parent_tier and link == link_type and validated_stamps == stamps:
+                return
+
+        if link_type == "TimeAssociation":
+            sppasHierarchy.validate_time_association(parent_tier, child_tier)
+        elif link_type == "TimeAlignment":
+            sppasHierarchy.validate_time_alignment(parent_tier, child_tier)
+        self.__validated[child_tier] = (parent_tier, link_type, stamps)
+
+    # -----------------------------------------------------------------------
+
     def validate_link(self, link_type, parent_tier, child_tier):
         """Validate a hierarchy link between 2 tiers.
 
@@ -273,6 +305,8 @@ class sppasHierarchy(sppasMetaData):
         """
         self.validate_link(link_type, parent_tier, child_tier)
         self.__hierarchy[child_tier] = (parent_tier, link_type)
+        self.__validated[child_tier] = (parent_tier, link_type,
+                                        sppasHierarchy.__get_stamps(parent_tier, child_tier))
 
     # -----------------------------------------------------------------------
 
@@ -284,6 +318,7 @@ class sppasHierarchy(sppasMetaData):
         """
         if child_tier in self.__hierarchy.keys():
             del self.__hierarchy[child_tier]
+        self.__validated.pop(child_tier, None)
 
     # -----------------------------------------------------------------------
 
@@ -301,6 +336,7 @@ class sppasHierarchy(sppasMetaData):
 
         for child_tier in to_remove:
             del self.__hierarchy[child_tier]
+            self.__validated.pop(child_tier, None)
 
     # -----------------------------------------------------------------------
 
@@ -318,6 +354,7 @@ class sppasHierarchy(sppasMetaData):
 
         for child_tier in to_remove:
             del self.__hierarchy[child_tier]
+            self.__validated.pop(child_tier, None)
 
     # -----------------------------------------------------------------------
 
@@ -351,6 +388,16 @@ class sppasHierarchy(sppasMetaData):
 
         return "TimeAlignment"
 
+    # ------------------------------------------------------------------------
+    # Private
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def __get_stamps(parent_tier, child_tier):
+        """Return the modification stamps of a link between 2 tiers."""
+        return (parent_tier.get_modification_stamp(),
+                child_tier.get_modification_stamp())
+
     # ------------------------------------------------------------------------
     # Overloads
     # ------------------------------------------------------------------------
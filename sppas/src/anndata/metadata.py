@@ -53,27 +53,33 @@ class sppasMetaData(object):
 
     Meta data keys and values are unicode strings.
 
+    The dictionary and the 'id' are created on demand: instances without
+    metadata don't have any dictionary, and the 'id' is generated the
+    first time it is requested. Reading a large file creates a lot of
+    annotations whose metadata are never used.
+
     """
 
     def __init__(self):
         """Create a sppasMetaData instance.
 
-        Add a GUID-like in the dictionary of metadata, with key "id".
+        The GUID-like 'id' of the dictionary of metadata is created on demand.
 
         """
-        self.__metadata = OrderedDict()
-        self.gen_id()
+        self.__metadata = None
 
     # -----------------------------------------------------------------------
 
     def get_id(self):
         """Return the identifier of this object."""
-        return self.__metadata['id']
+        return self.__get_metadata()['id']
 
     # -----------------------------------------------------------------------
 
     def gen_id(self):
         """Re-generate an 'id'."""
+        if self.__metadata is None:
+            self.__metadata = OrderedDict()
         self.__metadata['id'] = str(uuid.uuid4())
 
     # -----------------------------------------------------------------------
@@ -85,6 +91,10 @@ class sppasMetaData(object):
         :returns: (Boolean)
 
         """
+        if entry == 'id':
+            return True
+        if self.__metadata is None:
+            return False
         return entry in self.__metadata
 
     # -----------------------------------------------------------------------
@@ -97,13 +107,17 @@ class sppasMetaData(object):
         :returns: (str) meta data value or default value
 
         """
+        if entry == 'id':
+            return self.get_id()
+        if self.__metadata is None:
+            return default
         return self.__metadata.get(entry, default)
 
     # -----------------------------------------------------------------------
 
     def get_meta_keys(self):
         """Return the list of metadata keys."""
-        return self.__metadata.keys()
+        return self.__get_metadata().keys()
 
     # -----------------------------------------------------------------------
 
@@ -125,7 +139,12 @@ class sppasMetaData(object):
         su = sppasUnicode(value)
         value = su.to_strip()
 
-        self.__metadata[key] = value
+        if self.__metadata is None and key == 'id':
+            # the 'id' is given: no need to generate one
+            self.__metadata = OrderedDict()
+            self.__metadata[key] = value
+        else:
+            self.__get_metadata()[key] = value
 
     # -----------------------------------------------------------------------
 
@@ -137,7 +156,7 @@ class sppasMetaData(object):
         """
         if key == 'id':
             raise ValueError("Identifier key can't be removed of the metadata.")
-        if key in self.__metadata:
+        if self.__metadata is not None and key in self.__metadata:
             del self.__metadata[key]
 
     # -----------------------------------------------------------------------
@@ -226,8 +245,32 @@ class sppasMetaData(object):
     # ------------------------------------------------------------------------
 
     def __len__(self):
+        if self.__metadata is None:
+            return 1
         return len(self.__metadata)
 
+    # ------------------------------------------------------------------------
+
+    def __getstate__(self):
+        """Return the state to be pickled or copied.
+
+        The 'id' is created if needed: a copy has the same 'id' as the
+        original object.
+
+        """
+        self.__get_metadata()
+        return self.__dict__
+
+    # ------------------------------------------------------------------------
+    # Private
+    # ------------------------------------------------------------------------
+
+    def __get_metadata(self):
+        """Return the dictionary of metadata, created with its 'id' if needed."""
+        if self.__metadata is None:
+            self.gen_id()
+        return self.__metadata
+
 # ---------------------------------------------------------------------------
 
 
@@ -39,14 +39,13 @@
 
 """
 
-import logging
-
 from sppas.core.coreutils import sppasUnicode
 from sppas.core.coreutils import sppasTypeError
 from sppas.core.coreutils import IntervalRangeException
 
 from .anndataexc import AnnDataTypeError
 from .anndataexc import AnnDataIndexError
+from .anndataexc import AnnDataValueError
 from .anndataexc import IntervalBoundsError
 from .anndataexc import CtrlVocabContainsError
 from .anndataexc import TierAppendError
@@ -60,6 +59,7 @@ from .ann.annlocation import sppasLocation
 from .metadata import sppasMetaData
 from .ctrlvocab import sppasCtrlVocab
 from .media import sppasMedia
+from .tierindex import sppasTierIndex
 
 # ----------------------------------------------------------------------------
 
@@ -79,6 +79,11 @@ class sppasTier(sppasMetaData):
         - a media (optional),
         - a parent (optional).
 
+    The localizations of the annotations are indexed in order to search
+    for annotations in O(log n). The index is created when a search is
+    requested, updated when annotations are appended or added, and
+    re-created after any other change.
+
     """
 
     def __init__(self, name=None, ctrl_vocab=None, media=None, parent=None):
@@ -97,6 +102,9 @@ class sppasTier(sppasMetaData):
         self.__ctrl_vocab = None
         self.__media = None
         self.__parent = None
+        self.__index = None
+        self.__index_stamp = 0
+        self.__stamp = 0
 
         self.set_name(name)
         self.set_ctrl_vocab(ctrl_vocab)
@@ -129,6 +137,26 @@ class sppasTier(sppasMetaData):
         """Return the parent of the tier."""
         return self.__parent
 
+    # -----------------------------------------------------------------------
+
+    def get_modification_stamp(self):
+        """Return the modification stamp of the annotations.
+
+        It is incremented each time an annotation is added into or removed
+        from the tier, and each time the location of an annotation of the
+        tier is modified in-place.
+
+        :return: (int)
+
+        """
+        return self.__stamp
+
+    # -----------------------------------------------------------------------
+
+    def touch(self):
+        """Indicate that the location of an annotation was modified in-place."""
+        self.__stamp += 1
+
     # -----------------------------------------------------------------------
     # Setters
     # -----------------------------------------------------------------------
@@ -352,6 +380,7 @@ class sppasTier(sppasMetaData):
                 raise TierAppendError(end, new)
 
         self.__ann.append(annotation)
+        self.__update_index(len(self.__ann) - 1, annotation)
 
     # -----------------------------------------------------------------------
 
@@ -372,16 +401,21 @@ class sppasTier(sppasMetaData):
         except Exception:
 
             if annotation.location_is_point():
-                index = self.index(annotation.get_lowest_localization())
+                index = self.__find_point(annotation.get_lowest_localization())
                 if index != -1:
                     if self.__ann[index].get_lowest_localization().get_midpoint() == \
                             annotation.get_lowest_localization().get_midpoint():
                         raise TierAddError(index)
                     self.__ann.insert(index + 1, annotation)
+                    self.__update_index(index + 1, annotation)
                     return index + 1
                 else:
-                    index = self.near(annotation.get_lowest_localization(), direction=-1)
+                    # Insert just before the nearest point after the new one
+                    index = self.near(annotation.get_lowest_localization(), direction=1)
+                    if index == -1:
+                        index = len(self.__ann)
                     self.__ann.insert(index, annotation)
+                    self.__update_index(index, annotation)
                     return index
 
             else:
@@ -405,12 +439,112 @@ class sppasTier(sppasMetaData):
                         raise TierAddError(index+1)
 
                 self.__ann.insert(index + 1, annotation)
+                self.__update_index(index + 1, annotation)
                 return index + 1
 
         return len(self.__ann) - 1
 
     # -----------------------------------------------------------------------
 
+    def extend_sorted(self, annotations, validate="once"):
+        """Append the given sorted annotations at the end of the tier.
+
+        This is the fast way to fill a tier with annotations created in the
+        time order, as the readers and the annotations do. With validate
+        "once", the instances, the order and the types of the locations and
+        of the labels are checked in a single pass over the annotations,
+        instead of re-examining the tier for each one. If the tier is a
+        child in the hierarchy of its transcription, the tier is validated
+        once all annotations are added. With validate "each", they are
+        appended one by one, like with append().
+
+        With validate "once", either all the annotations are added or none.
+
+        :param annotations: (iterable of sppasAnnotation) Sorted annotations
+        :param validate: (str) "once" or "each"
+        :raises: AnnDataTypeError, AnnDataValueError, CtrlVocabContainsError, \
+        HierarchyContainsError, HierarchyTypeError, TierAppendError
+        :returns: (int) Number of added annotations
+
+        """
+        if validate == "each":
+            nb = 0
+            for annotation in annotations:
+                self.append(annotation)
+                nb += 1
+            return nb
+
+        if validate != "once":
+            raise AnnDataValueError("validate", validate)
+
+        annotations = list(annotations)
+        if len(annotations) == 0:
+            return 0
+
+        # The type of location and of labels of the tier
+        first = self.__ann[0] if len(self.__ann) > 0 else annotations[0]
+        if isinstance(first, sppasAnnotation) is False:
+            raise AnnDataTypeError(first, "sppasAnnotation")
+        is_point = first.location_is_point()
+        is_interval = first.location_is_interval()
+        is_disjoint = first.location_is_disjoint()
+        labels_type = self.get_labels_type()
+
+        end = None
+        if len(self.__ann) > 0:
+            end = self.__ann[-1].get_highest_localization()
+
+        for annotation in annotations:
+            if isinstance(annotation, sppasAnnotation) is False:
+                raise AnnDataTypeError(annotation, "sppasAnnotation")
+
+            # Location: same type than the tier, and sorted
+            if annotation.location_is_point() is True and is_point is False:
+                raise AnnDataTypeError(str(annotation)+" (sppasPoint)", "sppasInterval")
+            if annotation.location_is_interval() is True and is_interval is False:
+                raise AnnDataTypeError(str(annotation)+" (sppasInterval)", "sppasPoint")
+            if annotation.location_is_disjoint() is True and is_disjoint is False:
+                raise AnnDataTypeError(annotation, "sppasDisjoint")
+
+            new = annotation.get_lowest_localization()
+            if end is not None:
+                if is_point is True and end == new:
+                    raise TierAppendError(end, new)
+                if end > new:
+                    raise TierAppendError(end, new)
+            end = annotation.get_highest_localization()
+
+            # Labels: in the controlled vocabulary and of the same type
+            for label in annotation.get_labels():
+                if self.__ctrl_vocab is not None:
+                    for tag, score in label:
+                        if tag.is_empty() is False and self.__ctrl_vocab.contains(tag) is False:
+                            raise CtrlVocabContainsError(tag)
+                if labels_type in ("str", "float", "int", "bool") and label.is_tagged():
+                    if label.get_type() != labels_type:
+                        raise AnnDataTypeError(label, labels_type)
+            if labels_type == "":
+                labels_type = annotation.get_label_type()
+
+        nb = len(self.__ann)
+        self.__ann.extend(annotations)
+        self.__index = None
+        self.__stamp += 1
+        if self.__parent is not None and self.__parent.get_hierarchy().get_parent(self) is not None:
+            try:
+                self.__parent.validate_hierarchy(self)
+            except Exception:
+                del self.__ann[nb:]
+                self.__stamp += 1
+                raise
+
+        for annotation in annotations:
+            annotation.set_parent(self, validate=False)
+
+        return len(annotations)
+
+    # -----------------------------------------------------------------------
+
     def remove(self, begin, end, overlaps=False):
         """Remove annotation intervals between begin and end.
 
@@ -430,6 +564,8 @@ class sppasTier(sppasMetaData):
         for a in reversed(annotations):
             copied_anns.append(a.copy())
             self.__ann.remove(a)
+        self.__index = None
+        self.__stamp += 1
 
         if self.__parent is not None:
             try:
@@ -459,11 +595,14 @@ class sppasTier(sppasMetaData):
             raise AnnDataIndexError(index)
 
         self.__ann.pop(index)
+        self.__index = None
+        self.__stamp += 1
         if self.__parent is not None:
             try:
                 self.validate()
             except:
                 self.__ann.insert(index, copied_ann)
+                self.__stamp += 1
                 raise
 
     # -----------------------------------------------------------------------
@@ -485,6 +624,9 @@ class sppasTier(sppasMetaData):
                 except:
                     # we should write a message to logging
                     pass
+        if nb > 0:
+            self.__index = None
+            self.__stamp += 1
         return nb
 
     # -----------------------------------------------------------------------
@@ -768,59 +910,54 @@ class sppasTier(sppasMetaData):
         if begin > self.get_last_point() or end < self.get_first_point():
             return []
 
+        # No annotation before lo can end after begin.
+        lo = self.__get_index().first_end_reaching(begin)
+
         annotations = list()
         if self.is_point() is True:
-            lo = self.index(begin)
-            if lo == -1:
-                lo = self.near(begin, direction=1)
-            for i, ann in enumerate(self.__ann[lo:]):
+            for i in range(lo, len(self.__ann)):
+                ann = self.__ann[i]
                 lowest = ann.get_lowest_localization()
                 highest = ann.get_highest_localization()
                 if lowest > end and highest > end:
                     break
                 if lowest >= begin and highest <= end:
                     if indexes is True:
-                        annotations.append(lo+i)
+                        annotations.append(i)
                     else:
                         annotations.append(ann)
 
-        else:
-            lo = self.__find(begin, radius_overlaps, closest=True)
-            if lo != -1:
-                if overlaps is True:
-                    for i, ann in enumerate(self.__ann[lo:]):
-                        b = ann.get_lowest_localization()
-                        e = ann.get_highest_localization()
-                        if b > end:
-                            break
-                        if radius_overlaps is False:
-                            if end > b and begin < e:
-                                if indexes is True:
-                                    annotations.append(lo + i)
-                                else:
-                                    annotations.append(ann)
-                        else:
-                            if end >= b and begin <= e:
-                                if indexes is True:
-                                    annotations.append(lo + i)
-                                else:
-                                    annotations.append(ann)
+        elif overlaps is True:
+            for i in range(lo, len(self.__ann)):
+                ann = self.__ann[i]
+                b = ann.get_lowest_localization()
+                e = ann.get_highest_localization()
+                if b > end:
+                    break
+                if radius_overlaps is False:
+                    is_matching = end > b and begin < e
                 else:
-                    # Keep only annotations strictly in the given interval.
-                    # No overlapping annotation is allowed.
-                    for i, ann in enumerate(self.__ann[lo:]):
-                        b = ann.get_lowest_localization()
-                        e = ann.get_highest_localization()
-                        if b >= begin and e <= end:
-                            if indexes is True:
-                                annotations.append(lo + i)
-                            else:
-                                annotations.append(ann)
-                        if b >= end:
-                            break
-            else:
-                logging.info("No annotation is matching begin={}, end={}"
-                             "".format(begin, end))
+                    is_matching = end >= b and begin <= e
+                if is_matching is True:
+                    if indexes is True:
+                        annotations.append(i)
+                    else:
+                        annotations.append(ann)
+
+        else:
+            # Keep only annotations strictly in the given interval.
+            # No overlapping annotation is allowed.
+            for i in range(lo, len(self.__ann)):
+                ann = self.__ann[i]
+                b = ann.get_lowest_localization()
+                e = ann.get_highest_localization()
+                if b >= begin and e <= end:
+                    if indexes is True:
+                        annotations.append(i)
+                    else:
+                        annotations.append(ann)
+                if b >= end:
+                    break
 
         return annotations
 
@@ -830,6 +967,8 @@ class sppasTier(sppasMetaData):
         """Return the index of the moment (int), or -1.
 
         Only for tier with points.
+        If more than one point is matching the moment, thanks to the
+        radius values, the method returns the first one.
 
         :param moment: (sppasPoint)
 
@@ -837,25 +976,14 @@ class sppasTier(sppasMetaData):
         if self.is_point() is False:
             return -1
 
-        lo = 0
-        hi = len(self.__ann)
-        mid = (lo + hi) // 2
-        found = False
-        while lo < hi:
-            mid = (lo + hi) // 2
-            a = self.__ann[mid]
+        for i in range(self.__get_index().first_end_reaching(moment), len(self.__ann)):
+            a = self.__ann[i]
             if moment < a.get_lowest_localization():
-                hi = mid
-            elif moment > a.get_highest_localization():
-                lo = mid + 1
-            else:
-                found = True
                 break
+            if moment <= a.get_highest_localization():
+                return i
 
-        if found is False:
-            return -1
-
-        return mid
+        return -1
 
     # ------------------------------------------------------------------------
 
@@ -872,31 +1000,14 @@ class sppasTier(sppasMetaData):
         if self.is_point() is True:
             return -1
 
-        lo = 0
-        hi = len(self.__ann)
-        mid = (lo + hi) // 2
-        found = False
-        while lo < hi:
-            mid = (lo + hi) // 2
-            begin = self.__ann[mid].get_lowest_localization()
+        for i in range(self.__get_index().first_begin_reaching(moment), len(self.__ann)):
+            begin = self.__ann[i].get_lowest_localization()
             if moment < begin:
-                hi = mid
-            elif moment > begin:
-                lo = mid + 1
-            else:
-                found = True
                 break
-        if found is False:
-            return -1
-        if mid == 0:
-            return 0
+            if moment == begin:
+                return i
 
-        # We go back to look at the previous localizations
-        # until they are different.
-        while mid >= 0 and self.__ann[mid].get_lowest_localization() == moment:
-            mid -= 1
-
-        return mid + 1
+        return -1
 
     # ------------------------------------------------------------------------
 
@@ -921,7 +1032,11 @@ class sppasTier(sppasMetaData):
         if self.is_point() is True:
             return -1
 
-        for i, a in enumerate(self.__ann):
+        tier_index = self.__get_index()
+        for i in range(tier_index.first_end_reaching(moment), len(self.__ann)):
+            if tier_index.begins_after(i, moment) is True:
+                break
+            a = self.__ann[i]
             b = a.get_lowest_localization()
             e = a.get_highest_localization()
             if bound == -1:
@@ -957,38 +1072,24 @@ class sppasTier(sppasMetaData):
         if self.is_point() is True:
             return -1
 
-        lo = 0
-        hi = len(self.__ann)
-        mid = (lo + hi) // 2
-        found = False
-        while lo < hi:
-            mid = (lo + hi) // 2
-            a = self.__ann[mid]
-            if moment < a.get_highest_localization():
-                hi = mid
-            elif moment > a.get_highest_localization():
-                lo = mid + 1
-            else:
-                found = True
+        tier_index = self.__get_index()
+        for i in range(tier_index.last_end_reaching(moment), -1, -1):
+            if tier_index.ends_before(i, moment) is True:
                 break
+            if self.__ann[i].get_highest_localization() == moment:
+                return i
 
-        if found is False:
-            return -1
-        if mid == len(self.__ann) - 1:
-            return mid
-
-        # We go further to look at the next localizations until they are different.
-        while mid+1 < len(self.__ann) and \
-                self.__ann[mid+1].get_highest_localization() == moment:
-            mid += 1
-
-        return mid
+        return -1
 
     # -----------------------------------------------------------------------
 
     def is_superset(self, other):
         """Return True if this tier contains all points of the other tier.
 
+        The sorted points of both tiers are merged, so that each point of
+        the other tier is compared only to the points of this tier which
+        are within reach of its radius.
+
         :param other: (sppasTier)
         :returns: Boolean
 
@@ -996,11 +1097,34 @@ class sppasTier(sppasMetaData):
         if len(other) == 0:
             return True
 
-        tier_points = self.get_all_points()
-        other_points = other.get_all_points()
+        tier_points = self.__get_points_values()
+        other_points = other.__get_points_values()
+        if len(tier_points) == 0:
+            return False
 
-        for op in other_points:
-            if op not in tier_points:
+        # Two points can be equal only if the distance between their
+        # midpoints is lesser than the sum of the largest radius.
+        reach = max(radius for midpoint, radius in tier_points) + \
+            max(radius for midpoint, radius in other_points)
+
+        # Merge the sorted points: the first candidate is only moving forward
+        first = 0
+        for midpoint, radius in other_points:
+            margin = reach + sppasTierIndex.EPSILON * (1. + abs(midpoint))
+            while first < len(tier_points) and \
+                    midpoint - tier_points[first][0] > margin:
+                first += 1
+
+            # Points are equal if the delta is in the radius, like sppasPoint
+            is_found = False
+            i = first
+            while i < len(tier_points) and \
+                    tier_points[i][0] - midpoint <= margin:
+                if abs(tier_points[i][0] - midpoint) <= tier_points[i][1] + radius:
+                    is_found = True
+                    break
+                i += 1
+            if is_found is False:
                 return False
 
         return True
@@ -1028,9 +1152,7 @@ class sppasTier(sppasMetaData):
         if len(self.__ann) == 1:
             return 0
 
-        index = self.__find(moment, radius_overlaps=False, closest=True)
-        if index == -1:
-            return -1
+        index = self.__closest(moment)
         a = self.__ann[index]
 
         # forward
@@ -1052,7 +1174,6 @@ class sppasTier(sppasMetaData):
         # direction == 0 (select the nearest)
 
         # if time is during an annotation
-        a = self.__ann[index]
         if a.get_lowest_localization() <= moment <= a.get_highest_localization():
             return index
 
@@ -1491,13 +1612,89 @@ class sppasTier(sppasMetaData):
     # Private
     # -----------------------------------------------------------------------
 
-    def __find(self, x, radius_overlaps=False, closest=False):
+    def __get_index(self):
+        """Return the index of localizations, created if needed."""
+        if self.__index is None or self.__index_stamp != self.__stamp:
+            self.__index = sppasTierIndex(self.__ann)
+            self.__index_stamp = self.__stamp
+        return self.__index
+
+    # -----------------------------------------------------------------------
+
+    def __get_points_values(self):
+        """Return the sorted (midpoint, radius) of all points of the tier.
+
+        Unlike get_all_points(), the points are not copied.
+
+        """
+        points = list()
+        for ann in self.__ann:
+            for localization, score in ann.get_location():
+                if isinstance(localization, sppasPoint) is True:
+                    points.append(localization)
+                elif isinstance(localization, sppasInterval) is True:
+                    points.append(localization.get_begin())
+                    points.append(localization.get_end())
+                else:
+                    for interval in localization.get_intervals():
+                        points.append(interval.get_begin())
+                        points.append(interval.get_end())
+
+        return sorted((p.get_midpoint(), p.get_radius() or 0) for p in points)
+
+    # -----------------------------------------------------------------------
+
+    def __update_index(self, index, annotation):
+        """Update the index of localizations with an inserted annotation.
+
+        :param index: (int) Index of the annotation in the tier
+        :param annotation: (sppasAnnotation)
+
+        """
+        if self.__index is not None and self.__index_stamp == self.__stamp \
+                and len(self.__index) + 1 == len(self.__ann):
+            self.__index.insert(index, annotation)
+            self.__index_stamp += 1
+        else:
+            self.__index = None
+        self.__stamp += 1
+
+    # -----------------------------------------------------------------------
+
+    def __find_point(self, moment):
+        """Return the index of a point matching the moment, or -1.
+
+        Unlike index(), a dichotomy search returns any of the points that
+        are matching the moment: add() is rejecting the new point only if
+        this one has the same midpoint.
+
+        :param moment: (sppasPoint)
+
+        """
+        lo = 0
+        hi = len(self.__ann)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            a = self.__ann[mid]
+            if moment < a.get_lowest_localization():
+                hi = mid
+            elif moment > a.get_highest_localization():
+                lo = mid + 1
+            else:
+                return mid
+
+        return -1
+
+    # -----------------------------------------------------------------------
+
+    def __closest(self, x):
         """Find index of the 1st annotation whose moment value contains x.
 
+        If no annotation contains x, the index of the last annotation
+        before x is returned.
+
         :param x: (sppasPoint)
-        :param radius_overlaps: (bool)
-        :param closest: (bool) return the closest if there's no annotation on x
-        :return: (int) -1 if not found and closest is False.
+        :return: (int) -1 if the tier is empty
 
         """
         # No annotations in the tier
@@ -1505,87 +1702,27 @@ class sppasTier(sppasMetaData):
             return -1
         # x is before the first one
         if x < self.__ann[0].get_highest_localization():
-            if closest is False:
-                return -1
             return 0
         # x is after the last one
         if x > self.__ann[-1].get_highest_localization():
-            if closest is False:
-                return -1
             return len(self.__ann) - 1
-        # Only one annotation in the tier
-        if len(self.__ann) == 1:
-            if closest is True:
-                return 0
-            if self.__ann[0].get_lowest_localization() <= x < self.__ann[0].get_highest_localization():
-                return 0
-            return -1
 
-        # More than one annotation in the tier.
         is_point = self.is_point()
-        lo = 0
-        hi = len(self.__ann)  # - 1
-        mid = int(float(lo + hi) / 2.)
-
-        # Dichotomy search for the ann idx.
-        found = False
-        while found is False and lo < hi:
-            mid = int(float(lo + hi) / 2.)
-            a = self.__ann[mid]
+        lo = self.__get_index().first_end_reaching(x)
+        for i in range(lo, len(self.__ann)):
+            a = self.__ann[i]
             if is_point is True:
-                p = a.get_location().get_best()
-                if p == x:
-                    found = True
-                elif x < p:
-                    hi = mid
-                else:
-                    lo = mid + 1
-            else:  # Interval or Disjoint
+                if a.get_location().get_best() == x:
+                    return i
+            else:
                 b = a.get_lowest_localization()
                 e = a.get_highest_localization()
-                # SPPAS 4.12
-                # if b <= x < e:
-                #     return mid
-                # later versions:
-                if radius_overlaps is False:
-                    if b.get_midpoint() <= x < e.get_midpoint():
-                        found = True
-                else:
-                    if b <= x <= e:
-                        found = True
-
-                if found is False:
-                    if x <= e:
-                        hi = mid
-                    else:
-                        lo = mid + 1
-
-        if found is True:
-            # The dichotomy search returns randomly an annotation which contains x.
-            # The expected result is the first one. So, store all matching ann
-            # indexes in a list then get the right one.
-            tmp_annotations = list()
-            tmp_annotations.append(mid)
-            i = mid
-            # Go backward into the list of anns, from mid.
-            for ann in reversed(self.__ann[:mid]):
-                i = i - 1
-                b = ann.get_lowest_localization()
-                e = ann.get_highest_localization()
-                if radius_overlaps is False:
-                    if b < x < e:
-                        tmp_annotations.append(i)
-                else:
-                    if b <= x <= e:
-                        tmp_annotations.append(i)
-                if b > x:
-                    break
-            return tmp_annotations[-1]
+                if b < x < e or b.get_midpoint() <= x < e.get_midpoint():
+                    return i
+            if a.get_lowest_localization() > x:
+                return max(0, i - 1)
 
-        # No annotation found.
-        if closest is False:
-            return -1
-        return mid
+        return len(self.__ann) - 1
 
     # -----------------------------------------------------------------------
     # Overloads
@@ -0,0 +1,294 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.anndata.tierindex.py
+:author:   Brigitte Bigi
+:contact:  contact@sppas.org
+:summary:  Index of the localizations of the annotations of a tier.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    ---------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2023  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    ---------------------------------------------------------------------
+
+"""
+
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+
+# ----------------------------------------------------------------------------
+
+
+class sppasTierIndex(object):
+    """Arrays of the lowest and highest localizations of annotations.
+
+    The index stores the midpoint and the radius values of the lowest and
+    the highest localizations of a list of sorted annotations. It allows
+    to find in O(log n) the range of annotations that can match a given
+    point. It does not decide if an annotation is matching: the relations
+    between points are taking the radius into account and they have to be
+    checked on the annotations themselves. The index only ensures that no
+    annotation outside of the returned range can be matching.
+
+    Because annotations of a tier are sorted, but only with radius-aware
+    relations, the midpoint values are not strictly sorted. The searches
+    are then made on prefix maximum and suffix minimum arrays, which are
+    always sorted:
+
+        - the maximum of (midpoint + radius) of all previous annotations;
+        - the minimum of (midpoint - radius) of all next annotations.
+
+    The index does not know when the localizations are modified in-place:
+    the tier re-creates it when its modification stamp has changed.
+
+    """
+
+    # Relative margin added to the searched values, so that a rounding of
+    # the float values can't exclude any expected annotation of the range.
+    EPSILON = 1e-9
+
+    def __init__(self, annotations=()):
+        """Create a sppasTierIndex instance.
+
+        :param annotations: (list of sppasAnnotation) Sorted annotations
+
+        """
+        self.__begin_mid = array('d')
+        self.__begin_radius = array('d')
+        self.__end_mid = array('d')
+        self.__end_radius = array('d')
+
+        # Prefix maximum of (midpoint + radius) of the begin/end points
+        self.__max_begin = array('d')
+        self.__max_end = array('d')
+        # Suffix minimum of (midpoint - radius) of the begin/end points
+        self.__min_begin = array('d')
+        self.__min_end = array('d')
+
+        for ann in annotations:
+            b_mid, b_radius = sppasTierIndex.__point_values(ann.get_lowest_localization())
+            e_mid, e_radius = sppasTierIndex.__point_values(ann.get_highest_localization())
+            self.__begin_mid.append(b_mid)
+            self.__begin_radius.append(b_radius)
+            self.__end_mid.append(e_mid)
+            self.__end_radius.append(e_radius)
+            if len(self.__max_begin) > 0:
+                self.__max_begin.append(max(self.__max_begin[-1], b_mid + b_radius))
+                self.__max_end.append(max(self.__max_end[-1], e_mid + e_radius))
+            else:
+                self.__max_begin.append(b_mid + b_radius)
+                self.__max_end.append(e_mid + e_radius)
+
+        self.__min_begin = array('d', self.__begin_mid)
+        self.__min_end = array('d', self.__end_mid)
+        for i in reversed(range(len(self.__begin_mid))):
+            self.__min_begin[i] -= self.__begin_radius[i]
+            self.__min_end[i] -= self.__end_radius[i]
+            if i + 1 < len(self.__begin_mid):
+                self.__min_begin[i] = min(self.__min_begin[i], self.__min_begin[i + 1])
+                self.__min_end[i] = min(self.__min_end[i], self.__min_end[i + 1])
+
+    # -----------------------------------------------------------------------
+
+    def get_begin_midpoint(self, index):
+        """Return the midpoint value of the lowest localization at index."""
+        return self.__begin_mid[index]
+
+    # -----------------------------------------------------------------------
+
+    def get_end_midpoint(self, index):
+        """Return the midpoint value of the highest localization at index."""
+        return self.__end_mid[index]
+
+    # -----------------------------------------------------------------------
+    # Update
+    # -----------------------------------------------------------------------
+
+    def append(self, annotation):
+        """Append the localizations of an annotation at the end of the index.
+
+        :param annotation: (sppasAnnotation)
+
+        """
+        self.insert(len(self.__begin_mid), annotation)
+
+    # -----------------------------------------------------------------------
+
+    def insert(self, index, annotation):
+        """Insert the localizations of an annotation at the given index.
+
+        :param index: (int) Index of the annotation in the tier
+        :param annotation: (sppasAnnotation)
+
+        """
+        b_mid, b_radius = sppasTierIndex.__point_values(annotation.get_lowest_localization())
+        e_mid, e_radius = sppasTierIndex.__point_values(annotation.get_highest_localization())
+        self.__begin_mid.insert(index, b_mid)
+        self.__begin_radius.insert(index, b_radius)
+        self.__end_mid.insert(index, e_mid)
+        self.__end_radius.insert(index, e_radius)
+
+        sppasTierIndex.__insert_max(self.__max_begin, index, b_mid + b_radius)
+        sppasTierIndex.__insert_max(self.__max_end, index, e_mid + e_radius)
+        sppasTierIndex.__insert_min(self.__min_begin, index, b_mid - b_radius)
+        sppasTierIndex.__insert_min(self.__min_end, index, e_mid - e_radius)
+
+    # -----------------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------------
+
+    def first_end_reaching(self, point):
+        """Return the index of the first annotation which can end at point.
+
+        No annotation before the returned index has its highest localization
+        either equal or greater than point.
+
+        :param point: (sppasPoint)
+        :return: (int) An index in range [0, len]
+
+        """
+        low, high = sppasTierIndex.__point_bounds(point)
+        return bisect_left(self.__max_end, low)
+
+    # -----------------------------------------------------------------------
+
+    def first_begin_reaching(self, point):
+        """Return the index of the first annotation which can start at point.
+
+        No annotation before the returned index has its lowest localization
+        either equal or greater than point.
+
+        :param point: (sppasPoint)
+        :return: (int) An index in range [0, len]
+
+        """
+        low, high = sppasTierIndex.__point_bounds(point)
+        return bisect_left(self.__max_begin, low)
+
+    # -----------------------------------------------------------------------
+
+    def last_end_reaching(self, point):
+        """Return the index of the last annotation which can end at point.
+
+        No annotation after the returned index has its highest localization
+        either equal or lower than point.
+
+        :param point: (sppasPoint)
+        :return: (int) An index in range [-1, len-1]
+
+        """
+        low, high = sppasTierIndex.__point_bounds(point)
+        return bisect_right(self.__min_end, high) - 1
+
+    # -----------------------------------------------------------------------
+
+    def begins_after(self, index, point):
+        """Return True if annotations from index all start after point.
+
+        :param index: (int) Index of an annotation
+        :param point: (sppasPoint)
+
+        """
+        low, high = sppasTierIndex.__point_bounds(point)
+        return self.__min_begin[index] > high
+
+    # -----------------------------------------------------------------------
+
+    def ends_before(self, index, point):
+        """Return True if annotations until index all end before point.
+
+        :param index: (int) Index of an annotation
+        :param point: (sppasPoint)
+
+        """
+        low, high = sppasTierIndex.__point_bounds(point)
+        return self.__max_end[index] < low
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __point_values(point):
+        """Return the midpoint and the radius of a point as floats.
+
+        :param point: (sppasPoint, float, int)
+
+        """
+        if isinstance(point, (int, float)) is True:
+            return float(point), 0.
+        radius = point.get_radius()
+        if radius is None:
+            radius = 0.
+        return float(point.get_midpoint()), float(radius)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __point_bounds(point):
+        """Return the lowest and highest values a point can be equal to."""
+        mid, radius = sppasTierIndex.__point_values(point)
+        margin = sppasTierIndex.EPSILON * max(1., abs(mid))
+        return mid - radius - margin, mid + radius + margin
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __insert_max(values, index, value):
+        """Insert a value into an array of prefix maximum values."""
+        if index > 0:
+            values.insert(index, max(values[index - 1], value))
+        else:
+            values.insert(index, value)
+        i = index + 1
+        while i < len(values) and values[i] < value:
+            values[i] = value
+            i += 1
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __insert_min(values, index, value):
+        """Insert a value into an array of suffix minimum values."""
+        if index < len(values):
+            values.insert(index, min(values[index], value))
+        else:
+            values.insert(index, value)
+        i = index - 1
+        while i >= 0 and values[i] > value:
+            values[i] = value
+            i -= 1
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__begin_mid)
@@ -52,6 +52,7 @@ from .metadata import sppasMetaData
 from .ctrlvocab import sppasCtrlVocab
 from .media import sppasMedia
 from .tier import sppasTier
+from .columnartier import sppasColumnarTier
 from .hierarchy import sppasHierarchy
 from .ann.annotation import sppasAnnotation
 
@@ -383,7 +384,7 @@ class sppasTranscription(sppasMetaData):
             link_type = self._hierarchy.get_hierarchy_type(tier)
 
             if link_type == "TimeAssociation":
-                sppasHierarchy.validate_time_association(parent_tier, tier)
+                self._hierarchy.validate_child(tier)
                 # raise TierHierarchyError(tier.get_name())
 
             # The parent must have such location...
@@ -414,13 +415,8 @@ class sppasTranscription(sppasMetaData):
         else:
             # if current tier is a parent
             for child_tier in self._hierarchy.get_children(tier):
-                link_type = self._hierarchy.get_hierarchy_type(child_tier)
-
                 # Ensure the hierarchy is still valid with children
-                if link_type == "TimeAssociation":
-                    sppasHierarchy.validate_time_association(tier, child_tier)
-                elif link_type == "TimeAlignment":
-                    sppasHierarchy.validate_time_alignment(tier, child_tier)
+                self._hierarchy.validate_child(child_tier)
 
     # -----------------------------------------------------------------------
 
@@ -434,19 +430,11 @@ class sppasTranscription(sppasMetaData):
         parent_tier = self._hierarchy.get_parent(tier)
         if parent_tier is not None:
             # Given tier is a child
-            link_type = self._hierarchy.get_hierarchy_type(tier)
-            if link_type == "TimeAssociation":
-                sppasHierarchy.validate_time_association(parent_tier, tier)
-            if link_type == "TimeAlignment":
-                sppasHierarchy.validate_time_alignment(parent_tier, tier)
+            self._hierarchy.validate_child(tier)
         else:
             # Given tier is a parent
             for child_tier in self._hierarchy.get_children(tier):
-                link_type = self._hierarchy.get_hierarchy_type(child_tier)
-                if link_type == "TimeAssociation":
-                    sppasHierarchy.validate_time_association(tier, child_tier)
-                elif link_type == "TimeAlignment":
-                    sppasHierarchy.validate_time_alignment(tier, child_tier)
+                self._hierarchy.validate_child(child_tier)
 
     # -----------------------------------------------------------------------
     # Tiers
@@ -486,7 +474,7 @@ class sppasTranscription(sppasMetaData):
         """Return True if the given tier is in the list of tiers.
 
         """
-        if isinstance(tier, sppasTier) is False:
+        if isinstance(tier, (sppasTier, sppasColumnarTier)) is False:
             return False
         for t in self._tiers:
             if t is tier:
@@ -613,7 +601,7 @@ class sppasTranscription(sppasMetaData):
         :param tier: (sppasTier) The tier to rename.
 
         """
-        if not isinstance(tier, sppasTier):
+        if not isinstance(tier, (sppasTier, sppasColumnarTier)):
             raise AnnDataTypeError(tier, "sppasTier")
 
         name = tier.get_name()
@@ -644,7 +632,7 @@ class sppasTranscription(sppasMetaData):
     def append(self, tier):
         """Append a new tier.
 
-        :param tier: (sppasTier) the tier to append
+        :param tier: (sppasTier, sppasColumnarTier) the tier to append
 
         """
         if self.contains(tier) is True:
@@ -742,7 +730,9 @@ class sppasTranscription(sppasMetaData):
             return
 
         for tier in self._tiers:
-            if delay < 0:
+            if isinstance(tier, sppasColumnarTier) is True:
+                tier.shift(delay)
+            elif delay < 0:
                 # shifted to left: from the first to the last annotation
                 for ann in tier:
                     ann.get_location().shift(delay)
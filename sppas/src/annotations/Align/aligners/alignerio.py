@@ -584,6 +584,43 @@ class mlf(BaseAlignersReader):
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def get_entries(lines):
+        """Return the label entries of a master label file.
+
+        A mlf file of HVite with several aligned audio files contains an
+        entry for each one. An entry starts by the quoted name of the
+        label file and ends by a line with a dot:
+
+            #!MLF!#
+            "*/track_000001.lab"
+            0 200000 h#_s2 -188.945724 h#
+            ...
+            .
+
+        :param lines: (List of str)
+        :returns: (dict) The lines of each entry, with the base name of
+        its label file without extension as key.
+
+        """
+        entries = dict()
+        entry = None
+        for line in lines:
+            line = line.strip()
+            if entry is None:
+                if line.startswith('"') and line.endswith('"'):
+                    name = line[1:-1].replace("\\", "/").split("/")[-1]
+                    entry = list()
+                    entries[os.path.splitext(name)[0]] = entry
+            elif line == ".":
+                entry = None
+            else:
+                entry.append(line)
+
+        return entries
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def read(filename):
         """Read an alignment file (a mlf file).
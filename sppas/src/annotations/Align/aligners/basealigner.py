@@ -41,6 +41,9 @@
 import os
 import shutil
 import random
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 from sppas.core.coreutils import sppasUnicode
@@ -49,6 +52,13 @@ from ..models.acm.tiedlist import sppasTiedList
 
 # ---------------------------------------------------------------------------
 
+# The tiedlist of a model can be modified by aligners running concurrently.
+# The lock serializes the writers; the readers are protected by replacing
+# the file at once.
+_tiedlist_lock = threading.Lock()
+
+# ---------------------------------------------------------------------------
+
 
 class BaseAligner(object):
     """Base class for any automatic alignment system.
@@ -105,7 +115,10 @@ class BaseAligner(object):
     def add_tiedlist(self, entries):
         """Add missing triphones/biphones in the tiedlist of the model.
 
-        Backup the initial file if entries were added.
+        Backup the initial file if entries were added. The new tiedlist is
+        written into a temporary file which then replaces the initial one:
+        an aligner running concurrently never reads a partially written
+        tiedlist.
 
         :param entries: (list) List of missing entries into the tiedlist.
         :returns: list of entries really added
@@ -115,17 +128,24 @@ class BaseAligner(object):
         if os.path.exists(tied_file) is False:
             return []
 
-        tie = sppasTiedList()
-        tie.read(tied_file)
-        add_entries = tie.add_to_tie(entries)
-        if len(add_entries) > 0:
-            today = str(date.today())
-            rand_val = str(int(random.random()*10000))
-            backup_tied_file = os.path.join(
-                self._model,
-                "tiedlist." + today + "." + rand_val)
-            shutil.copy(tied_file, backup_tied_file)
-            tie.save(tied_file)
+        with _tiedlist_lock:
+            tie = sppasTiedList()
+            tie.read(tied_file)
+            add_entries = tie.add_to_tie(entries)
+            if len(add_entries) > 0:
+                today = str(date.today())
+                rand_val = str(int(random.random()*10000))
+                backup_tied_file = os.path.join(
+                    self._model,
+                    "tiedlist." + today + "." + rand_val)
+                shutil.copy(tied_file, backup_tied_file)
+                tmp_tied_file = tied_file + ".{:d}.tmp".format(os.getpid())
+                try:
+                    tie.save(tmp_tied_file)
+                    os.replace(tmp_tied_file, tied_file)
+                finally:
+                    if os.path.exists(tmp_tied_file):
+                        os.remove(tmp_tied_file)
 
         return add_entries
 
@@ -193,3 +213,79 @@ class BaseAligner(object):
 
         """
         raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def run_alignments(self, tracks, nb_jobs=1):
+        """Perform forced-alignment of several tracks.
+
+        The tracks are divided into batches by get_batches(). Each batch is
+        aligned by run_batch() of a copy of this aligner, and a pool of
+        nb_jobs threads aligns the batches concurrently if nb_jobs is more
+        than 1. The results are returned in the order of the tracks.
+
+        A track is a tuple (phones, tokens, input_wav, output_align), with
+        the same input_wav and output_align than in run_alignment().
+
+        :param tracks: (list) The tracks to time-align
+        :param nb_jobs: (int) Max number of batches aligned at a time
+        :returns: (list) A tuple (message, error) for each track. error is
+        the exception raised by the track, or None if success.
+
+        """
+        nb_jobs = max(1, min(int(nb_jobs), len(tracks)))
+        batches = self.get_batches(tracks, nb_jobs)
+        if len(batches) == 1:
+            return self.run_batch(batches[0])
+
+        results = list()
+        with ThreadPoolExecutor(max_workers=nb_jobs) as executor:
+            futures = [executor.submit(copy.copy(self).run_batch, batch)
+                       for batch in batches]
+            for future in futures:
+                results.extend(future.result())
+        return results
+
+    # -----------------------------------------------------------------------
+
+    def get_batches(self, tracks, nb_jobs=1):
+        """Divide the tracks into batches of consecutive tracks.
+
+        The default is a batch for each track if several jobs are allowed:
+        the system is run once per track anyway, and the pool of jobs then
+        balances tracks of very different durations.
+
+        :param tracks: (list) The tracks to time-align
+        :param nb_jobs: (int) Max number of batches aligned at a time
+        :returns: (list of list) Batches, in the order of the tracks
+
+        """
+        if nb_jobs > 1:
+            return [[track] for track in tracks]
+        return [tracks]
+
+    # -----------------------------------------------------------------------
+
+    def run_batch(self, tracks):
+        """Perform forced-alignment of a batch of tracks.
+
+        The default is to align each track with run_alignment(). Aligners
+        able to align several audio files in a single run of the system
+        should override it.
+
+        :param tracks: (list) Tuples (phones, tokens, input_wav, output_align)
+        :returns: (list) A tuple (message, error) for each track
+
+        """
+        results = list()
+        for phones, tokens, input_wav, output_align in tracks:
+            try:
+                self.set_phones(phones)
+                self.set_tokens(tokens)
+                message = self.check_data()
+                message += self.run_alignment(input_wav, output_align)
+                results.append((message, None))
+            except Exception as e:
+                results.append(("", e))
+
+        return results
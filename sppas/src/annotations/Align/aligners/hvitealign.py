@@ -48,6 +48,8 @@ from sppas.src.resources.dictpron import sppasDictPron
 from sppas.core.coreutils import u
 
 from .basealigner import BaseAligner
+from .alignerio import BaseAlignersReader
+from .alignerio import mlf
 
 # ----------------------------------------------------------------------------
 
@@ -70,6 +72,10 @@ class HviteAligner(BaseAligner):
             - a paragraph...
         no longer than a few seconds.
 
+        A batch of such segments can also be aligned by a single run of
+        HVite, with a script file listing the audio files: the acoustic
+        model is then loaded only once.
+
         :param model_dir: (str) Name of the directory of the acoustic model
 
         """
@@ -89,7 +95,18 @@ class HviteAligner(BaseAligner):
 
         """
         dictpron = sppasDictPron()
+        self.gen_grammar(grammar_name, dictpron)
+        dictpron.save_as_ascii(dict_name)
+
+    # -----------------------------------------------------------------------
+
+    def gen_grammar(self, grammar_name, dictpron):
+        """Generate the grammar for HVite and add pronunciations to a dict.
+
+        :param grammar_name: (str) the file name of the tokens
+        :param dictpron: (sppasDictPron) the dictionary to fill in
 
+        """
         with codecs.open(grammar_name, 'w', sg.__encoding__) as flab:
 
             for token, pron in zip(self._tokens.split(), self._phones.split()):
@@ -104,8 +121,6 @@ class HviteAligner(BaseAligner):
                 # lab file (one token per line)
                 flab.write(token+"\n")
 
-        dictpron.save_as_ascii(dict_name)
-
     # -----------------------------------------------------------------------
 
     def run_hvite(self, inputwav, outputalign):
@@ -128,6 +143,134 @@ class HviteAligner(BaseAligner):
         grammar_name = base_name + ".lab"
         self.gen_dependencies(grammar_name, dict_name)
 
+        command = self._hvite_command(dict_name, outputalign)
+        command += inputwav
+
+        return self._execute(command, outputalign)
+
+    # -----------------------------------------------------------------------
+
+    def run_hvite_batch(self, scpname, dict_name, outputalign):
+        """Perform the speech segmentation of a list of audio files.
+
+        Call the system command `HVite` with a script file. The label file
+        of each audio file is expected in the same directory, with the same
+        base name and the ".lab" extension. The alignments of all the files
+        are saved in a single master label file.
+
+        :param scpname: (str) the script file name with the audio file names
+        :param dict_name: (str) the dictionary of all the audio files
+        :param outputalign: (str) the output file name
+
+        """
+        if self._model is None:
+            raise IOError('HVite aligner requires an acoustic model')
+
+        command = self._hvite_command(dict_name, outputalign)
+        command += ' -S "' + scpname.replace('"', '\\"') + '"'
+
+        return self._execute(command, outputalign)
+
+    # -----------------------------------------------------------------------
+
+    def get_batches(self, tracks, nb_jobs=1):
+        """Divide the tracks into nb_jobs batches of consecutive tracks.
+
+        Each batch is aligned by a single run of HVite.
+
+        :param tracks: (list) The tracks to time-align
+        :param nb_jobs: (int) Max number of batches aligned at a time
+        :returns: (list of list) Batches, in the order of the tracks
+
+        """
+        nb_jobs = max(1, min(nb_jobs, len(tracks)))
+        size, remain = divmod(len(tracks), nb_jobs)
+        batches = list()
+        start = 0
+        for i in range(nb_jobs):
+            end = start + size + (1 if i < remain else 0)
+            batches.append(tracks[start:end])
+            start = end
+        return batches
+
+    # -----------------------------------------------------------------------
+
+    def run_batch(self, tracks):
+        """Perform the speech segmentation of a batch of tracks.
+
+        The tracks are aligned by a single run of HVite as long as the
+        pronunciations of their tokens are the same. The dictionary of a
+        run is the union of the pronunciations of its tracks, so a track
+        with a token pronounced differently is aligned by the next run.
+        A track missing in the result of a run is aligned alone, to get
+        the message of HVite.
+
+        :param tracks: (list) Tuples (phones, tokens, input_wav, output_align)
+        :returns: (list) A tuple (message, error) for each track
+
+        """
+        results = [("", None)] * len(tracks)
+        group = list()
+        prons = dict()
+        for i, (phones, tokens, input_wav, output_align) in enumerate(tracks):
+            try:
+                self.set_phones(phones)
+                self.set_tokens(tokens)
+                message = self.check_data()
+            except Exception as e:
+                results[i] = ("", e)
+                continue
+
+            track = (i, message, self._phones, self._tokens)
+            track_prons = dict()
+            for token, pron in zip(self._tokens.split(), self._phones.split()):
+                track_prons.setdefault(token, set()).update(pron.split("|"))
+            for token in track_prons:
+                if token in prons and prons[token] != track_prons[token]:
+                    self.__run_group(group, tracks, results)
+                    group = list()
+                    prons = dict()
+                    break
+            prons.update(track_prons)
+            group.append(track)
+
+        self.__run_group(group, tracks, results)
+        return results
+
+    # -----------------------------------------------------------------------
+
+    def run_alignment(self, input_wav, output_align):
+        """Execute the external program `HVite` to align.
+
+        Given audio file must match the ones we used to train the acoustic
+        model: PCM-WAV 16000 Hz, 16 bits
+
+        :param input_wav: (str) audio input file name
+        :param output_align: (str) the output file name
+
+        :returns: (str) An empty string.
+
+        """
+        output_align = output_align + "." + self._outext
+
+        message = self.run_hvite(input_wav, output_align)
+
+        if os.path.isfile(output_align):
+            with codecs.open(output_align, 'r', sg.__encoding__) as f:
+                lines = f.readlines()
+                f.close()
+
+            if len(lines) == 1:
+                raise IOError(message + "\n" + lines[0])
+
+        return ""
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def _hvite_command(self, dict_name, outputalign):
+        """Return the HVite command, without the audio input."""
         # Example of use with triphones:
         #
         # HVite
@@ -172,9 +315,14 @@ class HviteAligner(BaseAligner):
         command += ' -y lab'
         command += ' "' + dict_name.replace('"', '\\"') + '" '
         command += ' "' + graph.replace('"', '\\"') + '" '
-        command += inputwav
 
-        # Execute command
+        return command
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _execute(command, outputalign):
+        """Execute an HVite command and return its message."""
         p = Popen(command, shell=True, stdout=PIPE, stderr=STDOUT)
         p.wait()
         line = p.communicate()
@@ -196,28 +344,60 @@ class HviteAligner(BaseAligner):
 
     # -----------------------------------------------------------------------
 
-    def run_alignment(self, input_wav, output_align):
-        """Execute the external program `HVite` to align.
-
-        Given audio file must match the ones we used to train the acoustic
-        model: PCM-WAV 16000 Hz, 16 bits
-
-        :param input_wav: (str) audio input file name
-        :param output_align: (str) the output file name
+    def __run_group(self, group, tracks, results):
+        """Align a group of tracks by a single run of HVite.
 
-        :returns: (str) An empty string.
+        :param group: (list) Tuples (index, message, phones, tokens)
+        :param tracks: (list) All the tracks of the batch
+        :param results: (list) The results to fill in
 
         """
-        output_align = output_align + "." + self._outext
+        if len(group) == 0:
+            return
 
-        message = self.run_hvite(input_wav, output_align)
-
-        if os.path.isfile(output_align):
-            with codecs.open(output_align, 'r', sg.__encoding__) as f:
-                lines = f.readlines()
-                f.close()
+        # The input files of HVite, named after the first track
+        base_name = os.path.splitext(tracks[group[0][0]][2])[0] + "-batch"
+        dict_name = base_name + ".dict"
+        scp_name = base_name + ".scp"
+        output_batch = base_name + "." + self._outext
 
-            if len(lines) == 1:
-                raise IOError(message + "\n" + lines[0])
+        dictpron = sppasDictPron()
+        with codecs.open(scp_name, 'w', sg.__encoding__) as fscp:
+            for i, message, phones, tokens in group:
+                input_wav = tracks[i][2]
+                self._phones = phones
+                self._tokens = tokens
+                self.gen_grammar(os.path.splitext(input_wav)[0] + ".lab",
+                                 dictpron)
+                fscp.write(input_wav + "\n")
+        dictpron.save_as_ascii(dict_name)
 
-        return ""
+        try:
+            self.run_hvite_batch(scp_name, dict_name, output_batch)
+            entries = mlf.get_entries(
+                BaseAlignersReader.get_lines(output_batch))
+        except Exception:
+            entries = dict()
+
+        # Split the result into the alignment file of each track
+        for i, message, phones, tokens in group:
+            input_wav = tracks[i][2]
+            output_align = tracks[i][3] + "." + self._outext
+            name = os.path.splitext(os.path.basename(input_wav))[0]
+            units = mlf.get_units(entries.get(name, list()))
+            if len(units) > 0:
+                with codecs.open(output_align, 'w', sg.__encoding__) as fp:
+                    fp.write("#!MLF!#\n")
+                    fp.write('"*/{:s}.lab"\n'.format(name))
+                    for line in entries[name]:
+                        fp.write(line + "\n")
+                    fp.write(".\n")
+                results[i] = (message, None)
+            else:
+                try:
+                    self._phones = phones
+                    self._tokens = tokens
+                    results[i] = (message + self.run_alignment(
+                        input_wav, tracks[i][3]), None)
+                except Exception as e:
+                    results[i] = ("", e)
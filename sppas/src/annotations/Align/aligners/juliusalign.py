@@ -126,6 +126,14 @@ class JuliusAligner(BaseAligner):
     If outext is set to "walign", JuliusAligner will use a slm and will
     produce words alignments only.
 
+    The grammar and the dictionary are fixed when `julius` starts, and they
+    are specific to each segment. Unlike HviteAligner, JuliusAligner has
+    then no batched mode: `-filelist` decodes all the files with the same
+    grammar, and the acoustic model is loaded by each run of `julius`, i.e.
+    once per segment. Only the segments can be aligned concurrently with
+    run_alignments(). The module mode of `julius` (-module), which allows
+    to change the grammar of a running process, is not supported.
+
     """
 
     def __init__(self, model_dir=None):
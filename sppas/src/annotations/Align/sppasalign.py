@@ -178,6 +178,7 @@ class sppasAlign(sppasBaseAnnotation):
             - clean
             - basic
             - aligner
+            - nbjobs
 
         :param options: (sppasOption)
 
@@ -195,6 +196,9 @@ class sppasAlign(sppasBaseAnnotation):
             elif "aligner" == key:
                 self.set_aligner(opt.get_value())
 
+            elif "nbjobs" == key:
+                self.set_nb_jobs(opt.get_value())
+
             elif "pattern" in key:
                 self._options[key] = opt.get_value()
 
@@ -233,6 +237,22 @@ class sppasAlign(sppasBaseAnnotation):
         """
         self._options['basic'] = basic
 
+    # -----------------------------------------------------------------------
+
+    def set_nb_jobs(self, nb_jobs):
+        """Fix the max number of tracks to align at a time.
+
+        :param nb_jobs: (int) Number of concurrent jobs. 1 to align the
+        tracks one after the other.
+        :raises: ValueError
+
+        """
+        nb_jobs = int(nb_jobs)
+        if nb_jobs < 1:
+            raise ValueError("The number of jobs should be a positive "
+                             "integer. Got {:d}.".format(nb_jobs))
+        self._options['nbjobs'] = nb_jobs
+
     # -----------------------------------------------------------------------
     # Automatic Speech Segmentation
     # -----------------------------------------------------------------------
@@ -260,33 +280,32 @@ class sppasAlign(sppasBaseAnnotation):
         if nb_tracks == 0:
             raise EmptyDirectoryError(workdir)
 
-        # Align each track
-        track_number = 0
-        while track_number < nb_tracks:
+        # Align all the tracks, in batches if the aligner can, and
+        # several tracks at a time if allowed
+        tracks = [self._tracksrw.get_filenames(workdir, track_number)
+                  for track_number in range(1, nb_tracks + 1)]
+        results = self._segmenter.segment_tracks(
+            tracks, self._options.get('nbjobs', 1))
 
-            # Fix track number (starts from 1)
-            track_number += 1
+        for track_number, (msg, error) in enumerate(results, start=1):
             logging.info(MSG_ALIGN_TRACK.format(number=track_number))
+            (audio, phn, token, align) = tracks[track_number - 1]
 
-            # Fix the expected filenames for this track
-            (audio, phn, token, align) = self._tracksrw.get_filenames(workdir, track_number)
-
-            # Perform speech segmentation
-            try:
-                msg = self._segmenter.segment(audio, phn, token, align)
+            if error is None:
                 if len(msg) > 0:
                     self.logfile.print_message(MSG_ALIGN_TRACK.format(number=track_number), indent=1)
                     self.logfile.print_message(msg, indent=2, status=annots.warning)
 
-            except Exception as e:
+            else:
                 self.logfile.print_message(MSG_ALIGN_TRACK.format(number=track_number), indent=1)
                 # Something went wrong and the aligner failed
                 self.logfile.print_message(
                     MSG_ALIGN_FAILED.format(name=self._segmenter.get_aligner_name()),
                     indent=2,
                     status=annots.error)
-                self.logfile.print_message(str(e), indent=3, status=annots.error)
-                logging.error(traceback.format_exc())
+                self.logfile.print_message(str(error), indent=3, status=annots.error)
+                logging.error("".join(traceback.format_exception(
+                    type(error), error, error.__traceback__)))
 
                 # Execute BasicAlign
                 if self._options['basic'] is True:
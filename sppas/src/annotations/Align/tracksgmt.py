@@ -202,6 +202,50 @@ class TrackSegmenter(object):
 
         return ret
 
+    # -----------------------------------------------------------------------
+
+    def segment_tracks(self, tracks, nb_jobs=1):
+        """Call the aligner to perform speech segmentation of several tracks.
+
+        The tracks the aligner has to time-align are given to it all at
+        once, so that it can align them in batches instead of one by one.
+        The other ones are segmented like in segment().
+
+        :param tracks: (list) Tuples (audio_filename, phon_name, token_name, align_name)
+        :param nb_jobs: (int) Max number of batches the aligner runs at a time
+        :returns: (list) A tuple (message, error) for each track. error is
+        the exception raised by the track, or None if success.
+
+        """
+        results = [("", None)] * len(tracks)
+        to_align = list()
+        indexes = list()
+        for i, (audio_filename, phon_name, token_name, align_name) in enumerate(tracks):
+            phones = ""
+            tokens = ""
+            if phon_name is not None:
+                phones = self._readline(phon_name)
+            if token_name is not None:
+                tokens = self._readline(token_name)
+
+            if len(phones) > 0 and os.path.exists(audio_filename) is True and \
+                    (len(phones.split()) > 1 or "-" in phones):
+                to_align.append((phones, tokens, audio_filename, align_name))
+                indexes.append(i)
+            else:
+                try:
+                    results[i] = (self.segment(audio_filename, phon_name,
+                                               token_name, align_name), None)
+                except Exception as e:
+                    results[i] = ("", e)
+
+        if len(to_align) > 0:
+            aligned = self._aligner.run_alignments(to_align, nb_jobs)
+            for i, result in zip(indexes, aligned):
+                results[i] = result
+
+        return results
+
     # -----------------------------------------------------------------------
     # Private
     # -----------------------------------------------------------------------
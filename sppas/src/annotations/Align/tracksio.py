@@ -55,6 +55,7 @@ from sppas.src.anndata import sppasLocation
 from sppas.src.anndata import sppasInterval
 from sppas.src.anndata import sppasPoint
 from sppas.src.anndata.aio.aioutils import serialize_labels
+from sppas.src.anndata.aio.aioutils import extend_tier
 from sppas.src.resources.mapping import sppasMapping
 from sppas.src.anndata import sppasTag, sppasLabel
 
@@ -352,6 +353,7 @@ class TracksReader(object):
 
         """
         try:
+            annotations = list()
             for i, t in enumerate(tdata):
                 # fix the location - an interval
                 (loc_s, loc_e, contents, scores) = t
@@ -370,7 +372,9 @@ class TracksReader(object):
                     tag_scores = None
                 label = sppasLabel(tags, tag_scores)
 
-                tier.create_annotation(location, label)
+                annotations.append(sppasAnnotation(location, label))
+
+            extend_tier(tier, annotations)
 
         except:
             logging.error('The following data were not added to the tier '
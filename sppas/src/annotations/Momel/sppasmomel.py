@@ -40,9 +40,11 @@
 """
 
 from sppas.src.anndata.aio.praat import sppasPitchTier
+from sppas.src.anndata.aio.aioutils import extend_tier
 from sppas.src.anndata import sppasTrsRW
 from sppas.src.anndata import sppasTranscription
 from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasAnnotation
 from sppas.src.anndata import sppasLocation
 from sppas.src.anndata import sppasPoint
 from sppas.src.anndata import sppasLabel
@@ -270,11 +272,11 @@ class sppasMomel(sppasBaseAnnotation):
 
         """
         tier = sppasTier('Momel')
-        for anchor in anchors:
-            tier.create_annotation(
+        extend_tier(tier, [
+            sppasAnnotation(
                 sppasLocation(sppasPoint(anchor.x * 0.01, 0.005)),
-                sppasLabel(sppasTag(anchor.y, "float"))
-            )
+                sppasLabel(sppasTag(anchor.y, "float")))
+            for anchor in anchors])
 
         return tier
 
@@ -40,6 +40,7 @@
 """
 
 import logging
+import bisect
 
 from sppas.core.config import symbols
 from sppas.src.anndata import sppasTrsRW
@@ -161,45 +162,46 @@ class sppasOtherRepet(sppasBaseRepet):
         if self._options['allechos'] is True:
             trs_output.create_tier("OR-AllEchos")
 
+        # Build the data of the speakers, indexed once for all the windows
+        data1 = DataSpeaker([serialize_labels(ann.get_labels())
+                             for ann in inputtier1])
+        midpoints1 = [ann.get_lowest_localization().get_midpoint()
+                      for ann in inputtier1]
+        labels2 = [serialize_labels(ann.get_labels()) for ann in inputtier2]
+        data2 = DataSpeaker(labels2)
+        breaks2 = [i for i, label in enumerate(labels2) if label == SIL_ORTHO]
+        midpoints2 = [ann.get_lowest_localization().get_midpoint()
+                      for ann in inputtier2]
+
         # Initialization of tok_start, and tok_end
         tok_start_src = 0
         tok_end_src = min(20, len(inputtier1)-1)  # 20 is the max nb of tokens in a src
         tok_start_echo = 0
 
-        tokens2 = list()
-        speaker2 = DataSpeaker(tokens2)
+        speaker2 = DataSpeaker(list())
         # Detection is here:
         # detect() is applied word by word, from tok_start to tok_end
         while tok_start_src < tok_end_src:
 
-            # Build an array with the tokens
-            tokens1 = [serialize_labels(inputtier1[i].get_labels())
-                       for i in range(tok_start_src, tok_end_src+1)]
-            speaker1 = DataSpeaker(tokens1)
+            # Get the window of the tokens
+            speaker1 = data1.get_window(tok_start_src, tok_end_src)
 
             # Create speaker2
             # re-create only if different of the previous step...
-            src_begin = inputtier1[tok_start_src].get_lowest_localization().get_midpoint()
-            echo_begin = inputtier2[tok_start_echo].get_lowest_localization().get_midpoint()
-            if len(tokens2) == 0 or echo_begin < src_begin:
-                tokens2 = list()
-                nb_breaks = 0
-                init_tok_start_echo = tok_start_echo
-                tok_start_echo = -1
-
-                for i in range(init_tok_start_echo, len(inputtier2)):
-                    ann = inputtier2[i]
-                    # append tokens only if ann is during or after the beginning of the source
-                    if ann.get_lowest_localization().get_midpoint() >= src_begin:
-                        label = serialize_labels(ann.get_labels())
-                        if tok_start_echo == -1:
-                            tok_start_echo = i
-                        if label == SIL_ORTHO:
-                            nb_breaks += 1
-                        if nb_breaks == self._options['span']:
-                            break
-                        tokens2.append(label)
-                speaker2 = DataSpeaker(tokens2)
+            src_begin = midpoints1[tok_start_src]
+            echo_begin = midpoints2[tok_start_echo]
+            if len(speaker2) == 0 or echo_begin < src_begin:
+                # tokens are during or after the beginning of the source,
+                # and until the span-th break
+                tok_start_echo = bisect.bisect_left(
+                    midpoints2, src_begin, max(0, tok_start_echo))
+                i = bisect.bisect_left(breaks2, tok_start_echo) + self._options['span'] - 1
+                tok_end_echo = len(labels2)
+                if i < len(breaks2):
+                    tok_end_echo = breaks2[i]
+                speaker2 = data2.get_window(tok_start_echo, tok_end_echo - 1)
+                if tok_start_echo == len(labels2):
+                    tok_start_echo = -1
 
             # We can't go too further due to the required time-alignment of
             # tokens between src/echo
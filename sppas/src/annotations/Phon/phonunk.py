@@ -40,14 +40,17 @@
 """
 
 import re
+import bisect
 
 from sppas.core.coreutils import sppasUnicode
+from sppas.src.resources import sppasDictPron
 
 from .dagphon import sppasDAGPhonetizer
 
 # ---------------------------------------------------------------------------
 
 LIMIT_SIZE = 40  # Max nb of characters of an unknown entry
+MEMO_SIZE = 10000  # Max nb of memorized phonetizations
 
 # ---------------------------------------------------------------------------
 
@@ -63,6 +66,13 @@ class sppasPhonUnk(object):
     dictionary. Since this algorithm uses the dictionary, the quality of
     such a phonetization strongly depends on this resource.
 
+    The prefixes of an entry are searched by dichotomy among the sorted
+    entries of the dictionary, and its suffixes among the sorted reversed
+    entries: the scan of an entry stops as soon as no entry starts (or
+    ends) with the string. The reversed entries are sorted at the first
+    unknown entry, and sorted again if the dictionary was modified. The
+    results of the last MEMO_SIZE entries are memorized.
+
     :example:
     >>> d = { 'a':'a|aa', 'b':'b', 'c':'c|cc', 'abb':'abb', 'bac':'bac' }
     >>> p = sppasPhonUnk(d)
@@ -78,6 +88,16 @@ class sppasPhonUnk(object):
         self.prondict = pron_dict
         self.dagphon = sppasDAGPhonetizer(variants=4)
 
+        # Sorted reversed entries of the dictionary, and sorted entries if
+        # the dictionary can't search for a prefix, created when needed.
+        # The stamp is the one of the dictionary when they were created.
+        self.__reversed = None
+        self.__entries = None
+        self.__stamp = None
+
+        # Memorized phonetization of the entries, None if failed
+        self.__phons = dict()
+
     # ------------------------------------------------------------------
     # Getters and Setters
     # ------------------------------------------------------------------
@@ -89,6 +109,7 @@ class sppasPhonUnk(object):
 
         """
         self.dagphon.set_variants(v)
+        self.__phons = dict()
 
     # -----------------------------------------------------------------------
 
@@ -100,6 +121,31 @@ class sppasPhonUnk(object):
         :raises: Exception if the word can NOT be phonetized
 
         """
+        self.__check_entries()
+        if entry in self.__phons:
+            pron = self.__phons[entry]
+            if pron is None:
+                raise Exception
+            return pron
+
+        # Forget the oldest memorized entry
+        if len(self.__phons) >= MEMO_SIZE:
+            del self.__phons[next(iter(self.__phons))]
+
+        try:
+            pron = self.__phonetize(entry)
+        except Exception:
+            self.__phons[entry] = None
+            raise
+        self.__phons[entry] = pron
+        return pron
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __phonetize(self, entry):
+        """Return the phonetization of an unknown entry or raise Exception."""
         _str = sppasUnicode(entry).to_strip()
         _str = sppasUnicode(_str).to_lower()
         if len(_str) > 0 and _str[-1].isalnum() is False:
@@ -148,25 +194,64 @@ class sppasPhonUnk(object):
         raise Exception
 
     # -----------------------------------------------------------------------
-    # Private
+
+    def __check_entries(self):
+        """Sort the entries if not done or if the dictionary was modified.
+
+        A dict has no modification stamp: its size is used instead.
+
+        """
+        if isinstance(self.prondict, sppasDictPron) is True:
+            stamp = self.prondict.get_modification_stamp()
+        else:
+            stamp = len(self.prondict)
+        if self.__reversed is not None and stamp == self.__stamp:
+            return
+
+        if isinstance(self.prondict, sppasDictPron) is True:
+            self.__entries = None
+        else:
+            self.__entries = sorted(self.prondict)
+        self.__reversed = sorted(token[::-1] for token in self.prondict)
+        self.__stamp = stamp
+        self.__phons = dict()
+
+    # -----------------------------------------------------------------------
+
+    def __has_prefix(self, prefix):
+        """Return True if an entry of the dictionary starts with prefix."""
+        if self.__entries is None:
+            return self.prondict.has_prefix(prefix)
+        return sppasPhonUnk.__starts_with(self.__entries, prefix)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __starts_with(entries, prefix):
+        """Return True if a string of the sorted list starts with prefix."""
+        i = bisect.bisect_left(entries, prefix)
+        return i < len(entries) and entries[i].startswith(prefix)
+
     # -----------------------------------------------------------------------
 
     def __longestlr(self, entry):
         """Select the longest phonetization of an entry, from the end.
 
+        The prefixes of the entry are explored in a single scan, which
+        stops as soon as no entry of the dictionary starts with a prefix.
+
         :param entry: (str)
 
         """
-        i = len(entry)
-        while i > 0:
-            # Find in the dictionary a substring from 0 to i
+        longest = 0
+        for i in range(1, len(entry) + 1):
+            if self.__has_prefix(entry[:i]) is False:
+                break
             if entry[:i] in self.prondict:
-                # Return index for the longest string
-                return i
-            i -= 1
+                longest = i
 
-        # Did not find any pronunciation for this entry!
-        return 0
+        # 0 if we did not find any pronunciation for this entry!
+        return longest
 
     # -----------------------------------------------------------------------
 
@@ -219,17 +304,23 @@ class sppasPhonUnk(object):
     # -----------------------------------------------------------------------
 
     def __longestrl(self, entry):
-        """Select the longest phonetization of an entry, from the start."""
-        i = 0
-        while i < len(entry):
-            # Find in the dictionary a substring from i to the entry-length
-            if entry[i:] in self.prondict:
-                # Return index for the longest string
-                return i
-            i += 1
-
-        # Did not find any pronunciation for this entry!
-        return len(entry)
+        """Select the longest phonetization of an entry, from the start.
+
+        The suffixes of the entry are explored in a single scan, which
+        stops as soon as no entry of the dictionary ends with a suffix.
+
+        """
+        longest = len(entry)
+        reversed_entry = entry[::-1]
+        for i in range(1, len(entry) + 1):
+            if sppasPhonUnk.__starts_with(self.__reversed,
+                                          reversed_entry[:i]) is False:
+                break
+            if entry[-i:] in self.prondict:
+                longest = len(entry) - i
+
+        # len(entry) if we did not find any pronunciation for this entry!
+        return longest
 
     # -----------------------------------------------------------------------
 
@@ -76,32 +76,51 @@ class ReOccurences(object):
         in ann2. It is not one-to-one: some labels of ann2 could not match
         those of ann1.
 
+        The tags of anns2 are indexed, so that the annotations matching a
+        label of ann1 are get from the tags of this label, instead of
+        comparing this label to all labels of all annotations.
+
         :param ann1: (sppasAnnotation)
         :param anns2: (list of sppasAnnotation)
         :returns: (list of sppasAnnotation)
 
         """
-        reocc = list()
-        for ann2 in anns2:
-
-            # Evaluate if all labels of ann1 are also in ann2
-            match = False
-            for label1 in ann1.get_labels():
-                match = False
-                for label2 in ann2.get_labels():
-                    equals = ReOccurences.compare_labels(label1, label2)
-                    # we've found that a label of ann2 is matching label1
-                    # we can stop to search it anymore. label1 == label2
-                    if equals > 0:
-                        match = True
-                        break
-
-                # As soon as a label1 is missing in ann2, we can stop:
-                # ann2 is not a re-occurrence of ann1
-                if match is False:
-                    break
-
-            if match is True:
-                reocc.append(ann2)
-
+        labels1 = ann1.get_labels()
+        if len(labels1) == 0:
+            return list()
+
+        # key=content of a tag, value=indexes in anns2 of the annotations
+        # with a label having this tag
+        index = dict()
+        # indexes of the labelled annotations, and of those having a label
+        # with twice the same tag: any label has a tag in common with it.
+        labelled = set()
+        twice = set()
+        for i, ann2 in enumerate(anns2):
+            for label2 in ann2.get_labels():
+                labelled.add(i)
+                tags2 = [tag.get_typed_content() for tag, score in label2]
+                if len(tags2) != len(set(tags2)):
+                    twice.add(i)
+                for content in tags2:
+                    index.setdefault(content, set()).add(i)
+
+        # Evaluate if all labels of ann1 are also in ann2
+        matching = labelled
+        for label1 in labels1:
+            tags1 = [tag.get_typed_content() for tag, score in label1]
+            if len(tags1) != len(set(tags1)):
+                # a tag in common with any label
+                continue
+            found = set(twice)
+            for content in tags1:
+                found.update(index.get(content, ()))
+
+            # As soon as a label1 is missing in ann2, ann2 is not a
+            # re-occurrence of ann1
+            matching = matching & found
+            if len(matching) == 0:
+                break
+
+        reocc = [ann2 for i, ann2 in enumerate(anns2) if i in matching]
         return list(set(reocc))
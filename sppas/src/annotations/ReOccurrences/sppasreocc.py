@@ -146,17 +146,18 @@ class sppasReOcc(sppasBaseAnnotation):
             tier_spk2.set_radius(0.04)
 
         end_loc = tier_spk2[-1].get_highest_localization()
+        cursor = 0
         for ann1 in tier_spk1:
 
             # Localization of the end of the current annotation of spk1
             cur_loc = ann1.get_highest_localization()
 
-            # Search for the annotations of spk2 after this localization
-            all_anns2 = tier_spk2.find(cur_loc, end_loc, overlaps=False)
+            # Move to the first annotation of spk2 after this localization
+            cursor = sppasReOcc.__move_cursor(tier_spk2, cursor, cur_loc)
 
             # Select only the next N annotations of spk2
-            window_size = min(len(all_anns2), self._options["span"])
-            anns2 = all_anns2[:window_size]
+            anns2 = list(sppasReOcc.__window(tier_spk2, cursor, cur_loc, end_loc,
+                                             self._options["span"]))
 
             # Search for the re-occurring labels of annotations
             # -------------------------------------------------
@@ -166,6 +167,62 @@ class sppasReOcc(sppasBaseAnnotation):
 
         return annset.to_tier()
 
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def __move_cursor(tier, cursor, begin):
+        """Return the index of the first annotation starting after begin.
+
+        The cursor is moved from its previous position: it goes forward
+        while the localizations of spk1 are increasing, so that all the
+        annotations of spk2 are visited only once.
+
+        :param tier: (sppasTier)
+        :param cursor: (int) Previous index
+        :param begin: (sppasPoint)
+        :returns: (int) Index in the tier, or the length of the tier
+
+        """
+        while cursor < len(tier) and tier[cursor].get_lowest_localization() < begin:
+            cursor += 1
+        while cursor > 0 and tier[cursor - 1].get_lowest_localization() >= begin:
+            cursor -= 1
+        return cursor
+
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def __window(tier, cursor, begin, end, size):
+        """Yield the next annotations of the tier, from the cursor.
+
+        The annotations are the first ones tier.find(begin, end,
+        overlaps=False) would return, but without searching for all of them.
+
+        :param tier: (sppasTier)
+        :param cursor: (int) Index of the first annotation starting after begin
+        :param begin: (sppasPoint)
+        :param end: (sppasPoint)
+        :param size: (int) Max number of annotations
+
+        """
+        if begin > end:
+            return
+        is_point = tier.is_point()
+        nb = 0
+        for i in range(cursor, len(tier)):
+            if nb == size:
+                break
+            ann = tier[i]
+            b = ann.get_lowest_localization()
+            e = ann.get_highest_localization()
+            if is_point is True and b > end and e > end:
+                break
+            if b >= begin and e <= end:
+                nb += 1
+                yield ann
+            if is_point is False and b >= end:
+                break
+
     # ----------------------------------------------------------------------
     # Apply the annotation on a given file
     # -----------------------------------------------------------------------
@@ -39,6 +39,7 @@
 """
 
 import re
+import bisect
 
 from sppas.core.config import symbols
 from sppas.core.coreutils import RangeBoundsException
@@ -215,7 +216,13 @@ class Entry(object):
 class DataSpeaker(object):
     """Class to store data of a speaker.
 
-    Stored data are a list of formatted unicode strings.
+    Stored data are a list of formatted unicode strings. An index is built
+    once when the data are created: the sorted positions of the words, and
+    the positions of each word. It allows to get the next word or an echo
+    of a word with a dichotomic search instead of walking the entries.
+
+    A window on the entries can be get without copying the data nor
+    re-building the index: indexes of the window start at 0.
 
     """
 
@@ -229,6 +236,45 @@ class DataSpeaker(object):
         for tok in tokens:
             self.__entries.append(Entry(tok).get())
 
+        # The window of the entries
+        self.__start = 0
+        self.__end = len(self.__entries)
+
+        # The index of the words: all positions and positions of each word
+        self.__words = list()
+        self.__positions = dict()
+        for i, entry in enumerate(self.__entries):
+            if len(entry) > 0 and entry not in symbols.all:
+                self.__words.append(i)
+                if entry in self.__positions:
+                    self.__positions[entry].append(i)
+                else:
+                    self.__positions[entry] = [i]
+
+    # -----------------------------------------------------------------------
+
+    def get_window(self, start, end):
+        """Return the data of the speaker from start to end (included).
+
+        The returned DataSpeaker shares its entries and its index with this
+        one.
+
+        :param start: (int) Index of the first entry of the window
+        :param end: (int) Index of the last entry of the window
+        :returns: (DataSpeaker)
+
+        """
+        start = max(0, int(start))
+        end = min(int(end) + 1, len(self))
+        window = DataSpeaker(list())
+        window.__entries = self.__entries
+        window.__words = self.__words
+        window.__positions = self.__positions
+        window.__start = self.__start + start
+        window.__end = max(window.__start, self.__start + end)
+
+        return window
+
     # -----------------------------------------------------------------------
 
     def is_word(self, idx):
@@ -246,15 +292,17 @@ class DataSpeaker(object):
         """
         if idx < 0:
             return False
-        if idx >= len(self.__entries):
+        if idx >= len(self):
             return False
 
+        entry = self.__entries[self.__start + idx]
+
         # An empty string
-        if len(self.__entries[idx]) == 0:
+        if len(entry) == 0:
             return False
 
         # Symbols used by SPPAS to represent an event
-        if self.__entries[idx] in symbols.all:
+        if entry in symbols.all:
             return False
 
         return True
@@ -273,11 +321,29 @@ class DataSpeaker(object):
         self.__get_entry(current)
 
         # search for the next word after the current index
-        c_next = current + 1
-        while c_next < len(self.__entries):
-            if self.is_word(c_next) is True:
-                return c_next
-            c_next += 1
+        i = bisect.bisect_right(self.__words, self.__start + current)
+        if i < len(self.__words) and self.__words[i] < self.__end:
+            return self.__words[i] - self.__start
+
+        return -1
+
+    # -----------------------------------------------------------------------
+
+    def find_word(self, word, current=0):
+        """Return the index of the first occurrence of a word from current.
+
+        :param word: (str) The formatted word to search for
+        :param current: (int) From index
+        :returns: (int) Index of the word or -1
+
+        """
+        positions = self.__positions.get(word, None)
+        if positions is None or current < 0:
+            return -1
+
+        i = bisect.bisect_left(positions, self.__start + current)
+        if i < len(positions) and positions[i] < self.__end:
+            return positions[i] - self.__start
 
         return -1
 
@@ -297,15 +363,8 @@ class DataSpeaker(object):
             return -1
 
         # Search for this word in the other speaker data
-        word = self.__entries[current]
-        while 0 <= other_current < len(other_speaker):
-            other_token = other_speaker[other_current]
-            if word == other_token:
-                return other_current
-            # not found. try next one
-            other_current = other_speaker.get_next_word(other_current)
-
-        return -1
+        return other_speaker.find_word(self.__entries[self.__start + current],
+                                       other_current)
 
     # -----------------------------------------------------------------------
     # Private
@@ -321,25 +380,25 @@ class DataSpeaker(object):
 
         """
         if idx < 0:
-            raise IndexRangeException(idx, 0, len(self.__entries))
-        if idx >= len(self.__entries):
-            raise IndexRangeException(idx, 0, len(self.__entries))
+            raise IndexRangeException(idx, 0, len(self))
+        if idx >= len(self):
+            raise IndexRangeException(idx, 0, len(self))
 
-        return self.__entries[idx]
+        return self.__entries[self.__start + idx]
 
     # -----------------------------------------------------------------------
     # Overloads
     # -----------------------------------------------------------------------
 
     def __str__(self):
-        return " ".join([e for e in self.__entries])
+        return " ".join([e for e in self])
 
     def __iter__(self):
-        for a in self.__entries:
-            yield a
+        for i in range(self.__start, self.__end):
+            yield self.__entries[i]
 
     def __getitem__(self, i):
         return self.__get_entry(i)
 
     def __len__(self):
-        return len(self.__entries)
+        return self.__end - self.__start
@@ -39,6 +39,7 @@
 """
 
 import logging
+import bisect
 
 from sppas.core.config import symbols
 from sppas.src.anndata import sppasTrsRW
@@ -85,33 +86,31 @@ class sppasSelfRepet(sppasBaseRepet):
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def __find_next_break(tier, start, span):
+    def __find_next_break(breaks, nb_tokens, start, span):
         """Return the index of the next interval representing a break.
 
         It depends on the 'span' value.
 
-        :param tier: (sppasTier)
+        :param breaks: (list) Sorted indexes of the intervals of the breaks
+        :param nb_tokens: (int) Number of intervals in the tier
         :param start: (int) the position of the token where the search will start
         :param span: (int)
         :returns: (int) index of the next interval corresponding to the span
 
         """
-        nb_breaks = 0
-        for i in range(start, len(tier)):
-            if serialize_labels(tier[i].get_labels()) == SIL_ORTHO:
-                nb_breaks += 1
-                if nb_breaks == span:
-                    return i
-        return len(tier) - 1
+        i = bisect.bisect_left(breaks, start) + span - 1
+        if i < len(breaks):
+            return breaks[i]
+        return nb_tokens - 1
 
     # -----------------------------------------------------------------------
 
-    def __fix_indexes(self, tier, tok_start, shift):
+    def __fix_indexes(self, breaks, nb_tokens, tok_start, shift):
         tok_start += shift
         tok_search = sppasSelfRepet.__find_next_break(
-            tier, tok_start + 1, span=1)
+            breaks, nb_tokens, tok_start + 1, span=1)
         tok_end = sppasSelfRepet.__find_next_break(
-            tier, tok_start + 1, span=self._options['span'])
+            breaks, nb_tokens, tok_start + 1, span=self._options['span'])
 
         return tok_start, tok_search, tok_end
 
@@ -137,16 +136,20 @@ class sppasSelfRepet(sppasBaseRepet):
         # Create a data structure to detect and store a source/echos
         repetition = SelfRepetition(stop_words)
 
+        # Build the data of the speaker, indexed once for all the windows
+        tokens = [serialize_labels(ann.get_labels()) for ann in tier]
+        data = DataSpeaker(tokens)
+        breaks = [i for i, token in enumerate(tokens) if token == SIL_ORTHO]
+
         # Initialization of the indexes to work with tokens
-        tok_start, tok_search, tok_end = self.__fix_indexes(tier, 0, 0)
+        tok_start, tok_search, tok_end = self.__fix_indexes(
+            breaks, len(tokens), 0, 0)
 
         # Detection is here:
         while tok_start < tok_end:
 
-            # Build an array with the tokens
-            tokens = [serialize_labels(tier[i].get_labels())
-                      for i in range(tok_start, tok_end+1)]
-            speaker = DataSpeaker(tokens)
+            # Get the window of the tokens
+            speaker = data.get_window(tok_start, tok_end)
 
             # Detect the first self-repetition in these data
             limit = tok_search - tok_start
@@ -161,7 +164,7 @@ class sppasSelfRepet(sppasBaseRepet):
 
             # Fix indexes for the next search
             tok_start, tok_search, tok_end = self.__fix_indexes(
-                tier, tok_start, shift)
+                breaks, len(tokens), tok_start, shift)
 
         return trs_output
 
@@ -86,7 +86,22 @@ class DictReplUTF8(sppasDictRepl):
 class TextNormalizer(object):
     """Multilingual text normalization
 
+    The actions enabled for an utterance are turned into a pipeline, i.e. a
+    list of functions, only once for a given language. The pipelines share
+    the tools created for the language: the splitter, the tokenizer and the
+    numbers converter.
+
     """
+
+    # The actions of a pipeline, in the order they are performed
+    ACTIONS = ("replace", "tokenize", "numbers", "lower", "punct")
+
+    # Float numbers
+    __NUMBER_SEP_POINT = re.compile('([0-9])\\.([0-9])')
+    __NUMBER_SEP = re.compile('([0-9])\\,([0-9])')
+
+    # -----------------------------------------------------------------------
+
     def __init__(self, vocab=None, lang="und"):
         """Create a TextNormalizer instance.
 
@@ -108,6 +123,16 @@ class TextNormalizer(object):
         self.delimiter = ' '
         self._cutp = TextCutParser()
 
+        # The replacements of the UTF-8 characters
+        self.__utf_repl = [(key, self.dicoutf.replace(key))
+                           for key in self.dicoutf]
+
+        # The pipelines and the tools of the language, created when needed
+        self.__pipelines = dict()
+        self.__splitter = None
+        self.__tokenizer = None
+        self.__num2letter = None
+
     # -----------------------------------------------------------------------
 
     def get_vocab_filename(self):
@@ -136,6 +161,7 @@ class TextNormalizer(object):
         # TODO: test instance
 
         self.vocab = vocab
+        self.__reset()
 
     # -----------------------------------------------------------------------
 
@@ -148,6 +174,7 @@ class TextNormalizer(object):
         # TODO: test instance
 
         self.repl = repl
+        self.__reset()
 
     # -----------------------------------------------------------------------
 
@@ -170,6 +197,7 @@ class TextNormalizer(object):
 
         """
         self.lang = lang
+        self.__reset()
 
     # -----------------------------------------------------------------------
 
@@ -180,14 +208,24 @@ class TextNormalizer(object):
 
         """
         self.num_dict = num_dict
+        self.__reset()
         try:
-            sppasNumConstructor.construct(self.lang, self.num_dict)
+            self.__num2letter = sppasNumConstructor.construct(self.lang, self.num_dict)
             logging.info('Conversion of numbers enabled for language {:s}'
                          ''.format(self.lang))
         except Exception as e:
             logging.error('Conversion of numbers will be disabled due to the '
                           'following error: {:s}'.format(str(e)))
 
+    # -----------------------------------------------------------------------
+
+    def __reset(self):
+        """Forget the pipelines and the tools of the previous resources."""
+        self.__pipelines = dict()
+        self.__splitter = None
+        self.__tokenizer = None
+        self.__num2letter = None
+
     # -----------------------------------------------------------------------
     # Language independent modules (or not!)
     # -----------------------------------------------------------------------
@@ -203,10 +241,8 @@ class TextNormalizer(object):
         """
         # Specific case of float numbers
         sent = ' '.join(utt)
-        sent = re.sub(u('([0-9])\\.([0-9])'),
-                      u(r'\1 NUMBER_SEP_POINT \2'), sent)
-        sent = re.sub(u('([0-9])\\,([0-9])'),
-                      u(r'\1 NUMBER_SEP \2'), sent)
+        sent = TextNormalizer.__NUMBER_SEP_POINT.sub(r'\1 NUMBER_SEP_POINT \2', sent)
+        sent = TextNormalizer.__NUMBER_SEP.sub(r'\1 NUMBER_SEP \2', sent)
         sent = sppasUnicode(sent).to_strip()
         _utt = sent.split()
 
@@ -228,23 +264,17 @@ class TextNormalizer(object):
         :returns: (list)
 
         """
-        tok = sppasTokenSegmenter(self.vocab)
+        if self.__tokenizer is None:
+            self.__tokenizer = sppasTokenSegmenter(self.vocab)
+            # longest matching for whitespace
+            if sppasLangISO.without_whitespace(self.lang):
+                self.__tokenizer.set_separator("")
+                self.__tokenizer.set_aggregate_max(15)
 
         # rules for - ' .
-        unbind_result = tok.unbind(utt)
-
-        # longest matching for whitespace
-        if sppasLangISO.without_whitespace(self.lang):
-            tok.set_separator("")
-            tok.set_aggregate_max(15)
-
-        bind_result = tok.bind(unbind_result)
-
-        # restore default values to the tokenizer
-        tok.set_aggregate_max()
-        tok.set_separator()
+        unbind_result = self.__tokenizer.unbind(utt)
 
-        return bind_result
+        return self.__tokenizer.bind(unbind_result)
 
     # -----------------------------------------------------------------------
 
@@ -255,10 +285,12 @@ class TextNormalizer(object):
         :returns: (list)
 
         """
-        try:
-            num2letter = sppasNumConstructor.construct(self.lang, self.num_dict)
-        except:
-            return utt
+        if self.__num2letter is None:
+            try:
+                self.__num2letter = sppasNumConstructor.construct(self.lang, self.num_dict)
+            except:
+                return utt
+        num2letter = self.__num2letter
 
         try:
             _result = list()
@@ -314,10 +346,51 @@ class TextNormalizer(object):
 
         return _utt
 
+    # -----------------------------------------------------------------------
+
+    def remove_punct(self, utt):
+        """Remove the punctuation of an utterance.
+
+        :param utt: (list)
+
+        """
+        return self.remove(utt, self.punct)
+
     # -----------------------------------------------------------------------
     # The main normalizer is HERE!
     # -----------------------------------------------------------------------
 
+    def get_pipeline(self, actions):
+        """Return the functions to perform on an utterance for the actions.
+
+        The pipeline is created only once for each set of actions, and it is
+        forgotten if the language or a resource is changed.
+
+        :param actions: (list) the modules/options to enable.
+        :returns: (list) functions taking and returning a list of tokens
+
+        """
+        key = tuple(action for action in TextNormalizer.ACTIONS if action in actions)
+        pipeline = self.__pipelines.get(key, None)
+        if pipeline is None:
+            pipeline = list()
+            if "replace" in key:
+                pipeline.append(self.replace)
+            if "tokenize" in key:
+                pipeline.append(self.tokenize)
+            if "numbers" in key:
+                pipeline.append(self.numbers)
+            if "lower" in key:
+                pipeline.append(self.lower)
+            pipeline.append(TextNormalizer.variants)
+            if "punct" in key:
+                pipeline.append(self.remove_punct)
+            self.__pipelines[key] = pipeline
+
+        return pipeline
+
+    # -----------------------------------------------------------------------
+
     def normalize(self, entry, actions=[]):
         """Tokenize an utterance.
 
@@ -341,8 +414,8 @@ class TextNormalizer(object):
         _str = sppasUnicode(entry).to_strip()
 
         # Remove UTF-8 specific characters that are not in our dictionaries!
-        for key in self.dicoutf:
-            _str = _str.replace(key, self.dicoutf.replace(key))
+        for key, value in self.__utf_repl:
+            _str = _str.replace(key, value)
 
         # Remove cut information -- new in SPPAS 4.11
         _cuts = self._cutp.parse_cut(_str)
@@ -358,8 +431,9 @@ class TextNormalizer(object):
             _str = ortho.toe_spelling(_str, False)
 
         # Split using whitespace or characters.
-        splitter = sppasSimpleSplitter(self.lang, self.repl)
-        utt = splitter.split(_str)
+        if self.__splitter is None:
+            self.__splitter = sppasSimpleSplitter(self.lang, self.repl)
+        utt = self.__splitter.split(_str)
 
         # The entry is now a list of strings on which we'll perform actions
         # -----------------------------------------------------------------
@@ -370,22 +444,8 @@ class TextNormalizer(object):
             actions.append("lower")
             actions.append("punct")
 
-        if "replace" in actions:
-            utt = self.replace(utt)
-
-        if "tokenize" in actions:
-            utt = self.tokenize(utt)
-
-        if "numbers" in actions:
-            utt = self.numbers(utt)
-
-        if "lower" in actions:
-            utt = self.lower(utt)
-
-        utt = TextNormalizer.variants(utt)
-
-        if "punct" in actions:
-            utt = self.remove(utt, self.punct)
+        for action in self.get_pipeline(actions):
+            utt = action(utt)
 
         return [sppasUnicode(s).to_strip() for s in utt]
 
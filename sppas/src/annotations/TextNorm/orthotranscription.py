@@ -74,6 +74,40 @@ class sppasOrthoTranscription(object):
 
     """
 
+    # Tags of the activity
+    __ACTIVITY = re.compile(r'(gpd_[0-9]+)|(gpf_[0-9]+)|(ipu_[0-9]+)', re.UNICODE)
+
+    # Invalid parenthesis content
+    __PARENTHESIS_INSIDE = re.compile(r'\s+\([\w\xaa-\xff]+\)\s+', re.UNICODE)
+    __PARENTHESIS_START = re.compile(r'^\([\w\xaa-\xff]+\)\s+', re.UNICODE)
+    __PARENTHESIS_END = re.compile(r'\s+\([\w\xaa-\xff]+\)$', re.UNICODE)
+
+    # Special pronunciations, before cleaning
+    __PRONUNCIATION = re.compile(r'\s*\[([^,]+),([^,]+)\]', re.UNICODE)
+
+    # Liaisons, laughter, noises and comments
+    __LIAISON = re.compile(r'\s=([\w]+)=', re.UNICODE)
+    __LAUGHING = re.compile(r"\s?@\s?@\s?", re.UNICODE)
+    __LAUGHTER_AFTER = re.compile(r"([\w\xaa-\xff]+)@", re.UNICODE)
+    __LAUGHTER_BEFORE = re.compile(r"@([\w\xaa-\xff]+)", re.UNICODE)
+    __NOISE_AFTER = re.compile(r"([\w\xaa-\xff]+)\*", re.UNICODE)
+    __NOISE_BEFORE = re.compile(r"\*([\w\xaa-\xff]+)", re.UNICODE)
+    __COMMENT_BRACES = re.compile(r'\{[\s\w\xaa-\xff\-:]+\}', re.UNICODE)
+    __COMMENT_BRACKETS = re.compile(r'\[[\s\w\xaa-\xff\-:]+\]', re.UNICODE)
+
+    # Special elisions, variants and pronunciations
+    __ELISION_FAKED = re.compile(r'\([\s\w\xaa-\xff\-\']+\)', re.UNICODE)
+    __ELISION_STD = re.compile(r'\(([\s\w\xaa-\xff\-]+)\)', re.UNICODE)
+    __VARIANTS = re.compile(r'\s+\<([\-\'\s\w\xaa-\xff]+),([\-\'\s\w\xaa-\xff]+)\>', re.UNICODE)
+    __PRONUNCIATION_FAKED = re.compile(r'\s+\[([\s\w\xaa-\xff/-]+),([\*\+\s\w\xaa-\xff/]+)\]', re.UNICODE)
+    __PRONUNCIATION_STD = re.compile(r'\s+\[([\s\w\xaa-\xff\\/-]+),[\+\*\s\w\xaa-\xff\\/]+\]', re.UNICODE)
+
+    # Proper names with the "PTS" system and numbers
+    __PROPER_NAME = re.compile(r',\s?[PTS]+\s?[\/\\]+\s?\$', re.UNICODE)
+    __NUMBER = re.compile(r"\s(?=,[0-9]+)", re.UNICODE)
+
+    # -----------------------------------------------------------------------
+
     def __init__(self):
         pass
 
@@ -94,17 +128,15 @@ class sppasOrthoTranscription(object):
         ### entry = re.sub(u('\$'), r'$', entry, re.UNICODE)
 
         # Tags of the activity
-        entry = re.sub(u('(gpd_[0-9]+)'), r" ", entry, re.UNICODE)
-        entry = re.sub(u('(gpf_[0-9]+)'), r" ", entry, re.UNICODE)
-        entry = re.sub(u('(ipu_[0-9]+)'), r" ", entry, re.UNICODE)
+        entry = sppasOrthoTranscription.__ACTIVITY.sub(" ", entry)
 
         # Remove invalid parenthesis content
-        entry = re.sub(u(r'\s+\([\w\xaa-\xff]+\)\s+'), ' ', entry, re.UNICODE)
-        entry = re.sub(u(r'^\([\w\xaa-\xff]+\)\s+'), ' ', entry, re.UNICODE)
-        entry = re.sub(u(r'\s+\([\w\xaa-\xff]+\)$'), ' ', entry, re.UNICODE)
+        entry = sppasOrthoTranscription.__PARENTHESIS_INSIDE.sub(' ', entry)
+        entry = sppasOrthoTranscription.__PARENTHESIS_START.sub(' ', entry)
+        entry = sppasOrthoTranscription.__PARENTHESIS_END.sub(' ', entry)
 
-        entry = re.sub(u(r'\s*\[([^,]+),([^,]+)\]'),
-                       sppasOrthoTranscription.__replace, entry, re.UNICODE)
+        entry = sppasOrthoTranscription.__PRONUNCIATION.sub(
+            sppasOrthoTranscription.__replace, entry)
 
         return " ".join(entry.split())
 
@@ -130,52 +162,52 @@ class sppasOrthoTranscription(object):
 
         if std is False:
             # Stick un-regular liaisons to the previous token
-            _fentry = re.sub(u(r'\s=([\w]+)='), r'-\1', _fentry, re.UNICODE)
+            _fentry = sppasOrthoTranscription.__LIAISON.sub(r'-\1', _fentry)
         else:
             # Remove liaisons
-            _fentry = re.sub(u(r'\s=([\w]+)='), u(' '), _fentry, re.UNICODE)
+            _fentry = sppasOrthoTranscription.__LIAISON.sub(' ', _fentry)
 
         # Laughing sequences
-        _fentry = re.sub(u(r"\s?@\s?@\s?"), u(' '), _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__LAUGHING.sub(' ', _fentry)
 
         # Laughter
-        _fentry = re.sub(u(r"([\w\xaa-\xff]+)@"), u(r"\1 @"), _fentry, re.UNICODE)
-        _fentry = re.sub(u(r"@([\w\xaa-\xff]+)"), u(r"@ \1"), _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__LAUGHTER_AFTER.sub(r"\1 @", _fentry)
+        _fentry = sppasOrthoTranscription.__LAUGHTER_BEFORE.sub(r"@ \1", _fentry)
 
         # Noises
-        _fentry = re.sub(u(r"([\w\xaa-\xff]+)\*"), u(r"\1 *"), _fentry, re.UNICODE)
-        _fentry = re.sub(u(r"\*([\w\xaa-\xff]+)"), u(r"* \1"), _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__NOISE_AFTER.sub(r"\1 *", _fentry)
+        _fentry = sppasOrthoTranscription.__NOISE_BEFORE.sub(r"* \1", _fentry)
 
         # Transcriptor comment's: {comment} {com-ment} {comment: hello}
-        _fentry = re.sub(u(r'\{[\s\w\xaa-\xff\-:]+\}'), '', _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__COMMENT_BRACES.sub('', _fentry)
         # Transcriptor comment's: [comment]
-        _fentry = re.sub(u(r'\[[\s\w\xaa-\xff\-:]+\]'), '', _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__COMMENT_BRACKETS.sub('', _fentry)
 
         if std is False:
             # Special elisions (remove parenthesis content)
-            _fentry = re.sub(u(r'\([\s\w\xaa-\xff\-\']+\)'), '', _fentry, re.UNICODE)
+            _fentry = sppasOrthoTranscription.__ELISION_FAKED.sub('', _fentry)
         else:
             # Special elisions (keep parenthesis content)
-            _fentry = re.sub(u(r'\(([\s\w\xaa-\xff\-]+)\)'), u(r'\1'), _fentry, re.UNICODE)
+            _fentry = sppasOrthoTranscription.__ELISION_STD.sub(r'\1', _fentry)
 
         # Morphological variants
-        _fentry = re.sub(u(r'\s+\<([\-\'\s\w\xaa-\xff]+),([\-\'\s\w\xaa-\xff]+)\>'), u(r' {\1|\2}'), _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__VARIANTS.sub(r' {\1|\2}', _fentry)
 
         if std is False:
             # Special pronunciations (keep right part)
-            _fentry = re.sub(u(r'\s+\[([\s\w\xaa-\xff/-]+),([\*\+\s\w\xaa-\xff/]+)\]'), u(r' \2'), _fentry, re.UNICODE)
+            _fentry = sppasOrthoTranscription.__PRONUNCIATION_FAKED.sub(r' \2', _fentry)
         else:
             # Special pronunciations (keep left part)
-            _fentry = re.sub(u(r'\s+\[([\s\w\xaa-\xff\\/-]+),[\+\*\s\w\xaa-\xff\\/]+\]'), u(r' \1'), _fentry, re.UNICODE)
+            _fentry = sppasOrthoTranscription.__PRONUNCIATION_STD.sub(r' \1', _fentry)
 
         # Changed in SPPAS 4.12: proper names with "PTS" system  $John Doe, P/$
         # are no longer supported because "$" can be used as a symbol for "dollars"!
         # So it must not be used to represent anything else.
-        _fentry = re.sub(u(r',\s?[PTS]+\s?[\/\\]+\s?\$'), '', _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__PROPER_NAME.sub('', _fentry)
         # _fentry = re.sub(u('\\$'), '', _fentry, re.UNICODE)
 
         # specific case with numbers
-        _fentry = re.sub(u(r"\s(?=,[0-9]+)"), '', _fentry, re.UNICODE)
+        _fentry = sppasOrthoTranscription.__NUMBER.sub('', _fentry)
 
         # ok, now stop regexp and work with unicode:
         _fentry = sppasUnicode(_fentry).to_strip()
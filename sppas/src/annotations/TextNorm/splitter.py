@@ -59,6 +59,21 @@ class sppasSimpleSplitter(object):
     (for written texts).
 
     """
+
+    # Numbers and ascii characters, dates and ・ of character-based languages
+    __NOT_CHARACTERS = re.compile("([０-９0-9a-zA-ZＡ-Ｔ\\s]+\\.?[０-９0-9a-zA-ZＡ-Ｔ\\s]+)")
+    __DATES = re.compile("([０-９0-9\\s]+\\.?[月年日\\s]+)")
+    __NAKAGURO = re.compile('[\\s]*・[\\s]*')
+
+    # Numbers stick to characters, punctuation and dots
+    __NUMBER_CHAR = re.compile('([0-9])([a-zA-Z])')
+    __CHAR_NUMBER = re.compile('([a-zA-Z])([0-9])')
+    __BRACKETS = re.compile('\\[\\]')
+    __DOT_INSIDE = re.compile(' \\.([\\w-])')
+    __DOT_START = re.compile('^\\.([\\w-])')
+
+    # -----------------------------------------------------------------------
+
     def __init__(self, lang, dict_replace=None, speech=True):
         """Creates a sppasSimpleSplitter.
 
@@ -68,6 +83,7 @@ class sppasSimpleSplitter(object):
 
         """
         self.__lang = lang
+        self.__without_whitespace = sppasLangISO.without_whitespace(lang)
         self.__speech = speech
         if dict_replace is not None:
             self.__repl = dict_replace
@@ -87,14 +103,14 @@ class sppasSimpleSplitter(object):
         tmp = " ".join(y)
 
         # split all characters except numbers and ascii characters
-        sstr = re.sub(u("([０-９0-9a-zA-ZＡ-Ｔ\\s]+\\.?[０-９0-9a-zA-ZＡ-Ｔ\\s]+)"),
-                      lambda o: u(" %s " % o.group(0).replace(" ", "")), tmp)
+        sstr = sppasSimpleSplitter.__NOT_CHARACTERS.sub(
+            lambda o: u(" %s " % o.group(0).replace(" ", "")), tmp)
         # and dates...
         if self.__speech is False:
-            sstr = re.sub(u("([０-９0-9\\s]+\\.?[月年日\\s]+)"),
-                          lambda o: u(" %s " % o.group(0).replace(" ", "")), sstr)
+            sstr = sppasSimpleSplitter.__DATES.sub(
+                lambda o: u(" %s " % o.group(0).replace(" ", "")), sstr)
         # and ・
-        sstr = re.sub(u('[\\s]*・[\\s]*'), u("・"), sstr)
+        sstr = sppasSimpleSplitter.__NAKAGURO.sub(u("・"), sstr)
 
         return sstr
 
@@ -112,7 +128,7 @@ class sppasSimpleSplitter(object):
 
         """
         s = utt
-        if sppasLangISO.without_whitespace(self.__lang) is True:
+        if self.__without_whitespace is True:
             s = self.split_characters(s)
 
         toks = list()
@@ -121,20 +137,20 @@ class sppasSimpleSplitter(object):
             # if not a phonetized entry
             if t.startswith("/") is False and t.endswith("/") is False:
 
-                if sppasLangISO.without_whitespace(self.__lang) is False:
+                if self.__without_whitespace is False:
                     # Split numbers if stick to characters
                     # attention: do not replace [a-zA-Z] by [\w] (because \w includes numbers)
                     # and not on Asian languages: it can be a tone!
-                    t = re.sub(u('([0-9])([a-zA-Z])'), u(r'\1 \2'), t)
-                    t = re.sub(u('([a-zA-Z])([0-9])'), u(r'\1 \2'), t)
+                    t = sppasSimpleSplitter.__NUMBER_CHAR.sub(r'\1 \2', t)
+                    t = sppasSimpleSplitter.__CHAR_NUMBER.sub(r'\1 \2', t)
 
                 # Split some punctuation
-                t = re.sub(u('\\[\\]'), u(r'\\] \\['), t)
+                t = sppasSimpleSplitter.__BRACKETS.sub(r'\\] \\[', t)
 
                 # Split dots if stick to the beginning of a word
                 # info: a dot at the end of a word is analyzed by the tokenizer
-                t = re.sub(u(' \\.([\\w-])'), u(r' . \1'), t)
-                t = re.sub(u('^\\.([\\w-])'), u(r' . \1'), t)
+                t = sppasSimpleSplitter.__DOT_INSIDE.sub(r' . \1', t)
+                t = sppasSimpleSplitter.__DOT_START.sub(r' . \1', t)
 
                 # Split replacement characters
                 for r in self.__repl:
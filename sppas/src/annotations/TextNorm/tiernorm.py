@@ -84,9 +84,14 @@ class TierNormalizer(TextNormalizer):
     def normalize_tier(self, tier, actions):
         """Normalize all tags of all labels of a tier.
 
+        The pipeline of the actions is created once for the whole tier, and
+        a text repeated in several annotations is normalized only once.
+
         """
         cut_tier = self.__annotations_cut(tier)
         tokens_tier = sppasTier("TextNorm")
+        # key=text of a tag, value=list of its tokens
+        normalized = dict()
         for i, ann in enumerate(cut_tier):
             logging.info((info(1220, "annotations")).format(number=i + 1))
             location = ann.get_location().copy()
@@ -96,7 +101,7 @@ class TierNormalizer(TextNormalizer):
                 try:
                     # Normalize only the best tag because each label of an ortho
                     # should only concern 1 tag!
-                    tokens = self.__do_normalize(label.get_best(), actions)
+                    tokens = self.__do_normalize(label.get_best(), actions, normalized)
                 except Exception as e:
                     tokens = list()
                     message = (info(1258, "annotations")).format(i) + "{:s}".format(str(e))
@@ -210,11 +215,20 @@ class TierNormalizer(TextNormalizer):
 
     # -----------------------------------------------------------------------
 
-    def __do_normalize(self, text, actions):
-        """Return the list of tokens of the text."""
+    def __do_normalize(self, text, actions, normalized):
+        """Return the list of tokens of the text.
+
+        :param text: (sppasTag)
+        :param actions: (list) the modules/options to enable
+        :param normalized: (dict) the already normalized texts
+
+        """
         # Do not tokenize an empty label, noises, laughter...
         if text.is_speech() is True:
-            return self.normalize(text.get_content(), actions)
+            content = text.get_content()
+            if content not in normalized:
+                normalized[content] = self.normalize(content, actions)
+            return normalized[content]
         elif text.is_silence():
             # in ortho a silence could be one of "#" or "gpf_".
             # we normalize!
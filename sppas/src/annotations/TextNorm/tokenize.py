@@ -120,7 +120,10 @@ class sppasTokenSegmenter(object):
     def __stick_longest_lr(self, phrase, separator):
         """Return the longest first word of a phrase.
 
-        A longest matching algorithm is applied from left to right.
+        A longest matching algorithm is applied from left to right: the
+        tokens are aggregated with the separator, and the longest
+        aggregation found in the vocabulary, or lower-cased in the
+        vocabulary, is the first word.
 
         :param phrase: (str)
         :returns: tuple of (index of the first longest token, the longest token)
@@ -128,29 +131,55 @@ class sppasTokenSegmenter(object):
         """
         tab_toks = phrase.split(" ")
         token = tab_toks[0]
-        i = len(tab_toks)
 
         if self.__vocab is None:
             return 1, token
 
-        while i > 0:
-            # try to aggregate all tokens -- the longest token
-            token = separator.join(tab_toks)
+        # the aggregation of all tokens, and the end of the aggregation
+        # of the first ones
+        token = separator.join(tab_toks)
+        ends = dict()
+        end = -len(separator)
+        for i, tok in enumerate(tab_toks, 1):
+            end += len(separator) + len(tok)
+            ends[end] = i
+
+        nb = self.__longest_in_vocab(token, ends)
+
+        # new in SPPAS 4.10 to get the same result with
+        # L'assiette // l'assiette
+        lower = token.lower()
+        if lower != token:
+            if len(lower) == len(token) and "Σ" not in token:
+                # the lower-cased aggregations are the beginnings of this one
+                nb = max(nb, self.__longest_in_vocab(lower, ends))
+            else:
+                i = len(tab_toks)
+                while i > nb:
+                    if self.__vocab.is_unk(separator.join(tab_toks[:i]).lower()) is False:
+                        nb = i
+                        break
+                    i -= 1
 
-            # next round will try without the last token
-            tab_toks.pop()
-            i -= 1
+        # the first real token is the first given token
+        nb = max(nb, 1)
+        token = separator.join(tab_toks[:nb])
+        return nb - 1, sppasUnicode(token).to_strip()
 
-            # stop the "while" when the token is in the vocabulary
-            if self.__vocab.is_unk(token) is False:
-                break
-            # new in SPPAS 4.10 to get the same result with
-            # L'assiette // l'assiette
-            if self.__vocab.is_unk(token.lower()) is False:
-                break
+    # -----------------------------------------------------------------------
 
-        # the first real token is the first given token
-        return i, sppasUnicode(token).to_strip()
+    def __longest_in_vocab(self, text, ends):
+        """Return the nb of tokens of the longest aggregation in the vocab.
+
+        :param text: (str) The aggregation of all tokens
+        :param ends: (dict) End in text of the aggregation of each nb of tokens
+        :returns: (int) 0 if no aggregation is in the vocabulary
+
+        """
+        lengths = self.__vocab.get_prefix_lengths(text, ends)
+        if len(lengths) > 0:
+            return ends[lengths[-1]]
+        return 0
 
     # -----------------------------------------------------------------------
 
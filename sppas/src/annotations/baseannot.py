@@ -42,6 +42,7 @@
 import logging
 import os
 import json
+import multiprocessing
 
 from sppas.core.config import annots
 from sppas.core.config import paths
@@ -54,6 +55,46 @@ from .autils import sppasFiles
 from .annotationsexc import AnnotationOptionError
 from .diagnosis import sppasDiagnosis
 from .report import sppasAnnReport
+from .report import sppasAnnReportRecorder
+
+# ---------------------------------------------------------------------------
+# The annotation of a worker process of a batch processing
+# ---------------------------------------------------------------------------
+
+_worker_annotation = None
+_worker_error = None
+
+
+def _init_batch_worker(arguments):
+    """Create the annotation of a worker process and load its resources.
+
+    An error is not raised: the worker would be re-created endlessly by
+    the pool. It is reported for each file the worker has to annotate.
+
+    :param arguments: (tuple) Returned by get_worker_arguments()
+
+    """
+    global _worker_annotation, _worker_error
+    try:
+        _worker_annotation = sppasBaseAnnotation.create_worker_annotation(*arguments)
+        # The messages of load_resources() were already printed by the
+        # annotation of the main process: they must not be replayed.
+        _worker_annotation.logfile.pop_records()
+    except Exception as e:
+        _worker_error = str(e)
+
+
+def _run_batch_worker(input_files):
+    """Annotate a file in a worker process.
+
+    :returns: (created files, recorded messages of the report)
+
+    """
+    if _worker_error is not None:
+        return list(), [("print_message", (_worker_error, 2, annots.error)),
+                        ("print_newline", ())]
+    out_names = _worker_annotation.batch_item_processing(input_files)
+    return out_names, _worker_annotation.logfile.pop_records()
 
 # ---------------------------------------------------------------------------
 
@@ -93,6 +134,11 @@ class sppasBaseAnnotation(object):
         self._out_extensions = dict()
         self.set_default_out_extensions()
 
+        # The number of processes of the batch processing and the
+        # arguments of load_resources() in each one.
+        self.__nb_workers = 1
+        self.__resources = (tuple(), dict())
+
         # Then, fill in the values from a configuration file
         self.__load(config)
 
@@ -328,6 +374,73 @@ class sppasBaseAnnotation(object):
         """Load the linguistic resources."""
         pass
 
+    # -----------------------------------------------------------------------
+
+    def set_nb_workers(self, nb_workers, *args, **kwargs):
+        """Fix the number of processes to annotate a bunch of files.
+
+        With more than one worker, each process creates its own instance
+        of the annotation and loads its resources once with the given
+        arguments, then it annotates the files it is given by
+        batch_processing().
+
+        :param nb_workers: (int) Number of processes. 1 to not use workers.
+        :param args: Arguments of load_resources() in each worker
+        :param kwargs: Keyword arguments of load_resources() in each worker
+        :raises: ValueError
+
+        """
+        nb_workers = int(nb_workers)
+        if nb_workers < 1:
+            raise ValueError("The number of workers should be a positive "
+                             "integer. Got {:d}.".format(nb_workers))
+        self.__nb_workers = nb_workers
+        self.__resources = (args, kwargs)
+
+    # -----------------------------------------------------------------------
+
+    def get_nb_workers(self):
+        """Return the number of processes to annotate a bunch of files."""
+        return self.__nb_workers
+
+    # -----------------------------------------------------------------------
+
+    def get_worker_arguments(self):
+        """Return the arguments to create this annotation in a worker process.
+
+        :returns: (class, options, output extensions, args, kwargs)
+
+        """
+        args, kwargs = self.__resources
+        return self.__class__, self._options, self._out_extensions, args, kwargs
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def create_worker_annotation(ann_class, options, out_extensions, args, kwargs):
+        """Create an annotation like the one of get_worker_arguments().
+
+        The messages of the created annotation are recorded into a
+        sppasAnnReportRecorder.
+
+        The options are fixed with the values of the given ones, then the
+        given ones are copied: a value which is not a bool, an int, a float
+        or a str -- like None or a list, can't be given with a sppasOption()
+        without being converted.
+
+        :returns: (sppasBaseAnnotation)
+
+        """
+        ann = ann_class(log=sppasAnnReportRecorder())
+        ann.fix_options([sppasOption(key, type(value).__name__, value)
+                         for key, value in options.items()
+                         if isinstance(value, (bool, int, float, str))])
+        ann._options = dict(options)
+        for out_format in out_extensions:
+            ann.set_out_extension(out_extensions[out_format], out_format)
+        ann.load_resources(*args, **kwargs)
+        return ann
+
     # -----------------------------------------------------------------------
     # Perform automatic annotation:
     # -----------------------------------------------------------------------
@@ -393,7 +506,10 @@ class sppasBaseAnnotation(object):
         """Perform the annotation on a bunch of files.
 
         Can be used by an annotation manager to launch all the annotations on
-        all checked files of a workspace in a single process.
+        all checked files of a workspace in a single process, or in several
+        worker processes if set_nb_workers() was used. In both cases, the
+        messages of the report and the progress are in the order of the
+        given list, and so is the returned list of created files.
 
         The given list of inputs can then be either:
             - a list of file names: [file1, file2, ...], or
@@ -405,8 +521,7 @@ class sppasBaseAnnotation(object):
         :return: (list of str) List of created files
 
         """
-        if len(self._options) > 0:
-            self.print_options()
+        self.print_options()
 
         total = len(file_names)
         if total == 0:
@@ -415,25 +530,32 @@ class sppasBaseAnnotation(object):
         if progress:
             progress.update(0, "")
 
+        nb_workers = min(self.__nb_workers, total)
+        if nb_workers > 1:
+            pool = multiprocessing.get_context("spawn").Pool(
+                nb_workers, _init_batch_worker, (self.get_worker_arguments(),))
+            results = pool.imap(_run_batch_worker, file_names)
+        else:
+            pool = None
+            results = ((self.batch_item_processing(f), list()) for f in file_names)
+
         # Execute the annotation for each file in the list
-        for i, input_files in enumerate(file_names):
-            try:
-                inputs = self._fix_inputs(input_files)
-            except Exception as e:
-                logging.critical(e)
-            else:
-                self.print_diagnosis(*inputs)
+        try:
+            for i, input_files in enumerate(file_names):
                 if progress:
                     progress.set_fraction(round(float(i)/float(total), 2))
-                    progress.set_text("{!s:s}".format(*inputs))
-
-                out_names = self.run_for_batch_processing(inputs)
-                if out_names is None or (isinstance(out_names, (list, tuple)) and len(out_names) == 0):
-                    self.logfile.print_message(info(1306, "annotations"), indent=1, status=annots.info)
-                else:
-                    files_processed_success.extend([f for f in out_names if f is not None])
-                    self.logfile.print_message(out_names[0], indent=1, status=annots.ok)
-            self.logfile.print_newline()
+                    if isinstance(input_files, (list, tuple)) is False:
+                        progress.set_text("{!s:s}".format(input_files))
+                    elif len(input_files) > 0:
+                        progress.set_text("{!s:s}".format(input_files[0]))
+
+                out_names, records = next(results)
+                sppasAnnReportRecorder.replay(records, self.logfile)
+                files_processed_success.extend(out_names)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
 
         # Indicate completed!
         if progress:
@@ -443,6 +565,32 @@ class sppasBaseAnnotation(object):
 
     # -----------------------------------------------------------------------
 
+    def batch_item_processing(self, input_files):
+        """Perform the annotation on an item of a batch processing.
+
+        :param input_files: (str or list of str) An item of the list of inputs
+        :return: (list of str) List of created files
+
+        """
+        files = list()
+        try:
+            inputs = self._fix_inputs(input_files)
+        except Exception as e:
+            logging.critical(e)
+        else:
+            self.print_diagnosis(*inputs)
+            out_names = self.run_for_batch_processing(inputs)
+            if out_names is None or (isinstance(out_names, (list, tuple)) and len(out_names) == 0):
+                self.logfile.print_message(info(1306, "annotations"), indent=1, status=annots.info)
+            else:
+                files = [f for f in out_names if f is not None]
+                self.logfile.print_message(out_names[0], indent=1, status=annots.ok)
+        self.logfile.print_newline()
+
+        return files
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def transfer_metadata(from_trs, to_trs):
         """Transfer the metadata from a sppasTranscription to another one.
@@ -499,9 +647,11 @@ class sppasBaseAnnotation(object):
     # -----------------------------------------------------------------------
 
     def print_options(self):
-        """Print the list of options in the user log.
+        """Print the list of options in the user log, if any.
 
         """
+        if len(self._options) == 0:
+            return
         self.logfile.print_message(info(1050, "annotations") + ": ",
                                    indent=0, status=None)
 
@@ -42,15 +42,20 @@ import logging
 import traceback
 import sys
 import os
+import multiprocessing
 from threading import Thread
 
+from sppas.core.config import annots
 from sppas.src.utils import sppasFileUtils
 from sppas.src.wkps import States
 from sppas.src.anndata import sppasTranscription, sppasTrsRW
+from sppas.src.anndata import sppasTrsCache
 
 from .autils import sppasFiles
 from .infotier import sppasMetaInfoTier
+from .baseannot import sppasBaseAnnotation
 from .report import sppasAnnReport
+from .report import sppasAnnReportRecorder
 # Import of all annotations integrated into SPPAS
 from .imports import *
 
@@ -63,6 +68,76 @@ MSG_GET_FILES = "Create the list of files to be processed."
 MSG_NO_FILE = "No file to process."
 MSG_ONE_FILE = "One file will be processed."
 MSG_N_FILES = "A list of {:d} files will be processed."
+MSG_UNAVAILABLE = "Annotation is un-available. No files processed."
+
+# ----------------------------------------------------------------------------
+# The annotations of a worker process of a pipeline
+# ----------------------------------------------------------------------------
+
+_pipeline_annotations = list()
+_pipeline_error = None
+
+
+def _init_pipeline_worker(arguments):
+    """Create the annotations of a worker process and load their resources.
+
+    :param arguments: (list) Returned by get_worker_arguments() or None
+
+    """
+    global _pipeline_annotations, _pipeline_error
+    sppasTrsRW.set_cache(sppasTrsCache())
+    try:
+        _pipeline_annotations = [
+            None if args is None else sppasBaseAnnotation.create_worker_annotation(*args)
+            for args in arguments]
+        # The messages of load_resources() were already printed by the
+        # annotations of the main process: they must not be replayed.
+        for a in _pipeline_annotations:
+            if a is not None:
+                a.logfile.pop_records()
+    except Exception as e:
+        _pipeline_error = str(e)
+
+
+def _run_pipeline_worker(root_id):
+    """Annotate the files of a root in a worker process."""
+    if _pipeline_error is not None:
+        return [(list(), [("print_message", (_pipeline_error, 2, annots.error)),
+                          ("print_newline", ())])] * len(_pipeline_annotations)
+    return _stream_root(_pipeline_annotations, root_id)
+
+
+def _stream_root(annotations, root_id):
+    """Perform the annotations on the files of a root, one after the other.
+
+    The input files of an annotation are searched from its input patterns
+    when its turn has come, i.e. when the previous annotations have
+    created their output files.
+
+    :param annotations: (list of sppasBaseAnnotation or None)
+    :param root_id: (str) Identifier of a root of the workspace
+    :returns: list with (created files, recorded messages) or None if no
+    file was found for each annotation
+
+    """
+    results = list()
+    for a in annotations:
+        files = list()
+        if a is not None:
+            files = sppasAnnotationsManager.search_for_files(
+                root_id, a.get_input_patterns(), a.get_input_extensions())
+        if len(files) == 0:
+            results.append(None)
+            continue
+
+        try:
+            out_files = a.batch_item_processing(files)
+        except Exception as e:
+            out_files = list()
+            a.logfile.print_message("{:s}".format(str(e)), indent=1, status=-1)
+        results.append((out_files, a.logfile.pop_records()))
+
+    return results
 
 # ----------------------------------------------------------------------------
 
@@ -89,6 +164,7 @@ class sppasAnnotationsManager(Thread):
 
         # fix optional members
         self.__do_merge = False
+        self.__do_pipeline = False
 
         # start threading
         self.start()
@@ -105,6 +181,22 @@ class sppasAnnotationsManager(Thread):
         """
         self.__do_merge = do_merge
 
+    # -----------------------------------------------------------------------
+
+    def set_do_pipeline(self, do_pipeline):
+        """Fix if the 'annotate' method streams each root through the annotations.
+
+        If set to True, the consecutive annotations of type STANDALONE are
+        not performed one after the other on all the files: each root of
+        the workspace is annotated by all of them, one after the other,
+        and the roots are given to the worker processes of the parameters.
+        The report is the same.
+
+        :param do_pipeline: (bool) if set to True, roots are streamed
+
+        """
+        self.__do_pipeline = do_pipeline
+
     # ------------------------------------------------------------------------
     # Run annotations
     # ------------------------------------------------------------------------
@@ -131,32 +223,45 @@ class sppasAnnotationsManager(Thread):
         self._logfile.print_header()
         self._logfile.print_annotations_header()
 
-        # Run all enabled annotations -- store stats on successes
-        ann_stats = [-1] * self._parameters.get_step_numbers()
-        for i in range(self._parameters.get_step_numbers()):
-
-            # ignore disabled annotations
-            if self._parameters.get_step_status(i) is False:
-                continue
+        # The outputs of an annotation are handed off to the next ones
+        sppasTrsRW.set_cache(sppasTrsCache())
+        try:
+            # Run all enabled annotations -- store stats on successes
+            ann_stats = [-1] * self._parameters.get_step_numbers()
+            steps = [i for i in range(self._parameters.get_step_numbers())
+                     if self._parameters.get_step_status(i) is True]
+            for stage in self._get_stages(steps):
+                if len(stage) > 1:
+                    try:
+                        self._run_pipeline(stage, ann_stats)
+                    except Exception as e:
+                        self._logfile.print_message("{:s}".format(str(e)), indent=1, status=-1)
+                        logging.info(traceback.format_exc())
+                        for i in stage:
+                            ann_stats[i] = max(0, ann_stats[i])
+                    continue
 
-            # ok, this annotation is enabled.
-            annotation_key = self._parameters.get_step_key(i)
-            self._logfile.print_step(i)
-            if self._progress:
-                self._progress.set_new()
-                self._progress.set_header(self._parameters.get_step_name(i))
+                # ok, this annotation is enabled.
+                i = stage[0]
+                annotation_key = self._parameters.get_step_key(i)
+                self._logfile.print_step(i)
+                if self._progress:
+                    self._progress.set_new()
+                    self._progress.set_header(self._parameters.get_step_name(i))
 
-            try:
-                ann_stats[i] = self._run_annotation(annotation_key)
-            except Exception as e:
-                self._logfile.print_message("{:s}".format(str(e)), indent=1, status=-1)
-                logging.info(traceback.format_exc())
-                ann_stats[i] = 0
+                try:
+                    ann_stats[i] = self._run_annotation(annotation_key)
+                except Exception as e:
+                    self._logfile.print_message("{:s}".format(str(e)), indent=1, status=-1)
+                    logging.info(traceback.format_exc())
+                    ann_stats[i] = 0
 
-        # Log file & Merge
-        self._logfile.print_newline()
-        if self.__do_merge:
-            self._merge()
+            # Log file & Merge
+            self._logfile.print_newline()
+            if self.__do_merge:
+                self._merge()
+        finally:
+            sppasTrsRW.set_cache(None)
         self._logfile.print_separator()
         self._logfile.print_stats(ann_stats)
         self._logfile.close()
@@ -210,6 +315,8 @@ class sppasAnnotationsManager(Thread):
         step = self._parameters.get_step(step_idx)
         try:
             auto_annot.load_resources(*step.get_langresource(), lang=step.get_lang())
+            auto_annot.set_nb_workers(self._parameters.get_nb_workers(),
+                                      *step.get_langresource(), lang=step.get_lang())
         except Exception as e:
             self._parameters.disable_step(step_idx)
             self._logfile.print_message(MSG_ANN_DISABLED.format(annotation_key, str(e)))
@@ -263,8 +370,7 @@ class sppasAnnotationsManager(Thread):
         # Create the annotation instance
         a = self.__create_ann_instance(annotation_key)
         if a is None:
-            self._logfile.print_message("Annotation is un-available. "
-                                        "No files processed.", indent=0)
+            self._logfile.print_message(MSG_UNAVAILABLE, indent=0)
             return 0
 
         # Fix the list of input files to be processed
@@ -284,6 +390,131 @@ class sppasAnnotationsManager(Thread):
         self._parameters.add_to_workspace(out_files)
         return len(out_files)
 
+    # -----------------------------------------------------------------------
+
+    def _get_stages(self, steps):
+        """Return the list of stages to perform the given steps.
+
+        Without pipeline, each step is a stage. With pipeline, consecutive
+        STANDALONE annotations are grouped into a stage: the files of a root
+        depend only on the files of the same root. Any other annotation
+        needs the files of other roots: it's a stage on its own, which is
+        waiting for the previous stages to be completed on all the roots.
+
+        :param steps: (list of int) Indexes of the enabled annotations
+        :returns: list of lists of step indexes
+
+        """
+        stages = list()
+        stage = list()
+        for i in steps:
+            types = self._parameters.get_step_types(i)
+            if self.__do_pipeline is True and all(t == "STANDALONE" for t in types):
+                stage.append(i)
+            else:
+                if len(stage) > 0:
+                    stages.append(stage)
+                    stage = list()
+                stages.append([i])
+        if len(stage) > 0:
+            stages.append(stage)
+
+        return stages
+
+    # -----------------------------------------------------------------------
+
+    def _run_pipeline(self, steps, ann_stats):
+        """Stream each root through a stage of STANDALONE annotations.
+
+        Each root is annotated by all the annotations of the stage, one
+        after the other. The roots are given to worker processes if more
+        than one worker is defined in the parameters. The messages are
+        printed into the report as if the annotations were performed one
+        after the other on all the files.
+
+        :param steps: (list of int) Indexes of the annotations of the stage
+        :param ann_stats: (list) Number of files created by each annotation
+
+        """
+        # Create the annotations. Their messages are recorded.
+        report = self._logfile
+        annotations = list()
+        records = list()
+        try:
+            for i in steps:
+                self._logfile = sppasAnnReportRecorder()
+                self._logfile.print_step(i)
+                annotations.append(
+                    self.__create_ann_instance(self._parameters.get_step_key(i)))
+                records.append(self._logfile.pop_records())
+        finally:
+            self._logfile = report
+
+        # Annotate each root with all the annotations of the stage
+        wkp = self._parameters.get_workspace()
+        roots = wkp.get_fileroot_from_state(States().CHECKED) + wkp.get_fileroot_from_state(States().AT_LEAST_ONE_CHECKED)
+        roots_ids = [root.id for root in roots]
+        total = len(roots_ids)
+        if self._progress:
+            self._progress.set_new()
+            self._progress.set_header(" + ".join(
+                self._parameters.get_step_name(i) for i in steps))
+            self._progress.update(0, "")
+
+        nb_workers = min(self._parameters.get_nb_workers(), total)
+        if nb_workers > 1:
+            arguments = [None if a is None else a.get_worker_arguments()
+                         for a in annotations]
+            pool = multiprocessing.get_context("spawn").Pool(
+                nb_workers, _init_pipeline_worker, (arguments,))
+            results = pool.imap(_run_pipeline_worker, roots_ids)
+        else:
+            pool = None
+            results = (_stream_root(annotations, root_id) for root_id in roots_ids)
+
+        roots_results = list()
+        try:
+            for r, root_id in enumerate(roots_ids):
+                if self._progress:
+                    self._progress.set_fraction(round(float(r)/float(total), 2))
+                    self._progress.set_text(root_id)
+                roots_results.append(next(results))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        # Print the messages like if each annotation was performed on all files
+        for k, i in enumerate(steps):
+            sppasAnnReportRecorder.replay(records[k], self._logfile)
+            a = annotations[k]
+            if a is None:
+                self._logfile.print_message(MSG_UNAVAILABLE, indent=0)
+                ann_stats[i] = 0
+                continue
+
+            step_results = [res[k] for res in roots_results if res[k] is not None]
+            self._logfile.print_message(MSG_GET_FILES, indent=0)
+            if len(step_results) == 0:
+                self._logfile.print_message(MSG_NO_FILE, indent=1)
+            elif len(step_results) == 1:
+                self._logfile.print_message(MSG_ONE_FILE, indent=1)
+            else:
+                self._logfile.print_message(MSG_N_FILES.format(len(step_results)), indent=1)
+
+            a.logfile = self._logfile
+            a.print_options()
+            out_files = list()
+            for created_files, step_records in step_results:
+                sppasAnnReportRecorder.replay(step_records, self._logfile)
+                out_files.extend(created_files)
+
+            self._parameters.add_to_workspace(out_files)
+            ann_stats[i] = len(out_files)
+
+        if self._progress:
+            self._progress.update(1, "Completed.")
+
     # -----------------------------------------------------------------------
     # Manage annotations:
     # -----------------------------------------------------------------------
@@ -395,7 +626,7 @@ class sppasAnnotationsManager(Thread):
         types = annotation.get_types()
         for root in roots:
             # Search for the files: 0 or 1 for each defined -pattern.extension
-            founded_files = self.__search_for_files(root.id, all_patterns, all_extensions)
+            founded_files = sppasAnnotationsManager.search_for_files(root.id, all_patterns, all_extensions)
             if len(founded_files) > 0:
                 if len(types) == 0 or "STANDALONE" in types:
                     files.append(founded_files)
@@ -436,8 +667,16 @@ class sppasAnnotationsManager(Thread):
 
     # ------------------------------------------------------------------------
 
-    def __search_for_files(self, root_id, all_patterns, all_extensions):
-        """Search for the files: 0 or 1 for each defined -pattern.extension."""
+    @staticmethod
+    def search_for_files(root_id, all_patterns, all_extensions):
+        """Search for the files: 0 or 1 for each defined -pattern.extension.
+
+        :param root_id: (str) Identifier of a root of the workspace
+        :param all_patterns: (list) Input patterns of an annotation
+        :param all_extensions: (list) Input extensions of an annotation
+        :returns: list of file names
+
+        """
         founded_files = list()
         for pattern, extensions in zip(all_patterns, all_extensions):
             # Create a list with the pattern followed by each possible extension
@@ -462,7 +701,7 @@ class sppasAnnotationsManager(Thread):
             if ref.get_type() == ann_type:
                 for fr in wkp.get_fileroot_with_ref(ref):
                     if fr.id != root.id:
-                        other_files[fr.id] = self.__search_for_files(fr.id, all_patterns, all_extensions)
+                        other_files[fr.id] = sppasAnnotationsManager.search_for_files(fr.id, all_patterns, all_extensions)
 
         return other_files
 
@@ -326,6 +326,9 @@ class sppasParam(object):
         # A log file to communicate to the user
         self._report = None
 
+        # The number of processes to annotate the files
+        self._nb_workers = 1
+
         # Input files to annotate
         self._workspace = sppasWorkspace()
 
@@ -474,6 +477,33 @@ class sppasParam(object):
         """Return the name of the file for the Procedure Outcome Report."""
         return self._report
 
+    # -----------------------------------------------------------------------
+    # Number of processes
+    # -----------------------------------------------------------------------
+
+    def set_nb_workers(self, nb_workers):
+        """Fix the number of processes to annotate the files.
+
+        :param nb_workers: (int) Number of processes, 0 for one per CPU
+        :return: (int) the assigned number of processes
+        :raise: ValueError
+
+        """
+        nb_workers = int(nb_workers)
+        if nb_workers == 0:
+            nb_workers = os.cpu_count() or 1
+        if nb_workers < 0:
+            raise ValueError("The number of workers should be a positive "
+                             "integer. Got {:d}.".format(nb_workers))
+        self._nb_workers = nb_workers
+        return nb_workers
+
+    # -----------------------------------------------------------------------
+
+    def get_nb_workers(self):
+        """Return the number of processes to annotate the files."""
+        return self._nb_workers
+
     # -----------------------------------------------------------------------
     # selected language
     # -----------------------------------------------------------------------
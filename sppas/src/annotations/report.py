@@ -395,3 +395,72 @@ class sppasAnnReport(object):
             number = 0
 
         return sppasAnnReport.STR_INDENT * number
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAnnReportRecorder(sppasAnnReport):
+    """Record the messages of an annotation instead of printing them.
+
+    The worker processes of a batch processing can't write into the
+    report of the main process: the messages of each file are recorded,
+    then they are printed into the report of the main process in the
+    order the files were given.
+
+    """
+
+    def __init__(self, parameters=None):
+        """Create a sppasAnnReportRecorder instance.
+
+        :param parameters: (sppasParam)
+
+        """
+        super(sppasAnnReportRecorder, self).__init__(parameters)
+        self.__records = list()
+
+    # -----------------------------------------------------------------------
+
+    def pop_records(self):
+        """Return the list of recorded messages and clear it.
+
+        :returns: list of (method name, arguments)
+
+        """
+        records = self.__records
+        self.__records = list()
+        return records
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def replay(records, report):
+        """Print the recorded messages into a report.
+
+        :param records: list of (method name, arguments)
+        :param report: (sppasAnnReport)
+
+        """
+        for name, args in records:
+            getattr(report, name)(*args)
+
+    # -----------------------------------------------------------------------
+    # Write data
+    # -----------------------------------------------------------------------
+
+    def print_step(self, step_number):
+        self.__records.append(("print_step", (step_number,)))
+
+    def print_message(self, message, indent=0, status=None):
+        self.__records.append(("print_message", (message, indent, status)))
+
+    def print_raw_text(self, text):
+        self.__records.append(("print_raw_text", (text,)))
+
+    def print_newline(self):
+        self.__records.append(("print_newline", ()))
+
+    def print_separator(self):
+        self.__records.append(("print_separator", ()))
+
+    def print_item(self, main_info, second_info=None):
+        self.__records.append(("print_item", (main_info, second_info)))
@@ -0,0 +1,146 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.annotations.tests.bench_align.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time to align the tracks of a recording.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.src.annotations.tests.bench_align [aligner] [nb_jobs] [minutes]
+
+The demo recording is split into tracks, like sppasAlign does. The tracks
+are aligned one after the other, then nb_jobs at a time. Then, the tracks
+are copied until their total duration is the given number of minutes, and
+this synthetic recording is aligned the same two ways.
+
+"""
+
+import os
+import sys
+import time
+import shutil
+
+from sppas.core.config import paths
+from sppas.src.anndata import sppasTrsRW
+from sppas.src.resources.mapping import sppasMapping
+from sppas.src.annotations.searchtier import sppasFindTier
+from sppas.src.annotations.Align.sppasalign import sppasAlign
+from sppas.src.annotations.Align.tracksio import TracksReaderWriter
+from sppas.src.annotations.Align.tracksio import ListOfTracks
+from sppas.src.annotations.Align.tracksgmt import TrackSegmenter
+
+# ---------------------------------------------------------------------------
+
+MODEL = os.path.join(paths.resources, "models", "models-fra")
+DEMO = os.path.join(paths.demo, "demo")
+
+# ---------------------------------------------------------------------------
+
+
+def split_demo(workdir):
+    """Split the demo recording into tracks and return their units."""
+    phon_tier = sppasFindTier.phonetization(
+        sppasTrsRW(DEMO + "-phon.xra").read())
+    tok_tier = sppasFindTier.tokenization(
+        sppasTrsRW(DEMO + "-token.xra").read())
+    mapping = sppasMapping(os.path.join(MODEL, "monophones.repl"))
+    tracksrw = TracksReaderWriter(mapping)
+    tracksrw.split_into_tracks(DEMO + ".wav", phon_tier, tok_tier, None, workdir)
+    return ListOfTracks.read(workdir)
+
+# ---------------------------------------------------------------------------
+
+
+def copy_tracks(workdir, units, minutes):
+    """Copy the tracks until their duration is the given nb of minutes.
+
+    :returns: (int) Number of tracks
+
+    """
+    demo_duration = sum(e - s for s, e in units)
+    nb_copies = max(1, int(minutes * 60. / demo_duration))
+    for copy_idx in range(1, nb_copies):
+        for i in range(len(units)):
+            src = TracksReaderWriter.get_filenames(workdir, i + 1)
+            dst = TracksReaderWriter.get_filenames(
+                workdir, copy_idx * len(units) + i + 1)
+            for src_name, dst_name in zip(src[:3], dst[:3]):
+                if os.path.exists(src_name):
+                    shutil.copy(src_name, dst_name)
+    return nb_copies * len(units)
+
+# ---------------------------------------------------------------------------
+
+
+def bench(segmenter, workdir, nb_tracks, nb_jobs):
+    """Return the time to align the tracks with the given nb of jobs."""
+    tracks = [TracksReaderWriter.get_filenames(workdir, i)
+              for i in range(1, nb_tracks + 1)]
+    start = time.perf_counter()
+    results = segmenter.segment_tracks(tracks, nb_jobs)
+    elapsed = time.perf_counter() - start
+    nb_errors = len([error for msg, error in results if error is not None])
+    return elapsed, nb_errors
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    aligner = "julius"
+    nb_jobs = os.cpu_count() or 1
+    minutes = 30
+    if len(sys.argv) > 1:
+        aligner = sys.argv[1]
+    if len(sys.argv) > 2:
+        nb_jobs = int(sys.argv[2])
+    if len(sys.argv) > 3:
+        minutes = float(sys.argv[3])
+
+    segmenter = TrackSegmenter(MODEL, aligner)
+    workdir = sppasAlign.fix_workingdir()
+    try:
+        units = split_demo(workdir)
+        nb_demo = len(units)
+        nb_synth = copy_tracks(workdir, units, minutes)
+
+        for name, nb_tracks in (("demo", nb_demo), ("synthetic", nb_synth)):
+            for jobs in (1, nb_jobs):
+                elapsed, nb_errors = bench(segmenter, workdir, nb_tracks, jobs)
+                print("{:s} - {:d} tracks, {:s}, {:d} jobs: {:.3f} seconds, "
+                      "{:d} errors".format(name, nb_tracks, aligner, jobs,
+                                           elapsed, nb_errors))
+    finally:
+        shutil.rmtree(workdir)
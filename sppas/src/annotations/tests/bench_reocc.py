@@ -0,0 +1,117 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.annotations.tests.bench_reocc.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time to search for re-occurrences.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.src.annotations.tests.bench_reocc [minutes] [span]
+
+A synthetic two-speaker dialogue of the given duration is created: the
+speakers are taking turns, and each turn is a sequence of time-aligned
+tokens randomly picked in a small vocabulary. The re-occurrences of the
+tokens of each speaker are searched in the tokens of the other one.
+
+"""
+
+import sys
+import time
+import random
+
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+from sppas.src.annotations.ReOccurrences.sppasreocc import sppasReOcc
+
+# ---------------------------------------------------------------------------
+
+
+def create_dialogue(minutes, nb_words=500, seed=1):
+    """Return the tiers of tokens of two speakers taking turns.
+
+    :param minutes: (float) Duration of the dialogue
+    :param nb_words: (int) Size of the vocabulary
+    :param seed: (int) Seed of the random generator
+    :returns: (sppasTier, sppasTier)
+
+    """
+    rand = random.Random(seed)
+    words = ["w" + str(i) for i in range(nb_words)]
+    # the frequency of a word is inversely proportional to its rank
+    weights = [1. / (i + 1) for i in range(nb_words)]
+
+    tiers = [sppasTier("Tokens"), sppasTier("Tokens")]
+    cur_time = 0.
+    speaker = 0
+    while cur_time < minutes * 60.:
+        nb_tokens = rand.randint(1, 30)
+        for token in rand.choices(words, weights, k=nb_tokens):
+            duration = rand.uniform(0.15, 0.45)
+            interval = sppasInterval(sppasPoint(round(cur_time, 3)),
+                                     sppasPoint(round(cur_time + duration, 3)))
+            tiers[speaker].create_annotation(sppasLocation(interval),
+                                             sppasLabel(sppasTag(token)))
+            cur_time += duration
+        cur_time += rand.uniform(0.1, 1.)
+        speaker = 1 - speaker
+
+    return tiers[0], tiers[1]
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    minutes = 60
+    span = 10
+    if len(sys.argv) > 1:
+        minutes = float(sys.argv[1])
+    if len(sys.argv) > 2:
+        span = int(sys.argv[2])
+
+    tier_spk1, tier_spk2 = create_dialogue(minutes)
+    reocc = sppasReOcc()
+    reocc.set_span(span)
+
+    start = time.perf_counter()
+    tiers = reocc.detection(tier_spk1, tier_spk2)
+    elapsed = time.perf_counter() - start
+    print("{:.1f} minutes - {:d} and {:d} tokens, span {:d}: {:.3f} seconds, "
+          "{:d} re-occurrences".format(minutes, len(tier_spk1), len(tier_spk2),
+                                      span, elapsed, len(tiers[0])))
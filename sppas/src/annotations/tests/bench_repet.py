@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.annotations.tests.bench_repet.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time to detect self- and other-repetitions.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.src.annotations.tests.bench_repet [minutes] [span]
+
+A synthetic conversation of the given duration is created: the speakers
+are taking turns, and each turn is made of IPUs of time-aligned tokens
+randomly picked in a small vocabulary, separated by silences. The speaker
+who is not talking is silent during the turn of the other one. The
+self-repetitions of each speaker and the other-repetitions of the second
+one are detected.
+
+"""
+
+import sys
+import time
+import random
+
+from sppas.core.config import symbols
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+from sppas.src.annotations.SelfRepet.sppasrepet import sppasSelfRepet
+from sppas.src.annotations.OtherRepet.sppasrepet import sppasOtherRepet
+
+# ---------------------------------------------------------------------------
+
+SIL_ORTHO = list(symbols.ortho.keys())[list(symbols.ortho.values()).index("silence")]
+
+# ---------------------------------------------------------------------------
+
+
+def create_conversation(minutes, nb_words=500, seed=1):
+    """Return the tiers of tokens of two speakers taking turns.
+
+    :param minutes: (float) Duration of the conversation
+    :param nb_words: (int) Size of the vocabulary
+    :param seed: (int) Seed of the random generator
+    :returns: (sppasTier, sppasTier)
+
+    """
+    rand = random.Random(seed)
+    words = ["w" + str(i) for i in range(nb_words)]
+    # the frequency of a word is inversely proportional to its rank
+    weights = [1. / (i + 1) for i in range(nb_words)]
+
+    tiers = [sppasTier("Tokens"), sppasTier("Tokens")]
+
+    def add_token(speaker, begin, end, token):
+        interval = sppasInterval(sppasPoint(round(begin, 3)),
+                                 sppasPoint(round(end, 3)))
+        tiers[speaker].create_annotation(sppasLocation(interval),
+                                         sppasLabel(sppasTag(token)))
+
+    cur_time = 0.
+    speaker = 0
+    while cur_time < minutes * 60.:
+        turn_begin = cur_time
+        for ipu in range(rand.randint(1, 3)):
+            if ipu > 0:
+                duration = rand.uniform(0.2, 0.8)
+                add_token(speaker, cur_time, cur_time + duration, SIL_ORTHO)
+                cur_time += duration
+            nb_tokens = rand.randint(1, 15)
+            for token in rand.choices(words, weights, k=nb_tokens):
+                duration = rand.uniform(0.15, 0.45)
+                add_token(speaker, cur_time, cur_time + duration, token)
+                cur_time += duration
+        # the other speaker is silent during the turn and the gap
+        duration = rand.uniform(0.2, 0.8)
+        add_token(speaker, cur_time, cur_time + duration, SIL_ORTHO)
+        add_token(1 - speaker, turn_begin, cur_time + duration, SIL_ORTHO)
+        cur_time += duration
+        speaker = 1 - speaker
+
+    return tiers[0], tiers[1]
+
+# ---------------------------------------------------------------------------
+
+
+def bench_self(tier, span):
+    """Return the nb of sources and the time to detect self-repetitions."""
+    repet = sppasSelfRepet()
+    repet.set_span(span)
+    start = time.perf_counter()
+    trs = repet.self_detection(tier)
+    return len(trs.find("SR-Source")), time.perf_counter() - start
+
+# ---------------------------------------------------------------------------
+
+
+def bench_other(tier_src, tier_echo, span):
+    """Return the nb of sources and the time to detect other-repetitions."""
+    repet = sppasOtherRepet()
+    repet.set_span(span)
+    start = time.perf_counter()
+    trs = repet.other_detection(tier_src, tier_echo)
+    return len(trs.find("OR-Source")), time.perf_counter() - start
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    minutes = 30
+    span = 5
+    if len(sys.argv) > 1:
+        minutes = float(sys.argv[1])
+    if len(sys.argv) > 2:
+        span = int(sys.argv[2])
+
+    tier_spk1, tier_spk2 = create_conversation(minutes)
+    print("{:.1f} minutes - {:d} and {:d} tokens, span {:d}"
+          "".format(minutes, len(tier_spk1), len(tier_spk2), span))
+
+    nb, elapsed = bench_self(tier_spk1, span)
+    print("  self-repetitions: {:.3f} seconds, {:d} sources".format(elapsed, nb))
+    nb, elapsed = bench_other(tier_spk1, tier_spk2, span)
+    print("  other-repetitions: {:.3f} seconds, {:d} sources".format(elapsed, nb))
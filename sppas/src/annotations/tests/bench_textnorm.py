@@ -0,0 +1,117 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.annotations.tests.bench_textnorm.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the throughput of the Text Normalization.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.src.annotations.tests.bench_textnorm [nb_rounds]
+
+The transcription of the demo and of the samples is normalized with the
+faked, standard and custom actions, and the throughput is printed in
+utterances per second. The tiers are normalized nb_rounds times, after a
+first round that loads the resources.
+
+"""
+
+import os
+import sys
+import time
+
+from sppas.core.config import paths
+from sppas.src.anndata import sppasTrsRW
+from sppas.src.annotations.searchtier import sppasFindTier
+from sppas.src.annotations.TextNorm.sppastextnorm import sppasTextNorm
+
+# ---------------------------------------------------------------------------
+
+
+def get_tiers(lang):
+    """Return the transcription tiers of the demo and samples of a language."""
+    filenames = list()
+    if lang == "fra":
+        filenames.append(os.path.join(paths.demo, "demo.TextGrid"))
+    folder = os.path.join(paths.samples, "samples-" + lang)
+    if os.path.exists(folder):
+        for filename in sorted(os.listdir(folder)):
+            if filename.endswith(".TextGrid"):
+                filenames.append(os.path.join(folder, filename))
+
+    tiers = list()
+    for filename in filenames:
+        try:
+            tier = sppasFindTier.transcription(sppasTrsRW(filename).read())
+            tiers.append(tier)
+        except Exception:
+            pass
+    return tiers
+
+# ---------------------------------------------------------------------------
+
+
+def bench(lang, nb_rounds):
+    """Return the nb of utterances and the time to normalize them."""
+    textnorm = sppasTextNorm()
+    textnorm.load_resources(
+        os.path.join(paths.resources, "vocab", lang + ".vocab"), lang=lang)
+    textnorm.set_faked(True)
+    textnorm.set_std(True)
+    textnorm.set_custom(True)
+
+    tiers = get_tiers(lang)
+    for tier in tiers:
+        textnorm.convert(tier)
+
+    start = time.perf_counter()
+    for i in range(nb_rounds):
+        for tier in tiers:
+            textnorm.convert(tier)
+    elapsed = time.perf_counter() - start
+    return nb_rounds * sum(len(tier) for tier in tiers), elapsed
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    nb_rounds = 10
+    if len(sys.argv) > 1:
+        nb_rounds = int(sys.argv[1])
+
+    for lang in ("fra", "eng"):
+        nb_utt, elapsed = bench(lang, nb_rounds)
+        print("{:s} - {:d} utterances: {:.3f} seconds, {:.1f} utterances/s"
+              "".format(lang, nb_utt, elapsed, nb_utt / elapsed))
@@ -43,6 +43,7 @@ import unittest
 import os
 import shutil
 import codecs
+from concurrent.futures import ThreadPoolExecutor
 
 from sppas.core.config import sg
 from sppas.core.config import paths
@@ -67,6 +68,7 @@ from sppas.src.annotations.Align.tracksio import TracksReader
 from sppas.src.annotations.Align.tracksio import TracksReaderWriter
 from sppas.src.annotations.Align.sppasalign import sppasAlign
 
+from sppas.src.annotations.Align.models.acm.tiedlist import sppasTiedList
 from sppas.src.annotations.Align.aligners import sppasAligners
 from sppas.src.annotations.Align.aligners.basealigner import BaseAligner
 from sppas.src.annotations.Align.aligners.basicalign import BasicAligner
@@ -195,6 +197,22 @@ class TestAlignersIO(unittest.TestCase):
         self.assertEqual((0., 0.09, 'h#_s2-h#_s3-h#_s4', None), prons[0])
         self.assertEqual(9, len(phones))
 
+    def test_get_entries_mlf(self):
+        lines = ['#!MLF!#',
+                 '"*/track_000001.lab"',
+                 '0 200000 a -188.945724 A',
+                 '.',
+                 '"*/track_000002.lab"',
+                 '0 100000 b -100.000000 B',
+                 '100000 300000 c -150.000000',
+                 '.']
+        entries = mlf.get_entries(lines)
+        self.assertEqual(2, len(entries))
+        self.assertEqual(['0 200000 a -188.945724 A'], entries["track_000001"])
+        self.assertEqual([(0, 100000), (100000, 300000)],
+                         mlf.get_units(entries["track_000002"]))
+        self.assertEqual(dict(), mlf.get_entries(['#!MLF!#']))
+
 # ---------------------------------------------------------------------------
 
 
@@ -266,6 +284,59 @@ class TestBaseAligner(unittest.TestCase):
         self.assertTrue(len(self._aligner.check_data()) > 20)  # error msg
         self.assertEqual("w_0 w_1 w_2", self._aligner._tokens)
 
+    def test_run_alignments(self):
+        # the aligner fails: an error for each track
+        tracks = [("a b", "w1 w2", "audio", "output")] * 3
+        results = self._aligner.run_alignments(tracks)
+        self.assertEqual(3, len(results))
+        for message, error in results:
+            self.assertIsInstance(error, NotImplementedError)
+
+        # no phones to align
+        results = self._aligner.run_alignments([("", "", "audio", "output")])
+        self.assertIsInstance(results[0][1], IOError)
+
+        # results are in the order of the tracks, whatever the nb of jobs
+        class EchoAligner(BaseAligner):
+            def run_alignment(self, input_wav, output_align):
+                return self._phones
+        tracks = [(str(i), "w", "audio", "output") for i in range(7)]
+        for nb_jobs in (1, 3, 10):
+            results = EchoAligner().run_alignments(tracks, nb_jobs)
+            self.assertEqual([(str(i), None) for i in range(7)], results)
+
+    def test_add_tiedlist(self):
+        model = os.path.join(TEMP, "model")
+        os.makedirs(model)
+        try:
+            tied_file = os.path.join(model, "tiedlist")
+            with codecs.open(tied_file, "w", sg.__encoding__) as fp:
+                fp.write("a+a\nb+b\na-b+a\nb-a+b\n"
+                         "a+c a+a\nb+c b+b\nc-a+c b-a+b\nc-b+c a-b+a\n")
+
+            # the aligners of several tracks add entries concurrently
+            entries = [["a-b+b"], ["b-a+a"], ["a+b"], ["b+a"]]
+            aligner = BaseAligner(model)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                added = list(executor.map(aligner.add_tiedlist, entries))
+            self.assertEqual(entries, added)
+
+            tie = sppasTiedList()
+            tie.read(tied_file)
+            for entry in entries:
+                self.assertTrue(tie.is_tied(entry[0]))
+            self.assertEqual(0, len([f for f in os.listdir(model)
+                                     if f.endswith(".tmp")]))
+            self.assertEqual([], aligner.add_tiedlist(["a-b+b"]))
+        finally:
+            shutil.rmtree(TEMP)
+
+    def test_get_batches(self):
+        tracks = [(str(i), "w", "audio", "output") for i in range(5)]
+        self.assertEqual([tracks], self._aligner.get_batches(tracks))
+        self.assertEqual([[t] for t in tracks],
+                         self._aligner.get_batches(tracks, 2))
+
 # ---------------------------------------------------------------------------
 
 
@@ -342,6 +413,13 @@ class TestHviteAlign(unittest.TestCase):
         self._modeldir = os.path.join(MODELDIR, "models-fra")
         self._aligner = HviteAligner(self._modeldir)
 
+    def test_get_batches(self):
+        tracks = [(str(i), "w", "audio", "output") for i in range(5)]
+        self.assertEqual([tracks], self._aligner.get_batches(tracks))
+        batches = self._aligner.get_batches(tracks, 2)
+        self.assertEqual([tracks[:3], tracks[3:]], batches)
+        self.assertEqual(5, len(self._aligner.get_batches(tracks, 8)))
+
 # ---------------------------------------------------------------------------
 
 
@@ -0,0 +1,272 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.annotations.tests.test_batch.py
+:author:   Brigitte Bigi
+:contact:  contact@sppas.org
+:summary:  Tests of the batch processing of an automatic annotation.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+"""
+
+
+import unittest
+import os
+import shutil
+import tempfile
+
+from sppas.core.config import paths
+from sppas.src.anndata import sppasTrsRW
+
+from ..param import sppasParam
+from .. import manager as ann_manager
+from ..manager import sppasAnnotationsManager
+from ..report import sppasAnnReport
+from ..report import sppasAnnReportRecorder
+from ..Syll.sppassyll import sppasSyll
+
+# ---------------------------------------------------------------------------
+
+SAMPLES = os.path.join(paths.samples, "annotation-results", "samples-fra")
+FRA_SYLL = os.path.join(paths.resources, "syll", "syllConfig-fra.txt")
+
+# ---------------------------------------------------------------------------
+
+
+class sppasVerboseSyll(sppasSyll):
+    """A syllabification reporting the loading of its resources."""
+
+    def load_resources(self, config_filename, lang="und", **kwargs):
+        self.logfile.print_message("Resources: " + config_filename, indent=2)
+        sppasSyll.load_resources(self, config_filename, lang, **kwargs)
+
+# ---------------------------------------------------------------------------
+
+
+class TestAnnReportRecorder(unittest.TestCase):
+    """Test of the recorder of the messages of a report.
+
+    """
+
+    def test_replay(self):
+        recorder = sppasAnnReportRecorder()
+        recorder.print_message("message", indent=1, status=0)
+        recorder.print_newline()
+        recorder.print_item("item", "value")
+        records = recorder.pop_records()
+        self.assertEqual(3, len(records))
+        self.assertEqual(0, len(recorder.pop_records()))
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            expected_file = os.path.join(tmp_dir, "expected.txt")
+            report = sppasAnnReport()
+            report.create(expected_file)
+            report.print_message("message", indent=1, status=0)
+            report.print_newline()
+            report.print_item("item", "value")
+            report.close()
+
+            replayed_file = os.path.join(tmp_dir, "replayed.txt")
+            report = sppasAnnReport()
+            report.create(replayed_file)
+            sppasAnnReportRecorder.replay(records, report)
+            report.close()
+
+            with open(expected_file) as fp1, open(replayed_file) as fp2:
+                self.assertEqual(fp1.read(), fp2.read())
+        finally:
+            shutil.rmtree(tmp_dir)
+
+# ---------------------------------------------------------------------------
+
+
+class TestBatchProcessing(unittest.TestCase):
+    """Test of the batch processing with and without workers.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filenames = sorted(f for f in os.listdir(SAMPLES)
+                                if f.endswith("-palign.xra"))[:4]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def annotate(self, folder, nb_workers, ann_class=sppasSyll):
+        """Copy the samples into the folder and syllabify them."""
+        folder = os.path.join(self.tmp_dir, folder)
+        os.mkdir(folder)
+        inputs = list()
+        for filename in self.filenames:
+            shutil.copy(os.path.join(SAMPLES, filename), folder)
+            inputs.append(os.path.join(folder, filename))
+
+        report = sppasAnnReport()
+        report.create(os.path.join(self.tmp_dir, folder + ".txt"))
+        syll = ann_class(log=report)
+        syll.load_resources(FRA_SYLL, lang="fra")
+        syll.set_nb_workers(nb_workers, FRA_SYLL, lang="fra")
+        out_files = syll.batch_processing(inputs)
+        report.close()
+
+        with open(os.path.join(self.tmp_dir, folder + ".txt")) as fp:
+            content = fp.read().replace(folder, "")
+        return [os.path.relpath(f, folder) for f in out_files], content
+
+    def test_workers(self):
+        syll = sppasSyll()
+        self.assertEqual(1, syll.get_nb_workers())
+        with self.assertRaises(ValueError):
+            syll.set_nb_workers(0)
+
+        out_files, content = self.annotate("sequential", 1)
+        self.assertEqual(len(self.filenames), len(out_files))
+
+        # Same created files and same report, in the same order
+        w_out_files, w_content = self.annotate("workers", 3)
+        self.assertEqual(out_files, w_out_files)
+        self.assertEqual(content, w_content)
+
+        for filename in out_files:
+            trs1 = sppasTrsRW(os.path.join(self.tmp_dir, "sequential", filename)).read()
+            trs2 = sppasTrsRW(os.path.join(self.tmp_dir, "workers", filename)).read()
+            self.assertEqual(len(trs1), len(trs2))
+            for tier1, tier2 in zip(trs1, trs2):
+                self.assertEqual(len(tier1), len(tier2))
+                for a1, a2 in zip(tier1, tier2):
+                    self.assertEqual(a1, a2)
+
+    def test_worker_options(self):
+        syll = sppasSyll()
+        syll.set_usesintervals(None)
+        syll.set_tiername("tokens")
+        syll.set_create_tier_classes(False)
+        syll.set_nb_workers(2, FRA_SYLL, lang="fra")
+        worker = sppasSyll.create_worker_annotation(*syll.get_worker_arguments())
+        self.assertEqual(syll._options, worker._options)
+        for key in syll._options:
+            self.assertIs(type(syll.get_option(key)), type(worker.get_option(key)))
+
+    def test_workers_resources(self):
+        # The messages of the resources are printed once, by the annotation
+        # of the main process, and not in the report of a file.
+        out_files, content = self.annotate("sequential", 1, sppasVerboseSyll)
+        self.assertEqual(1, content.count("Resources: "))
+        self.assertEqual((out_files, content),
+                         self.annotate("workers", 3, sppasVerboseSyll))
+
+# ---------------------------------------------------------------------------
+
+
+class TestPipeline(unittest.TestCase):
+    """Test of the annotations streamed on each root by the manager.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filenames = sorted(f for f in os.listdir(SAMPLES)
+                                if f.endswith("-palign.xra"))[:4]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def annotate(self, folder, do_pipeline, nb_workers):
+        """Copy the samples into the folder, then syllabify and TGA."""
+        folder = os.path.join(self.tmp_dir, folder)
+        os.mkdir(folder)
+        for filename in self.filenames:
+            shutil.copy(os.path.join(SAMPLES, filename), folder)
+
+        parameters = sppasParam(["syllabify.json", "tga.json"])
+        for i in range(parameters.get_step_numbers()):
+            parameters.activate_step(i)
+        parameters.add_to_workspace(folder)
+        parameters.set_lang("fra")
+        parameters.set_nb_workers(nb_workers)
+        parameters.set_report_filename(folder + ".txt")
+
+        manager = sppasAnnotationsManager()
+        manager.set_do_pipeline(do_pipeline)
+        manager.annotate(parameters)
+
+        with open(folder + ".txt") as fp:
+            lines = [line.replace(folder, "") for line in fp
+                     if line.startswith("Date:") is False]
+        return sorted(os.listdir(folder)), lines
+
+    def test_stages(self):
+        parameters = sppasParam(["searchipus.json", "syllabify.json",
+                                 "otherrepet.json", "tga.json"])
+        steps = list(range(parameters.get_step_numbers()))
+        manager = sppasAnnotationsManager()
+        manager._parameters = parameters
+        self.assertEqual([[0], [1], [2], [3]], manager._get_stages(steps))
+        manager.set_do_pipeline(True)
+        self.assertEqual([[0, 1], [2], [3]], manager._get_stages(steps))
+
+    def test_cache(self):
+        class sppasFailingManager(sppasAnnotationsManager):
+            def _get_stages(self, steps):
+                raise RuntimeError("stages")
+
+        parameters = sppasParam(["syllabify.json"])
+        with self.assertRaises(RuntimeError):
+            sppasFailingManager().annotate(parameters)
+        self.assertIsNone(sppasTrsRW.get_cache())
+
+    def test_pipeline(self):
+        files, report = self.annotate("sequential", False, 1)
+        self.assertEqual(3 * len(self.filenames), len(files))
+
+        # Same created files and same report
+        self.assertEqual((files, report), self.annotate("pipeline", True, 1))
+        self.assertEqual((files, report), self.annotate("workers", True, 2))
+
+    def test_worker_resources(self):
+        syll = sppasVerboseSyll(log=sppasAnnReportRecorder())
+        syll.load_resources(FRA_SYLL, lang="fra")
+        syll.set_nb_workers(2, FRA_SYLL, lang="fra")
+        self.assertEqual(1, len(syll.logfile.pop_records()))
+        try:
+            ann_manager._init_pipeline_worker([None, syll.get_worker_arguments()])
+            self.assertIsNone(ann_manager._pipeline_error)
+            annotations = ann_manager._pipeline_annotations
+            self.assertIsNone(annotations[0])
+            # The messages of the resources are not replayed for a root
+            self.assertEqual(0, len(annotations[1].logfile.pop_records()))
+        finally:
+            ann_manager._pipeline_annotations = list()
+            sppasTrsRW.set_cache(None)
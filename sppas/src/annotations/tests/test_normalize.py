@@ -355,6 +355,25 @@ class TestNormalizer(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_pipeline(self):
+        """... Pipeline of the actions to perform."""
+
+        p = self.tok.get_pipeline(["tokenize", "replace"])
+        self.assertEqual(3, len(p))
+        self.assertIs(p, self.tok.get_pipeline(["std", "replace", "tokenize"]))
+        self.assertIsNot(p, self.tok.get_pipeline(["replace"]))
+        self.assertEqual(1, len(self.tok.get_pipeline(["std"])))
+
+        # the pipelines are created again if the language changes
+        self.tok.set_lang("cmn")
+        self.assertIsNot(p, self.tok.get_pipeline(["tokenize", "replace"]))
+        self.tok.set_lang("fra")
+
+        self.assertEqual(u("un deux").split(), self.tok.normalize(u("/un, deux!!!")))
+        self.assertEqual(u("un deux").split(), self.tok.normalize(u("/un, deux!!!")))
+
+    # -----------------------------------------------------------------------
+
     def test_stick(self):
         """... Token Segmenter on compound words."""
 
@@ -371,6 +390,18 @@ class TestNormalizer(unittest.TestCase):
         s = t.bind([u("L' assiette")])
         self.assertEqual(s, [u("L'")])
 
+        # without separator, like for languages with no space
+        v = sppasVocabulary()
+        for w in ("a", "ab", "abc", "bcd", "d"):
+            v.add(w)
+        t = sppasTokenSegmenter(v)
+        t.set_separator("")
+        t.set_aggregate_max(15)
+        s = t.bind([u("a"), u("b"), u("c"), u("d")])
+        self.assertEqual(s, [u("abc"), u("d")])
+        s = t.bind([u("A"), u("B"), u("c")])
+        self.assertEqual(s, [u("ABc")])
+
     # -----------------------------------------------------------------------
 
     def test_sampa(self):
@@ -52,6 +52,7 @@ from sppas.src.anndata import sppasTrsRW
 
 from sppas.src.annotations.Phon.phonetize import sppasDictPhonetizer
 from sppas.src.annotations.Phon.dagphon import sppasDAGPhonetizer
+from sppas.src.annotations.Phon import phonunk
 from sppas.src.annotations.Phon.phonunk import sppasPhonUnk
 from sppas.src.annotations.Phon.sppasphon import sppasPhon
 
@@ -327,6 +328,42 @@ class TestPhonUnk(unittest.TestCase):
         self.assertEqual(set('a-b|aa-b'.split('|')),
                          set(self.p.get_phon('abd').split('|')))
 
+    # -----------------------------------------------------------------------
+
+    def test_phon_memorized(self):
+        """... Phonetization of an unknown entry, twice."""
+        self.assertEqual(self.p.get_phon('abd'), self.p.get_phon('abd'))
+        for i in range(2):
+            with self.assertRaises(Exception):
+                self.p.get_phon('ddd')
+
+        # the dictionary is added new entries after a phonetization
+        d = sppasDictPron()
+        p = sppasPhonUnk(d)
+        with self.assertRaises(Exception):
+            p.get_phon('abd')
+        d.add_pron("ab", "a b")
+        d.add_pron("d", "d")
+        self.assertEqual("a-b-d", p.get_phon('abd'))
+
+        # a pronunciation is added but not an entry
+        d.add_pron("d", "t")
+        self.assertEqual(2, len(d))
+        self.assertEqual("a-b-d|a-b-t", p.get_phon('abd'))
+
+    def test_phon_memo_size(self):
+        """... The memorized phonetizations are bounded."""
+        size = phonunk.MEMO_SIZE
+        phonunk.MEMO_SIZE = 3
+        try:
+            for entry in ("ab", "abb", "ac", "bb", "bc"):
+                self.p.get_phon(entry)
+            self.assertEqual(3, len(self.p._sppasPhonUnk__phons))
+            self.assertFalse("ab" in self.p._sppasPhonUnk__phons)
+            self.assertTrue("bc" in self.p._sppasPhonUnk__phons)
+        finally:
+            phonunk.MEMO_SIZE = size
+
 
 # ---------------------------------------------------------------------------
 
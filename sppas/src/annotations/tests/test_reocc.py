@@ -347,3 +347,30 @@ class TestSPPASOcc(unittest.TestCase):
         self.assertEqual("2", tiers[1][1].get_best_tag().get_content())
         self.assertEqual("R1", tiers[2][1].get_best_tag().get_content())
         self.assertEqual("R1", tiers[2][2].get_best_tag().get_content())
+
+    def test_detection_span(self):
+        t1 = sppasTier("tier1")
+        t2 = sppasTier("tier2")
+        for i, tag in enumerate(("a", "b", "c", "d", "e", "f")):
+            t2.create_annotation(sppasLocation(sppasPoint(10 + i)),
+                                 sppasLabel(sppasTag(tag)))
+        # "b" is the 2nd annotation of t2 after 1, and "f" is the 5th one
+        # after 11 and the 2nd one after 14
+        t1.create_annotation(sppasLocation(sppasPoint(1)), sppasLabel(sppasTag("b")))
+        t1.create_annotation(sppasLocation(sppasPoint(11)), sppasLabel(sppasTag("f")))
+        t1.create_annotation(sppasLocation(sppasPoint(14)), sppasLabel(sppasTag("f")))
+        t1.create_annotation(sppasLocation(sppasPoint(16)), sppasLabel(sppasTag("f")))
+
+        r = sppasReOcc()
+        r.set_span(3)
+        tiers = r.detection(t1, t2)
+        self.assertEqual(2, len(tiers[0]))
+        self.assertEqual(sppasPoint(1), tiers[0][0].get_lowest_localization())
+        self.assertEqual(sppasPoint(14), tiers[0][1].get_lowest_localization())
+        self.assertEqual(2, len(tiers[2]))
+        self.assertEqual(sppasPoint(11), tiers[2][0].get_lowest_localization())
+        self.assertEqual(sppasPoint(15), tiers[2][1].get_lowest_localization())
+
+        r.set_span(1)
+        tiers = r.detection(t1, t2)
+        self.assertEqual(0, len(tiers[0]))
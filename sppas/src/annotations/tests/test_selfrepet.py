@@ -185,6 +185,50 @@ class TestDataSpeaker(unittest.TestCase):
         d = DataSpeaker(["tok1", "tok2", "tok1"])
         self.assertEqual(d.is_word_repeated(0, 1, d), 2)
         self.assertEqual(d.is_word_repeated(1, 2, d), -1)
+        self.assertEqual(d.is_word_repeated(0, 3, d), -1)
+        self.assertEqual(d.is_word_repeated(0, -1, d), -1)
+
+    # -----------------------------------------------------------------------
+
+    def test_find_word(self):
+        d = DataSpeaker(["tok1", "*", "tok2", "tok1~", "#"])
+        self.assertEqual(d.find_word("tok1"), 0)
+        self.assertEqual(d.find_word("tok1", 1), 3)
+        self.assertEqual(d.find_word("tok1", 4), -1)
+        self.assertEqual(d.find_word("tok2", 1), 2)
+        self.assertEqual(d.find_word("tok3"), -1)
+        # symbols are not words
+        self.assertEqual(d.find_word("*"), -1)
+        self.assertEqual(d.find_word("#"), -1)
+
+    # -----------------------------------------------------------------------
+
+    def test_get_window(self):
+        d = DataSpeaker(["tok1", "tok2", "*", "tok1", "tok3", "tok2"])
+        w = d.get_window(2, 4)
+        self.assertEqual(len(w), 3)
+        self.assertEqual(list(w), ["*", "tok1", "tok3"])
+        self.assertEqual(w[1], "tok1")
+        self.assertFalse(w.is_word(0))
+        self.assertTrue(w.is_word(2))
+        self.assertFalse(w.is_word(3))
+        self.assertEqual(w.get_next_word(0), 1)
+        self.assertEqual(w.get_next_word(2), -1)
+        self.assertEqual(w.find_word("tok1"), 1)
+        self.assertEqual(w.find_word("tok2"), -1)
+        with self.assertRaises(ValueError):
+            w.get_next_word(3)
+
+        # search for the echos of a window into another one
+        self.assertEqual(w.is_word_repeated(1, 0, d), 0)
+        self.assertEqual(w.is_word_repeated(1, 1, d), 3)
+        self.assertEqual(d.is_word_repeated(1, 0, w), -1)
+        self.assertEqual(d.is_word_repeated(3, 0, w), 1)
+
+        # a window in a window, or out of the entries
+        self.assertEqual(list(w.get_window(1, 10)), ["tok1", "tok3"])
+        self.assertEqual(len(d.get_window(6, 10)), 0)
+        self.assertEqual(len(d.get_window(3, 2)), 0)
 
 # ---------------------------------------------------------------------------
 
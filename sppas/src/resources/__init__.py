@@ -58,6 +58,7 @@ from .patterns import sppasPatterns
 from .unigram import sppasUnigram
 from .vocab import sppasVocabulary
 from .dumpfile import sppasDumpFile
+from .dictstore import sppasDictStore
 from .hand import sppasHandResource
 
 __all__ = (
@@ -69,5 +70,6 @@ __all__ = (
     "sppasUnigram",
     "sppasVocabulary",
     "sppasDumpFile",
+    "sppasDictStore",
     "sppasHandResource"
 )
@@ -40,6 +40,7 @@
 
 import os
 import codecs
+import bisect
 import logging
 import xml.etree.cElementTree as ET
 
@@ -49,7 +50,7 @@ from sppas.core.config import paths
 from sppas.core.config import separators
 from sppas.core.coreutils import sppasUnicode
 
-from .dumpfile import sppasDumpFile
+from .dictstore import sppasDictStore
 from .resourcesexc import FileIOError, FileUnicodeError, FileFormatError
 
 # ---------------------------------------------------------------------------
@@ -93,9 +94,11 @@ class sppasDictPron(object):
     def __init__(self, dict_filename=None, nodump=False):
         """Create a sppasDictPron instance.
 
-        A dump file is a binary version of the dictionary. Its size is greater
-        than the original ASCII dictionary but the time to load is divided
-        by two or three.
+        A dump file is a binary version of the dictionary: a sppasDictStore.
+        It is not loaded but mapped in memory, so that the dictionary is
+        available immediately and its pages are shared by all the processes
+        using it. It is created when the ASCII dictionary is loaded, and
+        re-created if it is older.
 
         :param dict_filename: (str) Name of the file of the pronunciation dict
         :param nodump: (bool) Create or not a dump file.
@@ -106,25 +109,28 @@ class sppasDictPron(object):
         # The pronunciation dictionary
         self._dict = dict()
 
+        # Number of changes of the dictionary, and its sorted entries if
+        # it is not a mapped one: both are used to search for prefixes.
+        self.__stamp = 0
+        self.__entries = None
+
         # Either read the dictionary from a dumped file or from the original
         # ASCII one.
         if dict_filename is not None:
 
             self._filename = dict_filename
-            dp = sppasDumpFile(dict_filename)
             data = None
 
-            # Try first to get the dict from a dump file
-            # (at least 2 times faster)
+            # Try first to map the dict from a dump file
             if nodump is False:
-                data = dp.load_from_dump()
+                data = sppasDictStore.load_from_dump(dict_filename)
 
             # Load from ascii if:
             # 1st load, or, dump load error, or dump older than ascii
             if data is None:
                 self.load(dict_filename)
                 if nodump is False:
-                    dp.save_as_dump(self._dict)
+                    sppasDictStore.save_as_dump(dict_filename, self._dict)
             else:
                 self._dict = data
 
@@ -138,6 +144,18 @@ class sppasDictPron(object):
 
     # -----------------------------------------------------------------------
 
+    def get_modification_stamp(self):
+        """Return the modification stamp of the dictionary.
+
+        It is incremented each time a pronunciation is added.
+
+        :return: (int)
+
+        """
+        return self.__stamp
+
+    # -----------------------------------------------------------------------
+
     def get_unkstamp(self):
         """Return the unknown words stamp."""
         return symbols.unk
@@ -204,6 +222,24 @@ class sppasDictPron(object):
 
     # -----------------------------------------------------------------------
 
+    def has_prefix(self, prefix):
+        """Return True if an entry of the dictionary starts with the prefix.
+
+        :param prefix: (str) a string
+        :returns: (bool)
+
+        """
+        s = sppasDictPron.format_token(prefix)
+        if isinstance(self._dict, sppasDictStore) is True:
+            return self._dict.has_prefix(s)
+
+        if self.__entries is None:
+            self.__entries = sorted(self._dict)
+        i = bisect.bisect_left(self.__entries, s)
+        return i < len(self.__entries) and self.__entries[i].startswith(s)
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def format_token(entry):
         """Remove the CR/LF, tabs, multiple spaces and others... and lowerise.
@@ -244,8 +280,12 @@ class sppasDictPron(object):
         # Get the current pronunciation and append the new one
         new_pron = cur_pron + new_pron
 
-        # Add (or change) the entry in the dict
+        # Add (or change) the entry in the dict, which can't be a mapped one
+        if isinstance(self._dict, sppasDictStore) is True:
+            self._dict = dict(self._dict.items())
         self._dict[entry] = new_pron
+        self.__stamp += 1
+        self.__entries = None
 
     # -----------------------------------------------------------------------
 
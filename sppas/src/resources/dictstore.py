@@ -0,0 +1,377 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.src.resources.dictstore.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: A read-only dictionary of strings in a memory-mapped file.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+"""
+
+import os
+import sys
+import mmap
+import array
+import bisect
+import struct
+import logging
+from collections.abc import Mapping
+
+from .dumpfile import sppasDumpFile
+from .resourcesexc import FileFormatError
+
+# ---------------------------------------------------------------------------
+
+
+class sppasDictStore(Mapping):
+    """A read-only dictionary of strings in a memory-mapped file.
+
+    The entries of the dictionary are not loaded: the file is mapped in
+    memory and an entry is searched by dichotomy among the sorted keys.
+    Opening the file is then immediate, whatever its size, and several
+    processes reading the same file share its pages. Only the key of one
+    entry every BLOCK_SIZE ones is decoded: the block of entries of a key
+    is found with the bisect module, then the key is searched in python
+    among the entries of its block.
+
+    The file contains:
+
+        - a header: "SPPASDS1" then the number of entries N;
+        - a table of N+1 offsets: the position of each entry in the data,
+          then the size of the data;
+        - the data: each entry is the UTF-8 key, a NUL byte, then the UTF-8
+          value. The entries are sorted by the bytes of their key.
+
+    Integers are stored as unsigned little-endian 64 bits.
+
+        >>> sppasDictStore.save("eng.store", {"a": "@|eI", "the": "D-@|D-i:"})
+        >>> d = sppasDictStore("eng.store")
+        >>> d.get("the")
+        >>> "D-@|D-i:"
+
+    """
+
+    FILENAME_EXT = ".store"
+    BLOCK_SIZE = 32
+    MAGIC = b"SPPASDS1"
+
+    # -----------------------------------------------------------------------
+
+    def __init__(self, filename):
+        """Map a dictionary file in memory.
+
+        :param filename: (str) Name of a file created by save()
+        :raises: IOError, FileFormatError
+
+        """
+        self._filename = filename
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < 16:
+                raise FileFormatError(0, filename)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:8] != sppasDictStore.MAGIC:
+            self._map.close()
+            raise FileFormatError(0, filename)
+        self._len = struct.unpack_from("<Q", self._map, 8)[0]
+        self._data = 16 + (self._len + 1) * 8
+        if self._data + self.__offset(self._len) != size:
+            self._map.close()
+            raise FileFormatError(0, filename)
+
+        # The table of offsets is read without being copied if the byte
+        # order of the system is the one of the file.
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._map)[16:self._data].cast("Q")
+        else:
+            self._offsets = array.array("Q", self._map[16:self._data])
+            self._offsets.byteswap()
+
+        # The keys of one entry every BLOCK_SIZE ones, to find the block of
+        # entries of a key without iterating in python.
+        self._blocks = [self.__entry_key(i)
+                        for i in range(0, self._len, sppasDictStore.BLOCK_SIZE)]
+
+    # -----------------------------------------------------------------------
+
+    def get_filename(self):
+        """Return the name of the mapped file."""
+        return self._filename
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Close the memory-mapped file."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._map.close()
+
+    # -----------------------------------------------------------------------
+
+    def items(self):
+        """Return a generator of the (key, value) entries in sorted order."""
+        for i in range(self._len):
+            yield self.__entry(i)
+
+    # -----------------------------------------------------------------------
+    # Load/Save
+    # -----------------------------------------------------------------------
+
+    def has_prefix(self, prefix):
+        """Return True if the key of an entry starts with the given string.
+
+        :param prefix: (str)
+        :returns: (bool)
+
+        """
+        if isinstance(prefix, str) is False:
+            return False
+        prefix = prefix.encode("utf-8")
+        block = max(0, bisect.bisect_right(self._blocks, prefix) - 1)
+        lo = block * sppasDictStore.BLOCK_SIZE
+        hi = min(lo + sppasDictStore.BLOCK_SIZE, self._len)
+
+        # Search the first entry not lower than the prefix. Its key starts
+        # with the prefix if any key does. It can be the first one of the
+        # next block.
+        size = len(prefix)
+        data = self._data
+        offsets = self._offsets
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data + offsets[mid]
+            if self._map[start:start + size] < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._len:
+            return False
+        start = data + offsets[lo]
+        return self._map[start:start + size] == prefix
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def save(filename, data):
+        """Save a dictionary of strings into a file to be mapped.
+
+        The file is written under a temporary name then renamed, so that
+        a process never maps an incomplete file.
+
+        :param filename: (str) Name of the file
+        :param data: (dict) Keys and values are strings without NUL char
+        :returns: (bool)
+
+        """
+        entries = sorted((key.encode("utf-8"), value.encode("utf-8"))
+                         for key, value in data.items())
+        tmp_filename = filename + ".{:d}.tmp".format(os.getpid())
+        try:
+            with open(tmp_filename, 'wb') as f:
+                f.write(sppasDictStore.MAGIC)
+                f.write(struct.pack("<Q", len(entries)))
+                offset = 0
+                offsets = [offset]
+                for key, value in entries:
+                    offset += len(key) + len(value) + 1
+                    offsets.append(offset)
+                f.write(struct.pack("<{:d}Q".format(len(offsets)), *offsets))
+                for key, value in entries:
+                    f.write(key)
+                    f.write(b"\0")
+                    f.write(value)
+            os.replace(tmp_filename, filename)
+        except Exception as e:
+            logging.info('Save a dictionary store failed: {:s}'.format(str(e)))
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            return False
+
+        return True
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def load_from_dump(filename):
+        """Map the store of an ASCII file if it is up-to-date.
+
+        :param filename: (str) Name of the ASCII file
+        :returns: (sppasDictStore) or None
+
+        """
+        dp = sppasDumpFile(filename, sppasDictStore.FILENAME_EXT)
+        if dp.has_dump() is False:
+            return None
+
+        try:
+            store = sppasDictStore(dp.get_dump_filename())
+        except Exception as e:
+            logging.info('Map a dictionary store failed: {:s}'.format(str(e)))
+            return None
+
+        sppasDictStore.__remove_pickle(filename)
+        return store
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def save_as_dump(filename, data):
+        """Save the store of an ASCII file.
+
+        :param filename: (str) Name of the ASCII file
+        :param data: (dict) Keys and values are strings without NUL char
+        :returns: (bool)
+
+        """
+        dp = sppasDumpFile(filename, sppasDictStore.FILENAME_EXT)
+        if sppasDictStore.save(dp.get_dump_filename(), data) is False:
+            return False
+
+        sppasDictStore.__remove_pickle(filename)
+        return True
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __remove_pickle(filename):
+        """Remove the pickle dump of an ASCII file, if any.
+
+        The previous versions saved the dictionaries as pickle dump files.
+        They are not used anymore since the store replaced them.
+
+        :param filename: (str) Name of the ASCII file
+
+        """
+        dump_filename = sppasDumpFile(filename).get_dump_filename()
+        if os.path.exists(dump_filename):
+            try:
+                os.remove(dump_filename)
+            except OSError as e:
+                logging.info('Remove a dumped data failed: {:s}'.format(str(e)))
+
+    # -----------------------------------------------------------------------
+
+    def __offset(self, i):
+        """Return the offset of the i-th entry in the data."""
+        return struct.unpack_from("<Q", self._map, 16 + i * 8)[0]
+
+    # -----------------------------------------------------------------------
+
+    def __entry_key(self, i):
+        """Return the key of the i-th entry, as bytes."""
+        start = self._data + self._offsets[i]
+        end = self._data + self._offsets[i + 1]
+        return self._map[start:self._map.find(b"\0", start, end)]
+
+    # -----------------------------------------------------------------------
+
+    def __entry(self, i):
+        """Return the (key, value) of the i-th entry."""
+        start = self._data + self._offsets[i]
+        end = self._data + self._offsets[i + 1]
+        sep = self._map.find(b"\0", start, end)
+        return (self._map[start:sep].decode("utf-8"),
+                self._map[sep + 1:end].decode("utf-8"))
+
+    # -----------------------------------------------------------------------
+
+    def __find(self, key):
+        """Return the value of a key or None.
+
+        The key followed by the NUL byte is compared to the same number of
+        bytes of an entry: they are equal only if the key of the entry is
+        the given one, and they are ordered like the keys otherwise.
+
+        """
+        if isinstance(key, str) is False:
+            return None
+        key = key.encode("utf-8")
+        block = bisect.bisect_right(self._blocks, key) - 1
+        if block < 0:
+            return None
+        lo = block * sppasDictStore.BLOCK_SIZE
+        hi = min(lo + sppasDictStore.BLOCK_SIZE, self._len)
+
+        key += b"\0"
+        size = len(key)
+        data = self._data
+        offsets = self._offsets
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data + offsets[mid]
+            cur = self._map[start:start + size]
+            if cur < key:
+                lo = mid + 1
+            elif cur > key:
+                hi = mid
+            else:
+                return self._map[start + size:data + offsets[mid + 1]].decode("utf-8")
+        return None
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def get(self, key, default=None):
+        value = self.__find(key)
+        if value is None:
+            return default
+        return value
+
+    # -----------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        value = self.__find(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    # -----------------------------------------------------------------------
+
+    def __contains__(self, key):
+        return self.__find(key) is not None
+
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return self._len
+
+    # -----------------------------------------------------------------------
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self.__entry_key(i).decode("utf-8")
@@ -41,11 +41,16 @@
 
 import unittest
 import os.path
+import shutil
+import tempfile
 
 from sppas.core.config import paths
 from sppas.core.coreutils import u
 
 from sppas.src.resources.dictpron import sppasDictPron
+from sppas.src.resources.dictstore import sppasDictStore
+from sppas.src.resources.dumpfile import sppasDumpFile
+from sppas.src.resources.resourcesexc import FileFormatError
 from sppas.src.resources.dictrepl import sppasDictRepl
 from sppas.src.resources.mapping import sppasMapping
 from sppas.src.resources.unigram import sppasUnigram
@@ -90,6 +95,26 @@ class TestDictPron(unittest.TestCase):
         self.assertTrue("É" in d)
         self.assertTrue(u("É") in d)
 
+        # the modification stamp is incremented even if the size is not
+        stamp = d.get_modification_stamp()
+        d.add_pron("é", "E")
+        self.assertEqual(1, len(d))
+        self.assertEqual(stamp + 1, d.get_modification_stamp())
+
+    # -----------------------------------------------------------------------
+
+    def test_has_prefix(self):
+        d = sppasDictPron()
+        d.add_pron("abc", "a b c")
+        d.add_pron("b", "b")
+        self.assertTrue(d.has_prefix("a"))
+        self.assertTrue(d.has_prefix("AB"))
+        self.assertTrue(d.has_prefix("abc"))
+        self.assertFalse(d.has_prefix("abcd"))
+        self.assertFalse(d.has_prefix("c"))
+        d.add_pron("cd", "c d")
+        self.assertTrue(d.has_prefix("c"))
+
     # -----------------------------------------------------------------------
 
     def test_is_unk(self):
@@ -133,6 +158,33 @@ class TestDictPron(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_load_dump(self):
+        """Map the dump of an HTK-ASCII pronunciation dictionary."""
+        dict_copy = DICT_TEST + ".copy"
+        store = DICT_TEST + sppasDictStore.FILENAME_EXT
+        shutil.copy(DICT_TEST, dict_copy)
+        try:
+            d = sppasDictPron(dict_copy)
+            self.assertTrue(os.path.exists(store))
+            d2 = sppasDictPron(dict_copy)
+            self.assertIsInstance(d2._dict, sppasDictStore)
+            self.assertEqual(len(d), len(d2))
+            for token in d:
+                self.assertEqual(d.get_pron(token), d2.get_pron(token))
+            self.assertTrue(d2.is_unk('azerty'))
+            self.assertFalse(d2.is_unk(u('ÊTRE')))
+
+            # the mapped dict is copied when modified
+            d2.add_pron("abc", "a b")
+            self.assertIsInstance(d2._dict, dict)
+            self.assertEqual(d2.get_pron(u('abc')), "a-b-c|a-c|a-b")
+            self.assertEqual(d.get_pron(u('abc')), "a-b-c|a-c")
+        finally:
+            os.remove(dict_copy)
+            os.remove(store)
+
+    # -----------------------------------------------------------------------
+
     def test_load_xml(self):
         """Load a pronunciation dictionary from a RALF dic file (xml)."""
 
@@ -167,6 +219,113 @@ class TestDictPron(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+class TestDictStore(unittest.TestCase):
+    """Test of sppasDictStore class."""
+
+    def setUp(self):
+        self.filename = DICT_TEST + sppasDictStore.FILENAME_EXT
+
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    # -----------------------------------------------------------------------
+
+    def test_save_map(self):
+        data = {u("être"): "E-t-R", "a": "a|A", "abc": "a-b-c", "b": ""}
+        self.assertTrue(sppasDictStore.save(self.filename, data))
+        d = sppasDictStore(self.filename)
+        self.assertEqual(4, len(d))
+        self.assertEqual(sorted(data), sorted(d))
+        self.assertEqual(data, dict(d.items()))
+        for key in data:
+            self.assertTrue(key in d)
+            self.assertEqual(data[key], d[key])
+        self.assertEqual("", d["b"])
+        self.assertFalse("ab" in d)
+        self.assertFalse("" in d)
+        self.assertFalse(3 in d)
+        self.assertIsNone(d.get("abcd"))
+        self.assertEqual("x", d.get("abcd", "x"))
+        with self.assertRaises(KeyError):
+            d["abcd"]
+        d.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_find(self):
+        data = dict()
+        for i in range(200):
+            data["k" * (i % 7) + str(i)] = str(i)
+            data[u("é") * (i % 5) + str(i)] = ""
+        self.assertTrue(sppasDictStore.save(self.filename, data))
+        d = sppasDictStore(self.filename)
+        self.assertEqual(len(data), len(d))
+        for key in data:
+            self.assertEqual(data[key], d[key])
+            self.assertIsNone(d.get(key[:-1] + "/"))
+            self.assertEqual(key + "0" in data, key + "0" in d)
+        self.assertFalse("" in d)
+        self.assertFalse("0k" in d)
+        for key in data:
+            for i in range(len(key) + 1):
+                self.assertTrue(d.has_prefix(key[:i]))
+            self.assertEqual(any(k.startswith(key + "/") for k in data),
+                             d.has_prefix(key + "/"))
+        self.assertFalse(d.has_prefix("0k"))
+        self.assertFalse(d.has_prefix("z"))
+        self.assertFalse(d.has_prefix(3))
+        d.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_empty(self):
+        self.assertTrue(sppasDictStore.save(self.filename, dict()))
+        d = sppasDictStore(self.filename)
+        self.assertEqual(0, len(d))
+        self.assertFalse("a" in d)
+        self.assertEqual([], list(d))
+        d.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_bad_file(self):
+        with self.assertRaises(IOError):
+            sppasDictStore(self.filename)
+        with open(self.filename, "wb") as f:
+            f.write(b"not a dictionary store")
+        with self.assertRaises(FileFormatError):
+            sppasDictStore(self.filename)
+        self.assertIsNone(sppasDictStore.load_from_dump(DICT_TEST))
+
+    # -----------------------------------------------------------------------
+
+    def test_dump(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmp_dir, "dict.txt")
+            shutil.copy(DICT_TEST, filename)
+            pickle_dp = sppasDumpFile(filename)
+            store_dp = sppasDumpFile(filename, sppasDictStore.FILENAME_EXT)
+
+            # the pickle of a previous version is replaced by the store
+            self.assertTrue(pickle_dp.save_as_dump(dict()))
+            d = sppasDictPron(filename)
+            self.assertTrue(store_dp.has_dump())
+            self.assertFalse(os.path.exists(pickle_dp.get_dump_filename()))
+            self.assertTrue(d.is_pron_of("abc", "a-b-c"))
+
+            # and also if the store already exists
+            self.assertTrue(pickle_dp.save_as_dump(dict()))
+            d = sppasDictPron(filename)
+            self.assertFalse(os.path.exists(pickle_dp.get_dump_filename()))
+            self.assertTrue(d.is_pron_of("abc", "a-b-c"))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+# ---------------------------------------------------------------------------
+
+
 class TestUnigram(unittest.TestCase):
     """Test of sppasUnigram."""
 
@@ -81,6 +81,20 @@ class TestVocabulary(unittest.TestCase):
         self.assertTrue(u("être") in l)
         #self.assertTrue(l.is_unk("être")) True with Python 2.7 but False with Python 3.
 
+    def test_prefix_lengths(self):
+        l = sppasVocabulary()
+        l.add("a")
+        l.add("abc")
+        l.add("abcde")
+        self.assertEqual(l.get_prefix_lengths("abcdef"), [1, 3, 5])
+        self.assertEqual(l.get_prefix_lengths("abcdef", [3, 4]), [3])
+        self.assertEqual(l.get_prefix_lengths("abx"), [1])
+        self.assertEqual(l.get_prefix_lengths("xabc"), [])
+        l.add("ab")
+        self.assertEqual(l.get_prefix_lengths("abx"), [1, 2])
+        l.clear()
+        self.assertEqual(l.get_prefix_lengths("abc"), [])
+
     def test_save(self):
         l = sppasVocabulary(VOCAB, nodump=True)
         l.save(VOCAB_TEST)
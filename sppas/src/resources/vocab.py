@@ -71,6 +71,9 @@ class sppasVocabulary(object):
         # Set the list of entries to be case-sensitive or not.
         self.__case_sensitive = case_sensitive
 
+        # The beginnings of the entries, created when needed
+        self.__prefixes = None
+
         self.__filename = ""
         if filename is not None:
 
@@ -116,6 +119,7 @@ class sppasVocabulary(object):
 
         if entry not in self.__entries:
             self.__entries[entry] = None
+            self.__prefixes = None
             return True
 
         return False
@@ -138,6 +142,43 @@ class sppasVocabulary(object):
 
     # -----------------------------------------------------------------------
 
+    def get_prefix_lengths(self, text, lengths=None):
+        """Return the lengths of the beginnings of text that are entries.
+
+        The beginnings of all the entries are computed at the first call,
+        like a trie. Then, text is scanned from left to right and the scan
+        stops as soon as the beginning of text can't match any entry.
+
+        :param text: (str)
+        :param lengths: (iterable) Increasing lengths of the beginnings to
+        scan. Default is all of them.
+        :returns: (list) Increasing lengths
+
+        """
+        if self.__prefixes is None:
+            # key=a beginning of an entry, value=True if it is an entry
+            prefixes = dict()
+            for word in self.__entries:
+                prefixes[word] = True
+                for i in range(len(word) - 1, 0, -1):
+                    if word[:i] in prefixes:
+                        break
+                    prefixes[word[:i]] = False
+            self.__prefixes = prefixes
+
+        if lengths is None:
+            lengths = range(1, len(text) + 1)
+        entries = list()
+        for i in lengths:
+            is_entry = self.__prefixes.get(text[:i])
+            if is_entry is None:
+                break
+            if is_entry is True:
+                entries.append(i)
+        return entries
+
+    # -----------------------------------------------------------------------
+
     def is_unk(self, entry):
         """Return True if entry is unknown (not in the list).
 
@@ -151,6 +192,7 @@ class sppasVocabulary(object):
     def clear(self):
         """Remove all entries of the vocabulary."""
         self.__entries = dict()
+        self.__prefixes = None
 
     # -----------------------------------------------------------------------
 
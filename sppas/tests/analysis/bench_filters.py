@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.analysis.bench_filters.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the relation filter between two tiers.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.analysis.bench_filters [nb_phones]
+
+A tier of phones is related to a tier of tokens with 5 times less
+annotations. The time of sppasTierFilters.rel() is compared to the time
+of comparing each annotation with all the annotations of the other tier,
+and the results are checked to be identical.
+
+The tag(), dur() and loc() filters of the tier of phones are compared to
+the match of the labels and of the location of each annotation.
+
+"""
+
+import sys
+import time
+import logging
+
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+from sppas.src.anndata.ann.annlocation import sppasIntervalCompare
+from sppas.src.anndata.ann.annlocation import sppasDurationCompare
+from sppas.src.anndata.ann.annlocation import sppasLocalizationCompare
+from sppas.src.anndata.ann.annlabel import sppasTagCompare
+from sppas.src.structs import sppasBaseFilters
+from sppas.src.analysis.tierfilters import sppasTierFilters
+
+PHONES = ("a", "l", "E", "p", "#", "t", "@", "R", "e", "s")
+
+# ---------------------------------------------------------------------------
+
+
+def create_tier(name, nb_annotations, duration):
+    """Return a tier of nb_annotations contiguous labelled intervals."""
+    tier = sppasTier(name)
+    for i in range(nb_annotations):
+        tier.create_annotation(sppasLocation(sppasInterval(
+            sppasPoint(round(i * duration, 3), 0.0005),
+            sppasPoint(round((i + 1) * duration, 3), 0.0005))),
+            sppasLabel(sppasTag(PHONES[(i * 7) % len(PHONES)])))
+    return tier
+
+# ---------------------------------------------------------------------------
+
+
+def match_each(tier, tag_kwargs, dur_kwargs, loc_kwargs):
+    """Match the labels and the location of each annotation of the tier."""
+    tag_functions = sppasBaseFilters.fix_functions(sppasTagCompare(), **tag_kwargs)
+    dur_functions = sppasBaseFilters.fix_functions(sppasDurationCompare(), **dur_kwargs)
+    loc_functions = sppasBaseFilters.fix_functions(sppasLocalizationCompare(), **loc_kwargs)
+    tagged = [ann for ann in tier
+              if any(label.match(tag_functions) for label in ann.get_labels())]
+    durations = [ann for ann in tier
+                 if ann.get_location().match_duration(dur_functions)]
+    located = [ann for ann in tier
+               if ann.get_location().match_localization(loc_functions)]
+    return tagged, durations, located
+
+# ---------------------------------------------------------------------------
+
+
+def connect_all(tier, other_tier, names, **kwargs):
+    """Compare each annotation with all the annotations of the other tier."""
+    comparator = sppasIntervalCompare()
+    functions = [comparator.get(name) for name in names]
+    result = dict()
+    for ann in tier:
+        for localization, score in ann.get_location():
+            for other_ann in other_tier:
+                for other_loc, other_score in other_ann.get_location():
+                    for func in functions:
+                        if func(localization, other_loc, **kwargs):
+                            result.setdefault(ann, set()).add(func.__name__)
+    return result
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.ERROR)
+    nb = 2000
+    if len(sys.argv) > 1:
+        nb = int(sys.argv[1])
+
+    phones = create_tier("Phones", nb, 0.06)
+    tokens = create_tier("Tokens", nb // 5, 0.27)
+
+    for names, kwargs in ((("during", "starts", "finishes", "equals"), {}),
+                          (("overlaps", "overlappedby"), {"overlap_min": 0.01}),
+                          (("before", "after"), {"max_delay": 0.5})):
+        start = time.perf_counter()
+        res = sppasTierFilters(phones).rel(tokens, *names, **kwargs)
+        elapsed_rel = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = connect_all(phones, tokens, names, **kwargs)
+        elapsed_all = time.perf_counter() - start
+
+        assert len(res) == len(expected)
+        for ann in expected:
+            assert set(res.get_value(ann)) == expected[ann]
+        print("{:s}: {:d} annotations. rel(): {:.3f} seconds, all pairs: {:.3f} seconds"
+              "".format(", ".join(names), len(res), elapsed_rel, elapsed_all))
+
+    tag_kwargs = {"iexact": "e", "not_startswith": "#"}
+    dur_kwargs = {"ge": 0.05, "lt": 0.1}
+    loc_kwargs = {"rangefrom": 10., "rangeto": 50.}
+
+    start = time.perf_counter()
+    f = sppasTierFilters(phones)
+    res = (f.tag(**tag_kwargs), f.dur(**dur_kwargs), f.loc(**loc_kwargs))
+    elapsed_filters = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = match_each(phones, tag_kwargs, dur_kwargs, loc_kwargs)
+    elapsed_each = time.perf_counter() - start
+
+    for r, e in zip(res, expected):
+        assert set(r) == set(e)
+    print("tag, dur, loc: {:d} annotations. filters: {:.3f} seconds, each annotation: {:.3f} seconds"
+          "".format(sum(len(r) for r in res), elapsed_filters, elapsed_each))
@@ -50,12 +50,18 @@ from sppas.src.anndata.tier import sppasTier
 from sppas.src.anndata.ann.annlocation import sppasLocation
 from sppas.src.anndata.ann.annlocation import sppasInterval
 from sppas.src.anndata.ann.annlocation import sppasPoint
+from sppas.src.anndata.ann.annlocation import sppasIntervalCompare
+from sppas.src.anndata.ann.annlocation import sppasDuration
+from sppas.src.anndata.ann.annlocation import sppasDurationCompare
+from sppas.src.anndata.ann.annlocation import sppasLocalizationCompare
 from sppas.src.anndata.ann.annlabel import sppasTag
 from sppas.src.anndata.ann.annlabel import sppasLabel
+from sppas.src.anndata.ann.annlabel import sppasTagCompare
 from sppas.src.anndata.ann.annotation import sppasAnnotation
 
 from sppas.src.anndata.ann.annset import sppasAnnSet
 from sppas.src.analysis.tierfilters import sppasTierFilters
+from sppas.src.structs import sppasBaseFilters
 from sppas.src.analysis.tierfilters import SingleFilterTier
 from sppas.src.analysis.tierfilters import RelationFilterTier
 
@@ -362,6 +368,112 @@ class TestFiltersTier(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+class TestFiltersColumns(unittest.TestCase):
+    """Test filters on the columns of a tier versus on each annotation."""
+
+    def setUp(self):
+        contents = ("le", "La", "#", "chat", "+", "l'", "Al", "pla")
+        self.tier = sppasTier("Tier")
+        for i in range(40):
+            labels = list()
+            for j in range(i % 3):
+                tags = [sppasTag(contents[(i + j) % len(contents)]),
+                        sppasTag(contents[(i * j) % len(contents)])]
+                labels.append(sppasLabel(tags, [0.6, 0.4]))
+            begin = float(i) * 0.1
+            end = begin + 0.05 * float(1 + i % 4)
+            self.tier.create_annotation(sppasLocation(sppasInterval(
+                sppasPoint(begin, 0.005 * (i % 2)),
+                sppasPoint(end, 0.01))), labels)
+
+    # -----------------------------------------------------------------------
+
+    def test_tag(self):
+        """Compare tag() with the match of the labels."""
+        for label_logic_bool in ("any", "all"):
+            for kwargs in ({"exact": u("le")},
+                           {"not_exact": u("le")},
+                           {"iexact": u("LA"), "startswith": u("p"),
+                            "logic_bool": "or"},
+                           {"icontains": u("l"), "not_iendswith": u("A")},
+                           {"regexp": u("^.l$")}):
+                kwargs = dict(kwargs)
+                logic_bool = kwargs.pop("logic_bool", "and")
+                functions = sppasBaseFilters.fix_functions(
+                    sppasTagCompare(), **kwargs)
+                expected = list()
+                for ann in self.tier:
+                    matches = [label.match(functions, logic_bool)
+                               for label in ann.get_labels()]
+                    if len(matches) == 0:
+                        continue
+                    if label_logic_bool == "any" and any(matches) is True:
+                        expected.append(ann)
+                    if label_logic_bool == "all" and all(matches) is True:
+                        expected.append(ann)
+
+                kwargs["logic_bool"] = logic_bool
+                kwargs["logic_bool_label"] = label_logic_bool
+                res = sppasTierFilters(self.tier).tag(**kwargs)
+                self.assertEqual(len(expected), len(res))
+                for ann in expected:
+                    self.assertTrue(ann in res)
+
+    # -----------------------------------------------------------------------
+
+    def test_dur_loc_nlab(self):
+        """Compare dur(), loc() and nlab() with the match of the locations."""
+        f = sppasTierFilters(self.tier)
+        for kwargs in ({"eq": 0.1}, {"ne": 0.1}, {"gt": 0.15}, {"lt": 0.15},
+                       {"ge": 0.1, "le": 0.15}, {"not_eq": 0.1},
+                       {"eq": sppasDuration(0.1, 0.005)}):
+            functions = sppasBaseFilters.fix_functions(
+                sppasDurationCompare(), **kwargs)
+            expected = [ann for ann in self.tier
+                        if ann.get_location().match_duration(functions)]
+            self.assertEqual(set(expected), set(f.dur(**kwargs)))
+
+        for kwargs in ({"rangefrom": 1.}, {"rangeto": 2.05},
+                       {"rangefrom": sppasPoint(1.2, 0.005),
+                        "rangeto": sppasPoint(2.05, 0.005)}):
+            functions = sppasBaseFilters.fix_functions(
+                sppasLocalizationCompare(), **kwargs)
+            expected = [ann for ann in self.tier
+                        if ann.get_location().match_localization(functions)]
+            self.assertEqual(set(expected), set(f.loc(**kwargs)))
+
+        self.assertEqual(len(self.tier) // 3 + 1, len(f.nlab(leq=0)))
+        self.assertEqual(len(self.tier) // 3 * 2, len(f.nlab(lge=1, lle=2)))
+
+    # -----------------------------------------------------------------------
+
+    def test_modified_tier(self):
+        """The filters are applied on the tier as it is when called."""
+        f = sppasTierFilters(self.tier)
+        self.assertEqual(0, len(f.loc(rangefrom=10.)))
+        self.assertEqual(0, len(f.tag(exact=u("new"))))
+
+        # Modify a localization in-place, add and remove annotations
+        last = self.tier[-1]
+        self.assertTrue(last in f.loc(rangeto=5.))
+        last.get_location().get_best().set_end(sppasPoint(10.5, 0.01))
+        self.assertFalse(last in f.loc(rangeto=5.))
+        self.assertTrue(last in f.dur(gt=1.))
+        new = self.tier.create_annotation(
+            sppasLocation(sppasInterval(sppasPoint(11.), sppasPoint(12.))),
+            sppasLabel(sppasTag("new")))
+        self.assertEqual(1, len(f.loc(rangefrom=9.)))
+        self.assertTrue(new in f.tag(exact=u("new")))
+        self.tier.pop(0)
+        self.assertEqual(len(self.tier) // 3, len(f.nlab(leq=0)))
+
+        # Modify labels
+        self.tier[0].append_label(sppasLabel(sppasTag("new")))
+        self.assertEqual(2, len(f.tag(exact=u("new"))))
+
+# ---------------------------------------------------------------------------
+
+
 class TestFilterRelationTier(unittest.TestCase):
     """Test relations.
 
@@ -622,6 +734,49 @@ class TestFilterRelationTier(unittest.TestCase):
         res2 = f.rel(self.rtier, "overlaps") | f.rel(self.rtier, "overlappedby")
         self.assertEqual(res1, res2)
 
+    # -----------------------------------------------------------------------
+
+    def test_relations_reach(self):
+        """Compare with all the annotations of the other tier."""
+        comparator = sppasIntervalCompare()
+
+        def connect_all(tier, other_tier, names, **kwargs):
+            expected = dict()
+            for ann in tier:
+                for other_ann in other_tier:
+                    for name in names:
+                        if comparator.get(name)(ann.get_location().get_best(),
+                                                other_ann.get_location().get_best(),
+                                                **kwargs):
+                            expected.setdefault(ann, set()).add(name)
+            return expected
+
+        # the same tier with a radius, and overlapping intervals
+        tier = sppasTier("Tier")
+        for ann in self.tier:
+            tier.create_annotation(sppasLocation(sppasInterval(
+                sppasPoint(float(ann.get_lowest_localization().get_midpoint()), 0.005),
+                sppasPoint(float(ann.get_highest_localization().get_midpoint()), 0.005))))
+        other_tier = sppasTier("Other")
+        for i in range(12):
+            other_tier.create_annotation(sppasLocation(sppasInterval(
+                sppasPoint(float(i), 0.005), sppasPoint(float(i + 1 + (i % 3)), 0.005))))
+
+        allen = ["equals", "overlaps", "overlappedby", "starts", "startedby",
+                 "finishes", "finishedby", "during", "contains", "meets", "metby"]
+        for names, kwargs in (
+                (allen, {}),
+                (["before", "after"], {}),
+                (["before", "after"], {"max_delay": 2}),
+                (["before", "after"], {"max_delay": 0.5}),
+                (["overlaps", "overlappedby"], {"overlap_min": 0.5, "overlapped_min": 1})):
+            for tier, other in ((self.tier, self.rtier), (tier, other_tier)):
+                res = sppasTierFilters(tier).rel(other, *names, **kwargs)
+                expected = connect_all(tier, other, names, **kwargs)
+                self.assertEqual(len(expected), len(res))
+                for ann in expected:
+                    self.assertEqual(expected[ann], set(res.get_value(ann)))
+
 # ---------------------------------------------------------------------------
 
 
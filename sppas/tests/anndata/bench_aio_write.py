@@ -0,0 +1,123 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.bench_aio_write.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time and memory to write the annotated files.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.anndata.bench_aio_write [nb_annotations]
+
+A transcription with a tier of intervals with gaps, a tier of contiguous
+intervals and a tier of points is written into each of the output file
+formats. The benchmark prints the number of written annotations per second
+and the peak of the memory allocated while writing.
+
+"""
+
+import os.path
+import sys
+import time
+import logging
+import tempfile
+import tracemalloc
+
+from sppas.src.anndata import sppasTrsRW
+from sppas.src.anndata import sppasTranscription
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+
+# ---------------------------------------------------------------------------
+
+
+def create_transcription(nb_annotations):
+    """Return a transcription with 3 tiers of nb_annotations each."""
+    trs = sppasTranscription("bench")
+    tokens = trs.create_tier("Tokens")
+    phones = trs.create_tier("Phones")
+    pitch = trs.create_tier("Pitch")
+    for i in range(nb_annotations):
+        begin = i * 0.05
+        end = (i + 1) * 0.05
+        if i % 3 != 0:
+            tokens.create_annotation(
+                sppasLocation(sppasInterval(sppasPoint(begin), sppasPoint(end))),
+                sppasLabel(sppasTag("w{:d}".format(i % 100))))
+        phones.create_annotation(
+            sppasLocation(sppasInterval(sppasPoint(begin), sppasPoint(end))),
+            sppasLabel(sppasTag("p{:d}".format(i % 40))))
+        pitch.create_annotation(
+            sppasLocation(sppasPoint(begin)),
+            sppasLabel(sppasTag("{:d}".format(100 + i % 50))))
+    return trs
+
+# ---------------------------------------------------------------------------
+
+
+def write(trs, filename):
+    """Write the transcription, return the time and the peak of memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    sppasTrsRW(filename).write(trs)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.ERROR)
+    nb = 10000
+    if len(sys.argv) > 1:
+        nb = int(sys.argv[1])
+
+    trs = create_transcription(nb)
+    nb_ann = sum(len(tier) for tier in trs)
+    print("Write {:d} annotations".format(nb_ann))
+    with tempfile.TemporaryDirectory() as folder:
+        for extension in sorted(sppasTrsRW.extensions_out(), key=str.lower):
+            filename = os.path.join(folder, "bench." + extension)
+            try:
+                elapsed, peak = write(trs, filename)
+            except Exception as e:
+                print("    {:s}: not written: {:s}".format(extension, str(e)))
+                continue
+            print("    {:s}: {:.0f} annotations/second, peak memory {:.2f} MB"
+                  "".format(extension, nb_ann / elapsed, peak / 1e6))
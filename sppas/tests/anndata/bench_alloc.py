@@ -0,0 +1,116 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.bench_alloc.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the memory allocated to read the test corpus.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.anndata.bench_alloc
+
+All the annotated files of the test corpus are read and kept in memory.
+The benchmark prints the memory allocated to store them, and the number
+of instances of the classes representing the localizations and the labels.
+
+"""
+
+import os.path
+import gc
+import logging
+import tracemalloc
+
+from sppas.src.anndata import sppasTrsRW
+from sppas.src.anndata import sppasPoint
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+
+# ---------------------------------------------------------------------------
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# ---------------------------------------------------------------------------
+
+
+def read_corpus(folder):
+    """Read all the annotated files of a folder, return the transcriptions."""
+    extensions = [e.lower() for e in sppasTrsRW.extensions()]
+    transcriptions = list()
+    for filename in sorted(os.listdir(folder)):
+        if os.path.splitext(filename)[1].lower().strip('.') not in extensions:
+            continue
+        try:
+            transcriptions.append(sppasTrsRW(os.path.join(folder, filename)).read())
+        except Exception as e:
+            logging.info("File {:s} not read: {:s}".format(filename, str(e)))
+    return transcriptions
+
+# ---------------------------------------------------------------------------
+
+
+def count_instances():
+    """Return the number of instances of the localization and label classes."""
+    counts = dict()
+    classes = (sppasPoint, sppasInterval, sppasLabel, sppasTag)
+    for obj in gc.get_objects():
+        if type(obj) in classes:
+            name = type(obj).__name__
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.ERROR)
+
+    # A first reading to load modules and resources
+    read_corpus(DATA)
+    gc.collect()
+
+    tracemalloc.start()
+    corpus = read_corpus(DATA)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nb_ann = sum(len(tier) for trs in corpus for tier in trs)
+    print("Read {:d} files, {:d} annotations: {:.2f} MB allocated"
+          "".format(len(corpus), nb_ann, current / 1e6))
+    counts = count_instances()
+    for name in sorted(counts):
+        print("    {:s}: {:d} instances".format(name, counts[name]))
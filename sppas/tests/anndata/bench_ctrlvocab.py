@@ -0,0 +1,126 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.bench_ctrlvocab.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time to check tags with a controlled vocabulary.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.anndata.bench_ctrlvocab [nb_annotations] [nb_entries]
+
+An EAF file is written with a tier constrained by a controlled vocabulary,
+then it is read: the tag of each annotation is checked with the vocabulary.
+The time of sppasCtrlVocab.contains() is also compared to the time of
+comparing the tag to each entry of the vocabulary.
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from sppas.src.anndata import sppasTranscription
+from sppas.src.anndata import sppasCtrlVocab
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+from sppas.src.anndata.aio.readwrite import sppasTrsRW
+
+# ---------------------------------------------------------------------------
+
+
+def create_trs(nb_annotations, nb_entries):
+    """Return a transcription with a tier constrained by a vocabulary."""
+    trs = sppasTranscription("Bench")
+    vocab = sppasCtrlVocab("Vocab")
+    for i in range(nb_entries):
+        vocab.add(sppasTag("entry{:d}".format(i)))
+    trs.add_ctrl_vocab(vocab)
+    tier = trs.create_tier("Tier")
+    tier.set_ctrl_vocab(vocab)
+    for i in range(nb_annotations):
+        tier.create_annotation(
+            sppasLocation(sppasInterval(sppasPoint(i * 0.05), sppasPoint((i + 1) * 0.05))),
+            sppasLabel(sppasTag("entry{:d}".format((i * 7) % nb_entries))))
+    return trs
+
+# ---------------------------------------------------------------------------
+
+
+def contains_each(vocab, tag):
+    """Compare the tag to each entry of the vocabulary."""
+    for entry in vocab:
+        if tag == entry:
+            return True
+    return False
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    nb = 20000
+    nb_entries = 400
+    if len(sys.argv) > 1:
+        nb = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        nb_entries = int(sys.argv[2])
+
+    trs = create_trs(nb, nb_entries)
+    filename = os.path.join(tempfile.gettempdir(), "bench_ctrlvocab.eaf")
+    sppasTrsRW(filename).write(trs)
+
+    start = time.perf_counter()
+    trs = sppasTrsRW(filename).read()
+    print("Read EAF: {:d} annotations with a vocabulary of {:d} entries: {:.3f} seconds"
+          "".format(len(trs[0]), nb_entries, time.perf_counter() - start))
+    os.remove(filename)
+
+    vocab = trs[0].get_ctrl_vocab()
+    assert vocab is not None and len(vocab) == nb_entries
+    tags = [ann.get_labels()[0].get_best() for ann in trs[0]]
+
+    start = time.perf_counter()
+    assert all(vocab.contains(tag) for tag in tags)
+    elapsed_index = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert all(contains_each(vocab, tag) for tag in tags)
+    elapsed_each = time.perf_counter() - start
+    print("contains(): {:.3f} seconds, each entry: {:.3f} seconds"
+          "".format(elapsed_index, elapsed_each))
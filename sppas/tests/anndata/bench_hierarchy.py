@@ -0,0 +1,120 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.bench_hierarchy.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time to validate a hierarchy of tiers.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.anndata.bench_hierarchy [nb_phones]
+
+A tier of tokens is time-aligned with a tier of phones with 5 times more
+annotations. The time of sppasTier.is_superset() is compared to the time
+of searching each point of the tokens into the list of points of the
+phones. Then, annotations are added to the tier of phones, which is the
+parent of the tokens: each one requires to validate the hierarchy.
+
+"""
+
+import sys
+import time
+
+from sppas.src.anndata import sppasTranscription
+from sppas.src.anndata import sppasAnnotation
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+
+# ---------------------------------------------------------------------------
+
+
+def create_trs(nb_phones):
+    """Return a transcription with a tier of phones and a tier of tokens."""
+    trs = sppasTranscription("Bench")
+    phones = trs.create_tier("Phones")
+    tokens = trs.create_tier("Tokens")
+    phones.extend_sorted([sppasAnnotation(sppasLocation(sppasInterval(
+        sppasPoint(round(i * 0.06, 3), 0.0005),
+        sppasPoint(round((i + 1) * 0.06, 3), 0.0005))))
+        for i in range(nb_phones)])
+    tokens.extend_sorted([sppasAnnotation(sppasLocation(sppasInterval(
+        sppasPoint(round(i * 0.3, 3), 0.0005),
+        sppasPoint(round((i + 1) * 0.3, 3), 0.0005))))
+        for i in range(nb_phones // 5)])
+    return trs
+
+# ---------------------------------------------------------------------------
+
+
+def is_superset_all(tier, other):
+    """Search each point of the other tier into the points of the tier."""
+    tier_points = tier.get_all_points()
+    for op in other.get_all_points():
+        if op not in tier_points:
+            return False
+    return True
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    nb = 5000
+    if len(sys.argv) > 1:
+        nb = int(sys.argv[1])
+
+    trs = create_trs(nb)
+    phones = trs.find("Phones")
+    tokens = trs.find("Tokens")
+
+    start = time.perf_counter()
+    assert phones.is_superset(tokens) is True
+    elapsed_merge = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert is_superset_all(phones, tokens) is True
+    elapsed_all = time.perf_counter() - start
+    print("is_superset(): {:.3f} seconds, each point: {:.3f} seconds"
+          "".format(elapsed_merge, elapsed_all))
+
+    trs.add_hierarchy_link("TimeAlignment", phones, tokens)
+    end = phones.get_last_point().get_midpoint()
+    start = time.perf_counter()
+    for i in range(100):
+        phones.append(sppasAnnotation(sppasLocation(sppasInterval(
+            sppasPoint(round(end + i * 0.06, 3), 0.0005),
+            sppasPoint(round(end + (i + 1) * 0.06, 3), 0.0005)))))
+    print("100 annotations appended to the parent tier: {:.3f} seconds"
+          "".format(time.perf_counter() - start))
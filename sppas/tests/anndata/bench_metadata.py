@@ -0,0 +1,137 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.bench_metadata.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the memory and time to read a large TextGrid file.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.anndata.bench_metadata [nb_intervals]
+
+The metadata of the annotations, and their 'id', are created on demand.
+The benchmark reads a TextGrid file, then requests the 'id' of all the
+annotations: it is the cost of the metadata when they were created with
+the annotations.
+
+"""
+
+import sys
+import os.path
+import shutil
+import time
+import tracemalloc
+
+from sppas.src.utils.fileutils import sppasFileUtils
+from sppas.src.anndata.aio.praat import sppasTextGrid
+
+# ---------------------------------------------------------------------------
+
+
+def write_textgrid(filename, nb_intervals):
+    """Write a TextGrid file with a tier of nb_intervals intervals."""
+    with open(filename, "w", encoding="utf-8") as fp:
+        fp.write('File type = "ooTextFile"\n')
+        fp.write('Object class = "TextGrid"\n\n')
+        fp.write('xmin = 0.0\nxmax = {}\n'.format(nb_intervals * 0.05))
+        fp.write('tiers? <exists>\nsize = 1\nitem []:\n')
+        fp.write('\titem [1]:\n\t\tclass = "IntervalTier"\n\t\tname = "Phones"\n')
+        fp.write('\t\txmin = 0.0\n\t\txmax = {}\n'.format(nb_intervals * 0.05))
+        fp.write('\t\tintervals: size = {:d}\n'.format(nb_intervals))
+        for i in range(nb_intervals):
+            fp.write('\t\tintervals [{:d}]:\n'.format(i + 1))
+            fp.write('\t\t\txmin = {}\n'.format(round(i * 0.05, 3)))
+            fp.write('\t\t\txmax = {}\n'.format(round((i + 1) * 0.05, 3)))
+            fp.write('\t\t\ttext = "p{:d}"\n'.format(i % 40))
+
+# ---------------------------------------------------------------------------
+
+
+def measure_time(function, *args):
+    """Return the result of function and its duration."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+# ---------------------------------------------------------------------------
+
+
+def measure_memory(function, *args):
+    """Return the result of function and the size of the allocated memory."""
+    tracemalloc.start()
+    result = function(*args)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+# ---------------------------------------------------------------------------
+
+
+def read(filename):
+    trs = sppasTextGrid()
+    trs.read(filename)
+    return trs
+
+
+def request_ids(trs):
+    for tier in trs:
+        for ann in tier:
+            ann.get_id()
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    nb = 100000
+    if len(sys.argv) > 1:
+        nb = int(sys.argv[1])
+
+    temp = sppasFileUtils().set_random()
+    os.mkdir(temp)
+    try:
+        filename = os.path.join(temp, "large.TextGrid")
+        write_textgrid(filename, nb)
+
+        trs1, duration = measure_time(read, filename)
+        trs2, memory = measure_memory(read, filename)
+        print("Read {:d} intervals:     {:.3f} s, {:.1f} MB"
+              "".format(nb, duration, memory / 1e6))
+
+        _, duration = measure_time(request_ids, trs1)
+        _, memory = measure_memory(request_ids, trs2)
+        print("Request the 'id' of all: {:.3f} s, {:.1f} MB"
+              "".format(duration, memory / 1e6))
+    finally:
+        shutil.rmtree(temp)
@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.bench_tier_extend.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Benchmark of the time to fill a tier with sorted annotations.
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+This is not a test: it is not executed by the test launcher. Run it with:
+
+    > python -m sppas.tests.anndata.bench_tier_extend [nb_annotations]
+
+A tier is filled with sorted annotations, like the readers of files and
+the automatic annotations do: either one by one with sppasTier.add() or
+sppasTier.append(), or with a single call to sppasTier.extend_sorted().
+The labels of the tier are of type 'str' so that their type is checked.
+
+"""
+
+import sys
+import time
+
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasAnnotation
+from sppas.src.anndata import sppasLocation
+from sppas.src.anndata import sppasInterval
+from sppas.src.anndata import sppasPoint
+from sppas.src.anndata import sppasLabel
+from sppas.src.anndata import sppasTag
+
+# ---------------------------------------------------------------------------
+
+
+def create_annotations(nb_annotations):
+    """Return a list of nb_annotations sorted and labelled intervals."""
+    return [sppasAnnotation(
+                sppasLocation(sppasInterval(sppasPoint(i * 0.05), sppasPoint((i + 1) * 0.05))),
+                sppasLabel(sppasTag("p{:d}".format(i % 40))))
+            for i in range(nb_annotations)]
+
+# ---------------------------------------------------------------------------
+
+
+def fill_with_add(annotations):
+    tier = sppasTier("Phones")
+    for ann in annotations:
+        tier.add(ann)
+    return tier
+
+
+def fill_with_append(annotations):
+    tier = sppasTier("Phones")
+    for ann in annotations:
+        tier.append(ann)
+    return tier
+
+
+def fill_with_extend(annotations):
+    tier = sppasTier("Phones")
+    tier.extend_sorted(annotations)
+    return tier
+
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    nb = 5000
+    if len(sys.argv) > 1:
+        nb = int(sys.argv[1])
+
+    for name, fill in (("add", fill_with_add),
+                       ("append", fill_with_append),
+                       ("extend_sorted", fill_with_extend)):
+        annotations = create_annotations(nb)
+        start = time.perf_counter()
+        tier = fill(annotations)
+        elapsed = time.perf_counter() - start
+        assert len(tier) == nb
+        print("{:s}: {:d} annotations in {:.3f} seconds"
+              "".format(name, nb, elapsed))
@@ -41,12 +41,15 @@
 
 import unittest
 import os.path
+import shutil
 import xml.etree.cElementTree as ET
 
 from sppas.core.config import sg
 from sppas.src.utils.datatype import sppasTime
+from sppas.src.utils.fileutils import sppasFileUtils
 
 from sppas.src.anndata.aio.elan import sppasEAF
+from sppas.src.anndata.aio.elan import sppasEAFTimeSlots
 from sppas.src.anndata.ann.annlocation import sppasLocation
 from sppas.src.anndata.ann.annlocation import sppasInterval
 from sppas.src.anndata.ann.annlocation import sppasPoint
@@ -61,6 +64,7 @@ from sppas.src.anndata.aio.aioutils import format_labels
 # ---------------------------------------------------------------------------
 
 DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+TEMP = sppasFileUtils().set_random()
 
 # ---------------------------------------------------------------------------
 
@@ -70,6 +74,15 @@ class TestEAF(unittest.TestCase):
     Test reader/writer of EAF files.
 
     """
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
     def test_detect(self):
         """Test the file format detection method."""
 
@@ -123,6 +136,47 @@ class TestEAF(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_time_slots(self):
+        time_slots = sppasEAFTimeSlots()
+        self.assertEqual(0, len(time_slots))
+        time_slots['ts3'] = "1000"
+        time_slots['ts1'] = 0
+        time_slots['slot'] = "250"
+        time_slots['ts05'] = "500"
+        self.assertEqual(4, len(time_slots))
+        self.assertEqual(1000., time_slots.get('ts3'))
+        self.assertEqual(0., time_slots.get('ts1'))
+        self.assertEqual(250., time_slots.get('slot'))
+        self.assertEqual(500., time_slots.get('ts05'))
+        self.assertIsNone(time_slots.get('ts2'))
+        self.assertIsNone(time_slots.get('ts5'))
+        self.assertIsNone(time_slots.get('ts100'))
+        self.assertEqual(-1, time_slots.get('ts2', -1))
+
+        # the value is updated
+        time_slots['ts3'] = "2000"
+        self.assertEqual(4, len(time_slots))
+        self.assertEqual(2000., time_slots.get('ts3'))
+
+        # not a time value: stored as it is
+        time_slots['ts4'] = "abc"
+        self.assertEqual("abc", time_slots.get('ts4'))
+
+        # a time order
+        time_order_root = ET.fromstring(
+            '<TIME_ORDER>\n'
+            '  <TIME_SLOT TIME_SLOT_ID="ts1" TIME_VALUE="280"/>\n'
+            '  <TIME_SLOT TIME_SLOT_ID="ts2"/>\n'
+            '  <TIME_SLOT TIME_SLOT_ID="ts3" TIME_VALUE="1250"/>\n'
+            '</TIME_ORDER>')
+        time_slots = sppasEAF._parse_time_order(time_order_root)
+        self.assertEqual(2, len(time_slots))
+        self.assertEqual(280., time_slots.get('ts1'))
+        self.assertIsNone(time_slots.get('ts2', None))
+        self.assertEqual(1250., time_slots.get('ts3'))
+
+    # -----------------------------------------------------------------------
+
     def test_document_root(self):
         """document <-> root."""
 
@@ -517,6 +571,47 @@ class TestEAF(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_read(self):
+        """The tiers can be declared before their parent."""
+        eaf = sppasEAF()
+        eaf.read(os.path.join(DATA, "sample.eaf"))
+        self.assertEqual(11, len(eaf))
+        tier_names = [tier.get_name() for tier in eaf]
+        self.assertEqual(["K-Spch", "W-Spch", "W-Words", "W-POS"], tier_names[:4])
+        self.assertIs(eaf.find("W-Words"), eaf.get_hierarchy().get_parent(eaf.find("W-Spch")))
+
+        # the children tiers are declared before their parents
+        tree = ET.parse(os.path.join(DATA, "sample.eaf"))
+        root = tree.getroot()
+        tier_roots = root.findall('TIER')
+        index = list(root).index(tier_roots[0])
+        for tier_root in tier_roots:
+            root.remove(tier_root)
+        for i, tier_root in enumerate(reversed(tier_roots)):
+            root.insert(index + i, tier_root)
+        filename = os.path.join(TEMP, "reversed.eaf")
+        tree.write(filename, encoding="UTF-8", xml_declaration=True)
+
+        eaf_rev = sppasEAF()
+        eaf_rev.read(filename)
+        self.assertEqual(list(reversed(tier_names)),
+                         [tier.get_name() for tier in eaf_rev])
+        for tier in eaf:
+            tier_rev = eaf_rev.find(tier.get_name())
+            parent = eaf.get_hierarchy().get_parent(tier)
+            parent_rev = eaf_rev.get_hierarchy().get_parent(tier_rev)
+            if parent is None:
+                self.assertIsNone(parent_rev)
+            else:
+                self.assertEqual(parent.get_name(), parent_rev.get_name())
+            self.assertEqual(len(tier), len(tier_rev))
+            for ann, ann_rev in zip(tier, tier_rev):
+                self.assertEqual(ann.get_location(), ann_rev.get_location())
+                self.assertEqual(ann.get_labels(), ann_rev.get_labels())
+                self.assertEqual(ann.get_meta('id'), ann_rev.get_meta('id'))
+
+    # -----------------------------------------------------------------------
+
     def test_create_alignable_annotation_element(self):
 
         # An annotation without label
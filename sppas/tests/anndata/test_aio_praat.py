@@ -41,6 +41,7 @@
 
 import unittest
 import os
+import io
 
 from sppas.core.coreutils import u
 
@@ -52,6 +53,7 @@ from sppas.src.anndata.aio.praat import sppasBasePraat
 from sppas.src.anndata.aio.praat import sppasTextGrid
 from sppas.src.anndata.aio.praat import sppasBaseNumericalTier
 from sppas.src.anndata.aio.praat import sppasPitchTier
+from sppas.src.anndata.aio.aioutils import fill_gaps
 from sppas.src.anndata.ann.annlocation import sppasInterval
 from sppas.src.anndata.ann.annlocation import sppasPoint
 from sppas.src.anndata.ann.annlabel import sppasTag
@@ -299,6 +301,59 @@ class TestTextGrid(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_tokenize(self):
+        """Test the values of the long and short forms of a TextGrid."""
+
+        long_content = 'File type = "ooTextFile"\n'\
+                       'Object class = "TextGrid"\n'\
+                       '\n'\
+                       'xmin = 0 \n'\
+                       'tiers? <exists> \n'\
+                       'item []: \n'\
+                       '    item [1]:\n'\
+                       '        text = "a ""b""\n'\
+                       'c" ! comment\n'
+        values = list(sppasTextGrid._tokenize(long_content.split("\n")))
+        self.assertEqual(values, [(1, "ooTextFile", True),
+                                  (2, "TextGrid", True),
+                                  (4, "0", False),
+                                  (5, "<exists>", False),
+                                  (8, 'a "b"\nc', True),
+                                  (10, None, False)])
+
+        short_content = '"ooTextFile"\n'\
+                        '"TextGrid"\n'\
+                        '0\n'\
+                        '<exists>\n'\
+                        '""\n'\
+                        '""""\n'
+        values = list(sppasTextGrid._tokenize(short_content.split("\n")))
+        self.assertEqual(values, [(1, "ooTextFile", True),
+                                  (2, "TextGrid", True),
+                                  (3, "0", False),
+                                  (4, "<exists>", False),
+                                  (5, "", True),
+                                  (6, '"', True),
+                                  (7, None, False)])
+
+        with self.assertRaises(AioLineFormatError):
+            list(sppasTextGrid._tokenize(['"ooTextFile', 'TextGrid']))
+
+    # -----------------------------------------------------------------------
+
+    def test_next_value(self):
+        values = sppasTextGrid._tokenize(['"TextGrid"', '<exists>', '2'])
+        self.assertEqual(sppasTextGrid._next_value(values, is_text=True), (1, "TextGrid"))
+        self.assertEqual(sppasTextGrid._next_value(values), (3, "2"))
+        with self.assertRaises(AioLineFormatError):
+            sppasTextGrid._next_value(values)
+
+        values = sppasTextGrid._tokenize(['"TextGrid"'])
+        with self.assertRaises(AioLineFormatError):
+            sppasTextGrid._next_value(values)
+
+    # -----------------------------------------------------------------------
+
     def test_parse_tier_long(self):
         """Test the read of a tier."""
 
@@ -320,13 +375,20 @@ class TestTextGrid(unittest.TestCase):
 
         lines = tier_content.split("\n")
         txt = sppasTextGrid()
-        txt._parse_tier(lines, 1, is_long=True)
+        tier = txt._parse_tier(sppasTextGrid._tokenize(lines))
         self.assertEqual(len(txt), 1)
+        self.assertIs(tier, txt[0])
         self.assertEqual(txt[0].get_name(), "transcription")
         self.assertEqual(len(txt[0]), 2)
 
         with self.assertRaises(AioLineFormatError):
-            txt._parse_tier(lines, 2, is_long=True)
+            txt._parse_tier(sppasTextGrid._tokenize(lines[2:]))
+
+        # the annotations of an unselected tier are not created
+        values = sppasTextGrid._tokenize(lines + ['"end"'])
+        self.assertIsNone(txt._parse_tier(values, tier_names=["INTSINT"]))
+        self.assertEqual(len(txt), 1)
+        self.assertEqual(sppasTextGrid._next_value(values, is_text=True), (17, "end"))
 
         tier_content = 'item [1]:\n'\
                        '  class = "TextTier"\n'\
@@ -344,7 +406,7 @@ class TestTextGrid(unittest.TestCase):
                        '  class = "TextTier"\n'
         lines = tier_content.split("\n")
         txt = sppasTextGrid()
-        txt._parse_tier(lines, 1, is_long=True)
+        txt._parse_tier(sppasTextGrid._tokenize(lines), tier_names=["INTSINT"])
         self.assertEqual(len(txt), 1)
         self.assertEqual(txt[0].get_name(), "INTSINT")
         self.assertEqual(len(txt[0]), 2)
@@ -358,7 +420,7 @@ class TestTextGrid(unittest.TestCase):
                        '"transcription"\n'\
                        '0\n'\
                        '21.3471\n'\
-                       '11\n'\
+                       '2\n'\
                        '0\n'\
                        '2.4971007546\n'\
                        '"gpf_0"\n' \
@@ -368,13 +430,17 @@ class TestTextGrid(unittest.TestCase):
                        'porte d\'entrée pour laisser chort- sortir le chat"\n'
         lines = tier_content.split("\n")
         txt = sppasTextGrid()
-        txt._parse_tier(lines, 0, is_long=False)
+        txt._parse_tier(sppasTextGrid._tokenize(lines))
         self.assertEqual(len(txt), 1)
         self.assertEqual(txt[0].get_name(), "transcription")
         self.assertEqual(len(txt[0]), 2)
 
         with self.assertRaises(AioLineFormatError):
-            txt._parse_tier(lines, 1, is_long=False)
+            txt._parse_tier(sppasTextGrid._tokenize(lines[1:]))
+
+        # the tier is truncated
+        with self.assertRaises(AioLineFormatError):
+            txt._parse_tier(sppasTextGrid._tokenize(lines[:-3]))
 
         tier_content = '"TextTier"\n'\
                        '"INTSINT"\n'\
@@ -387,7 +453,7 @@ class TestTextGrid(unittest.TestCase):
                        '"T"\n'
         lines = tier_content.split("\n")
         txt = sppasTextGrid()
-        txt._parse_tier(lines, 0, is_long=False)
+        txt._parse_tier(sppasTextGrid._tokenize(lines))
         self.assertEqual(len(txt), 1)
         self.assertEqual(txt[0].get_name(), "INTSINT")
         self.assertEqual(len(txt[0]), 2)
@@ -401,8 +467,7 @@ class TestTextGrid(unittest.TestCase):
                       '    xmax = 2.4971007546\n' \
                       '    text = "gpf_0"\n'
         lines = ann_content.split("\n")
-        ann, nb = sppasTextGrid._parse_annotation(lines, 0, True)
-        self.assertEqual(nb, 3)
+        ann = sppasTextGrid._parse_annotation(sppasTextGrid._tokenize(lines), True)
         self.assertEqual(sppasInterval(
             sppasTextGrid.make_point(0.),
             sppasTextGrid.make_point(2.4971007546)
@@ -415,8 +480,7 @@ class TestTextGrid(unittest.TestCase):
                       '    text = "hier soir j\'ai ouvert la \n'\
                       'porte d\'entrée pour laisser chort- sortir le ""chat"""\n'
         lines = ann_content.split("\n")
-        ann, nb = sppasTextGrid._parse_annotation(lines, 1, True)
-        self.assertEqual(nb, 5)
+        ann = sppasTextGrid._parse_annotation(sppasTextGrid._tokenize(lines), True)
         self.assertEqual(sppasInterval(
                             sppasTextGrid.make_point(2.4971007546),
                             sppasTextGrid.make_point(5.6838880379)),
@@ -430,7 +494,7 @@ class TestTextGrid(unittest.TestCase):
                       '    number = 0.054406250000000066\n'\
                       '    value = "Top"\n'
         lines = ann_content.split("\n")
-        ann, nb = sppasTextGrid._parse_annotation(lines, 1, False)
+        ann = sppasTextGrid._parse_annotation(sppasTextGrid._tokenize(lines), False)
         self.assertEqual(sppasTextGrid.make_point(0.054406250000000066),
                          ann.get_location().get_best())
         self.assertEqual(sppasTag("Top"), ann.get_labels()[0].get_best())
@@ -444,8 +508,7 @@ class TestTextGrid(unittest.TestCase):
                       '2.4971007546\n' \
                       '"gpf_0"\n'
         lines = ann_content.split("\n")
-        ann, nb = sppasTextGrid._parse_annotation(lines, 0, True)
-        self.assertEqual(nb, 3)
+        ann = sppasTextGrid._parse_annotation(sppasTextGrid._tokenize(lines), True)
         self.assertEqual(sppasInterval(
             sppasTextGrid.make_point(0.),
             sppasTextGrid.make_point(2.4971007546)
@@ -457,8 +520,7 @@ class TestTextGrid(unittest.TestCase):
                       '"hier soir j\'ai ouvert la \n'\
                       'porte d\'entrée pour laisser chort- sortir le ""chat"""\n'
         lines = ann_content.split("\n")
-        ann, nb = sppasTextGrid._parse_annotation(lines, 0, True)
-        self.assertEqual(nb, 4)
+        ann = sppasTextGrid._parse_annotation(sppasTextGrid._tokenize(lines), True)
         self.assertEqual(sppasInterval(
             sppasTextGrid.make_point(2.4971007546),
             sppasTextGrid.make_point(5.6838880379)), ann.get_location().get_best())
@@ -476,21 +538,25 @@ class TestTextGrid(unittest.TestCase):
         ann_content = '    xmin = 0.0\n' \
                       '    xmax = 2.4971007546\n' \
                       '    text = "gpf_0"\n'
-        lines_i = ann_content.split("\n")
-        loc, nb = sppasTextGrid._parse_localization(lines_i, 0, True)
+        values = sppasTextGrid._tokenize(ann_content.split("\n"))
+        loc = sppasTextGrid._parse_localization(values, True)
         self.assertEqual(sppasInterval(
             sppasTextGrid.make_point(0.),
             sppasTextGrid.make_point(2.4971007546)
         ), loc)
-        self.assertEqual(nb, 2)
+        self.assertEqual(sppasTextGrid._next_value(values, is_text=True), (3, "gpf_0"))
 
         # point
         ann_content = '        number = 0.054406250000000066\n'\
                       '        value = 62.49343439812383\n'
-        lines_p = ann_content.split("\n")
-        loc, nb = sppasTextGrid._parse_localization(lines_p, 0, False)
+        values = sppasTextGrid._tokenize(ann_content.split("\n"))
+        loc = sppasTextGrid._parse_localization(values, False)
         self.assertEqual(sppasTextGrid.make_point(0.054406250000000066), loc)
-        self.assertEqual(nb, 1)
+        self.assertEqual(sppasTextGrid._next_value(values), (2, "62.49343439812383"))
+
+        # not a number
+        with self.assertRaises(AioLineFormatError):
+            sppasTextGrid._parse_localization(sppasTextGrid._tokenize(['xmin = 0.0', 'xmax = "2.0"']), True)
 
     # -----------------------------------------------------------------------
 
@@ -501,21 +567,21 @@ class TestTextGrid(unittest.TestCase):
         ann_content = '0.0\n' \
                       '2.4971007546\n' \
                       '"gpf_0"\n'
-        lines_i = ann_content.split("\n")
-        loc, nb = sppasTextGrid._parse_localization(lines_i, 0, True)
+        values = sppasTextGrid._tokenize(ann_content.split("\n"))
+        loc = sppasTextGrid._parse_localization(values, True)
         self.assertEqual(sppasInterval(
             sppasTextGrid.make_point(0.),
             sppasTextGrid.make_point(2.4971007546)
         ), loc)
-        self.assertEqual(nb, 2)
+        self.assertEqual(sppasTextGrid._next_value(values, is_text=True), (3, "gpf_0"))
 
         # point
         ann_content = '0.054406250000000066\n'\
                       '"Top"\n'
-        lines_p = ann_content.split("\n")
-        loc, nb = sppasTextGrid._parse_localization(lines_p, 0, False)
+        values = sppasTextGrid._tokenize(ann_content.split("\n"))
+        loc = sppasTextGrid._parse_localization(values, False)
         self.assertEqual(sppasTextGrid.make_point(0.054406250000000066), loc)
-        self.assertEqual(nb, 1)
+        self.assertEqual(sppasTextGrid._next_value(values, is_text=True), (2, "Top"))
 
     # -----------------------------------------------------------------------
 
@@ -527,9 +593,8 @@ class TestTextGrid(unittest.TestCase):
                       '2.4971007546\n' \
                       '"gpf_0"\n'
         lines_i = ann_content.split("\n")
-        labels, nb = sppasTextGrid._parse_text(lines_i, 2)
+        labels = sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines_i[2:]))
         self.assertEqual(sppasTag("gpf_0"), labels[0].get_best())
-        self.assertEqual(nb, 3)
 
         # multi-lines tag
         ann_content = '0.0\n' \
@@ -538,14 +603,13 @@ class TestTextGrid(unittest.TestCase):
                       'porte d\'entrée\n'\
                       'pour laisser chort- sortir le ""chat"""\n'
         lines = ann_content.split("\n")
-        labels, nb = sppasTextGrid._parse_text(lines, 2)
+        labels = sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines[2:]))
         self.assertEqual(sppasTag('hier soir j\'ai ouvert la'),
                          labels[0].get_best())
         self.assertEqual(sppasTag('porte d\'entrée'),
                          labels[1].get_best())
         self.assertEqual(sppasTag('pour laisser chort- sortir le "chat"'),
                          labels[2].get_best())
-        self.assertEqual(nb, 5)
 
         with self.assertRaises(AioLineFormatError):
             ann_content = '0.0\n' \
@@ -553,7 +617,7 @@ class TestTextGrid(unittest.TestCase):
                           '"hier soir j\'ai ouvert la\n' \
                           'porte d\'entrée\n'
             lines = ann_content.split("\n")
-            sppasTextGrid._parse_text(lines, 2)
+            sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines[2:]))
 
     # -----------------------------------------------------------------------
 
@@ -565,9 +629,8 @@ class TestTextGrid(unittest.TestCase):
                       '\t\txmax = 2.4971007546\n' \
                       '\t\ttext = "gpf_0"\n'
         lines_i = ann_content.split("\n")
-        tag, nb = sppasTextGrid._parse_text(lines_i, 2)
+        tag = sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines_i[2:]))
         self.assertEqual([sppasLabel(sppasTag("gpf_0"))], tag)
-        self.assertEqual(nb, 3)
 
         # multi-lines tag
         ann_content = '\t\txmin = 0.0\n' \
@@ -576,14 +639,13 @@ class TestTextGrid(unittest.TestCase):
                       'porte d\'entrée\n' \
                       'pour laisser chort- sortir le ""chat"""\n'
         lines = ann_content.split("\n")
-        labels, nb = sppasTextGrid._parse_text(lines, 2)
+        labels = sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines[2:]))
         self.assertEqual(u('hier soir j\'ai ouvert la'),
                          labels[0].get_best().get_content())
         self.assertEqual(u('porte d\'entrée'),
                          labels[1].get_best().get_content())
         self.assertEqual(u('pour laisser chort- sortir le "chat"'),
                          labels[2].get_best().get_content())
-        self.assertEqual(nb, 5)
 
         with self.assertRaises(AioLineFormatError):
             ann_content = '\t\txmin = 0.0\n' \
@@ -591,7 +653,11 @@ class TestTextGrid(unittest.TestCase):
                           '\t\ttext = "hier soir j\'ai ouvert la\n' \
                           'porte d\'entrée\n'
             lines = ann_content.split("\n")
-            sppasTextGrid._parse_text(lines, 2)
+            sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines[2:]))
+
+        # a number instead of a text
+        with self.assertRaises(AioLineFormatError):
+            sppasTextGrid._parse_text(sppasTextGrid._tokenize(lines_i))
 
     # -----------------------------------------------------------------------
 
@@ -610,6 +676,30 @@ class TestTextGrid(unittest.TestCase):
         self.assertEqual(txt[0].get_name(), "Tokens")
         self.assertEqual(len(txt[0]), 1)
 
+        # only a subset of the tiers
+        txt = sppasTextGrid()
+        txt.read(os.path.join(DATA, "sample.TextGrid"), tier_names=["P-Tones"])
+        self.assertEqual(len(txt), 1)
+        self.assertEqual(txt[0].get_name(), "P-Tones")
+        self.assertEqual(len(txt[0]), 2)
+
+        txt = sppasTextGrid()
+        txt.read(os.path.join(DATA, "sample.TextGrid"), tier_names=[])
+        self.assertEqual(len(txt), 0)
+
+    # -----------------------------------------------------------------------
+
+    def test_read_utf16(self):
+        txt = sppasTextGrid()
+        txt.read(os.path.join(DATA, "sample-utf16.TextGrid"))
+        self.assertEqual(len(txt), 2)
+        self.assertEqual(txt[0].get_name(), "transcription")
+        self.assertEqual(len(txt[0]), 1)
+        self.assertEqual(u("une classe entière qui a bien vu comment ça s'est passé"),
+                         txt[0][0].get_best_tag().get_content())
+        self.assertEqual(txt[1].get_name(), "P-Tones")
+        self.assertEqual(len(txt[1]), 2)
+
     # -----------------------------------------------------------------------
 
     def test_read_annotated_samples(self):
@@ -694,6 +784,40 @@ class TestTextGrid(unittest.TestCase):
         self.assertTrue('time = 0.881936360' in lines[1])
         self.assertTrue('mark = ""' in lines[2])
 
+    # -----------------------------------------------------------------------
+
+    def test_write_interval_tier(self):
+        """Write a tier of intervals and fill its gaps, without copying it."""
+
+        tier = sppasTier('toto')
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(1.), sppasPoint(2.))),
+                               sppasLabel(sppasTag("a")))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(2.), sppasPoint(3.))),
+                               sppasLabel(sppasTag("b")))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(4.), sppasPoint(5.))),
+                               sppasLabel(sppasTag("c")))
+
+        # the same content than the tier filled by fill_gaps()
+        filled = fill_gaps(tier, sppasPoint(0.), sppasPoint(6.))
+        self.assertEqual(6, len(filled))
+        expected = sppasTextGrid._serialize_tier_header(filled, 1)
+        for a, ann in enumerate(filled):
+            expected += sppasTextGrid._serialize_interval_annotation(ann, a+1)
+
+        fp = io.StringIO()
+        sppasTextGrid._write_interval_tier(fp, tier, 1, sppasPoint(0.), sppasPoint(6.))
+        self.assertEqual(expected, fp.getvalue())
+        self.assertEqual(3, len(tier))
+
+        # no gap at the extremities
+        fp = io.StringIO()
+        sppasTextGrid._write_interval_tier(fp, tier, 2, sppasPoint(1.), sppasPoint(5.))
+        lines = fp.getvalue().split("\n")
+        self.assertTrue('xmin = 1.0' in lines[3])
+        self.assertTrue('xmax = 5.0' in lines[4])
+        self.assertTrue('intervals: size = 4' in lines[5])
+        self.assertEqual(1, fp.getvalue().count('text = ""'))
+
 # ---------------------------------------------------------------------------
 
 
@@ -46,6 +46,8 @@ import shutil
 from sppas.core.config import paths
 from sppas.src.utils.fileutils import sppasFileUtils
 from sppas.src.anndata.aio.readwrite import sppasTrsRW
+from sppas.src.anndata.aio.readwrite import sppasTrsCache
+from sppas.src.anndata.aio.readwrite import FileFormatProperty
 
 # ---------------------------------------------------------------------------
 
@@ -168,6 +170,89 @@ class TestAIO(unittest.TestCase):
         self.assertFalse("PitchTier" in sppasTrsRW.annot_extensions())
         self.assertTrue("PitchTier" in sppasTrsRW.measure_extensions())
         self.assertTrue("tra" in sppasTrsRW.table_extensions())
+        self.assertTrue("vtt" in sppasTrsRW.extensions_out())
+        self.assertFalse("vtt" in sppasTrsRW.extensions_in())
+
+        # the cached lists can't be modified
+        sppasTrsRW.extensions_in().append("unknown")
+        self.assertFalse("unknown" in sppasTrsRW.extensions_in())
+
+        fp = FileFormatProperty(".unknown")
+        self.assertEqual("Unknown", fp.get_software())
+        self.assertFalse(fp.get_reader())
+        self.assertFalse(fp.get_writer())
+        self.assertIsNone(fp.get_trs_type())
+        self.assertEqual("Praat", FileFormatProperty(".textgrid").get_software())
+
+    # -----------------------------------------------------------------------
+
+    def test_declared_properties(self):
+        """The declared properties are the ones of the reader-writers."""
+        for ext in sppasTrsRW.extensions():
+            trs = sppasTrsRW.TRANSCRIPTION_TYPES[ext]()
+            fp = FileFormatProperty(ext)
+            self.assertEqual(ext, trs.default_extension)
+            self.assertEqual(trs.software, fp.get_software())
+            self.assertEqual(trs.trs_type, fp.get_trs_type())
+            self.assertIs(trs.__class__, fp._instance.__class__)
+
+            reader = True
+            try:
+                trs.read("")
+            except NotImplementedError:
+                reader = False
+            except Exception:
+                pass
+            self.assertEqual(reader, fp.get_reader(), ext)
+
+            writer = True
+            try:
+                trs.write("")
+            except NotImplementedError:
+                writer = False
+            except Exception:
+                pass
+            self.assertEqual(writer, fp.get_writer(), ext)
+
+    # -----------------------------------------------------------------------
+
+    def test_read_tier_selection(self):
+        """Read only a selection of the tiers of files."""
+
+        files = (os.path.join(paths.etc, "xml", "sample-1.2.xra"),
+                 os.path.join(DATA, "sample.TextGrid"),
+                 os.path.join(DATA, "sample-TGA.antx"),
+                 os.path.join(DATA, "sample.eaf"),
+                 os.path.join(DATA, "sample.ctm"))
+        for filename in files:
+            parser = sppasTrsRW(filename)
+            trs = parser.read()
+            name = trs[-1].get_name()
+
+            # a list of names
+            trs_sel = parser.read(tier_names=[name, "not-exists"])
+            self.assertEqual(len(trs_sel), 1)
+            self.assertEqual(trs_sel[0].get_name(), name)
+            self.assertEqual(len(trs_sel[0]), len(trs[-1]))
+            for ann, ann_sel in zip(trs[-1], trs_sel[0]):
+                self.assertEqual(ann.get_location(), ann_sel.get_location())
+                self.assertEqual(ann.get_labels(), ann_sel.get_labels())
+
+            # a function
+            trs_sel = parser.read(tier_names=lambda n: n != name)
+            self.assertEqual(len(trs_sel), len(trs) - 1)
+            self.assertIsNone(trs_sel.find(name))
+
+            # no tier at all
+            self.assertEqual(len(parser.read(tier_names=[])), 0)
+
+        # In EAF, the reference tiers are created from their parents
+        parser = sppasTrsRW(os.path.join(DATA, "sample.eaf"))
+        trs = parser.read()
+        trs_sel = parser.read(tier_names=["W-POS", "K-Spch"])
+        self.assertEqual([t.get_name() for t in trs_sel], ["K-Spch", "W-POS"])
+        self.assertEqual(len(trs_sel.find("W-POS")), len(trs.find("W-POS")))
+        self.assertEqual(len(trs_sel.get_hierarchy()), 0)
 
     # -----------------------------------------------------------------------
 
@@ -191,6 +276,79 @@ class TestAIO(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_IO_XRA_handoff(self):
+        """Write then read a XRA file with a cache of the transcriptions."""
+        cache = sppasTrsCache()
+        sppasTrsRW.set_cache(cache)
+        try:
+            parser = sppasTrsRW(os.path.join(paths.etc, "xml", "sample-1.2.xra"))
+            trs1 = parser.read()
+            self.assertEqual(0, len(cache))
+
+            parser.set_filename(os.path.join(TEMP, "sample-1.5.xra"))
+            parser.write(trs1)
+            self.assertEqual(1, len(cache))
+
+            # A copy of the written tiers is given to the first read only
+            trs2 = parser.read()
+            self.assertEqual(0, len(cache))
+            self.assertIsNot(trs1[0], trs2[0])
+            self.assertIs(trs2, trs2[0].get_parent())
+            self.assertIs(trs1, trs1[0].get_parent())
+            self.assertTrue(compare_tiers_trs(trs1, trs2))
+            trs3 = parser.read()
+            self.assertIsNot(trs2[0], trs3[0])
+
+            # The same as if the file was parsed
+            self.assertTrue(compare_tiers_trs(trs2, trs3))
+            self.assertTrue(compare_tiers_trs(trs3, trs2))
+            self.assertTrue(compare_ctrl_vocab_trs(trs2, trs3))
+            self.assertTrue(compare_media_trs(trs2, trs3))
+            self.assertEqual(trs2.get_hierarchy().get_hierarchy_type(trs2[1]),
+                             trs3.get_hierarchy().get_hierarchy_type(trs3[1]))
+            for key in trs3.get_meta_keys():
+                if key != "file_read_date":
+                    self.assertEqual(trs2.get_meta(key), trs3.get_meta(key))
+            self.assertEqual(list(trs2.get_meta_keys()), list(trs3.get_meta_keys()))
+
+            # The file was modified since it was written
+            parser.write(trs3)
+            with open(parser.get_filename(), "a") as fp:
+                fp.write("\n")
+            trs4 = parser.read()
+            self.assertIsNot(trs3[0], trs4[0])
+            self.assertTrue(compare_tiers_trs(trs3, trs4))
+
+            # The file was replaced by another one of the same size and time
+            parser.write(trs3)
+            filename = parser.get_filename()
+            with open(filename) as fp:
+                content = fp.read()
+            name = trs3[0].get_name()
+            stat = os.stat(filename)
+            with open(filename + ".tmp", "w") as fp:
+                fp.write(content.replace('tiername="' + name, 'tiername="X' + name[1:]))
+            os.utime(filename + ".tmp", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(filename + ".tmp", filename)
+            trs5 = parser.read()
+            self.assertEqual("X" + name[1:], trs5[0].get_name())
+
+            # A failed write discards the written transcription
+            parser.write(trs3)
+            self.assertEqual(1, len(cache))
+            with self.assertRaises(Exception):
+                parser.write(None)
+            self.assertEqual(0, len(cache))
+
+            # Only the written transcriptions of a reader-writer supporting it
+            parser.set_filename(os.path.join(TEMP, "sample.TextGrid"))
+            parser.write(trs1)
+            self.assertEqual(0, len(cache))
+        finally:
+            sppasTrsRW.set_cache(None)
+
+    # -----------------------------------------------------------------------
+
     def test_IO_ANTX(self):
         """Read/Write/Read then compare ANTX files."""
 
@@ -53,6 +53,7 @@ from sppas.src.anndata.ann.annlabel import sppasTag
 from sppas.src.anndata.aio.aioutils import fill_gaps, check_gaps, unfill_gaps
 from sppas.src.anndata.aio.aioutils import merge_overlapping_annotations
 from sppas.src.anndata.aio.aioutils import load
+from sppas.src.anndata.aio.aioutils import sniff_encoding
 from sppas.src.anndata.aio.aioutils import format_labels, serialize_labels
 
 # ---------------------------------------------------------------------------
@@ -78,6 +79,18 @@ class TestUtils(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_sniff_encoding(self):
+        """Return the encoding of a file from its first bytes."""
+
+        self.assertEqual(sniff_encoding(os.path.join(DATA, "sample.TextGrid")), "utf-8")
+        self.assertEqual(sniff_encoding(os.path.join(DATA, "sample.ctm"), "ISO-8859-1"), "ISO-8859-1")
+        self.assertEqual(sniff_encoding(os.path.join(DATA, "sample-utf16.TextGrid")), "UTF-16")
+
+        with self.assertRaises(IOError):
+            sniff_encoding(os.path.join(DATA, "not-exists"))
+
+    # -----------------------------------------------------------------------
+
     def test_format_labels(self):
         """Convert a string into a list of labels."""
 
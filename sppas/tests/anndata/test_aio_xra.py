@@ -42,8 +42,11 @@
 import unittest
 import os.path
 import shutil
+import re
+import xml.etree.cElementTree as ET
 
 from sppas.core.config import paths
+from sppas.core.config import sg
 from sppas.src.utils.fileutils import sppasFileUtils
 from sppas.src.anndata.aio.xra import sppasXRA
 
@@ -277,3 +280,41 @@ class TestXRA(unittest.TestCase):
             self.assertEqual(len(ctrl1), len(ctrl2))
             for entry in ctrl1:
                 self.assertTrue(ctrl2.contains(entry))
+
+    # -----------------------------------------------------------------------
+
+    def test_write_indent(self):
+        # Media with and without children, and an empty tier
+        xra = sppasXRA()
+        xra.read(os.path.join(paths.demo, "demo-coords.xra"))
+        xra.create_tier("empty")
+        self.assertGreater(len(xra.get_media_list()), 1)
+        xra.write(os.path.join(TEMP, "demo-coords.xra"))
+
+        # Content written by the whole tree indented with indent()
+        root = ET.Element('Document')
+        for key in ("author", "date", "format", "name"):
+            root.set(key, key)
+        metadata_root = ET.SubElement(root, 'Metadata')
+        sppasXRA.format_metadata(metadata_root, xra)
+        if len(metadata_root.findall('Entry')) == 0:
+            root.remove(metadata_root)
+        for tier in xra:
+            sppasXRA.format_tier(ET.SubElement(root, 'Tier'), tier)
+        for media in xra.get_media_list():
+            xra._format_media(ET.SubElement(root, 'Media'), media)
+        xra._format_hierarchy(ET.SubElement(root, 'Hierarchy'))
+        for vocabulary in xra.get_ctrl_vocab_list():
+            xra._format_vocabulary(ET.SubElement(root, 'Vocabulary'), vocabulary)
+        sppasXRA.indent(root)
+        ET.ElementTree(root).write(os.path.join(TEMP, "expected.xra"),
+                                   encoding=sg.__encoding__, method="xml",
+                                   xml_declaration=True)
+
+        with open(os.path.join(TEMP, "expected.xra"), "rb") as fp:
+            expected = fp.read()
+        with open(os.path.join(TEMP, "demo-coords.xra"), "rb") as fp:
+            written = re.sub(b'<Document [^>]*>',
+                             b'<Document author="author" date="date" format="format" name="name">',
+                             fp.read(), count=1)
+        self.assertEqual(expected, written)
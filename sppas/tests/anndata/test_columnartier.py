@@ -0,0 +1,294 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.test_columnartier.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Unittests of the class sppasColumnarTier().
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+"""
+
+import unittest
+import os.path
+import shutil
+
+from sppas.src.utils.fileutils import sppasFileUtils
+from sppas.src.anndata.anndataexc import AnnDataTypeError
+from sppas.src.anndata.anndataexc import IntervalBoundsError
+from sppas.src.anndata.anndataexc import CtrlVocabContainsError
+from sppas.src.anndata.anndataexc import TierAppendError
+from sppas.src.anndata.ann.annlocation import sppasLocation
+from sppas.src.anndata.ann.annlocation import sppasInterval
+from sppas.src.anndata.ann.annlocation import sppasPoint
+from sppas.src.anndata.ann.annlabel import sppasTag
+from sppas.src.anndata.ann.annlabel import sppasLabel
+from sppas.src.anndata.ctrlvocab import sppasCtrlVocab
+from sppas.src.anndata.tier import sppasTier
+from sppas.src.anndata.columnartier import sppasColumnarTier
+from sppas.src.anndata.transcription import sppasTranscription
+from sppas.src.anndata.aio.readwrite import sppasTrsRW
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+
+# ---------------------------------------------------------------------------
+
+
+class TestColumnarTier(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_append_points(self):
+        tier = sppasColumnarTier("PitchTier", tag_type="float")
+        self.assertTrue(tier.is_empty())
+        self.assertFalse(tier.is_point())
+        self.assertIsNone(tier.get_first_point())
+
+        tier.append(0.01, content=128.5)
+        tier.append(0.02, content="130.1", begin_radius=0.001)
+        tier.append(0.03)
+        self.assertEqual(len(tier), 3)
+        self.assertTrue(tier.is_point())
+        self.assertFalse(tier.is_interval())
+        self.assertTrue(tier.is_float())
+        self.assertEqual(tier.get_nb_filled_labels(), 2)
+        self.assertEqual(tier.get_first_point(), sppasPoint(0.01))
+        self.assertEqual(tier.get_last_point(), sppasPoint(0.03))
+        self.assertEqual(tier.get_content(0), "128.5")
+        self.assertIsNone(tier.get_content(2))
+
+        ann = tier[1]
+        self.assertTrue(ann.location_is_point())
+        self.assertEqual(ann.get_lowest_localization().get_radius(), 0.001)
+        self.assertEqual(ann.get_best_tag().get_typed_content(), 130.1)
+        self.assertEqual(len(tier[-1].get_labels()), 0)
+        self.assertEqual(len(tier[0:2]), 2)
+        with self.assertRaises(IndexError):
+            tier[3]
+
+        # Not sorted, or already existing points
+        with self.assertRaises(TierAppendError):
+            tier.append(0.02)
+        with self.assertRaises(TierAppendError):
+            tier.append(0.0305, begin_radius=0.001)
+        # Not a point
+        with self.assertRaises(AnnDataTypeError):
+            tier.append(0.1, 0.2)
+        # Not a float
+        with self.assertRaises(AnnDataTypeError):
+            tier.append(0.04, content="a")
+        self.assertEqual(len(tier), 3)
+
+    # -----------------------------------------------------------------------
+
+    def test_append_intervals(self):
+        tier = sppasColumnarTier("Phones")
+        tier.append(0., 1., "a")
+        tier.append(1., 2.5, "b", score=0.8)
+        tier.append(3., 4., "a")
+        self.assertTrue(tier.is_interval())
+        self.assertTrue(tier.is_string())
+        self.assertEqual(tier.get_contents(), ["a", "b"])
+        self.assertEqual(tier.get_end(1), 2.5)
+        self.assertEqual(tier[1].get_score(), 0.8)
+        self.assertIsNone(tier[0].get_score())
+        self.assertEqual(tier[2].get_location(),
+                         sppasLocation(sppasInterval(sppasPoint(3.), sppasPoint(4.))))
+        self.assertEqual(list(tier.rows())[1], (1., None, 2.5, None, "b", 0.8))
+
+        with self.assertRaises(IntervalBoundsError):
+            tier.append(5., 5.)
+        with self.assertRaises(TierAppendError):
+            tier.append(3.5, 6.)
+        with self.assertRaises(AnnDataTypeError):
+            tier.append(6.)
+
+        # int localizations
+        tier = sppasColumnarTier("Frames")
+        tier.append(0, 10, "a", begin_radius=1)
+        with self.assertRaises(AnnDataTypeError):
+            tier.append(10., 20.)
+        tier.append(10, 20)
+        loc = tier[0].get_lowest_localization()
+        self.assertIs(type(loc.get_midpoint()), int)
+        self.assertIs(type(loc.get_radius()), int)
+
+    # -----------------------------------------------------------------------
+
+    def test_ctrl_vocab(self):
+        voc = sppasCtrlVocab("Vowels")
+        voc.add(sppasTag("a"))
+        tier = sppasColumnarTier("Phones", ctrl_vocab=voc)
+        tier.append(0., 1., "a")
+        tier.append(1., 2., "")
+        with self.assertRaises(CtrlVocabContainsError):
+            tier.append(2., 3., "b")
+        tier.set_ctrl_vocab(None)
+        tier.append(2., 3., "b")
+        with self.assertRaises(CtrlVocabContainsError):
+            tier.set_ctrl_vocab(voc)
+
+    # -----------------------------------------------------------------------
+
+    def test_ids(self):
+        tier = sppasColumnarTier("Phones")
+        tier.append(0., 1., "a", identifier="a1")
+        tier.append(1., 2., "b")
+        self.assertEqual(tier[0].get_id(), "a1")
+        identifier = tier.get_annotation_id(1)
+        self.assertEqual(tier[1].get_id(), identifier)
+        self.assertEqual(tier.get_annotation_id(1), identifier)
+
+    # -----------------------------------------------------------------------
+
+    def test_from_to_tier(self):
+        tier = sppasTier("Phones")
+        tier.set_meta("language", "fra")
+        a1 = tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(0., 0.01), sppasPoint(1., 0.01))),
+                                    sppasLabel(sppasTag("a")))
+        a2 = tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(1., 0.01), sppasPoint(2., 0.01))))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(2.5), sppasPoint(3.))),
+                               sppasLabel(sppasTag("")))
+        a2.set_score(0.5)
+
+        columnar = sppasColumnarTier.from_tier(tier)
+        self.assertEqual(columnar.get_id(), tier.get_id())
+        self.assertEqual(columnar.get_name(), "Phones")
+        self.assertEqual(columnar.get_meta("language"), "fra")
+        self.assertEqual(len(columnar), 3)
+
+        new_tier = columnar.to_tier()
+        self.assertIsInstance(new_tier, sppasTier)
+        self.assertEqual(new_tier.get_id(), tier.get_id())
+        self.assertEqual(new_tier.get_meta("language"), "fra")
+        self.assertEqual(new_tier, tier)
+        for a, new_a in zip(tier, new_tier):
+            self.assertEqual(a.get_id(), new_a.get_id())
+            self.assertEqual(a.get_score(), new_a.get_score())
+            self.assertEqual(a.get_labels(), new_a.get_labels())
+            self.assertEqual(a.get_lowest_localization().get_radius(),
+                             new_a.get_lowest_localization().get_radius())
+
+        # Annotations that can't be represented
+        a1.append_label(sppasLabel(sppasTag("b")))
+        with self.assertRaises(AnnDataTypeError):
+            sppasColumnarTier.from_tier(tier)
+        a1.set_labels(sppasLabel([sppasTag("a"), sppasTag("b")]))
+        with self.assertRaises(AnnDataTypeError):
+            sppasColumnarTier.from_tier(tier)
+        a1.set_labels(sppasLabel(sppasTag("a")))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(3.5), sppasPoint(5.))))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(4.), sppasPoint(6.))))
+        with self.assertRaises(TierAppendError):
+            sppasColumnarTier.from_tier(tier)
+
+    # -----------------------------------------------------------------------
+
+    def test_transcription(self):
+        trs = sppasTranscription()
+        tier = sppasColumnarTier("Phones")
+        tier.append(1., 2., "a")
+        trs.append(tier)
+        self.assertTrue(trs.contains(tier))
+        self.assertIs(trs.find("Phones"), tier)
+        trs.append(sppasColumnarTier("Phones"))
+        self.assertEqual(trs[1].get_name(), "Phones(2)")
+        trs.shift(0.5)
+        self.assertEqual(tier.get_begin(0), 1.5)
+        self.assertEqual(trs.get_min_loc(), sppasPoint(1.5))
+
+    # -----------------------------------------------------------------------
+
+    def test_write(self):
+        tier = sppasTier("Phones")
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(0.5), sppasPoint(1.))),
+                               sppasLabel(sppasTag("a")))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(1.), sppasPoint(2.))),
+                               sppasLabel(sppasTag('say "hi"')))
+        tier.create_annotation(sppasLocation(sppasInterval(sppasPoint(2.5), sppasPoint(3.))),
+                               sppasLabel(sppasTag("b")))
+        points = sppasTier("Points")
+        points.create_annotation(sppasLocation(sppasPoint(0.2, 0.001)), sppasLabel(sppasTag("p")))
+        points.create_annotation(sppasLocation(sppasPoint(3.2, 0.001)), sppasLabel(sppasTag("q")))
+        trs = sppasTranscription()
+        trs.append(tier)
+        trs.append(points)
+        columnar_trs = sppasTranscription()
+        columnar_trs.set_meta("id", trs.get_id())
+        columnar_trs.append(sppasColumnarTier.from_tier(tier))
+        columnar_trs.append(sppasColumnarTier.from_tier(points))
+
+        # Written files are identical with a tier or a columnar tier
+        os.mkdir(os.path.join(TEMP, "expected"))
+        os.mkdir(os.path.join(TEMP, "columnar"))
+        for ext in ("TextGrid", "csv", "xra"):
+            expected = os.path.join(TEMP, "expected", "sample." + ext)
+            sppasTrsRW(expected).write(trs)
+            filename = os.path.join(TEMP, "columnar", "sample." + ext)
+            sppasTrsRW(filename).write(columnar_trs)
+            with open(expected) as fp:
+                expected_content = [line for line in fp.readlines() if "date" not in line and "file_path" not in line]
+            with open(filename) as fp:
+                content = [line for line in fp.readlines() if "date" not in line and "file_path" not in line]
+            self.assertEqual(expected_content, content)
+
+        # Columnar tiers are converted for the other writers
+        filename = os.path.join(TEMP, "columnar", "sample.eaf")
+        sppasTrsRW(filename).write(columnar_trs)
+        new_trs = sppasTrsRW(filename).read()
+        self.assertEqual(len(new_trs.find("Phones")), 3)
+        self.assertIsInstance(columnar_trs[0], sppasColumnarTier)
+
+    # -----------------------------------------------------------------------
+
+    def test_write_pitch(self):
+        tier = sppasColumnarTier("PitchTier", tag_type="float")
+        tier.append(0.01, content=128.5)
+        tier.append(0.02, content=130.)
+        trs = sppasTranscription()
+        trs.append(tier)
+        filename = os.path.join(TEMP, "columnar.PitchTier")
+        sppasTrsRW(filename).write(trs)
+        new_trs = sppasTrsRW(filename).read()
+        self.assertEqual(len(new_trs[0]), 2)
+        self.assertEqual(new_trs[0][1].get_lowest_localization().get_midpoint(), 0.02)
+        self.assertEqual(new_trs[0][1].get_best_tag().get_typed_content(), 130.)
@@ -107,6 +107,16 @@ class TestCtrlVocab(unittest.TestCase):
         self.assertTrue(voc_int.contains(sppasTag(2, "int")))
         self.assertFalse(voc_int.contains(sppasTag(2, "str")))
         self.assertFalse(voc_int.contains(sppasTag(2)))
+        # the typed contents are compared, like sppasTag does
+        self.assertTrue(voc_int.contains(sppasTag(2., "float")))
+        self.assertTrue(voc_int.contains(sppasTag(True, "bool")))
+        self.assertFalse(voc_int.contains(sppasTag(3, "int")))
+
+        # fuzzy tags are compared one by one
+        voc_point = sppasCtrlVocab("Points")
+        self.assertTrue(voc_point.add(sppasTag((27, 32, 3), "point")))
+        self.assertTrue(voc_point.contains(sppasTag((27, 32, 3), "point")))
+        self.assertFalse(voc_point.contains(sppasTag((40, 32), "point")))
 
     # -----------------------------------------------------------------------
 
@@ -116,5 +126,9 @@ class TestCtrlVocab(unittest.TestCase):
         self.assertTrue(voc.add(sppasTag("example")))
         self.assertTrue(voc.remove(sppasTag("example")))
         self.assertFalse(voc.remove(sppasTag("example")))
+        self.assertFalse(voc.contains(sppasTag("example")))
+        self.assertTrue(voc.contains(sppasTag("definition")))
+        self.assertTrue(voc.add(sppasTag("example")))
+        self.assertTrue(voc.contains(sppasTag("example")))
         with self.assertRaises(AnnDataTypeError):
             voc.remove("definition")
@@ -115,6 +115,42 @@ class TestHierarchy(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_validate_child(self):
+        trs = sppasTranscription()
+        ref_tier = trs.create_tier('reftier')
+        sub_tier = trs.create_tier('subtier')
+        for i in range(4):
+            ref_tier.create_annotation(sppasLocation(sppasInterval(
+                sppasPoint(1. + 0.5*i), sppasPoint(1.5 + 0.5*i))))
+        for i in range(2):
+            sub_tier.create_annotation(sppasLocation(sppasInterval(
+                sppasPoint(1. + float(i)), sppasPoint(2. + float(i)))))
+        trs.add_hierarchy_link("TimeAlignment", ref_tier, sub_tier)
+        hierarchy = trs.get_hierarchy()
+        hierarchy.validate_child(sub_tier)
+
+        # an in-place modification of a localization invalidates the link
+        ref_tier[3].get_location().get_best().get_end().set_midpoint(2.9)
+        with self.assertRaises(Exception):
+            hierarchy.validate_child(sub_tier)
+        ref_tier[3].get_location().get_best().get_end().set_midpoint(3.)
+        hierarchy.validate_child(sub_tier)
+
+        # removing an annotation of the parent is checked, and cancelled
+        with self.assertRaises(Exception):
+            ref_tier.pop(0)
+        self.assertEqual(4, len(ref_tier))
+        hierarchy.validate_child(sub_tier)
+        ref_tier.pop(1)
+        self.assertEqual(3, len(ref_tier))
+        hierarchy.validate_child(sub_tier)
+
+        # no link, nothing to validate
+        hierarchy.remove_child(sub_tier)
+        hierarchy.validate_child(sub_tier)
+
+    # -----------------------------------------------------------------------
+
     def test_append_annotation_if_hierarchy(self):
         trs = sppasTranscription()
         ref_tier = trs.create_tier('reftier')
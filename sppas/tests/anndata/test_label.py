@@ -40,6 +40,7 @@
 """
 
 import unittest
+import copy
 
 from sppas.core.config import symbols
 from sppas.core.coreutils import u
@@ -378,6 +379,38 @@ class TestTag(unittest.TestCase):
         self.assertEqual(text1, text2)
         self.assertTrue(text1 == text2)
 
+    # -----------------------------------------------------------------------
+
+    def test_intern(self):
+        tag = sppasTag.intern("toto")
+        self.assertTrue(tag.is_immutable())
+        self.assertFalse(sppasTag("toto").is_immutable())
+        self.assertEqual(tag, sppasTag("toto"))
+        self.assertIs(tag, sppasTag.intern("toto"))
+        self.assertIs(tag, sppasTag.intern(" toto\n"))
+        self.assertIsNot(tag, sppasTag.intern("titi"))
+
+        # an interned tag is shared: it can't be modified
+        with self.assertRaises(AnnDataTypeError):
+            tag.set_content("titi")
+        with self.assertRaises(AnnDataTypeError):
+            tag.set(sppasTag("titi"))
+        self.assertEqual(tag.get_content(), "toto")
+
+        # but its copies can
+        for t in (tag.copy(), copy.deepcopy(tag), copy.deepcopy(sppasLabel(tag)).get_best()):
+            self.assertFalse(t.is_immutable())
+            t.set_content("titi")
+            self.assertEqual(t.get_content(), "titi")
+        self.assertEqual(tag.get_content(), "toto")
+
+    # -----------------------------------------------------------------------
+
+    def test_slots(self):
+        tag = sppasTag("toto")
+        self.assertFalse(hasattr(tag, "__dict__"))
+        self.assertFalse(hasattr(sppasLabel(tag), "__dict__"))
+
 # ---------------------------------------------------------------------------
 
 
@@ -134,6 +134,16 @@ class TestPoint(unittest.TestCase):
         self.assertFalse(sppasPoint.check_types(2, 2.0))
         self.assertFalse(sppasPoint.check_types(2, sppasPoint(1)))
 
+    # -----------------------------------------------------------------------
+
+    def test_slots(self):
+        point = sppasPoint(1.5, 0.01)
+        self.assertFalse(hasattr(point, "__dict__"))
+        with self.assertRaises(AttributeError):
+            point.value = 1.5
+        interval = sppasInterval(sppasPoint(1.), point)
+        self.assertFalse(hasattr(interval, "__dict__"))
+
 # ---------------------------------------------------------------------------
 
 
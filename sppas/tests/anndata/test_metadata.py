@@ -0,0 +1,117 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: sppas.tests.anndata.test_metadata.py
+:author: Brigitte Bigi
+:contact: contact@sppas.org
+:summary: Unittests of the class sppasMetaData().
+
+.. _This file is part of SPPAS: https://sppas.org/
+..
+    -------------------------------------------------------------------------
+
+     ######   ########   ########      ###      ######
+    ##    ##  ##     ##  ##     ##    ## ##    ##    ##     the automatic
+    ##        ##     ##  ##     ##   ##   ##   ##            annotation
+     ######   ########   ########   ##     ##   ######        and
+          ##  ##         ##         #########        ##        analysis
+    ##    ##  ##         ##         ##     ##  ##    ##         of speech
+     ######   ##         ##         ##     ##   ######
+
+    Copyright (C) 2011-2024  Brigitte Bigi, CNRS
+    Laboratoire Parole et Langage, Aix-en-Provence, France
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+    This banner notice must not be removed.
+
+    -------------------------------------------------------------------------
+
+"""
+
+import unittest
+import copy
+import pickle
+
+from sppas.src.anndata.metadata import sppasMetaData
+from sppas.src.anndata.ann.annlocation import sppasInterval
+from sppas.src.anndata.ann.annlocation import sppasLocation
+from sppas.src.anndata.ann.annlocation import sppasPoint
+from sppas.src.anndata.ann.annlabel import sppasLabel
+from sppas.src.anndata.ann.annlabel import sppasTag
+from sppas.src.anndata.transcription import sppasTranscription
+
+# ---------------------------------------------------------------------------
+
+
+class TestMetaData(unittest.TestCase):
+
+    def test_lazy_id(self):
+        meta = sppasMetaData()
+        self.assertEqual(len(meta), 1)
+        self.assertTrue(meta.is_meta_key("id"))
+        self.assertFalse(meta.is_meta_key("name"))
+        self.assertEqual(meta.get_meta("name", "default"), "default")
+        identifier = meta.get_id()
+        self.assertEqual(len(identifier), 36)
+        self.assertEqual(meta.get_id(), identifier)
+        self.assertEqual(meta.get_meta("id"), identifier)
+        self.assertEqual(list(meta.get_meta_keys()), ["id"])
+
+        # Metadata of the instances are not shared
+        other = sppasMetaData()
+        other.set_meta("name", "other")
+        self.assertFalse(sppasMetaData().is_meta_key("name"))
+        self.assertNotEqual(other.get_id(), identifier)
+        self.assertEqual(list(other.get_meta_keys()), ["id", "name"])
+        self.assertEqual(len(other), 2)
+
+    # -----------------------------------------------------------------------
+
+    def test_set_id(self):
+        meta = sppasMetaData()
+        meta.set_meta("id", "a1")
+        self.assertEqual(meta.get_id(), "a1")
+        meta.gen_id()
+        self.assertNotEqual(meta.get_id(), "a1")
+        with self.assertRaises(ValueError):
+            meta.pop_meta("id")
+        meta.pop_meta("name")
+        self.assertEqual(len(meta), 1)
+
+    # -----------------------------------------------------------------------
+
+    def test_copy(self):
+        trs = sppasTranscription("trs")
+        tier = trs.create_tier("tier")
+        for i in range(3):
+            tier.create_annotation(
+                sppasLocation(sppasInterval(sppasPoint(i), sppasPoint(i+1))),
+                sppasLabel(sppasTag("tag%d" % i)))
+        tier[1].set_meta("key", "value")
+
+        for obj in (tier, trs):
+            for other in (copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+                self.assertEqual(other.get_id(), obj.get_id())
+                self.assertEqual(len(other), len(obj))
+
+        other = pickle.loads(pickle.dumps(trs))
+        self.assertEqual(other.get_name(), "trs")
+        other_tier = other.find("tier")
+        self.assertIs(other_tier.get_parent(), other)
+        for ann, other_ann in zip(tier, other_tier):
+            self.assertEqual(ann, other_ann)
+            self.assertEqual(ann.get_id(), other_ann.get_id())
+        self.assertEqual(other_tier[1].get_meta("key"), "value")
+        self.assertEqual(other_tier.find(sppasPoint(1), sppasPoint(2)),
+                         [other_tier[1]])
@@ -41,6 +41,7 @@
 
 import unittest
 import random
+import copy
 
 from sppas.src.anndata.anndataexc import AnnDataTypeError
 from sppas.src.anndata.anndataexc import AnnDataIndexError
@@ -254,6 +255,62 @@ class TestTier(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_extend_sorted(self):
+        a1 = sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(1), sppasPoint(3))),
+                             sppasLabel(sppasTag("a")))
+        a2 = sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(3), sppasPoint(9))))
+        a3 = sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(9), sppasPoint(11))),
+                             sppasLabel(sppasTag("c")))
+        tier = sppasTier()
+        self.assertEqual(0, tier.extend_sorted([]))
+        self.assertEqual(3, tier.extend_sorted(iter([a1, a2, a3])))
+        self.assertEqual(3, len(tier))
+        for ann in tier:
+            self.assertIs(tier, ann.get_parent())
+        self.assertEqual(1, tier.get_annotation_index(a2))
+        self.assertEqual(2, tier.lindex(sppasPoint(9)))
+
+        # the same with validate="each"
+        tier2 = sppasTier()
+        self.assertEqual(3, tier2.extend_sorted([a1.copy(), a2.copy(), a3.copy()], validate="each"))
+        self.assertEqual(len(tier), len(tier2))
+        with self.assertRaises(ValueError):
+            tier2.extend_sorted([], validate="never")
+
+        # nothing is added if any annotation is invalid
+        a4 = sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(11), sppasPoint(12))))
+        a5 = sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(10), sppasPoint(13))))
+        with self.assertRaises(ValueError):
+            tier.extend_sorted([a4, a5])
+        self.assertEqual(3, len(tier))
+        self.assertIsNone(a4.get_parent())
+        with self.assertRaises(AnnDataTypeError):
+            tier.extend_sorted([a4, sppasAnnotation(sppasLocation(sppasPoint(15)))])
+        with self.assertRaises(AnnDataTypeError):
+            tier.extend_sorted([a4, sppasAnnotation(
+                sppasLocation(sppasInterval(sppasPoint(12), sppasPoint(13))),
+                sppasLabel(sppasTag(2, "int")))])
+        with self.assertRaises(AnnDataTypeError):
+            tier.extend_sorted([a4, "a5"])
+        self.assertEqual(3, len(tier))
+
+        # points can't share a localization
+        tier = sppasTier()
+        with self.assertRaises(ValueError):
+            tier.extend_sorted([sppasAnnotation(sppasLocation(sppasPoint(1))),
+                                sppasAnnotation(sppasLocation(sppasPoint(1)))])
+        self.assertEqual(0, len(tier))
+
+        # controlled vocabulary
+        voc = sppasCtrlVocab("v")
+        voc.add(sppasTag("a"))
+        tier = sppasTier(ctrl_vocab=voc)
+        with self.assertRaises(CtrlVocabContainsError):
+            tier.extend_sorted([a1.copy(), a2.copy(), a3.copy()])
+        self.assertEqual(0, len(tier))
+
+    # -----------------------------------------------------------------------
+
     def test_intervals_index(self):
         tier = sppasTier()
         a1 = sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(1), sppasPoint(3))))
@@ -773,6 +830,90 @@ class TestTier(unittest.TestCase):
         tier.add(sppasAnnotation(sppasLocation(sppasPoint(2))))
         self.assertEqual(tier.index(sppasPoint(2)), 0)
 
+        # The first point is returned if several ones match with the radius
+        tier = sppasTier()
+        tier.append(sppasAnnotation(sppasLocation(sppasPoint(2., 1.))))
+        tier.append(sppasAnnotation(sppasLocation(sppasPoint(4.5, 1.))))
+        self.assertEqual(tier.index(sppasPoint(3.3, 0.5)), 0)
+        self.assertEqual(tier.index(sppasPoint(4.)), 1)
+        self.assertEqual(tier.index(sppasPoint(6.)), -1)
+
+    # -----------------------------------------------------------------------
+
+    def test_add_point_unsorted(self):
+        tier = sppasTier()
+        values = [9., 3., 10., 16., 13., 8., 0.5, 20.]
+        for v in values:
+            tier.add(sppasAnnotation(sppasLocation(sppasPoint(v))))
+        self.assertEqual(sorted(values),
+                         [a.get_lowest_localization().get_midpoint() for a in tier])
+        for i, v in enumerate(sorted(values)):
+            self.assertEqual(tier.index(sppasPoint(v)), i)
+
+    # -----------------------------------------------------------------------
+
+    def test_index_updated(self):
+        tier = sppasTier()
+        for i in range(10):
+            tier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(float(i)), sppasPoint(float(i+1))))))
+        self.assertEqual(tier.mindex(sppasPoint(9.5)), 9)
+
+        # Append or add annotations
+        tier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(10.), sppasPoint(11.)))))
+        self.assertEqual(tier.mindex(sppasPoint(10.5)), 10)
+        tier.add(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(2.5), sppasPoint(3.5)))))
+        self.assertEqual(tier.lindex(sppasPoint(2.5)), 3)
+        self.assertEqual(tier.mindex(sppasPoint(3.2)), 3)
+        self.assertEqual(len(tier.find(sppasPoint(2.), sppasPoint(4.))), 3)
+
+        # Remove annotations
+        tier.pop(3)
+        self.assertEqual(tier.lindex(sppasPoint(2.5)), -1)
+        self.assertEqual(tier.mindex(sppasPoint(3.2)), 3)
+
+        # Modify a localization in-place
+        tier[-1].get_location().get_best().set_end(sppasPoint(15.))
+        self.assertEqual(tier.mindex(sppasPoint(14.)), 10)
+        self.assertEqual(tier.rindex(sppasPoint(15.)), 10)
+        tier[0].get_location().get_best().get_begin().set_midpoint(0.5)
+        self.assertEqual(tier.mindex(sppasPoint(0.2)), -1)
+        self.assertEqual(tier.lindex(sppasPoint(0.5)), 0)
+        tier[1].get_location().get_best().set_radius(0.1)
+        self.assertEqual(tier.lindex(sppasPoint(1.05)), 1)
+
+        # Only the tier of the modified localization is modified
+        other = sppasTier()
+        other.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(0.), sppasPoint(1.)))))
+        stamp = other.get_modification_stamp()
+        tier[2].get_location().get_best().shift(0.)
+        sppasInterval(sppasPoint(1.), sppasPoint(2.)).set_radius(0.1)
+        self.assertEqual(stamp, other.get_modification_stamp())
+        other[0].get_location().get_best().get_end().set_midpoint(2.)
+        self.assertEqual(stamp + 1, other.get_modification_stamp())
+        self.assertEqual(other.mindex(sppasPoint(1.5)), 0)
+
+        # A copied localization is not owned by the tier anymore
+        stamp = tier.get_modification_stamp()
+        tier[0].get_location().copy().get_best().set_end(sppasPoint(0.8))
+        copy.deepcopy(tier[0].get_location()).get_best().get_begin().shift(0.1)
+        self.assertEqual(stamp, tier.get_modification_stamp())
+
+    # -----------------------------------------------------------------------
+
+    def test_add_point_duplicate(self):
+        tier = sppasTier()
+        for v in (30., 31.125, 31.13, 32.):
+            tier.create_annotation(sppasLocation(sppasPoint(v, 0.005)))
+        # 31.13 is the matching point found first
+        self.assertEqual(tier.add(sppasAnnotation(sppasLocation(sppasPoint(31.125, 0.005)))), 3)
+        self.assertEqual(5, len(tier))
+        # 31.125 is the matching point found first
+        tier.pop(2)
+        tier.pop(2)
+        with self.assertRaises(TierAddError):
+            tier.add(sppasAnnotation(sppasLocation(sppasPoint(31.125, 0.005))))
+        self.assertEqual(3, len(tier))
+
     # -----------------------------------------------------------------------
 
     def test_equal_annotation(self):
@@ -932,6 +1073,19 @@ class TestTier(unittest.TestCase):
         self.assertTrue(reftier.is_superset(subtier))
         self.assertFalse(subtier.is_superset(reftier))
 
+        # points are equal if they are within the radius
+        reftier = sppasTier()
+        reftier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(1., 0.01), sppasPoint(1.504, 0.002)))))
+        reftier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(1.504, 0.002), sppasPoint(2., 0.1)))))
+        reftier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(2.6, 0.002), sppasPoint(3.)))))
+        subtier = sppasTier()
+        subtier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(1.005), sppasPoint(1.51, 0.005)))))
+        self.assertTrue(reftier.is_superset(subtier))
+        subtier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(1.51, 0.005), sppasPoint(2.08)))))
+        self.assertTrue(reftier.is_superset(subtier))
+        subtier.append(sppasAnnotation(sppasLocation(sppasInterval(sppasPoint(2.51), sppasPoint(3.)))))
+        self.assertFalse(reftier.is_superset(subtier))
+
     # -----------------------------------------------------------------------
 
     def test_export_to_intervals(self):
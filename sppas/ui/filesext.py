@@ -41,6 +41,7 @@
 
 from sppas.core.config import sppasExtensionsSettings
 from sppas.src.anndata import sppasTrsRW
+from sppas.src.anndata import FileFormatProperty
 from sppas.src.videodata import video_extensions
 from sppas.src.imgdata import image_extensions
 
@@ -78,7 +79,7 @@ class FileAnnotIcon(object):
 
         # Add annotated files extensions
         for ext in sppasTrsRW.TRANSCRIPTION_TYPES:
-            software = sppasTrsRW.TRANSCRIPTION_TYPES[ext]().software
+            software = FileFormatProperty(ext).get_software()
             if ext.startswith(".") is False:
                 ext = "." + ext
             self.__exticon[ext.upper()] = software
@@ -118,10 +118,8 @@ class FormatsViewCtrl(sppasPanel):
 
     def __init__(self, parent, name="list_panel"):
         super(sppasPanel, self).__init__(parent, name=name)
-        self.__extensions = list()
-        ext = sppasTrsRW.extensions()
-        for e in ext:
-            self.__extensions.append(sppasTrsRW.TRANSCRIPTION_TYPES[e]().default_extension)
+        # the extensions are the default extension of each reader-writer
+        self.__extensions = sppasTrsRW.extensions()
         self._create_content()
         self.__set_pane_size()
         self.Bind(wx.EVT_LIST_ITEM_SELECTED, self._on_selected_item)